@@ -23,47 +23,70 @@ import os
 from queue import Queue
 from threading import Thread
 from typing import Iterator, Optional
+from uuid import uuid4
 
 from fastapi import Body, FastAPI, HTTPException
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from backend_v2.app.api.mappers import (
     to_device_profile_response,
     to_job_response,
     to_preset_response,
+    to_progress_response,
     to_run_response,
+    to_trace_response,
 )
 from backend_v2.app.api.run_execution import (
     apply_control_action,
     execute_prepared_run,
+    lock_devices,
     publish_job_status,
+    resume_request,
     request_cancel,
     request_pause,
     request_resume,
-    reset_run_control,
+    start_locked_run,
+)
+from backend_v2.app.api.run_preparation import (
+    PreparedRun,
+    checked_volatile_rules,
+    prepare_run,
 )
-from backend_v2.app.api.run_preparation import prepare_run
 from backend_v2.app.api.schemas import (
     AppResetCountsResponse,
     AppResetResponse,
     ActiveJobResponse,
     CreateJobRequest,
     DeviceImportResponse,
+    DeviceLockResponse,
     DeviceProfileResponse,
     ExecutionEventResponse,
+    InterruptedRunResponse,
     RuntimeModesResponse,
+    SchedulerStateResponse,
+    SessionBudgetResponse,
+    SshSessionPoolResponse,
+    BastionPoolResponse,
+    JobSessionShareResponse,
     StatusCommandRequest,
     StatusCommandResponse,
+    WorkerPoolResponse,
     JobResponse,
+    JobTraceResponse,
     PresetCreateRequest,
     PresetResponse,
     PresetUpdateRequest,
     RunJobRequest,
     RunJobResponse,
+    RunProgressResponse,
     FailedRowResponse,
 )
+from backend_v2.app.application.async_execution_engine import (
+    DEFAULT_BRIDGE_WORKERS,
+    AsyncExecutionEngine,
+)
 from backend_v2.app.application.device_import_service import (
     DeviceConnectionValidator,
     DeviceImportService,
@@ -73,28 +96,61 @@ from backend_v2.app.application.execution_engine import (
     ExecutionEngine,
 )
 from backend_v2.app.application.job_service import JobService
-from backend_v2.app.domain.models import is_active_job
+from backend_v2.app.application.metrics import BackendMetrics
+from backend_v2.app.application.rate_limit import TokenBucket
+from backend_v2.app.application.session_budget import FairShareSessionBudget
+from backend_v2.app.application.tracing import SpanExporter, Tracer, in_current_context
+from backend_v2.app.application.worker_pool import POOL_OPERATIONS, SessionWorkerPool
+from backend_v2.app.application.events import utc_now
+from backend_v2.app.domain.models import JobRecord, JobStatus, is_active_job
 from backend_v2.app.domain.state_machine import JobStateMachine
 from backend_v2.app.infrastructure.device_connection_validators import (
     NetmikoConnectionValidator,
     SimulatedConnectionValidator,
 )
+from backend_v2.app.infrastructure.in_memory_device_locks import InMemoryDeviceLocks
 from backend_v2.app.infrastructure.in_memory_device_store import InMemoryDeviceStore
 from backend_v2.app.infrastructure.in_memory_event_store import InMemoryEventStore
 from backend_v2.app.infrastructure.in_memory_job_store import InMemoryJobStore
 from backend_v2.app.infrastructure.in_memory_run_store import InMemoryRunStore
+from backend_v2.app.infrastructure.in_memory_duration_history import (
+    InMemoryDurationHistory,
+)
 from backend_v2.app.infrastructure.in_memory_control_store import InMemoryControlStore
+from backend_v2.app.infrastructure.file_run_journal import FileRunJournal
+from backend_v2.app.infrastructure.file_span_exporter import RotatingFileSpanExporter
+from backend_v2.app.infrastructure.in_memory_span_store import InMemorySpanStore
 from backend_v2.app.infrastructure.file_preset_store import (
     FilePresetStore,
     PresetConflictError,
 )
+from backend_v2.app.infrastructure.bastion_pool import (
+    DEFAULT_BASTION_IDLE_TTL_SECONDS,
+    DEFAULT_CHANNELS_PER_TRANSPORT,
+    DEFAULT_TRANSPORTS_PER_BASTION,
+    BastionTransportPool,
+)
 from backend_v2.app.infrastructure.netmiko_device_worker import NetmikoDeviceWorker
+from backend_v2.app.infrastructure.netmiko_session_pool import (
+    DEFAULT_IDLE_TTL_SECONDS,
+    DEFAULT_KEEPALIVE_SECONDS,
+    DEFAULT_MAX_AGE_SECONDS,
+    DEFAULT_MAX_IDLE_SESSIONS,
+    DEFAULT_WARM_TTL_SECONDS,
+    NetmikoSessionPool,
+)
 from backend_v2.app.infrastructure.netmiko_executor import (
+    DEFAULT_FAST_APPLY_CHUNK_LINES,
     parse_status_commands,
     run_status_commands,
 )
+from backend_v2.app.infrastructure.pool_reaper import (
+    DEFAULT_REAP_INTERVAL_SECONDS,
+    PoolReaper,
+)
 from backend_v2.app.infrastructure.run_coordinator import RunCoordinator
 from backend_v2.app.infrastructure.simulated_device_worker import SimulatedDeviceWorker
+from backend_v2.app.infrastructure.stack_sampler import StackSampler
 
 app = FastAPI(
     title="Network Device Configuration Manager v2 (Scaffold)",
@@ -124,12 +180,20 @@ device_store = InMemoryDeviceStore()
 event_store = InMemoryEventStore()
 run_store = InMemoryRunStore()
 control_store = InMemoryControlStore()
+duration_history = InMemoryDurationHistory()
+device_locks = InMemoryDeviceLocks()
 preset_store = FilePresetStore(
     path=os.getenv(
         "NW_EDIT_V2_PRESET_FILE",
         "backend_v2/data/run_presets.json",
     ).strip(),
 )
+run_journal = FileRunJournal(
+    directory=os.getenv(
+        "NW_EDIT_V2_RUN_JOURNAL_DIR",
+        "backend_v2/data/run_journal",
+    ).strip(),
+)
 run_coordinator = RunCoordinator()
 service = JobService(repository=store, state_machine=JobStateMachine())
 
@@ -142,17 +206,328 @@ def resolve_validator_mode() -> str:
     return os.getenv("NW_EDIT_V2_VALIDATOR_MODE", "netmiko").strip().lower()
 
 
+def resolve_async_bridge_workers() -> int:
+    raw = os.getenv("NW_EDIT_V2_ASYNC_BRIDGE_WORKERS", "").strip()
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_BRIDGE_WORKERS
+    except ValueError:
+        return DEFAULT_BRIDGE_WORKERS
+
+
+def resolve_connection_limiter() -> TokenBucket | None:
+    """Session-open rate limit shared by execution and import validation."""
+    try:
+        rate = float(os.getenv("NW_EDIT_V2_CONNECT_RATE", "").strip() or 0)
+        burst = float(os.getenv("NW_EDIT_V2_CONNECT_BURST", "").strip() or rate)
+    except ValueError:
+        return None
+    if rate <= 0:
+        return None
+    return TokenBucket(rate_per_second=rate, burst=max(1.0, burst))
+
+
+DEFAULT_SESSION_BUDGET = 200
+
+
+def resolve_session_budget() -> int:
+    """Device sessions allowed at once across every running job."""
+    raw = os.getenv("NW_EDIT_V2_SESSION_BUDGET", "").strip()
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_SESSION_BUDGET
+    except ValueError:
+        return DEFAULT_SESSION_BUDGET
+
+
+DEFAULT_POOL_SIZE = 100
+DEFAULT_POOL_QUOTAS = {"import": 10, "status": 10}
+
+
+def resolve_pool_size() -> int:
+    """Process-wide cap on device sessions (runs, imports, status commands)."""
+    raw = os.getenv("NW_EDIT_V2_POOL_SIZE", "").strip()
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_POOL_SIZE
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def resolve_pool_quotas() -> dict[str, int]:
+    """Per-operation quotas, e.g. ``import=10,status=5``; unknown names are ignored."""
+    raw = os.getenv("NW_EDIT_V2_POOL_QUOTAS", "").strip()
+    if not raw:
+        return dict(DEFAULT_POOL_QUOTAS)
+    quotas: dict[str, int] = {}
+    for item in raw.split(","):
+        name, _, value = item.partition("=")
+        name = name.strip().lower()
+        try:
+            quota = int(value)
+        except ValueError:
+            continue
+        if name in POOL_OPERATIONS and quota > 0:
+            quotas[name] = quota
+    return quotas
+
+
+def resolve_pool_job_quota() -> int | None:
+    """Most pool slots a single job may hold (unset = no per-job cap)."""
+    raw = os.getenv("NW_EDIT_V2_POOL_JOB_QUOTA", "").strip()
+    try:
+        return max(1, int(raw)) if raw else None
+    except ValueError:
+        return None
+
+
+DEFAULT_TRACE_BUFFER = 50000
+DEFAULT_TRACE_FILE_MAX_BYTES = 10 * 1024 * 1024
+
+
+def resolve_trace_sample_rate() -> float:
+    """Fraction of jobs traced (0 disables tracing)."""
+    raw = os.getenv("NW_EDIT_V2_TRACE_SAMPLE_RATE", "").strip()
+    try:
+        return min(1.0, max(0.0, float(raw))) if raw else 1.0
+    except ValueError:
+        return 1.0
+
+
+def resolve_trace_buffer() -> int:
+    """Spans kept in memory for ``GET /api/v2/jobs/{job_id}/trace``."""
+    raw = os.getenv("NW_EDIT_V2_TRACE_BUFFER", "").strip()
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_TRACE_BUFFER
+    except ValueError:
+        return DEFAULT_TRACE_BUFFER
+
+
+def resolve_trace_exporters(span_store: InMemorySpanStore) -> list[SpanExporter]:
+    """Ring buffer, plus a rotating JSONL file when ``NW_EDIT_V2_TRACE_FILE`` is set."""
+    exporters: list[SpanExporter] = [span_store]
+    path = os.getenv("NW_EDIT_V2_TRACE_FILE", "").strip()
+    if path:
+        raw = os.getenv("NW_EDIT_V2_TRACE_FILE_MAX_BYTES", "").strip()
+        try:
+            max_bytes = int(raw) if raw else DEFAULT_TRACE_FILE_MAX_BYTES
+        except ValueError:
+            max_bytes = DEFAULT_TRACE_FILE_MAX_BYTES
+        exporters.append(RotatingFileSpanExporter(path=path, max_bytes=max_bytes))
+    return exporters
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name, "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+def resolve_warm_session_ttl() -> float | None:
+    """TTL of sessions kept warm by import validation; None when the mode is off."""
+    if os.getenv("NW_EDIT_V2_WARM_SESSIONS", "").strip().lower() not in {
+        "1",
+        "true",
+        "yes",
+    }:
+        return None
+    return _env_number("NW_EDIT_V2_WARM_SESSION_TTL", DEFAULT_WARM_TTL_SECONDS)
+
+
+def resolve_pipelined_verify() -> bool:
+    """Send each verification stage's commands in one write."""
+    return os.getenv("NW_EDIT_V2_PIPELINED_VERIFY", "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+
+
+def resolve_fast_apply_chunk_lines() -> int:
+    """Config lines per fast-apply chunk; 0 when fast apply is off."""
+    if os.getenv("NW_EDIT_V2_FAST_APPLY", "").strip().lower() not in {
+        "1",
+        "true",
+        "yes",
+    }:
+        return 0
+    return max(
+        1,
+        int(
+            _env_number(
+                "NW_EDIT_V2_FAST_APPLY_CHUNK_LINES", DEFAULT_FAST_APPLY_CHUNK_LINES
+            )
+        ),
+    )
+
+
+def resolve_mask_volatile_lines() -> bool:
+    """Mask built-in per-platform volatile values before diffing (default on)."""
+    return os.getenv("NW_EDIT_V2_MASK_VOLATILE_LINES", "true").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+
+
+def resolve_ssh_session_pool() -> NetmikoSessionPool:
+    """Idle SSH sessions shared by runs and status commands (max idle 0 = no reuse)."""
+    return NetmikoSessionPool(
+        max_idle=int(
+            _env_number("NW_EDIT_V2_SSH_POOL_MAX_IDLE", DEFAULT_MAX_IDLE_SESSIONS)
+        ),
+        idle_ttl_seconds=_env_number(
+            "NW_EDIT_V2_SSH_POOL_IDLE_TTL", DEFAULT_IDLE_TTL_SECONDS
+        ),
+        max_age_seconds=_env_number(
+            "NW_EDIT_V2_SSH_POOL_MAX_AGE", DEFAULT_MAX_AGE_SECONDS
+        ),
+        keepalive_seconds=int(
+            _env_number("NW_EDIT_V2_SSH_KEEPALIVE", DEFAULT_KEEPALIVE_SECONDS)
+        ),
+    )
+
+
+def resolve_bastion_pool() -> BastionTransportPool:
+    """Bastion transports shared by every jump-host device session."""
+    return BastionTransportPool(
+        transports_per_bastion=int(
+            _env_number("NW_EDIT_V2_BASTION_TRANSPORTS", DEFAULT_TRANSPORTS_PER_BASTION)
+        ),
+        channels_per_transport=int(
+            _env_number(
+                "NW_EDIT_V2_BASTION_CHANNELS_PER_TRANSPORT",
+                DEFAULT_CHANNELS_PER_TRANSPORT,
+            )
+        ),
+        idle_ttl_seconds=_env_number(
+            "NW_EDIT_V2_BASTION_IDLE_TTL", DEFAULT_BASTION_IDLE_TTL_SECONDS
+        ),
+        keepalive_seconds=int(
+            _env_number("NW_EDIT_V2_SSH_KEEPALIVE", DEFAULT_KEEPALIVE_SECONDS)
+        ),
+    )
+
+
+def resolve_pool_reap_interval() -> float:
+    """Seconds between idle-session reaps (0 disables the reaper)."""
+    return _env_number("NW_EDIT_V2_POOL_REAP_INTERVAL", DEFAULT_REAP_INTERVAL_SECONDS)
+
+
+DEFAULT_PROFILE_MAX_SECONDS = 60.0
+
+
+def resolve_profile_max_seconds() -> float:
+    """Longest capture ``POST /api/v2/debug/profile`` accepts."""
+    raw = os.getenv("NW_EDIT_V2_PROFILE_MAX_SECONDS", "").strip()
+    try:
+        return max(0.1, float(raw)) if raw else DEFAULT_PROFILE_MAX_SECONDS
+    except ValueError:
+        return DEFAULT_PROFILE_MAX_SECONDS
+
+
+connection_limiter = resolve_connection_limiter()
+ssh_sessions = resolve_ssh_session_pool()
+bastions = resolve_bastion_pool()
+# Pools only expire idle sessions when used; reap them while the app is quiet.
+pool_reaper = PoolReaper(
+    resolve_pool_reap_interval(), prunes=[ssh_sessions.prune, bastions.prune]
+)
+pool_reaper.start()
+stack_sampler = StackSampler()
+span_store = InMemorySpanStore(capacity=resolve_trace_buffer())
+tracer = Tracer(
+    exporters=resolve_trace_exporters(span_store),
+    sample_rate=resolve_trace_sample_rate(),
+)
+metrics = BackendMetrics()
+session_budget = FairShareSessionBudget(total=resolve_session_budget())
+session_pool = SessionWorkerPool(
+    max_sessions=resolve_pool_size(),
+    operation_quotas=resolve_pool_quotas(),
+    owner_quota=resolve_pool_job_quota(),
+)
 if resolve_worker_mode() == "netmiko":
-    worker: DeviceWorker = NetmikoDeviceWorker(profile_resolver=device_store.get_by_key)
+    worker: DeviceWorker = NetmikoDeviceWorker(
+        profile_resolver=device_store.get_by_key,
+        session_pool=ssh_sessions,
+        bastions=bastions,
+        pipelined_verify=resolve_pipelined_verify(),
+        fast_apply_chunk_lines=resolve_fast_apply_chunk_lines(),
+        mask_volatile_lines=resolve_mask_volatile_lines(),
+    )
 else:
     worker = SimulatedDeviceWorker()
-engine = ExecutionEngine(worker=worker, publisher=event_store)
+engine = ExecutionEngine(
+    worker=worker,
+    publisher=event_store,
+    history=duration_history,
+    connection_limiter=connection_limiter,
+    session_budget=session_budget,
+    pool=session_pool,
+    journal=run_journal,
+    summary_store=run_store,
+    metrics=metrics,
+)
+async_engine = AsyncExecutionEngine(
+    worker=worker,
+    publisher=event_store,
+    bridge_workers=resolve_async_bridge_workers(),
+    history=duration_history,
+    connection_limiter=connection_limiter,
+    session_budget=session_budget,
+    pool=session_pool,
+    journal=run_journal,
+    summary_store=run_store,
+    metrics=metrics,
+)
+
+
+def restore_interrupted_jobs() -> int:
+    """Re-create jobs whose journaled run never finished as queued, resumable jobs."""
+    restored = 0
+    for journaled in run_journal.interrupted():
+        if store.get(journaled.job_id) is not None:
+            continue
+        store.save(
+            JobRecord(
+                job_id=journaled.job_id,
+                job_name=journaled.job_name,
+                creator=journaled.creator,
+                status=JobStatus.QUEUED,
+                created_at=journaled.created_at or utc_now(),
+                global_vars=dict(journaled.global_vars),
+            )
+        )
+        restored += 1
+    return restored
+
+
+restore_interrupted_jobs()
+
+
+def select_engine(prepared: PreparedRun) -> ExecutionEngine:
+    """Pick the thread-pool or asyncio engine for a prepared run."""
+    if prepared.engine_mode == "async":
+        return async_engine
+    return engine
+
 
 if resolve_validator_mode() == "netmiko":
-    validator: DeviceConnectionValidator = NetmikoConnectionValidator()
+    warm_session_ttl = resolve_warm_session_ttl()
+    validator: DeviceConnectionValidator = NetmikoConnectionValidator(
+        warm_sessions=ssh_sessions if warm_session_ttl is not None else None,
+        warm_ttl_seconds=warm_session_ttl,
+        bastions=bastions,
+    )
 else:
     validator = SimulatedConnectionValidator()
-device_import_service = DeviceImportService(store=device_store, validator=validator)
+device_import_service = DeviceImportService(
+    store=device_store,
+    validator=validator,
+    pool=session_pool,
+    metrics=metrics,
+    rate_limiter=connection_limiter,
+)
 
 
 @app.get("/health")
@@ -161,6 +536,38 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> PlainTextResponse:
+    """Prometheus text exposition of job, device, import and stream metrics."""
+    return PlainTextResponse(
+        metrics.render(event_store.event_counts()),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@app.post("/api/v2/debug/profile", response_class=PlainTextResponse)
+def capture_profile(seconds: float = 5.0) -> PlainTextResponse:
+    """Sample every thread for ``seconds`` and return collapsed stacks."""
+    max_seconds = resolve_profile_max_seconds()
+    if not 0 < seconds <= max_seconds:
+        raise HTTPException(
+            status_code=400,
+            detail=f"seconds must be greater than 0 and at most {max_seconds:g}",
+        )
+    try:
+        capture = stack_sampler.capture(seconds)
+    except RuntimeError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    filename = f"nw-edit-profile-{utc_now()[:19].replace(':', '')}.collapsed"
+    return PlainTextResponse(
+        capture.collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Profile-Samples": str(capture.samples),
+        },
+    )
+
+
 @app.get("/api/v2/runtime/modes", response_model=RuntimeModesResponse)
 def get_runtime_modes() -> RuntimeModesResponse:
     """Expose runtime worker/validator mode for UI."""
@@ -291,7 +698,13 @@ def reset_app_state() -> AppResetResponse:
         events=event_store.clear(),
         run_results=run_store.clear(),
         controls=control_store.clear(),
+        duration_history=duration_history.clear(),
+        # Otherwise unresumed journals come back as jobs on the next start.
+        run_journals=run_journal.clear(),
     )
+    # Pooled sessions were opened with the cleared devices' credentials.
+    ssh_sessions.close_all()
+    bastions.close_all()
     return AppResetResponse(reset=True, cleared=cleared)
 
 
@@ -303,18 +716,19 @@ def execute_status_command(payload: StatusCommandRequest) -> StatusCommandRespon
     if profile is None:
         raise HTTPException(status_code=404, detail="Device not found")
 
+    owner = f"status:{uuid4().hex[:8]}"
+    reservation = lock_devices(device_locks, owner, [key])
     try:
         if resolve_worker_mode() == "netmiko":
-            output = run_status_commands(
-                {
-                    "host": profile.host,
-                    "port": profile.port,
-                    "device_type": profile.device_type,
-                    "username": profile.username,
-                    "password": profile.password,
-                },
+            output = session_pool.submit(
+                "status",
+                owner,
+                run_status_commands,
+                profile.connection_params(),
                 payload.commands,
-            )
+                ssh_sessions,
+                bastions,
+            ).result()
         else:
             commands = parse_status_commands(payload.commands)
             output = "\n\n".join([f"$ {cmd}\n(simulated output)" for cmd in commands])
@@ -323,6 +737,65 @@ def execute_status_command(payload: StatusCommandRequest) -> StatusCommandRespon
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
+    finally:
+        reservation.release()
+
+
+@app.get("/api/v2/scheduler/state", response_model=SchedulerStateResponse)
+def get_scheduler_state() -> SchedulerStateResponse:
+    """Return the session budget, worker pool, SSH and bastion pools and device locks."""
+    in_use, jobs = session_budget.snapshot()
+    pool = session_pool.stats()
+    ssh = ssh_sessions.stats()
+    bastion = bastions.stats()
+    return SchedulerStateResponse(
+        worker_pool=WorkerPoolResponse(
+            capacity=pool.capacity,
+            active=pool.active,
+            queued=pool.queued,
+            utilization=pool.utilization,
+            completed=pool.completed,
+            mean_wait_seconds=pool.mean_wait_seconds,
+            max_wait_seconds=pool.max_wait_seconds,
+            operation_quotas=pool.operation_quotas,
+            active_by_operation=pool.active_by_operation,
+            queued_by_operation=pool.queued_by_operation,
+            active_by_owner=pool.active_by_owner,
+        ),
+        session_budget=SessionBudgetResponse(
+            total=session_budget.total,
+            in_use=in_use,
+            jobs=[
+                JobSessionShareResponse(
+                    job_id=job_id,
+                    in_use=state.in_use,
+                    fair_share=state.fair_share,
+                    waiting=state.waiting,
+                )
+                for job_id, state in sorted(jobs.items())
+            ],
+        ),
+        ssh_sessions=SshSessionPoolResponse(
+            idle=ssh.idle,
+            warm_idle=ssh.warm_idle,
+            checked_out=ssh.checked_out,
+            opened=ssh.opened,
+            reused=ssh.reused,
+            warm_reused=ssh.warm_reused,
+            discarded=ssh.discarded,
+        ),
+        bastions=BastionPoolResponse(
+            bastions=bastion.bastions,
+            transports=bastion.transports,
+            channels=bastion.channels,
+            opened_transports=bastion.opened_transports,
+            opened_channels=bastion.opened_channels,
+        ),
+        device_locks=[
+            DeviceLockResponse(device=device, owner=owner)
+            for device, owner in sorted(device_locks.snapshot().items())
+        ],
+    )
 
 
 @app.get("/api/v2/presets", response_model=list[PresetResponse])
@@ -349,6 +822,7 @@ def create_preset(payload: PresetCreateRequest) -> PresetResponse:
             os_model=payload.os_model,
             commands=list(payload.commands),
             verify_commands=list(payload.verify_commands),
+            diff_ignore_patterns=checked_volatile_rules(payload.diff_ignore_patterns),
         )
     except PresetConflictError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
@@ -365,6 +839,11 @@ def update_preset(preset_id: str, payload: PresetUpdateRequest) -> PresetRespons
             os_model=payload.os_model,
             commands=list(payload.commands),
             verify_commands=list(payload.verify_commands),
+            diff_ignore_patterns=(
+                None
+                if payload.diff_ignore_patterns is None
+                else checked_volatile_rules(payload.diff_ignore_patterns)
+            ),
         )
     except PresetConflictError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
@@ -375,19 +854,7 @@ def update_preset(preset_id: str, payload: PresetUpdateRequest) -> PresetRespons
 
 @app.post("/api/v2/jobs", response_model=JobResponse)
 def create_job(payload: CreateJobRequest) -> JobResponse:
-    """Create a queued job."""
-    jobs = store.list()
-    jobs.sort(key=lambda item: item.created_at, reverse=True)
-    for existing in jobs:
-        if is_active_job(existing):
-            label = existing.job_name or existing.job_id
-            raise HTTPException(
-                status_code=409,
-                detail=(
-                    f"Job '{label}' is already {existing.status.value}. "
-                    "Wait for it to finish or cancel it before starting another job."
-                ),
-            )
+    """Create a queued job; jobs may run concurrently on disjoint devices."""
     job = service.create_job(
         job_name=payload.job_name,
         creator=payload.creator,
@@ -415,6 +882,20 @@ def active_job() -> ActiveJobResponse:
     return ActiveJobResponse(active=False, job=None)
 
 
+@app.get("/api/v2/jobs/interrupted", response_model=list[InterruptedRunResponse])
+def list_interrupted_runs() -> list[InterruptedRunResponse]:
+    """List journaled runs that started but never finished."""
+    return [
+        InterruptedRunResponse(
+            job_id=journaled.job_id,
+            job_name=journaled.job_name,
+            finished_devices=len(journaled.finished_devices),
+            remaining_devices=journaled.remaining_devices(),
+        )
+        for journaled in run_journal.interrupted()
+    ]
+
+
 @app.get("/api/v2/jobs/{job_id}", response_model=JobResponse)
 def get_job(job_id: str) -> JobResponse:
     """Fetch job details."""
@@ -459,61 +940,82 @@ def apply_event(job_id: str, event_name: str) -> JobResponse:
 @app.post("/api/v2/jobs/{job_id}/run", response_model=RunJobResponse)
 def run_job(job_id: str, payload: RunJobRequest) -> RunJobResponse:
     """Run job with simulated worker and return summary."""
-    prepared = prepare_run(
-        job_id=job_id,
-        payload=payload,
-        job_store=store,
-        device_store=device_store,
-    )
-
-    reset_run_control(
-        job_id=job_id,
-        service=service,
-        control_store=control_store,
-    )
-
-    summary = execute_prepared_run(
-        job_id=job_id,
-        prepared=prepared,
-        engine=engine,
-        control_store=control_store,
-        run_store=run_store,
-        service=service,
-        commands=payload.commands,
-        verify_commands=list(payload.verify_commands or []),
-    )
-    return to_run_response(summary)
-
+    with tracer.trace(job_id, "run", mode="sync"):
+        prepared = prepare_run(
+            job_id=job_id,
+            payload=payload,
+            job_store=store,
+            device_store=device_store,
+            preset_store=preset_store,
+        )
 
-@app.post("/api/v2/jobs/{job_id}/run/async", response_model=JobResponse)
-def run_job_async(job_id: str, payload: RunJobRequest) -> JobResponse:
-    """Run job in background thread."""
-    prepared = prepare_run(
-        job_id=job_id,
-        payload=payload,
-        job_store=store,
-        device_store=device_store,
-    )
-    reset_run_control(
-        job_id=job_id,
-        service=service,
-        control_store=control_store,
-    )
+        reservation = start_locked_run(
+            job_id=job_id,
+            prepared=prepared,
+            service=service,
+            control_store=control_store,
+            device_locks=device_locks,
+            journal=run_journal,
+            journal_request=payload.model_dump(),
+        )
 
-    started = run_coordinator.start(
-        job_id=job_id,
-        target=lambda: execute_prepared_run(
+        summary = execute_prepared_run(
             job_id=job_id,
             prepared=prepared,
-            engine=engine,
+            engine=select_engine(prepared),
             control_store=control_store,
             run_store=run_store,
             service=service,
             commands=payload.commands,
             verify_commands=list(payload.verify_commands or []),
-        ),
-    )
+            reservation=reservation,
+            journal=run_journal,
+        )
+    return to_run_response(summary)
+
+
+def start_async_run(
+    job_id: str, payload: RunJobRequest, journal_request: dict[str, object]
+) -> JobResponse:
+    """Prepare, lock, journal and start a run in a background thread."""
+    with tracer.trace(job_id, "run", mode="async"):
+        prepared = prepare_run(
+            job_id=job_id,
+            payload=payload,
+            job_store=store,
+            device_store=device_store,
+            preset_store=preset_store,
+        )
+        reservation = start_locked_run(
+            job_id=job_id,
+            prepared=prepared,
+            service=service,
+            control_store=control_store,
+            device_locks=device_locks,
+            journal=run_journal,
+            journal_request=journal_request,
+        )
+
+        # The background run stays a child of this request's root span.
+        started = run_coordinator.start(
+            job_id=job_id,
+            target=in_current_context(
+                lambda: execute_prepared_run(
+                    job_id=job_id,
+                    prepared=prepared,
+                    engine=select_engine(prepared),
+                    control_store=control_store,
+                    run_store=run_store,
+                    service=service,
+                    commands=payload.commands,
+                    verify_commands=list(payload.verify_commands or []),
+                    reservation=reservation,
+                    journal=run_journal,
+                )
+            ),
+        )
     if not started:
+        reservation.release()
         raise HTTPException(status_code=409, detail="Job run already in progress")
     publish_job_status(
         event_store=event_store,
@@ -527,6 +1029,30 @@ def run_job_async(job_id: str, payload: RunJobRequest) -> JobResponse:
     return to_job_response(fresh)
 
 
+@app.post("/api/v2/jobs/{job_id}/run/async", response_model=JobResponse)
+def run_job_async(job_id: str, payload: RunJobRequest) -> JobResponse:
+    """Run job in background thread."""
+    return start_async_run(job_id, payload, payload.model_dump())
+
+
+@app.post("/api/v2/jobs/{job_id}/run/resume", response_model=JobResponse)
+def resume_interrupted_run(job_id: str) -> JobResponse:
+    """Re-run only the devices an interrupted run never finished."""
+    journaled = run_journal.load(job_id)
+    if journaled is None or not journaled.interrupted:
+        raise HTTPException(status_code=409, detail="No interrupted run to resume")
+    request = resume_request(journaled)
+    if request is None:
+        run_journal.finish_run(job_id, "completed")
+        raise HTTPException(
+            status_code=409, detail="Every device of the interrupted run finished"
+        )
+    # Journal the original request so later resumes still see every device.
+    return start_async_run(
+        job_id, RunJobRequest.model_validate(request), journaled.request
+    )
+
+
 @app.post("/api/v2/jobs/{job_id}/pause", response_model=JobResponse)
 def pause_job(job_id: str) -> JobResponse:
     """Pause async run scheduling."""
@@ -586,17 +1112,36 @@ def terminate_job(job_id: str) -> JobResponse:
 
 @app.get("/api/v2/jobs/{job_id}/result", response_model=RunJobResponse)
 def get_job_result(job_id: str) -> RunJobResponse:
-    """Return latest run result for a job."""
+    """Return latest run result for a job (partial while the run is executing)."""
     summary = run_store.get(job_id)
     if summary is None:
         raise HTTPException(status_code=404, detail="Run result not found")
-    return to_run_response(summary)
+    return to_run_response(summary.snapshot())
+
+
+@app.get("/api/v2/jobs/{job_id}/progress", response_model=RunProgressResponse)
+def get_job_progress(job_id: str) -> RunProgressResponse:
+    """Return progress counts and the partial summary of the latest run."""
+    summary = run_store.get(job_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Run result not found")
+    return to_progress_response(summary.snapshot())
+
+
+@app.get("/api/v2/jobs/{job_id}/trace", response_model=JobTraceResponse)
+def get_job_trace(job_id: str) -> JobTraceResponse:
+    """Return the job's recorded spans as a waterfall."""
+    spans = span_store.spans_for(job_id)
+    if not spans:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return to_trace_response(job_id, spans)
 
 
 @app.websocket("/ws/v2/jobs/{job_id}")
 async def ws_job_events(websocket: WebSocket, job_id: str) -> None:
     """Stream in-memory execution events for a job."""
     await websocket.accept()
+    metrics.websocket_connected()
     cursor = 0
     try:
         while True:
@@ -619,3 +1164,5 @@ async def ws_job_events(websocket: WebSocket, job_id: str) -> None:
             await asyncio.sleep(0.2)
     except WebSocketDisconnect:
         return
+    finally:
+        metrics.websocket_disconnected()
@@ -23,14 +23,21 @@ from backend_v2.app.api.schemas import (
     DeviceProfileResponse,
     DeviceRunResponse,
     JobResponse,
+    JobTraceResponse,
     PresetResponse,
     RunJobResponse,
+    RunProgressResponse,
+    StagePercentilesResponse,
+    TraceSpanResponse,
+    WaveRunResponse,
 )
+from backend_v2.app.application.tracing import Span, waterfall
 from backend_v2.app.domain.models import (
     DeviceProfile,
     ExecutionPreset,
     JobRecord,
     JobRunSummary,
+    StagePercentiles,
 )
 
 
@@ -70,9 +77,46 @@ def to_run_response(summary: JobRunSummary) -> RunJobResponse:
                 diff_truncated=result.diff_truncated,
                 diff_original_size=result.diff_original_size,
                 log_trimmed=result.log_trimmed,
+                duration_seconds=result.duration_seconds,
+                estimated_duration_seconds=summary.estimated_durations.get(key),
+                stage_timings=dict(result.stage_timings),
+                session_source=result.session_source,
             )
             for key, result in summary.device_results.items()
         },
+        waves=[
+            WaveRunResponse(
+                index=wave.index,
+                label=wave.label,
+                device_keys=wave.device_keys,
+                status=wave.status,
+                started_at=wave.started_at,
+                completed_at=wave.completed_at,
+            )
+            for wave in summary.waves
+        ],
+        schedule_order=summary.schedule_order,
+        status_counts=dict(summary.status_counts),
+        stage_percentiles={
+            stage: to_stage_percentiles_response(stats)
+            for stage, stats in summary.stage_percentiles().items()
+        },
+        stage_percentiles_by_device_type={
+            device_type: {
+                stage: to_stage_percentiles_response(stats)
+                for stage, stats in stages.items()
+            }
+            for device_type, stages in summary.stage_percentiles_by_device_type().items()
+        },
+        session_sources=summary.session_sources(),
+        warm_session_hit_rate=summary.warm_session_hit_rate(),
+    )
+
+
+def to_stage_percentiles_response(stats: StagePercentiles) -> StagePercentilesResponse:
+    """Convert stage percentiles to an API response."""
+    return StagePercentilesResponse(
+        count=stats.count, p50=stats.p50, p95=stats.p95, p99=stats.p99
     )
 
 
@@ -86,6 +130,7 @@ def to_preset_response(preset: ExecutionPreset) -> PresetResponse:
         verify_commands=preset.verify_commands,
         created_at=preset.created_at,
         updated_at=preset.updated_at,
+        diff_ignore_patterns=list(preset.diff_ignore_patterns),
     )
 
 
@@ -103,4 +148,50 @@ def to_device_profile_response(device: DeviceProfile) -> DeviceProfileResponse:
         prod=device.prod,
         connection_ok=device.connection_ok,
         error_message=device.error_message,
+        jump_host=device.jump_host,
+        jump_port=device.jump_port,
+        jump_username=device.jump_username,
+        jump_password=device.jump_password,
+    )
+
+
+def to_progress_response(summary: JobRunSummary) -> RunProgressResponse:
+    """Convert a (possibly still running) summary to a progress response."""
+    progress = summary.progress()
+    return RunProgressResponse(
+        job_id=summary.job_id,
+        status=summary.status.value,
+        total=progress.total,
+        started=progress.started,
+        finished=progress.finished,
+        in_progress=progress.in_progress,
+        pending=progress.pending,
+        percent_complete=progress.percent_complete,
+        status_counts=dict(summary.status_counts),
+        summary=to_run_response(summary),
+    )
+
+
+def to_trace_response(job_id: str, spans: list[Span]) -> JobTraceResponse:
+    """Convert recorded spans of one job to a waterfall response."""
+    rows = waterfall(spans)
+    total = max(
+        (row.offset_seconds + row.span.duration_seconds for row in rows), default=0.0
+    )
+    return JobTraceResponse(
+        job_id=job_id,
+        total_seconds=total,
+        spans=[
+            TraceSpanResponse(
+                span_id=row.span.span_id,
+                parent_id=row.span.parent_id,
+                name=row.span.name,
+                depth=row.depth,
+                offset_seconds=row.offset_seconds,
+                duration_seconds=row.span.duration_seconds,
+                attributes=dict(row.span.attributes),
+                error=row.span.error,
+            )
+            for row in rows
+        ],
     )
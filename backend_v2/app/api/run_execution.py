@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import Any
 
 from fastapi import HTTPException
 
@@ -28,11 +29,19 @@ from backend_v2.app.application.events import ExecutionEvent, utc_now
 from backend_v2.app.application.execution_control import ExecutionControl
 from backend_v2.app.application.execution_engine import ExecutionEngine
 from backend_v2.app.application.job_service import JobService
+from backend_v2.app.application.run_journal import JournaledRun, RunJournal
+from backend_v2.app.application.tracing import traced
 from backend_v2.app.domain.models import JobRecord, JobRunSummary
 from backend_v2.app.infrastructure.in_memory_control_store import InMemoryControlStore
+from backend_v2.app.infrastructure.in_memory_device_locks import (
+    DeviceLockConflict,
+    DeviceReservation,
+    InMemoryDeviceLocks,
+)
 from backend_v2.app.infrastructure.in_memory_event_store import InMemoryEventStore
 from backend_v2.app.infrastructure.in_memory_job_store import InMemoryJobStore
 from backend_v2.app.infrastructure.in_memory_run_store import InMemoryRunStore
+from backend_v2.app.infrastructure.volatile_lines import volatile_line_rules
 
 SUMMARY_EVENT_BY_STATUS = {
     "completed": "complete",
@@ -41,6 +50,60 @@ SUMMARY_EVENT_BY_STATUS = {
 }
 
 
+def lock_devices(
+    device_locks: InMemoryDeviceLocks, owner: str, keys: list[str]
+) -> DeviceReservation:
+    """Lock devices for one job or status command; 409 when another owner holds them."""
+    try:
+        return device_locks.acquire(owner=owner, keys=keys)
+    except DeviceLockConflict as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+
+def start_locked_run(
+    job_id: str,
+    prepared: PreparedRun,
+    service: JobService,
+    control_store: InMemoryControlStore,
+    device_locks: InMemoryDeviceLocks,
+    journal: RunJournal | None = None,
+    journal_request: dict[str, Any] | None = None,
+) -> DeviceReservation:
+    """Reserve the run's devices, transition the job to running and journal it."""
+    reservation = lock_devices(
+        device_locks, job_id, [device.key for device in prepared.devices]
+    )
+    try:
+        reset_run_control(job_id=job_id, service=service, control_store=control_store)
+    except HTTPException:
+        reservation.release()
+        raise
+    job = service.repository.get(job_id)
+    if journal is not None and job is not None:
+        journal.start_run(job, dict(journal_request or {}))
+    return reservation
+
+
+def resume_request(journaled: JournaledRun) -> dict[str, Any] | None:
+    """Original run request narrowed to unfinished devices (None if none remain).
+
+    The original canary is kept while it is unfinished; otherwise the first
+    remaining device is canaried so the resumed run still starts gated.
+    """
+    remaining = journaled.remaining_devices()
+    if not remaining:
+        return None
+    request = dict(journaled.request)
+    request["imported_device_keys"] = remaining
+    canary = request.get("canary") or {}
+    canary_key = f"{canary.get('host')}:{canary.get('port', 22)}"
+    if canary_key not in remaining:
+        host, _, port = remaining[0].rpartition(":")
+        request["canary"] = {"host": host, "port": int(port)}
+    return request
+
+
+@traced("reset_run_control")
 def reset_run_control(
     job_id: str,
     service: JobService,
@@ -53,11 +116,11 @@ def reset_run_control(
         raise HTTPException(status_code=409, detail=str(exc)) from exc
 
     control = control_store.get_or_create(job_id)
-    control.pause_event.clear()
-    control.cancel_event.clear()
+    control.reset()
     return control
 
 
+@traced("execute_prepared_run")
 def execute_prepared_run(
     job_id: str,
     prepared: PreparedRun,
@@ -67,21 +130,31 @@ def execute_prepared_run(
     service: JobService,
     commands: list[str] | None = None,
     verify_commands: list[str] | None = None,
+    reservation: DeviceReservation | None = None,
+    journal: RunJournal | None = None,
 ) -> JobRunSummary:
     """Execute a prepared run, persist its summary, and update job state."""
     control = control_store.get_or_create(job_id)
-    summary = engine.run_job(
-        job_id=job_id,
-        devices=prepared.devices,
-        canary=prepared.canary,
-        commands_by_device=prepared.commands_by_device,
-        verify_commands_by_device=prepared.verify_commands_by_device,
-        config=prepared.config,
-        commands=commands,
-        verify_commands=verify_commands,
-        control=control,
-    )
+    try:
+        with volatile_line_rules(prepared.diff_ignore_patterns):
+            summary = engine.run_job(
+                job_id=job_id,
+                devices=prepared.devices,
+                canary=prepared.canary,
+                commands_by_device=prepared.commands_by_device,
+                verify_commands_by_device=prepared.verify_commands_by_device,
+                config=prepared.config,
+                commands=commands,
+                verify_commands=verify_commands,
+                control=control,
+                device_attributes=prepared.device_attributes,
+            )
+    finally:
+        if reservation is not None:
+            reservation.release()
     run_store.save(summary)
+    if journal is not None:
+        journal.finish_run(job_id, summary.status.value)
     event_name = SUMMARY_EVENT_BY_STATUS.get(summary.status.value)
     if event_name is not None:
         try:
@@ -19,16 +19,28 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from fastapi import HTTPException
 
 from backend_v2.app.api.schemas import RunJobRequest
 from backend_v2.app.application.command_template import render_commands
+from backend_v2.app.application.duration_history import SCHEDULE_ORDERS
 from backend_v2.app.application.execution_engine import ExecutionConfig
+from backend_v2.app.application.tracing import traced
+from backend_v2.app.application.rollout import (
+    FailureBudget,
+    normalize_wave_percentages,
+)
 from backend_v2.app.domain.models import DeviceTarget, JobRecord
+from backend_v2.app.infrastructure.file_preset_store import FilePresetStore
 from backend_v2.app.infrastructure.in_memory_device_store import InMemoryDeviceStore
 from backend_v2.app.infrastructure.in_memory_job_store import InMemoryJobStore
+from backend_v2.app.infrastructure.volatile_lines import validate_volatile_rules
+
+ENGINE_MODES = {"thread", "async"}
+FAILURE_BUDGET_SCOPES = {"run", "wave"}
+MAX_THREAD_CONCURRENCY = 100
 
 
 @dataclass(frozen=True)
@@ -41,6 +53,17 @@ class PreparedRun:
     commands_by_device: dict[str, list[str]]
     verify_commands_by_device: dict[str, list[str]]
     config: ExecutionConfig
+    engine_mode: str = "thread"
+    device_attributes: dict[str, dict[str, str]] = field(default_factory=dict)
+    diff_ignore_patterns: tuple[str, ...] = ()
+
+
+def checked_volatile_rules(rules: list[str]) -> list[str]:
+    """Validate diff ignore patterns; 400 naming the first invalid one."""
+    try:
+        return validate_volatile_rules(rules)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 def resolve_run_targets(
@@ -93,11 +116,13 @@ def resolve_run_targets(
     return devices, canary
 
 
+@traced("prepare_run")
 def prepare_run(
     job_id: str,
     payload: RunJobRequest,
     job_store: InMemoryJobStore,
     device_store: InMemoryDeviceStore,
+    preset_store: FilePresetStore | None = None,
 ) -> PreparedRun:
     """Validate a run request and render commands for each target device."""
     job = job_store.get(job_id)
@@ -120,10 +145,86 @@ def prepare_run(
             status_code=400,
             detail="verify_mode must be one of: all, canary, none",
         )
+    engine_mode = (payload.engine_mode or "thread").strip().lower()
+    if engine_mode not in ENGINE_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail="engine_mode must be one of: thread, async",
+        )
+    schedule_order = (payload.schedule_order or "longest_first").strip().lower()
+    if schedule_order not in SCHEDULE_ORDERS:
+        raise HTTPException(
+            status_code=400,
+            detail="schedule_order must be one of: longest_first, fifo",
+        )
+    peak_concurrency = payload.concurrency_limit
+    if payload.adaptive_concurrency:
+        concurrency_max = payload.concurrency_max or payload.concurrency_limit
+        if payload.concurrency_min > concurrency_max:
+            raise HTTPException(
+                status_code=400,
+                detail="concurrency_min cannot exceed concurrency_max",
+            )
+        peak_concurrency = max(peak_concurrency, concurrency_max)
+    if engine_mode == "thread" and peak_concurrency > MAX_THREAD_CONCURRENCY:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"concurrency above {MAX_THREAD_CONCURRENCY} "
+                "requires engine_mode=async"
+            ),
+        )
+    try:
+        waves = (
+            tuple(normalize_wave_percentages(payload.waves)) if payload.waves else ()
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    invalid_limits = [
+        name
+        for name, limit in payload.group_limits.items()
+        if not name.strip() or limit < 1
+    ]
+    if invalid_limits:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "group_limits must map attribute names to positive limits: "
+                + ", ".join(repr(name) for name in invalid_limits)
+            ),
+        )
+    failure_budget_scope = (payload.failure_budget_scope or "run").strip().lower()
+    if failure_budget_scope not in FAILURE_BUDGET_SCOPES:
+        raise HTTPException(
+            status_code=400,
+            detail="failure_budget_scope must be one of: run, wave",
+        )
+    failure_budget: FailureBudget | None = None
+    if payload.max_failures is not None or payload.max_failure_percent is not None:
+        failure_budget = FailureBudget(
+            max_failures=payload.max_failures,
+            max_failure_percent=payload.max_failure_percent,
+            per_wave=failure_budget_scope == "wave",
+        )
+    diff_ignore_patterns = list(payload.diff_ignore_patterns)
+    if payload.preset_id:
+        preset = preset_store.get(payload.preset_id) if preset_store else None
+        if preset is None:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown preset_id: {payload.preset_id}"
+            )
+        diff_ignore_patterns = [*preset.diff_ignore_patterns, *diff_ignore_patterns]
+    diff_ignore_patterns = checked_volatile_rules(diff_ignore_patterns)
     commands_by_device: dict[str, list[str]] = {}
     verify_commands_by_device: dict[str, list[str]] = {}
+    device_attributes: dict[str, dict[str, str]] = {}
     for device in devices:
         profile = device_store.get_by_key(device.key)
+        if profile is not None:
+            device_attributes[device.key] = {
+                **profile.host_vars,
+                "device_type": profile.device_type,
+            }
         merged_vars = dict(job.global_vars)
         if profile is not None:
             merged_vars.update(profile.host_vars)
@@ -155,6 +256,13 @@ def prepare_run(
         stop_on_error=payload.stop_on_error,
         non_canary_retry_limit=payload.non_canary_retry_limit,
         retry_backoff_seconds=payload.retry_backoff_seconds,
+        waves=waves,
+        adaptive_concurrency=payload.adaptive_concurrency,
+        concurrency_min=payload.concurrency_min,
+        concurrency_max=payload.concurrency_max,
+        group_limits=dict(payload.group_limits),
+        schedule_order=schedule_order,
+        failure_budget=failure_budget,
     )
     return PreparedRun(
         job=job,
@@ -163,4 +271,7 @@ def prepare_run(
         commands_by_device=commands_by_device,
         verify_commands_by_device=verify_commands_by_device,
         config=config,
+        engine_mode=engine_mode,
+        device_attributes=device_attributes,
+        diff_ignore_patterns=tuple(diff_ignore_patterns),
     )
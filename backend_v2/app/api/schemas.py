@@ -61,11 +61,23 @@ class RunJobRequest(BaseModel):
     verify_commands: Optional[List[str]] = None
     verify_mode: str = Field(default="all")
     imported_device_keys: Optional[List[str]] = None
-    concurrency_limit: int = Field(default=5, ge=1, le=100)
+    engine_mode: str = Field(default="thread")
+    concurrency_limit: int = Field(default=5, ge=1, le=5000)
+    adaptive_concurrency: bool = False
+    concurrency_min: int = Field(default=1, ge=1, le=5000)
+    concurrency_max: Optional[int] = Field(default=None, ge=1, le=5000)
+    group_limits: Dict[str, int] = Field(default_factory=dict)
+    schedule_order: str = Field(default="longest_first")
     stagger_delay: float = Field(default=0.0, ge=0.0, le=60.0)
     stop_on_error: bool = True
+    max_failures: Optional[int] = Field(default=None, ge=0)
+    max_failure_percent: Optional[float] = Field(default=None, ge=0.0, le=100.0)
+    failure_budget_scope: str = Field(default="run")
     non_canary_retry_limit: int = Field(default=1, ge=0, le=3)
     retry_backoff_seconds: float = Field(default=0.0, ge=0.0, le=60.0)
+    waves: List[float] = Field(default_factory=list, max_length=20)
+    preset_id: Optional[str] = None
+    diff_ignore_patterns: List[str] = Field(default_factory=list, max_length=100)
     model_config = ConfigDict(extra="allow")
 
 
@@ -84,6 +96,30 @@ class DeviceRunResponse(BaseModel):
     diff_truncated: bool = False
     diff_original_size: int = 0
     log_trimmed: bool = False
+    duration_seconds: float = 0.0
+    estimated_duration_seconds: Optional[float] = None
+    stage_timings: Dict[str, float] = Field(default_factory=dict)
+    session_source: Optional[str] = None
+
+
+class WaveRunResponse(BaseModel):
+    """Rollout wave progress."""
+
+    index: int
+    label: str
+    device_keys: List[str]
+    status: str
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
+class StagePercentilesResponse(BaseModel):
+    """p50/p95/p99 seconds of one execution stage."""
+
+    count: int
+    p50: float
+    p95: float
+    p99: float
 
 
 class RunJobResponse(BaseModel):
@@ -95,6 +131,51 @@ class RunJobResponse(BaseModel):
     verify_commands: List[str] = Field(default_factory=list)
     target_device_keys: List[str] = Field(default_factory=list)
     device_results: Dict[str, DeviceRunResponse]
+    waves: List[WaveRunResponse] = Field(default_factory=list)
+    schedule_order: List[str] = Field(default_factory=list)
+    status_counts: Dict[str, int] = Field(default_factory=dict)
+    stage_percentiles: Dict[str, StagePercentilesResponse] = Field(default_factory=dict)
+    stage_percentiles_by_device_type: Dict[str, Dict[str, StagePercentilesResponse]] = (
+        Field(default_factory=dict)
+    )
+    session_sources: Dict[str, int] = Field(default_factory=dict)
+    warm_session_hit_rate: Optional[float] = None
+
+
+class TraceSpanResponse(BaseModel):
+    """One span of a job trace placed on its waterfall."""
+
+    span_id: str
+    parent_id: Optional[str] = None
+    name: str
+    depth: int
+    offset_seconds: float
+    duration_seconds: float
+    attributes: Dict[str, str] = Field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class JobTraceResponse(BaseModel):
+    """Recorded spans of a job as a depth-first waterfall."""
+
+    job_id: str
+    total_seconds: float
+    spans: List[TraceSpanResponse] = Field(default_factory=list)
+
+
+class RunProgressResponse(BaseModel):
+    """Live progress of a run with its partial summary."""
+
+    job_id: str
+    status: str
+    total: int
+    started: int
+    finished: int
+    in_progress: int
+    pending: int
+    percent_complete: float
+    status_counts: Dict[str, int] = Field(default_factory=dict)
+    summary: RunJobResponse
 
 
 class PresetCreateRequest(BaseModel):
@@ -104,6 +185,7 @@ class PresetCreateRequest(BaseModel):
     os_model: str = Field(min_length=1, max_length=100)
     commands: List[str] = Field(min_length=1)
     verify_commands: List[str] = Field(default_factory=list)
+    diff_ignore_patterns: List[str] = Field(default_factory=list, max_length=100)
 
 
 class PresetUpdateRequest(BaseModel):
@@ -113,6 +195,8 @@ class PresetUpdateRequest(BaseModel):
     os_model: str = Field(min_length=1, max_length=100)
     commands: List[str] = Field(min_length=1)
     verify_commands: List[str] = Field(default_factory=list)
+    # Omitted (e.g. by the preset form) keeps the stored patterns.
+    diff_ignore_patterns: Optional[List[str]] = Field(default=None, max_length=100)
 
 
 class PresetResponse(BaseModel):
@@ -125,6 +209,7 @@ class PresetResponse(BaseModel):
     verify_commands: List[str]
     created_at: str
     updated_at: str
+    diff_ignore_patterns: List[str] = Field(default_factory=list)
 
 
 class DeviceProfileResponse(BaseModel):
@@ -141,6 +226,10 @@ class DeviceProfileResponse(BaseModel):
     prod: bool = False
     connection_ok: bool
     error_message: Optional[str] = None
+    jump_host: Optional[str] = None
+    jump_port: int = 22
+    jump_username: Optional[str] = None
+    jump_password: Optional[str] = None
 
 
 class FailedRowResponse(BaseModel):
@@ -190,6 +279,87 @@ class ActiveJobResponse(BaseModel):
     job: Optional[JobResponse] = None
 
 
+class DeviceLockResponse(BaseModel):
+    """One locked device and the job or status command holding it."""
+
+    device: str
+    owner: str
+
+
+class JobSessionShareResponse(BaseModel):
+    """One job's use of the global session budget."""
+
+    job_id: str
+    in_use: int
+    fair_share: int
+    waiting: bool
+
+
+class SessionBudgetResponse(BaseModel):
+    """Global device-session budget shared across concurrent jobs."""
+
+    total: int
+    in_use: int
+    jobs: List[JobSessionShareResponse] = Field(default_factory=list)
+
+
+class WorkerPoolResponse(BaseModel):
+    """Utilization of the shared session worker pool."""
+
+    capacity: int
+    active: int
+    queued: int
+    utilization: float
+    completed: int
+    mean_wait_seconds: float
+    max_wait_seconds: float
+    operation_quotas: Dict[str, int] = Field(default_factory=dict)
+    active_by_operation: Dict[str, int] = Field(default_factory=dict)
+    queued_by_operation: Dict[str, int] = Field(default_factory=dict)
+    active_by_owner: Dict[str, int] = Field(default_factory=dict)
+
+
+class SshSessionPoolResponse(BaseModel):
+    """Idle SSH sessions kept for reuse and their reuse counters."""
+
+    idle: int
+    warm_idle: int
+    checked_out: int
+    opened: int
+    reused: int
+    warm_reused: int
+    discarded: int
+
+
+class BastionPoolResponse(BaseModel):
+    """Bastion transports and the device channels multiplexed over them."""
+
+    bastions: int
+    transports: int
+    channels: int
+    opened_transports: int
+    opened_channels: int
+
+
+class SchedulerStateResponse(BaseModel):
+    """Cross-job scheduler state: worker pool, session budget and device locks."""
+
+    worker_pool: WorkerPoolResponse
+    session_budget: SessionBudgetResponse
+    ssh_sessions: SshSessionPoolResponse
+    bastions: BastionPoolResponse
+    device_locks: List[DeviceLockResponse] = Field(default_factory=list)
+
+
+class InterruptedRunResponse(BaseModel):
+    """Journaled run that started but never finished."""
+
+    job_id: str
+    job_name: str
+    finished_devices: int
+    remaining_devices: List[str] = Field(default_factory=list)
+
+
 class RuntimeModesResponse(BaseModel):
     """Runtime mode response."""
 
@@ -205,6 +375,8 @@ class AppResetCountsResponse(BaseModel):
     events: int
     run_results: int
     controls: int
+    duration_history: int = 0
+    run_journals: int = 0
 
 
 class AppResetResponse(BaseModel):
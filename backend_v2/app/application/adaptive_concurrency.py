@@ -0,0 +1,137 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""AIMD in-flight window driven by device latency and error codes."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+# Error codes that indicate shared infrastructure (AAA, bastion, WAN) is
+# saturated rather than a device-specific configuration problem.
+CONGESTION_ERROR_CODES = frozenset(
+    {
+        "connection_timeout",
+        "connection_error",
+        "device_timeout",
+        "command_timeout",
+    }
+)
+
+
+@dataclass(frozen=True)
+class WindowChange:
+    """One adjustment of the in-flight window."""
+
+    previous: int
+    current: int
+    reason: str
+
+
+class AimdConcurrencyController:
+    """Additive-increase / multiplicative-decrease in-flight window.
+
+    The window grows by ``increase_step`` after each full window of healthy
+    completions and shrinks by ``decrease_factor`` on a congestion signal:
+    a congestion ``error_code``, a completion slower than
+    ``latency_tolerance`` times the healthy latency baseline and at least
+    ``latency_floor_seconds`` above it (so sub-second jitter is ignored), or
+    a recent congestion rate above ``max_error_rate``. After a decrease, further
+    decreases wait for one window of completions so a burst of failures
+    already in flight collapses the window only once.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        increase_step: int = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        max_error_rate: float = 0.2,
+        sample_size: int = 20,
+        baseline_alpha: float = 0.2,
+        latency_floor_seconds: float = 0.5,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.window = min(self.maximum, max(self.minimum, initial))
+        self.increase_step = max(1, increase_step)
+        self.decrease_factor = min(0.95, max(0.05, decrease_factor))
+        self.latency_tolerance = max(1.0, latency_tolerance)
+        self.max_error_rate = max_error_rate
+        self.baseline_alpha = baseline_alpha
+        self.latency_floor_seconds = max(0.0, latency_floor_seconds)
+        self.baseline_latency: float | None = None
+        self._recent: deque[bool] = deque(maxlen=max(1, sample_size))
+        self._healthy_streak = 0
+        self._cooldown = 0
+
+    def _congestion_reason(
+        self, latency_seconds: float, error_code: str | None
+    ) -> str | None:
+        if error_code in CONGESTION_ERROR_CODES:
+            return f"error_code={error_code}"
+        if (
+            self.baseline_latency is not None
+            and self.baseline_latency > 0
+            and latency_seconds > self.baseline_latency * self.latency_tolerance
+            and latency_seconds - self.baseline_latency > self.latency_floor_seconds
+        ):
+            return (
+                f"latency {latency_seconds:.2f}s > "
+                f"{self.latency_tolerance:g}x baseline {self.baseline_latency:.2f}s"
+            )
+        if len(self._recent) == self._recent.maxlen:
+            rate = sum(1 for congested in self._recent if congested) / len(self._recent)
+            if rate > self.max_error_rate:
+                return f"congestion rate {rate:.0%}"
+        return None
+
+    def record(
+        self, latency_seconds: float, error_code: str | None
+    ) -> WindowChange | None:
+        """Feed one device completion; return the window change, if any."""
+        reason = self._congestion_reason(latency_seconds, error_code)
+        self._recent.append(error_code in CONGESTION_ERROR_CODES)
+        if self._cooldown > 0:
+            self._cooldown -= 1
+
+        if reason is None:
+            if self.baseline_latency is None:
+                self.baseline_latency = latency_seconds
+            else:
+                self.baseline_latency += self.baseline_alpha * (
+                    latency_seconds - self.baseline_latency
+                )
+            self._healthy_streak += 1
+            if self._healthy_streak < self.window or self.window >= self.maximum:
+                return None
+            self._healthy_streak = 0
+            previous = self.window
+            self.window = min(self.maximum, self.window + self.increase_step)
+            return WindowChange(previous, self.window, "healthy window")
+
+        self._healthy_streak = 0
+        if self._cooldown > 0 or self.window <= self.minimum:
+            return None
+        previous = self.window
+        self.window = max(self.minimum, int(self.window * self.decrease_factor))
+        self._cooldown = previous
+        return WindowChange(previous, self.window, reason)
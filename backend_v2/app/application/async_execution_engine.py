@@ -0,0 +1,403 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Asyncio-native execution engine for large device fleets."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock
+from typing import Protocol
+
+from backend_v2.app.application.duration_history import DurationHistory
+from backend_v2.app.application.events import EventPublisher, device_progress
+from backend_v2.app.application.metrics import BackendMetrics
+from backend_v2.app.application.tracing import in_current_context, span, traced
+from backend_v2.app.application.rate_limit import TokenBucket
+from backend_v2.app.application.run_journal import RunJournal
+from backend_v2.app.application.session_budget import FairShareSessionBudget
+from backend_v2.app.application.worker_pool import SessionWorkerPool
+from backend_v2.app.application.execution_control import ExecutionControl
+from backend_v2.app.application.execution_engine import (
+    DeviceWorker,
+    ExecutionConfig,
+    ExecutionEngine,
+    RunSummaryStore,
+)
+from backend_v2.app.application.rollout import (
+    FanoutScheduler,
+    PlannedWave,
+    RunScheduling,
+)
+from backend_v2.app.domain.models import (
+    DeviceExecutionResult,
+    DeviceTarget,
+    JobRunSummary,
+)
+
+DEFAULT_BRIDGE_WORKERS = 64
+
+
+class AsyncDeviceWorker(Protocol):
+    """Worker that can execute one device without blocking the event loop."""
+
+    async def run_async(
+        self,
+        device: DeviceTarget,
+        commands: list[str],
+        verify_commands: list[str] | None = None,
+    ) -> DeviceExecutionResult:
+        """Execute commands on one device and return result."""
+
+
+class AsyncExecutionEngine(ExecutionEngine):
+    """Canary-first orchestration scheduled on an asyncio event loop.
+
+    In-flight devices are asyncio tasks rather than OS threads. Workers that
+    expose a coroutine ``run_async`` run directly on the loop; blocking
+    ``DeviceWorker.run`` implementations are bridged through the shared
+    session pool, or a bounded thread pool owned by this engine without one.
+    """
+
+    def __init__(
+        self,
+        worker: DeviceWorker,
+        publisher: EventPublisher | None = None,
+        bridge_workers: int = DEFAULT_BRIDGE_WORKERS,
+        history: DurationHistory | None = None,
+        connection_limiter: TokenBucket | None = None,
+        session_budget: FairShareSessionBudget | None = None,
+        pool: SessionWorkerPool | None = None,
+        journal: RunJournal | None = None,
+        summary_store: RunSummaryStore | None = None,
+        metrics: BackendMetrics | None = None,
+    ):
+        super().__init__(
+            worker=worker,
+            publisher=publisher,
+            history=history,
+            connection_limiter=connection_limiter,
+            session_budget=session_budget,
+            pool=pool,
+            journal=journal,
+            summary_store=summary_store,
+            metrics=metrics,
+        )
+        self.bridge_workers = max(1, bridge_workers)
+        self._bridge_lock = Lock()
+        self._bridge: ThreadPoolExecutor | None = None
+
+    def _bridge_executor(
+        self, job_id: str | None = None, max_concurrency: int | None = None
+    ) -> Executor:
+        """Shared session pool when configured, else this engine's bridge threads.
+
+        On the shared pool ``max_concurrency`` caps the run's slots, as the
+        thread engine does.
+        """
+        if self.pool is not None:
+            return self.pool.executor(
+                "run", job_id or "async-bridge", limit=max_concurrency
+            )
+        with self._bridge_lock:
+            if self._bridge is None:
+                self._bridge = ThreadPoolExecutor(
+                    max_workers=self.bridge_workers,
+                    thread_name_prefix="nw-edit-bridge",
+                )
+            return self._bridge
+
+    def shutdown(self) -> None:
+        """Release bridge threads."""
+        with self._bridge_lock:
+            bridge, self._bridge = self._bridge, None
+        if bridge is not None:
+            bridge.shutdown(wait=False)
+
+    async def _call_worker(
+        self,
+        device: DeviceTarget,
+        commands: list[str],
+        verify_commands: list[str],
+        job_id: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> DeviceExecutionResult:
+        run_async = getattr(self.worker, "run_async", None)
+        if run_async is not None and inspect.iscoroutinefunction(run_async):
+            result: DeviceExecutionResult = await run_async(
+                device=device,
+                commands=commands,
+                verify_commands=verify_commands,
+            )
+            return result
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._bridge_executor(job_id, max_concurrency),
+            in_current_context(
+                lambda: self.worker.run(
+                    device=device,
+                    commands=commands,
+                    verify_commands=verify_commands,
+                )
+            ),
+        )
+
+    async def _run_attempt_async(
+        self,
+        device: DeviceTarget,
+        commands_by_device: dict[str, list[str]],
+        verify_commands_by_device: dict[str, list[str]] | None,
+        attempt: int,
+        retry_limit: int,
+        control: ExecutionControl | None = None,
+        job_id: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> DeviceExecutionResult:
+        if control and control.cancel_event.is_set():
+            return DeviceExecutionResult(
+                status="cancelled",
+                error="Execution cancelled",
+                attempts=attempt,
+            )
+        commands, verify_commands = self._device_commands(
+            device, commands_by_device, verify_commands_by_device
+        )
+        self._emit_attempt_start(
+            job_id, device, attempt - 1, retry_limit, commands, verify_commands
+        )
+        started = time.monotonic()
+        with span(
+            "device_attempt", device=device.key, attempt=attempt
+        ) as current, device_progress(self._progress_reporter(job_id, device)):
+            result = await self._call_worker(
+                device, commands, verify_commands, job_id, max_concurrency
+            )
+            if current is not None:
+                current.set_attribute("status", result.status)
+        result.duration_seconds = time.monotonic() - started
+        self._emit_attempt_result(job_id, device, result)
+        result.attempts = attempt
+        return result
+
+    @staticmethod
+    def _control_signal(
+        control: ExecutionControl | None,
+    ) -> tuple[asyncio.Event, Callable[[], None]]:
+        """Loop-local event set whenever ``control`` changes (from any thread)."""
+        signal = asyncio.Event()
+        if control is None:
+            return signal, lambda: None
+        loop = asyncio.get_running_loop()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(signal.set)
+
+        return signal, control.add_listener(wake)
+
+    @staticmethod
+    async def _await_signal_or_tasks(
+        signal: asyncio.Event,
+        tasks: list[asyncio.Task[DeviceExecutionResult]],
+        timeout: float | None,
+    ) -> None:
+        """Return when a task finishes, ``signal`` is set, or ``timeout`` passes."""
+        waiter = asyncio.ensure_future(signal.wait())
+        try:
+            await asyncio.wait(
+                [*tasks, waiter], timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            waiter.cancel()
+
+    async def _run_wave_async(
+        self,
+        wave: PlannedWave,
+        summary: JobRunSummary,
+        commands_by_device: dict[str, list[str]],
+        verify_commands_by_device: dict[str, list[str]] | None,
+        config: ExecutionConfig,
+        control: ExecutionControl | None,
+        scheduling: RunScheduling,
+    ) -> FanoutScheduler | None:
+        """Fan out one wave as concurrent tasks; return None when cancelled."""
+        scheduler = self._new_scheduler(summary, wave, config, scheduling)
+        in_flight: dict[asyncio.Task[DeviceExecutionResult], DeviceTarget] = {}
+        signal, remove_listener = self._control_signal(control)
+        try:
+            while scheduler.has_work():
+                signal.clear()
+                if self._cancel_requested(control):
+                    self._report_control_latency(summary.job_id, control, "cancel")
+                    return None
+                paused = bool(control and control.pause_event.is_set())
+                if not paused:
+                    self._report_control_latency(summary.job_id, control, "resume")
+                while not paused and not self._cancel_requested(control):
+                    device = scheduler.next_device()
+                    if device is None:
+                        break
+                    attempt = scheduler.attempts[device.key]
+                    if attempt == 1:
+                        self._start_device(summary, device)
+                    task = asyncio.create_task(
+                        self._run_attempt_async(
+                            device,
+                            commands_by_device,
+                            verify_commands_by_device,
+                            attempt,
+                            config.non_canary_retry_limit,
+                            control,
+                            summary.job_id,
+                            config.max_concurrency,
+                        )
+                    )
+                    in_flight[task] = device
+
+                wakeup = None if paused else scheduler.next_wakeup()
+                if not in_flight and wakeup is None and not paused:
+                    break
+                await self._await_signal_or_tasks(signal, list(in_flight), wakeup)
+                for task in [task for task in in_flight if task.done()]:
+                    device = in_flight.pop(task)
+                    result = task.result()
+                    self._settle_attempt(summary, scheduler, device, result, config)
+                    if result.status == "cancelled":
+                        self._report_control_latency(summary.job_id, control, "cancel")
+                        return None
+        finally:
+            remove_listener()
+            # Let already-started devices finish so they are not abandoned
+            # mid-session when the wave exits early, and record what they did.
+            if in_flight:
+                await asyncio.gather(*in_flight.keys(), return_exceptions=True)
+                for task, device in in_flight.items():
+                    if not task.cancelled() and task.exception() is None:
+                        self._settle_attempt(
+                            summary, scheduler, device, task.result(), config
+                        )
+            self._record_abandoned_retries(summary, scheduler)
+        return scheduler
+
+    async def run_job_async(
+        self,
+        job_id: str,
+        devices: list[DeviceTarget],
+        canary: DeviceTarget,
+        commands_by_device: dict[str, list[str]],
+        verify_commands_by_device: dict[str, list[str]] | None,
+        config: ExecutionConfig,
+        commands: list[str] | None = None,
+        verify_commands: list[str] | None = None,
+        control: ExecutionControl | None = None,
+        device_attributes: dict[str, dict[str, str]] | None = None,
+    ) -> JobRunSummary:
+        """Run a job on the current event loop and return aggregated summary."""
+        summary, proceed = self._begin_run(
+            job_id,
+            devices,
+            canary,
+            commands,
+            verify_commands,
+            control,
+            device_attributes,
+        )
+        if not proceed:
+            return summary
+        planned = self._plan_rollout(summary, devices, canary, config)
+        lease, remove_lease_listener = self._open_session_lease(job_id, control)
+        try:
+            # 1) Canary first, no retry.
+            self._start_canary(summary, canary)
+            signal, remove_listener = self._control_signal(control)
+            try:
+                while True:
+                    signal.clear()
+                    wait_for = self._canary_token_wait(lease)
+                    if wait_for <= 0 or self._cancel_requested(control):
+                        break
+                    await self._await_signal_or_tasks(signal, [], wait_for)
+            finally:
+                remove_listener()
+            canary_result = await self._run_attempt_async(
+                device=canary,
+                commands_by_device=commands_by_device,
+                verify_commands_by_device=verify_commands_by_device,
+                attempt=1,
+                retry_limit=0,
+                control=control,
+                job_id=job_id,
+                max_concurrency=config.max_concurrency,
+            )
+            if lease is not None and wait_for <= 0:
+                lease.release()
+            self._record_result(summary, canary, canary_result)
+            if not self._canary_gate(summary, canary_result):
+                return summary
+
+            # 2) Release remaining devices wave by wave as concurrent tasks.
+            scheduling = self._build_scheduling(config, device_attributes, lease)
+            for wave in planned:
+                self._open_wave(summary, wave.index)
+                scheduler = await self._run_wave_async(
+                    wave,
+                    summary,
+                    commands_by_device,
+                    verify_commands_by_device,
+                    config,
+                    control,
+                    scheduling,
+                )
+                if not self._wave_gate(summary, wave, scheduler, config, control):
+                    return summary
+
+            return self._finish(summary, self._final_status(summary, control))
+        finally:
+            self._close_session_lease(lease, remove_lease_listener)
+
+    @traced("run_job")
+    def run_job(
+        self,
+        job_id: str,
+        devices: list[DeviceTarget],
+        canary: DeviceTarget,
+        commands_by_device: dict[str, list[str]],
+        verify_commands_by_device: dict[str, list[str]] | None,
+        config: ExecutionConfig,
+        commands: list[str] | None = None,
+        verify_commands: list[str] | None = None,
+        control: ExecutionControl | None = None,
+        device_attributes: dict[str, dict[str, str]] | None = None,
+    ) -> JobRunSummary:
+        """Run a job on a dedicated event loop (blocking caller thread)."""
+        return asyncio.run(
+            self.run_job_async(
+                job_id=job_id,
+                devices=devices,
+                canary=canary,
+                commands_by_device=commands_by_device,
+                verify_commands_by_device=verify_commands_by_device,
+                config=config,
+                commands=commands,
+                verify_commands=verify_commands,
+                control=control,
+                device_attributes=device_attributes,
+            )
+        )
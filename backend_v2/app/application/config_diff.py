@@ -0,0 +1,249 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Section-aware patience diff producing ``difflib``-style unified diffs."""
+
+from __future__ import annotations
+
+import difflib
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterator, Sequence
+
+# Anchorless regions up to this many line pairs are aligned with difflib;
+# larger ones are reported as a straight replacement.
+FALLBACK_MAX_PAIRS = 250_000
+
+Opcode = tuple[str, int, int, int, int]
+
+
+def _intern(lines: Sequence[object], table: dict[object, int]) -> list[int]:
+    return [table.setdefault(line, len(table)) for line in lines]
+
+
+def _longest_increasing(pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Longest run of ``pairs`` (sorted by a) whose b values also increase."""
+    tails: list[int] = []
+    tail_index: list[int] = []
+    previous: list[int] = []
+    for index, (_, b) in enumerate(pairs):
+        pile = bisect_left(tails, b)
+        if pile == len(tails):
+            tails.append(b)
+            tail_index.append(index)
+        else:
+            tails[pile] = b
+            tail_index[pile] = index
+        previous.append(tail_index[pile - 1] if pile else -1)
+    result: list[tuple[int, int]] = []
+    index = tail_index[-1] if tail_index else -1
+    while index >= 0:
+        result.append(pairs[index])
+        index = previous[index]
+    result.reverse()
+    return result
+
+
+def _matching_blocks(a: list[int], b: list[int]) -> list[tuple[int, int, int]]:
+    """Patience-diff matches between two interned sequences."""
+    blocks: list[tuple[int, int, int]] = []
+    regions = [(0, len(a), 0, len(b))]
+    while regions:
+        alo, ahi, blo, bhi = regions.pop()
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            blocks.append((alo, blo, 1))
+            alo += 1
+            blo += 1
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            blocks.append((ahi, bhi, 1))
+        if alo == ahi or blo == bhi:
+            continue
+
+        a_counts = Counter(a[alo:ahi])
+        b_positions: dict[int, int] = {}
+        b_counts = Counter(b[blo:bhi])
+        for j in range(blo, bhi):
+            if b_counts[b[j]] == 1:
+                b_positions[b[j]] = j
+        anchors = _longest_increasing(
+            [
+                (i, b_positions[a[i]])
+                for i in range(alo, ahi)
+                if a_counts[a[i]] == 1 and a[i] in b_positions
+            ]
+        )
+        if not anchors:
+            if (ahi - alo) * (bhi - blo) <= FALLBACK_MAX_PAIRS:
+                matcher = difflib.SequenceMatcher(
+                    None, a[alo:ahi], b[blo:bhi], autojunk=False
+                )
+                blocks.extend(
+                    (alo + i, blo + j, size)
+                    for i, j, size in matcher.get_matching_blocks()
+                    if size
+                )
+            continue
+        for i, j in anchors:
+            regions.append((alo, i, blo, j))
+            blocks.append((i, j, 1))
+            alo, blo = i + 1, j + 1
+        regions.append((alo, ahi, blo, bhi))
+    return sorted(blocks)
+
+
+def _sections(lines: Sequence[str]) -> list[tuple[int, int]]:
+    """Split lines into top-level sections: an unindented line and its body."""
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    for index in range(1, len(lines)):
+        line = lines[index]
+        if line.strip() and not line[0].isspace():
+            bounds.append((start, index))
+            start = index
+    if lines:
+        bounds.append((start, len(lines)))
+    return bounds
+
+
+def _section_blocks(
+    a: list[int], b: list[int], a_lines: Sequence[str], b_lines: Sequence[str]
+) -> list[tuple[int, int, int]]:
+    """Match identical sections first, then diff the lines of the gaps."""
+    a_bounds = _sections(a_lines)
+    b_bounds = _sections(b_lines)
+    table: dict[object, int] = {}
+    section_blocks = _matching_blocks(
+        _intern([tuple(a[lo:hi]) for lo, hi in a_bounds], table),
+        _intern([tuple(b[lo:hi]) for lo, hi in b_bounds], table),
+    )
+    blocks: list[tuple[int, int, int]] = []
+    a_pos = b_pos = 0
+    section_blocks.append((len(a_bounds), len(b_bounds), 0))
+    for i, j, size in section_blocks:
+        a_start = a_bounds[i][0] if i < len(a_bounds) else len(a)
+        b_start = b_bounds[j][0] if j < len(b_bounds) else len(b)
+        blocks.extend(
+            (a_pos + x, b_pos + y, n)
+            for x, y, n in _matching_blocks(a[a_pos:a_start], b[b_pos:b_start])
+        )
+        if size:
+            a_end = a_bounds[i + size - 1][1]
+            blocks.append((a_start, b_start, a_end - a_start))
+            a_pos, b_pos = a_end, b_start + (a_end - a_start)
+    return blocks
+
+
+def _opcodes(
+    blocks: list[tuple[int, int, int]], a_len: int, b_len: int
+) -> list[Opcode]:
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for ai, bj, size in [*blocks, (a_len, b_len, 0)]:
+        tag = ""
+        if i < ai and j < bj:
+            tag = "replace"
+        elif i < ai:
+            tag = "delete"
+        elif j < bj:
+            tag = "insert"
+        if tag:
+            opcodes.append((tag, i, ai, j, bj))
+        if size:
+            if opcodes and opcodes[-1][0] == "equal":
+                _, i1, _, j1, _ = opcodes.pop()
+                opcodes.append(("equal", i1, ai + size, j1, bj + size))
+            else:
+                opcodes.append(("equal", ai, ai + size, bj, bj + size))
+        i, j = ai + size, bj + size
+    return opcodes
+
+
+def _grouped(opcodes: list[Opcode], context: int) -> Iterator[list[Opcode]]:
+    """Hunks of ``opcodes`` with ``context`` lines around each change."""
+    if not opcodes:
+        return
+    codes = list(opcodes)
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > context * 2:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    return f"{start + 1 if length else start},{length}"
+
+
+def unified_config_diff(
+    pre: str,
+    post: str,
+    from_label: str = "pre",
+    to_label: str = "post",
+    context: int = 3,
+    sections: bool = True,
+) -> str:
+    """Unified diff of two outputs in ``difflib.unified_diff`` format.
+
+    Identical outputs return immediately. Lines are interned to integers and
+    aligned with patience diff; with ``sections`` unchanged top-level
+    sections (an unindented line plus its indented body) are matched as
+    single tokens first so only changed sections are diffed line by line.
+    """
+    if pre == post:
+        return ""
+    a_lines = pre.splitlines(keepends=True)
+    b_lines = post.splitlines(keepends=True)
+    table: dict[object, int] = {}
+    a = _intern(a_lines, table)
+    b = _intern(b_lines, table)
+    if sections:
+        blocks = _section_blocks(a, b, a_lines, b_lines)
+    else:
+        blocks = _matching_blocks(a, b)
+
+    out = [f"--- {from_label}\n", f"+++ {to_label}\n"]
+    hunks = 0
+    for group in _grouped(_opcodes(blocks, len(a), len(b)), context):
+        hunks += 1
+        first, last = group[0], group[-1]
+        out.append(
+            f"@@ -{_format_range(first[1], last[2])} "
+            f"+{_format_range(first[3], last[4])} @@\n"
+        )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                out.extend(" " + line for line in a_lines[i1:i2])
+                continue
+            out.extend("-" + line for line in a_lines[i1:i2])
+            out.extend("+" + line for line in b_lines[j1:j2])
+    return "".join(out) if hunks else ""
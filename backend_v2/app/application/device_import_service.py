@@ -21,14 +21,19 @@ from __future__ import annotations
 
 import csv
 import io
-from concurrent.futures import ThreadPoolExecutor
-from concurrent.futures import as_completed
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 import json
 import re
+import time
 from dataclasses import dataclass, field
 from typing import Callable
 from typing import Protocol
+from uuid import uuid4
 
+from backend_v2.app.application.metrics import BackendMetrics
+from backend_v2.app.application.rate_limit import TokenBucket
+from backend_v2.app.application.worker_pool import SessionWorkerPool
 from backend_v2.app.domain.models import DeviceProfile
 from backend_v2.app.infrastructure.in_memory_device_store import InMemoryDeviceStore
 
@@ -66,15 +71,62 @@ class DeviceImportService:
         "generic_linux": "linux",
         "generic-linux": "linux",
     }
-    _EXCLUDED_DEFAULT_VAR_COLUMNS = {"password", "host_vars", "verify_cmds"}
+    _EXCLUDED_DEFAULT_VAR_COLUMNS = {
+        "password",
+        "jump_password",
+        "host_vars",
+        "verify_cmds",
+    }
 
     def __init__(
-        self, store: InMemoryDeviceStore, validator: DeviceConnectionValidator
+        self,
+        store: InMemoryDeviceStore,
+        validator: DeviceConnectionValidator,
+        pool: SessionWorkerPool | None = None,
+        metrics: BackendMetrics | None = None,
+        rate_limiter: TokenBucket | None = None,
     ):
         self.store = store
         self.validator = validator
+        # Validation sessions count against the shared pool when configured.
+        self.pool = pool
+        self.metrics = metrics
+        # Shared with run execution; tokens are taken before a validation is
+        # submitted, so waiting for one never holds a shared pool slot.
+        self.rate_limiter = rate_limiter
         self._var_name_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
+    def _validate(self, device: DeviceProfile) -> tuple[bool, str | None]:
+        if self.metrics is None:
+            return self.validator.validate(device)
+        started = time.monotonic()
+        ok, error = self.validator.validate(device)
+        self.metrics.import_validated(ok, time.monotonic() - started)
+        return ok, error
+
+    def _submit_ready(
+        self,
+        executor: Executor,
+        pending: list[tuple[int, tuple[int, dict[str, str], DeviceProfile]]],
+        future_map: dict[
+            Future[tuple[bool, str | None]],
+            tuple[int, tuple[int, dict[str, str], DeviceProfile]],
+        ],
+    ) -> float:
+        """Submit validations that have a connection token; return the token wait.
+
+        At most ``IMPORT_VALIDATION_WORKERS`` are in flight, so a submitted
+        validation starts promptly instead of queueing with its token spent.
+        """
+        while pending and len(future_map) < self.IMPORT_VALIDATION_WORKERS:
+            if self.rate_limiter is not None:
+                token_wait = self.rate_limiter.try_acquire()
+                if token_wait > 0:
+                    return token_wait
+            index, entry = pending.pop()
+            future_map[executor.submit(self._validate, entry[2])] = (index, entry)
+        return 0.0
+
     def _normalize_device_type(self, device_type: str) -> str:
         canonical = device_type.strip()
         alias = self._DEVICE_TYPE_ALIASES.get(canonical.lower())
@@ -195,6 +247,19 @@ class DeviceImportService:
                 )
                 continue
 
+            jump_port_raw = normalized.get("jump_port", "")
+            try:
+                jump_port = int(jump_port_raw or "22")
+            except ValueError:
+                failures.append(
+                    FailedRow(
+                        row_number=row_number,
+                        row=normalized,
+                        error=f"Invalid jump_port value: {jump_port_raw}",
+                    )
+                )
+                continue
+
             verify_cmds = [
                 cmd.strip()
                 for cmd in (normalized.get("verify_cmds") or "").split(";")
@@ -264,6 +329,10 @@ class DeviceImportService:
                         verify_cmds=verify_cmds,
                         host_vars=host_vars,
                         prod=prod,
+                        jump_host=normalized.get("jump_host") or None,
+                        jump_port=jump_port,
+                        jump_username=normalized.get("jump_username") or None,
+                        jump_password=normalized.get("jump_password") or None,
                     ),
                 )
             )
@@ -275,30 +344,47 @@ class DeviceImportService:
         if progress_callback is not None:
             progress_callback({"type": "start", "total": len(indexed_devices)})
         processed = 0
-        with ThreadPoolExecutor(max_workers=self.IMPORT_VALIDATION_WORKERS) as executor:
-            future_map = {
-                executor.submit(self.validator.validate, entry[2]): (index, entry)
-                for index, entry in indexed_devices
-            }
-            for future in as_completed(future_map):
-                index, entry = future_map[future]
-                ok, error = future.result()
-                row_number, row, device = entry
-                processed += 1
-                device.connection_ok = ok
-                device.error_message = error
-                if progress_callback is not None:
-                    progress_callback(
-                        {
-                            "type": "progress",
-                            "processed": processed,
-                            "total": len(indexed_devices),
-                            "host": device.host,
-                            "port": device.port,
-                            "connection_ok": ok,
-                        }
-                    )
-                validation_results[index] = (row_number, row, device, ok, error)
+        executor: Executor
+        if self.pool is not None:
+            executor = self.pool.executor(
+                "import",
+                f"import:{uuid4().hex[:8]}",
+                limit=self.IMPORT_VALIDATION_WORKERS,
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.IMPORT_VALIDATION_WORKERS)
+        pending = list(reversed(indexed_devices))
+        future_map: dict[
+            Future[tuple[bool, str | None]],
+            tuple[int, tuple[int, dict[str, str], DeviceProfile]],
+        ] = {}
+        with executor:
+            while pending or future_map:
+                token_wait = self._submit_ready(executor, pending, future_map)
+                done, _ = wait_futures(
+                    future_map,
+                    timeout=token_wait or None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    index, entry = future_map.pop(future)
+                    ok, error = future.result()
+                    row_number, row, device = entry
+                    processed += 1
+                    device.connection_ok = ok
+                    device.error_message = error
+                    if progress_callback is not None:
+                        progress_callback(
+                            {
+                                "type": "progress",
+                                "processed": processed,
+                                "total": len(indexed_devices),
+                                "host": device.host,
+                                "port": device.port,
+                                "connection_ok": ok,
+                            }
+                        )
+                    validation_results[index] = (row_number, row, device, ok, error)
 
         valid_devices: list[DeviceProfile] = []
         for index in sorted(validation_results):
@@ -0,0 +1,56 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Per-device duration history used to order fan-out longest first."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from backend_v2.app.domain.models import DeviceTarget
+
+SCHEDULE_ORDERS = frozenset({"fifo", "longest_first"})
+
+
+class DurationHistory(Protocol):
+    """Expected execution time per device key, learned from past runs."""
+
+    def estimate(self, device_key: str) -> float | None:
+        """Return expected seconds for a device, or None when never seen."""
+
+    def record(self, device_key: str, duration_seconds: float) -> None:
+        """Fold one observed execution time into the history."""
+
+
+def estimate_durations(
+    devices: list[DeviceTarget], history: DurationHistory
+) -> dict[str, float]:
+    """Expected seconds per device; unseen devices get the mean of known ones."""
+    known = {
+        device.key: estimate
+        for device in devices
+        if (estimate := history.estimate(device.key)) is not None
+    }
+    fallback = sum(known.values()) / len(known) if known else 0.0
+    return {device.key: known.get(device.key, fallback) for device in devices}
+
+
+def order_longest_first(
+    devices: list[DeviceTarget], estimates: dict[str, float]
+) -> list[DeviceTarget]:
+    """Sort devices by expected duration, longest first, keeping input order on ties."""
+    return sorted(devices, key=lambda device: -estimates.get(device.key, 0.0))
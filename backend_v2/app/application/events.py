@@ -19,10 +19,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Protocol
 
+ProgressCallback = Callable[[str, str], None]
+
+_progress: ContextVar[ProgressCallback | None] = ContextVar(
+    "nw_edit_device_progress", default=None
+)
+
 
 def utc_now() -> str:
     """UTC timestamp in ISO format."""
@@ -46,3 +55,20 @@ class EventPublisher(Protocol):
 
     def publish(self, event: ExecutionEvent) -> None:
         """Publish one event."""
+
+
+@contextmanager
+def device_progress(callback: ProgressCallback) -> Iterator[None]:
+    """Route ``report_progress`` calls made in this context to ``callback``."""
+    token = _progress.set(callback)
+    try:
+        yield
+    finally:
+        _progress.reset(token)
+
+
+def report_progress(status: str, message: str) -> None:
+    """Report progress of the device attempt running in this context, if any."""
+    callback = _progress.get()
+    if callback is not None:
+        callback(status, message)
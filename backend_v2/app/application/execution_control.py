@@ -17,12 +17,106 @@
 # Review required for correctness, security, and licensing.
 """Execution control flags for pause/cancel behavior."""
 
-from threading import Event
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from threading import Condition, Event
+
+
+class _SignalEvent(Event):
+    """Event that notifies its owning control whenever it changes state."""
+
+    def __init__(self, on_change: Callable[[str, bool], None], name: str) -> None:
+        super().__init__()
+        self._on_change = on_change
+        self._name = name
+
+    def set(self) -> None:
+        was_set = self.is_set()
+        super().set()
+        if not was_set:
+            self._on_change(self._name, True)
+
+    def clear(self) -> None:
+        was_set = self.is_set()
+        super().clear()
+        if was_set:
+            self._on_change(self._name, False)
 
 
 class ExecutionControl:
-    """Control flags shared with execution engine."""
+    """Control flags shared with execution engine.
+
+    ``pause_event`` / ``cancel_event`` remain plain ``Event`` objects for
+    callers, but every change also bumps ``generation`` and wakes waiters so
+    schedulers block on one condition instead of polling. Anything else that
+    should wake a scheduler (a device finishing) calls ``notify``.
+    """
 
     def __init__(self) -> None:
-        self.pause_event = Event()
-        self.cancel_event = Event()
+        self._condition = Condition()
+        self._generation = 0
+        self._listeners: list[Callable[[], None]] = []
+        self._requested_at: dict[str, float] = {}
+        self.pause_event = _SignalEvent(self._on_flag_change, "pause")
+        self.cancel_event = _SignalEvent(self._on_flag_change, "cancel")
+
+    def _on_flag_change(self, name: str, is_set: bool) -> None:
+        now = time.monotonic()
+        with self._condition:
+            if name == "cancel" and is_set:
+                self._requested_at["cancel"] = now
+            elif name == "pause" and not is_set and not self.cancel_event.is_set():
+                self._requested_at["resume"] = now
+            elif name == "pause" and is_set:
+                self._requested_at.pop("resume", None)
+        self.notify()
+
+    def reset(self) -> None:
+        """Clear pause/cancel before a new run without recording requests."""
+        self.cancel_event.clear()
+        self.pause_event.clear()
+        with self._condition:
+            self._requested_at.clear()
+
+    @property
+    def generation(self) -> int:
+        with self._condition:
+            return self._generation
+
+    def notify(self) -> None:
+        """Wake every scheduler waiting on this control."""
+        with self._condition:
+            self._generation += 1
+            listeners = list(self._listeners)
+            self._condition.notify_all()
+        for listener in listeners:
+            listener()
+
+    def wait_for_signal(self, since_generation: int, timeout: float | None) -> bool:
+        """Block until ``notify`` runs after ``since_generation`` or timeout."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._generation != since_generation, timeout
+            )
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call ``listener`` on every notify; return a function that removes it."""
+        with self._condition:
+            self._listeners.append(listener)
+
+        def remove() -> None:
+            with self._condition:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return remove
+
+    def acknowledge(self, kind: str) -> float | None:
+        """Return seconds since a ``resume``/``cancel`` request, once per request."""
+        with self._condition:
+            requested_at = self._requested_at.pop(kind, None)
+        if requested_at is None:
+            return None
+        return time.monotonic() - requested_at
@@ -20,17 +20,59 @@
 from __future__ import annotations
 
 import time
-from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
 from typing import Protocol
 
+from backend_v2.app.application.adaptive_concurrency import (
+    AimdConcurrencyController,
+    WindowChange,
+)
+from backend_v2.app.application.duration_history import (
+    DurationHistory,
+    estimate_durations,
+    order_longest_first,
+)
 from backend_v2.app.application.execution_control import ExecutionControl
-from backend_v2.app.application.events import EventPublisher, ExecutionEvent, utc_now
+from backend_v2.app.application.metrics import BackendMetrics
+from backend_v2.app.application.tracing import in_current_context, span, traced
+from backend_v2.app.application.events import (
+    EventPublisher,
+    ExecutionEvent,
+    ProgressCallback,
+    device_progress,
+    utc_now,
+)
+from backend_v2.app.application.rate_limit import TokenBucket
+from backend_v2.app.application.retry_policy import backoff_delay, is_retryable
+from backend_v2.app.application.run_journal import RunJournal
+from backend_v2.app.application.rollout import (
+    FailureBudget,
+    FanoutScheduler,
+    GroupLimiter,
+    PlannedWave,
+    RunScheduling,
+    plan_waves,
+)
+from backend_v2.app.application.session_budget import (
+    SESSION_RETRY_SECONDS,
+    FairShareSessionBudget,
+    SessionLease,
+)
+from backend_v2.app.application.worker_pool import SessionWorkerPool
 from backend_v2.app.domain.models import (
     DeviceExecutionResult,
     DeviceTarget,
     JobRunSummary,
     JobStatus,
+    WaveSummary,
 )
 
 
@@ -51,18 +93,79 @@ class ExecutionConfig:
     """Runtime behavior for the execution engine."""
 
     concurrency_limit: int = 5
+    # Minimum spacing between device session opens within one run, enforced
+    # by a token bucket rather than sleeping in the scheduler loop.
     stagger_delay: float = 0.0
     stop_on_error: bool = True
     non_canary_retry_limit: int = 1
+    # Base of the jittered exponential backoff between attempts; a device
+    # waiting to retry does not hold a concurrency slot.
     retry_backoff_seconds: float = 0.0
+    # Cumulative percentages of non-canary devices released per wave, e.g.
+    # (1, 10, 50, 100). Empty means one wave with every remaining device.
+    waves: tuple[float, ...] = ()
+    # AIMD window between concurrency_min and concurrency_max, starting at
+    # concurrency_limit. concurrency_max defaults to concurrency_limit.
+    adaptive_concurrency: bool = False
+    concurrency_min: int = 1
+    concurrency_max: int | None = None
+    # Per-attribute caps keyed on host_vars/device_type, e.g. {"site": 4}.
+    group_limits: dict[str, int] = field(default_factory=dict)
+    # "longest_first" starts devices with the largest expected duration first
+    # (from the engine's duration history); "fifo" keeps import order.
+    schedule_order: str = "longest_first"
+    # Failures tolerated before scheduling stops; overrides stop_on_error
+    # when set (stop_on_error alone is a budget of zero failures).
+    failure_budget: FailureBudget | None = None
+
+    @property
+    def max_concurrency(self) -> int:
+        """Upper bound of simultaneously running devices."""
+        limit = max(1, self.concurrency_limit)
+        if self.adaptive_concurrency and self.concurrency_max is not None:
+            return max(limit, self.concurrency_max)
+        return limit
+
+
+class RunSummaryStore(Protocol):
+    """Receives the live summary when a run begins so partial results are readable."""
+
+    def save(self, summary: JobRunSummary) -> None:
+        """Store the summary for its job."""
 
 
 class ExecutionEngine:
     """Canary-first orchestration with controlled parallel fan-out."""
 
-    def __init__(self, worker: DeviceWorker, publisher: EventPublisher | None = None):
+    def __init__(
+        self,
+        worker: DeviceWorker,
+        publisher: EventPublisher | None = None,
+        history: DurationHistory | None = None,
+        connection_limiter: TokenBucket | None = None,
+        session_budget: FairShareSessionBudget | None = None,
+        pool: SessionWorkerPool | None = None,
+        journal: RunJournal | None = None,
+        summary_store: RunSummaryStore | None = None,
+        metrics: BackendMetrics | None = None,
+    ):
         self.worker = worker
         self.publisher = publisher
+        self.history = history
+        # Shared with the import validators so every session open counts
+        # against one AAA-friendly rate.
+        self.connection_limiter = connection_limiter
+        # Caps device sessions across every concurrently running job.
+        self.session_budget = session_budget
+        # Long-lived threads shared with imports and status commands; without
+        # it each run gets a private thread pool.
+        self.pool = pool
+        # Durable per-device outcomes so an interrupted run can be resumed.
+        self.journal = journal
+        # Gets the summary as soon as it exists; results are recorded into it
+        # in place, so readers see each device as soon as it completes.
+        self.summary_store = summary_store
+        self.metrics = metrics
 
     def _emit(
         self,
@@ -85,126 +188,179 @@ class ExecutionEngine:
             )
         )
 
-    def _run_with_retry(
+    def _emit_attempt_start(
         self,
+        job_id: str | None,
         device: DeviceTarget,
-        commands_by_device: dict[str, list[str]],
-        verify_commands_by_device: dict[str, list[str]] | None,
+        attempt: int,
         retry_limit: int,
-        backoff: float,
-        control: ExecutionControl | None = None,
-        job_id: str | None = None,
-    ) -> DeviceExecutionResult:
-        attempts = 0
-        last_result: DeviceExecutionResult | None = None
-        for attempt in range(retry_limit + 1):
-            if control and control.cancel_event.is_set():
-                return DeviceExecutionResult(
-                    status="cancelled",
-                    error="Execution cancelled",
-                    attempts=attempt + 1,
-                )
-            attempts = attempt + 1
-            commands = commands_by_device.get(device.key, [])
-            verify_commands: list[str] = []
-            if verify_commands_by_device is not None:
-                verify_commands = verify_commands_by_device.get(device.key, [])
+        commands: list[str],
+        verify_commands: list[str],
+    ) -> None:
+        if not job_id:
+            return
+        if self.metrics is not None:
+            self.metrics.attempt_started(job_id)
+        self._emit(
+            event_type="log",
+            job_id=job_id,
+            device=device.key,
+            message=(
+                f"Attempt {attempt + 1}/{retry_limit + 1}: "
+                f"{len(commands)} apply command(s), "
+                f"{len(verify_commands)} verify command(s)"
+            ),
+        )
+        for command in commands:
+            self._emit(
+                event_type="log",
+                job_id=job_id,
+                device=device.key,
+                message=f"apply> {command}",
+            )
+        for verify_command in verify_commands:
+            self._emit(
+                event_type="log",
+                job_id=job_id,
+                device=device.key,
+                message=f"verify> {verify_command}",
+            )
+
+    def _progress_reporter(
+        self, job_id: str | None, device: DeviceTarget
+    ) -> ProgressCallback:
+        """Emit worker progress (e.g. fast-apply chunks) as device events."""
+
+        def report(status: str, message: str) -> None:
             if job_id:
                 self._emit(
-                    event_type="log",
+                    event_type="device_progress",
                     job_id=job_id,
                     device=device.key,
-                    message=(
-                        f"Attempt {attempt + 1}/{retry_limit + 1}: "
-                        f"{len(commands)} apply command(s), "
-                        f"{len(verify_commands)} verify command(s)"
-                    ),
+                    status=status,
+                    message=message,
                 )
-                for command in commands:
-                    self._emit(
-                        event_type="log",
-                        job_id=job_id,
-                        device=device.key,
-                        message=f"apply> {command}",
-                    )
-                for verify_command in verify_commands:
-                    self._emit(
-                        event_type="log",
-                        job_id=job_id,
-                        device=device.key,
-                        message=f"verify> {verify_command}",
-                    )
+
+        return report
+
+    def _emit_attempt_result(
+        self,
+        job_id: str | None,
+        device: DeviceTarget,
+        result: DeviceExecutionResult,
+    ) -> None:
+        if not job_id:
+            return
+        if self.metrics is not None:
+            self.metrics.attempt_finished(job_id)
+        for line in result.logs:
+            self._emit(
+                event_type="log",
+                job_id=job_id,
+                device=device.key,
+                message=line,
+            )
+
+    @staticmethod
+    def _device_commands(
+        device: DeviceTarget,
+        commands_by_device: dict[str, list[str]],
+        verify_commands_by_device: dict[str, list[str]] | None,
+    ) -> tuple[list[str], list[str]]:
+        commands = commands_by_device.get(device.key, [])
+        verify_commands: list[str] = []
+        if verify_commands_by_device is not None:
+            verify_commands = verify_commands_by_device.get(device.key, [])
+        return commands, verify_commands
+
+    def _run_attempt(
+        self,
+        device: DeviceTarget,
+        commands_by_device: dict[str, list[str]],
+        verify_commands_by_device: dict[str, list[str]] | None,
+        attempt: int,
+        retry_limit: int,
+        control: ExecutionControl | None = None,
+        job_id: str | None = None,
+    ) -> DeviceExecutionResult:
+        """Run one attempt (1-based); retries are queued by the scheduler."""
+        if control and control.cancel_event.is_set():
+            return DeviceExecutionResult(
+                status="cancelled",
+                error="Execution cancelled",
+                attempts=attempt,
+            )
+        commands, verify_commands = self._device_commands(
+            device, commands_by_device, verify_commands_by_device
+        )
+        self._emit_attempt_start(
+            job_id, device, attempt - 1, retry_limit, commands, verify_commands
+        )
+        started = time.monotonic()
+        with span(
+            "device_attempt", device=device.key, attempt=attempt
+        ) as current, device_progress(self._progress_reporter(job_id, device)):
             result = self.worker.run(
                 device=device,
                 commands=commands,
                 verify_commands=verify_commands,
             )
-            if job_id:
-                for line in result.logs:
-                    self._emit(
-                        event_type="log",
-                        job_id=job_id,
-                        device=device.key,
-                        message=line,
-                    )
-            result.attempts = attempts
-            last_result = result
-            if result.status == "success":
-                return result
-            if job_id and attempt < retry_limit:
-                self._emit(
-                    event_type="log",
-                    job_id=job_id,
-                    device=device.key,
-                    message=(
-                        f"Attempt {attempt + 1} failed, retrying in " f"{backoff:.1f}s"
-                    ),
-                )
-            if attempt < retry_limit and backoff > 0:
-                time.sleep(backoff)
-        if last_result is None:
-            return DeviceExecutionResult(
-                status="failed",
-                error="No execution result",
-                attempts=attempts,
-            )
-        return last_result
+            if current is not None:
+                current.set_attribute("status", result.status)
+        result.duration_seconds = time.monotonic() - started
+        self._emit_attempt_result(job_id, device, result)
+        result.attempts = attempt
+        return result
 
-    def run_job(
+    def _finish(self, summary: JobRunSummary, status: JobStatus) -> JobRunSummary:
+        summary.status = status
+        if self.metrics is not None:
+            self.metrics.job_finished(summary.job_id, status.value)
+        self._emit(
+            event_type="job_complete", job_id=summary.job_id, status=status.value
+        )
+        return summary
+
+    def _begin_run(
         self,
         job_id: str,
         devices: list[DeviceTarget],
         canary: DeviceTarget,
-        commands_by_device: dict[str, list[str]],
-        verify_commands_by_device: dict[str, list[str]] | None,
-        config: ExecutionConfig,
-        commands: list[str] | None = None,
-        verify_commands: list[str] | None = None,
-        control: ExecutionControl | None = None,
-    ) -> JobRunSummary:
-        """Run a job and return aggregated summary."""
+        commands: list[str] | None,
+        verify_commands: list[str] | None,
+        control: ExecutionControl | None,
+        device_attributes: dict[str, dict[str, str]] | None = None,
+    ) -> tuple[JobRunSummary, bool]:
+        """Create the run summary and report whether fan-out may proceed."""
         summary = JobRunSummary(
             job_id=job_id,
             status=JobStatus.RUNNING,
             commands=list(commands or []),
             verify_commands=list(verify_commands or []),
             target_device_keys=[device.key for device in devices],
+            device_types={
+                key: attributes["device_type"]
+                for key, attributes in (device_attributes or {}).items()
+                if attributes.get("device_type")
+            },
         )
+        if self.summary_store is not None:
+            self.summary_store.save(summary)
         self._emit(event_type="job_status", job_id=job_id, status="running")
         if control and control.cancel_event.is_set():
-            summary.status = JobStatus.CANCELLED
-            self._emit(event_type="job_complete", job_id=job_id, status="cancelled")
-            return summary
+            self._finish(summary, JobStatus.CANCELLED)
+            return summary, False
         if not devices:
-            summary.status = JobStatus.FAILED
-            self._emit(event_type="job_complete", job_id=job_id, status="failed")
-            return summary
+            self._finish(summary, JobStatus.FAILED)
+            return summary, False
 
         if canary.key not in {d.key for d in devices}:
-            summary.status = JobStatus.FAILED
-            summary.device_results[canary.key] = DeviceExecutionResult(
-                status="failed",
-                error="Canary is not part of target devices",
+            summary.record_result(
+                canary.key,
+                DeviceExecutionResult(
+                    status="failed",
+                    error="Canary is not part of target devices",
+                ),
             )
             self._emit(
                 event_type="device_status",
@@ -213,8 +369,8 @@ class ExecutionEngine:
                 status="failed",
                 message="Canary is not part of target devices",
             )
-            self._emit(event_type="job_complete", job_id=job_id, status="failed")
-            return summary
+            self._finish(summary, JobStatus.FAILED)
+            return summary, False
 
         for device in devices:
             self._emit(
@@ -224,129 +380,512 @@ class ExecutionEngine:
                 status="queued",
                 message="Queued for execution",
             )
+        return summary, True
 
-        # 1) Canary first, no retry.
+    def _run_executor(self, job_id: str, config: ExecutionConfig) -> Executor:
+        """This run's view of the shared pool, or a private thread pool."""
+        if self.pool is not None:
+            return self.pool.executor("run", job_id, limit=config.max_concurrency)
+        return ThreadPoolExecutor(max_workers=config.max_concurrency)
+
+    def _open_session_lease(
+        self, job_id: str, control: ExecutionControl | None
+    ) -> tuple[SessionLease | None, Callable[[], None]]:
+        """Join the shared session budget; freed slots wake this run's control."""
+        if self.session_budget is None:
+            return None, lambda: None
+        lease = self.session_budget.register(job_id)
+        if control is None:
+            return lease, lambda: None
+        return lease, self.session_budget.add_listener(control.notify)
+
+    @staticmethod
+    def _close_session_lease(
+        lease: SessionLease | None, remove_listener: Callable[[], None]
+    ) -> None:
+        remove_listener()
+        if lease is not None:
+            lease.close()
+
+    def _canary_token_wait(self, lease: SessionLease | None = None) -> float:
+        """Take a session slot and connection token for the canary, or return the wait."""
+        if lease is not None and not lease.try_acquire():
+            return SESSION_RETRY_SECONDS
+        if self.connection_limiter is None:
+            return 0.0
+        wait = self.connection_limiter.try_acquire()
+        if wait > 0 and lease is not None:
+            lease.release(notify=False)
+        return wait
+
+    def _start_canary(self, summary: JobRunSummary, canary: DeviceTarget) -> None:
+        self._open_wave(summary, 0)
+        estimate = self.history.estimate(canary.key) if self.history else None
+        if estimate is not None:
+            summary.estimated_durations[canary.key] = estimate
+        summary.schedule_order.append(canary.key)
         self._emit(
             event_type="device_status",
-            job_id=job_id,
+            job_id=summary.job_id,
             device=canary.key,
             status="running",
             message="Starting canary",
         )
-        canary_result = self._run_with_retry(
-            device=canary,
-            commands_by_device=commands_by_device,
-            verify_commands_by_device=verify_commands_by_device,
-            retry_limit=0,
-            backoff=0.0,
-            control=control,
-            job_id=job_id,
+
+    def _record_result(
+        self,
+        summary: JobRunSummary,
+        device: DeviceTarget,
+        result: DeviceExecutionResult,
+    ) -> None:
+        summary.record_result(device.key, result)
+        if self.journal is not None:
+            self.journal.record_device(summary.job_id, device.key, result)
+        if self.metrics is not None:
+            self.metrics.device_result(result)
+        # Failed attempts end early, so only successful runs describe how long
+        # a device really takes.
+        if self.history is not None and result.status == "success":
+            self.history.record(device.key, result.duration_seconds)
+        self._emit(
+            event_type="device_status",
+            job_id=summary.job_id,
+            device=device.key,
+            status=result.status,
+            message=result.error,
         )
-        summary.device_results[canary.key] = canary_result
+
+    def _start_device(self, summary: JobRunSummary, device: DeviceTarget) -> None:
+        summary.schedule_order.append(device.key)
         self._emit(
             event_type="device_status",
-            job_id=job_id,
-            device=canary.key,
-            status=canary_result.status,
-            message=canary_result.error,
+            job_id=summary.job_id,
+            device=device.key,
+            status="running",
+        )
+
+    def _canary_gate(
+        self, summary: JobRunSummary, canary_result: DeviceExecutionResult
+    ) -> bool:
+        """Return True when the canary succeeded; otherwise finish the run."""
+        if canary_result.status == "success":
+            self._close_wave(summary, 0, "completed")
+            return True
+        status = (
+            JobStatus.CANCELLED
+            if canary_result.status == "cancelled"
+            else JobStatus.FAILED
         )
-        if canary_result.status != "success":
-            summary.status = (
-                JobStatus.CANCELLED
-                if canary_result.status == "cancelled"
-                else JobStatus.FAILED
+        self._close_wave(summary, 0, status.value)
+        self._skip_waves(summary, 1)
+        self._finish(summary, status)
+        return False
+
+    def _plan_rollout(
+        self,
+        summary: JobRunSummary,
+        devices: list[DeviceTarget],
+        canary: DeviceTarget,
+        config: ExecutionConfig,
+    ) -> list[PlannedWave]:
+        remaining = [d for d in devices if d.key != canary.key]
+        planned = plan_waves(remaining, list(config.waves))
+        summary.waves = [
+            WaveSummary(index=0, label="canary", device_keys=[canary.key])
+        ] + [
+            WaveSummary(
+                index=wave.index,
+                label=wave.label,
+                device_keys=[device.key for device in wave.devices],
+            )
+            for wave in planned
+        ]
+        return planned
+
+    def _build_scheduling(
+        self,
+        config: ExecutionConfig,
+        device_attributes: dict[str, dict[str, str]] | None,
+        lease: SessionLease | None = None,
+    ) -> RunScheduling:
+        scheduling = RunScheduling(session_lease=lease)
+        if self.connection_limiter is not None:
+            scheduling.rate_limiters.append(self.connection_limiter)
+        if config.stagger_delay > 0:
+            scheduling.rate_limiters.append(
+                TokenBucket(rate_per_second=1.0 / config.stagger_delay, burst=1)
+            )
+        if config.adaptive_concurrency:
+            scheduling.controller = AimdConcurrencyController(
+                initial=config.concurrency_limit,
+                minimum=config.concurrency_min,
+                maximum=config.max_concurrency,
             )
+        if config.group_limits:
+            scheduling.group_limiter = GroupLimiter(
+                config.group_limits, device_attributes or {}
+            )
+        return scheduling
+
+    def _new_scheduler(
+        self,
+        summary: JobRunSummary,
+        wave: PlannedWave,
+        config: ExecutionConfig,
+        scheduling: RunScheduling,
+    ) -> FanoutScheduler:
+        devices = wave.devices
+        if self.history is not None:
+            estimates = estimate_durations(devices, self.history)
+            summary.estimated_durations.update(estimates)
+            if config.schedule_order == "longest_first":
+                # Longest-processing-time-first keeps slow devices from
+                # starting last and stretching the wave's makespan.
+                devices = order_longest_first(devices, estimates)
+        allowance: int | None = None
+        failures_before = 0
+        budget = config.failure_budget
+        if budget is not None:
+            if budget.per_wave:
+                allowance = budget.allowance(len(wave.devices))
+            else:
+                allowance = budget.allowance(len(summary.target_device_keys) - 1)
+                failures_before = summary.failure_count
+        scheduler = FanoutScheduler(
+            devices,
+            config.concurrency_limit,
+            config.stop_on_error,
+            controller=scheduling.controller,
+            group_limiter=scheduling.group_limiter,
+            rate_limiters=scheduling.rate_limiters,
+            failure_allowance=allowance,
+            failures_before=failures_before,
+            session_lease=scheduling.session_lease,
+        )
+        if self.metrics is not None:
+            self.metrics.window_changed(summary.job_id, scheduler.window)
+        return scheduler
+
+    def _settle_attempt(
+        self,
+        summary: JobRunSummary,
+        scheduler: FanoutScheduler,
+        device: DeviceTarget,
+        result: DeviceExecutionResult,
+        config: ExecutionConfig,
+    ) -> None:
+        """Queue a retryable failure for a later attempt, or record the result."""
+        if (
+            result.attempts <= config.non_canary_retry_limit
+            and not scheduler.halted
+            and is_retryable(result)
+        ):
+            delay = backoff_delay(result.attempts, config.retry_backoff_seconds)
+            change = scheduler.retry(device, result, delay)
             self._emit(
-                event_type="job_complete", job_id=job_id, status=summary.status.value
+                event_type="log",
+                job_id=summary.job_id,
+                device=device.key,
+                message=(
+                    f"Attempt {result.attempts} failed"
+                    f"{f' ({result.error_code})' if result.error_code else ''}, "
+                    f"retrying in {delay:.1f}s"
+                ),
             )
-            return summary
+        else:
+            change = scheduler.complete(device, result)
+            self._record_result(summary, device, result)
+        self._emit_window_change(summary.job_id, change)
 
-        # 2) Execute remaining devices in parallel.
-        remaining = [d for d in devices if d.key != canary.key]
-        if not remaining:
-            summary.status = JobStatus.COMPLETED
-            self._emit(event_type="job_complete", job_id=job_id, status="completed")
-            return summary
+    def _record_abandoned_retries(
+        self, summary: JobRunSummary, scheduler: FanoutScheduler
+    ) -> None:
+        """Record the last failure of devices still waiting to retry."""
+        for device, result in scheduler.drain_retries():
+            self._record_result(summary, device, result)
+
+    def _emit_window_change(self, job_id: str, change: WindowChange | None) -> None:
+        if change is None:
+            return
+        if self.metrics is not None:
+            self.metrics.window_changed(job_id, change.current)
+        self._emit(
+            event_type="concurrency_window",
+            job_id=job_id,
+            status="increase" if change.current > change.previous else "decrease",
+            message=(
+                f"Concurrency window {change.previous} -> {change.current} "
+                f"({change.reason})"
+            ),
+        )
+
+    def _open_wave(self, summary: JobRunSummary, index: int) -> None:
+        wave = summary.waves[index]
+        wave.status = "running"
+        wave.started_at = utc_now()
+        self._emit(
+            event_type="wave_status",
+            job_id=summary.job_id,
+            status="running",
+            message=(
+                f"Wave {index}/{len(summary.waves) - 1} ({wave.label}): "
+                f"{len(wave.device_keys)} device(s)"
+            ),
+        )
+
+    def _close_wave(self, summary: JobRunSummary, index: int, status: str) -> None:
+        wave = summary.waves[index]
+        wave.status = status
+        wave.completed_at = utc_now()
+        self._emit(
+            event_type="wave_status",
+            job_id=summary.job_id,
+            status=status,
+            message=f"Wave {index}/{len(summary.waves) - 1} ({wave.label}) {status}",
+        )
 
-        concurrency = max(1, config.concurrency_limit)
-        pending_devices = list(remaining)
+    def _skip_waves(self, summary: JobRunSummary, start_index: int) -> None:
+        for wave in summary.waves[start_index:]:
+            wave.status = "skipped"
+
+    def _wave_gate(
+        self,
+        summary: JobRunSummary,
+        wave: PlannedWave,
+        scheduler: FanoutScheduler | None,
+        config: ExecutionConfig,
+        control: ExecutionControl | None,
+    ) -> bool:
+        """Close a finished wave; return True when the next wave may start."""
+        if scheduler is None or (control and control.cancel_event.is_set()):
+            self._report_control_latency(summary.job_id, control, "cancel")
+            self._close_wave(summary, wave.index, "cancelled")
+            self._skip_waves(summary, wave.index + 1)
+            self._finish(summary, JobStatus.CANCELLED)
+            return False
+        if scheduler.budget_exceeded:
+            self._close_wave(summary, wave.index, "failed")
+            if config.failure_budget is not None:
+                scope = (
+                    f"wave {wave.index}" if config.failure_budget.per_wave else "run"
+                )
+                self._emit(
+                    event_type="failure_budget",
+                    job_id=summary.job_id,
+                    status="exceeded",
+                    message=(
+                        f"{scheduler.failures_before + scheduler.failed} failure(s) "
+                        f"exceed the {scope} budget of {scheduler.failure_allowance}"
+                    ),
+                )
+            self._skip_waves(summary, wave.index + 1)
+            self._finish(summary, JobStatus.FAILED)
+            return False
+        if scheduler.failed:
+            self._close_wave(summary, wave.index, "failed")
+            return True
+        self._close_wave(summary, wave.index, "completed")
+        return True
+
+    @staticmethod
+    def _cancel_requested(control: ExecutionControl | None) -> bool:
+        return bool(control and control.cancel_event.is_set())
+
+    def _final_status(
+        self, summary: JobRunSummary, control: ExecutionControl | None
+    ) -> JobStatus:
+        if control and control.cancel_event.is_set():
+            return JobStatus.CANCELLED
+        return JobStatus.FAILED if summary.failure_count else JobStatus.COMPLETED
+
+    def _report_control_latency(
+        self, job_id: str, control: ExecutionControl | None, kind: str
+    ) -> None:
+        """Publish how long the engine took to observe a resume/cancel request."""
+        latency = control.acknowledge(kind) if control else None
+        if latency is None:
+            return
+        self._emit(
+            event_type="control_latency",
+            job_id=job_id,
+            status=kind,
+            message=f"{kind} observed after {latency * 1000:.1f} ms",
+        )
+
+    @staticmethod
+    def _generation(control: ExecutionControl | None) -> int:
+        return control.generation if control else 0
+
+    @staticmethod
+    def _wait_for_control(
+        control: ExecutionControl | None, generation: int, timeout: float | None
+    ) -> None:
+        """Sleep up to ``timeout``, waking early on any signal after ``generation``."""
+        if control is None:
+            time.sleep(timeout or 0.0)
+            return
+        control.wait_for_signal(generation, timeout)
+
+    @staticmethod
+    def _await_completions(
+        in_flight: dict[Future[DeviceExecutionResult], DeviceTarget],
+        control: ExecutionControl | None,
+        generation: int,
+        timeout: float | None,
+    ) -> set[Future[DeviceExecutionResult]]:
+        """Wait until a device finishes, control changes, or ``timeout`` passes."""
+        if control is None:
+            done, _ = wait(
+                in_flight.keys(), timeout=timeout, return_when=FIRST_COMPLETED
+            )
+            return done
+        # Futures notify the control when they finish, so one condition wait
+        # covers completions as well as pause/resume/cancel.
+        done = {future for future in in_flight if future.done()}
+        if not done:
+            control.wait_for_signal(generation, timeout)
+            done = {future for future in in_flight if future.done()}
+        return done
+
+    def _run_wave(
+        self,
+        executor: Executor,
+        wave: PlannedWave,
+        summary: JobRunSummary,
+        commands_by_device: dict[str, list[str]],
+        verify_commands_by_device: dict[str, list[str]] | None,
+        config: ExecutionConfig,
+        control: ExecutionControl | None,
+        scheduling: RunScheduling,
+    ) -> FanoutScheduler | None:
+        """Fan out one wave at full concurrency; return None when cancelled."""
+        scheduler = self._new_scheduler(summary, wave, config, scheduling)
         in_flight: dict[Future[DeviceExecutionResult], DeviceTarget] = {}
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            while pending_devices or in_flight:
-                while (
-                    control
-                    and control.pause_event.is_set()
-                    and not control.cancel_event.is_set()
-                ):
-                    time.sleep(0.2)
-                if control and control.cancel_event.is_set():
-                    summary.status = JobStatus.CANCELLED
-                    self._emit(
-                        event_type="job_complete", job_id=job_id, status="cancelled"
-                    )
-                    return summary
-                while pending_devices and len(in_flight) < concurrency:
-                    if config.stop_on_error and any(
-                        r.status != "success" for r in summary.device_results.values()
-                    ):
-                        pending_devices = []
+        try:
+            while scheduler.has_work():
+                # Snapshot before reading flags so a signal arriving after the
+                # checks below still ends the wait at the bottom of the loop.
+                generation = self._generation(control)
+                if self._cancel_requested(control):
+                    self._report_control_latency(summary.job_id, control, "cancel")
+                    return None
+                paused = bool(control and control.pause_event.is_set())
+                if not paused:
+                    self._report_control_latency(summary.job_id, control, "resume")
+                while not paused and not self._cancel_requested(control):
+                    device = scheduler.next_device()
+                    if device is None:
                         break
-                    if control and control.cancel_event.is_set():
-                        pending_devices = []
-                        break
-                    device = pending_devices.pop(0)
-                    self._emit(
-                        event_type="device_status",
-                        job_id=job_id,
-                        device=device.key,
-                        status="running",
-                    )
+                    attempt = scheduler.attempts[device.key]
+                    if attempt == 1:
+                        self._start_device(summary, device)
                     future = executor.submit(
-                        self._run_with_retry,
+                        in_current_context(self._run_attempt),
                         device,
                         commands_by_device,
                         verify_commands_by_device,
+                        attempt,
                         config.non_canary_retry_limit,
-                        config.retry_backoff_seconds,
                         control,
-                        job_id,
+                        summary.job_id,
                     )
+                    if control is not None:
+                        future.add_done_callback(lambda _: control.notify())
                     in_flight[future] = device
-                    if config.stagger_delay > 0:
-                        time.sleep(config.stagger_delay)
 
+                # While paused nothing new starts, but in-flight devices are
+                # still collected; the wait ends on resume or cancel.
+                wakeup = None if paused else scheduler.next_wakeup()
                 if not in_flight:
-                    break
+                    if wakeup is None and not paused:
+                        break
+                    self._wait_for_control(control, generation, wakeup)
+                    continue
 
-                done, _ = wait(in_flight.keys(), return_when=FIRST_COMPLETED)
-                for future in done:
+                for future in self._await_completions(
+                    in_flight, control, generation, wakeup
+                ):
                     device = in_flight.pop(future)
                     result = future.result()
-                    summary.device_results[device.key] = result
-                    self._emit(
-                        event_type="device_status",
-                        job_id=job_id,
-                        device=device.key,
-                        status=result.status,
-                        message=result.error,
-                    )
+                    self._settle_attempt(summary, scheduler, device, result, config)
                     if result.status == "cancelled":
-                        summary.status = JobStatus.CANCELLED
-                        self._emit(
-                            event_type="job_complete", job_id=job_id, status="cancelled"
-                        )
-                        return summary
+                        self._report_control_latency(summary.job_id, control, "cancel")
+                        return None
+        finally:
+            self._record_abandoned_retries(summary, scheduler)
+        return scheduler
 
-        if control and control.cancel_event.is_set():
-            summary.status = JobStatus.CANCELLED
-        else:
-            has_failure = any(
-                r.status != "success" for r in summary.device_results.values()
-            )
-            summary.status = JobStatus.FAILED if has_failure else JobStatus.COMPLETED
-        self._emit(
-            event_type="job_complete",
-            job_id=job_id,
-            status=summary.status.value,
+    @traced("run_job")
+    def run_job(
+        self,
+        job_id: str,
+        devices: list[DeviceTarget],
+        canary: DeviceTarget,
+        commands_by_device: dict[str, list[str]],
+        verify_commands_by_device: dict[str, list[str]] | None,
+        config: ExecutionConfig,
+        commands: list[str] | None = None,
+        verify_commands: list[str] | None = None,
+        control: ExecutionControl | None = None,
+        device_attributes: dict[str, dict[str, str]] | None = None,
+    ) -> JobRunSummary:
+        """Run a job and return aggregated summary."""
+        summary, proceed = self._begin_run(
+            job_id,
+            devices,
+            canary,
+            commands,
+            verify_commands,
+            control,
+            device_attributes,
         )
-        return summary
+        if not proceed:
+            return summary
+        planned = self._plan_rollout(summary, devices, canary, config)
+        lease, remove_listener = self._open_session_lease(job_id, control)
+        try:
+            with self._run_executor(job_id, config) as executor:
+                # 1) Canary first, no retry.
+                self._start_canary(summary, canary)
+                while True:
+                    generation = self._generation(control)
+                    wait_for = self._canary_token_wait(lease)
+                    if wait_for <= 0 or self._cancel_requested(control):
+                        break
+                    self._wait_for_control(control, generation, wait_for)
+                canary_result = executor.submit(
+                    in_current_context(self._run_attempt),
+                    device=canary,
+                    commands_by_device=commands_by_device,
+                    verify_commands_by_device=verify_commands_by_device,
+                    attempt=1,
+                    retry_limit=0,
+                    control=control,
+                    job_id=job_id,
+                ).result()
+                if lease is not None and wait_for <= 0:
+                    lease.release()
+                self._record_result(summary, canary, canary_result)
+                if not self._canary_gate(summary, canary_result):
+                    return summary
+
+                # 2) Release remaining devices wave by wave, each at full concurrency.
+                scheduling = self._build_scheduling(config, device_attributes, lease)
+                for wave in planned:
+                    self._open_wave(summary, wave.index)
+                    scheduler = self._run_wave(
+                        executor,
+                        wave,
+                        summary,
+                        commands_by_device,
+                        verify_commands_by_device,
+                        config,
+                        control,
+                        scheduling,
+                    )
+                    if not self._wave_gate(summary, wave, scheduler, config, control):
+                        return summary
+
+                return self._finish(summary, self._final_status(summary, control))
+        finally:
+            self._close_session_lease(lease, remove_listener)
@@ -0,0 +1,250 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""In-process Prometheus metrics rendered in the text exposition format."""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable
+from threading import Lock
+
+from backend_v2.app.domain.models import DeviceExecutionResult
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# Stages exported as histograms; diff/disconnect are local and cheap.
+MEASURED_STAGES = ("connect", "pre_verify", "apply", "post_verify")
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Histogram:
+    """Cumulative-bucket histogram; observe is O(log buckets)."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+
+    def lines(self, name: str, labels: Labels) -> list[str]:
+        lines: list[str] = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            cumulative += count
+            bucket_labels = (*labels, ("le", _format_value(bound)))
+            lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(self.total)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class BackendMetrics:
+    """Counters, histograms and gauges updated in O(1) as work happens.
+
+    Rendering walks only the label sets seen so far plus running jobs, so a
+    scrape stays cheap during a large run.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._jobs: dict[Labels, int] = {}
+        self._device_results: dict[Labels, int] = {}
+        self._device_sessions: dict[Labels, int] = {}
+        self._stage_latency: dict[Labels, _Histogram] = {}
+        self._attempt_latency = _Histogram(LATENCY_BUCKETS)
+        self._in_flight: dict[str, int] = {}
+        self._windows: dict[str, int] = {}
+        self._websocket_clients = 0
+        self._import_validations: dict[Labels, int] = {}
+        self._import_latency = _Histogram(LATENCY_BUCKETS)
+
+    @staticmethod
+    def _increment(counters: dict[Labels, int], labels: Labels) -> None:
+        counters[labels] = counters.get(labels, 0) + 1
+
+    def job_finished(self, job_id: str, status: str) -> None:
+        with self._lock:
+            self._increment(self._jobs, (("status", status),))
+            self._in_flight.pop(job_id, None)
+            self._windows.pop(job_id, None)
+
+    def device_result(self, result: DeviceExecutionResult) -> None:
+        labels = (("status", result.status), ("error_code", result.error_code or ""))
+        with self._lock:
+            self._increment(self._device_results, labels)
+            if result.session_source is not None:
+                self._increment(
+                    self._device_sessions, (("source", result.session_source),)
+                )
+            if result.status == "cancelled":
+                return
+            self._attempt_latency.observe(result.duration_seconds)
+            for stage in MEASURED_STAGES:
+                seconds = result.stage_timings.get(stage)
+                if seconds is None:
+                    continue
+                key = (("stage", stage),)
+                histogram = self._stage_latency.get(key)
+                if histogram is None:
+                    histogram = self._stage_latency[key] = _Histogram(LATENCY_BUCKETS)
+                histogram.observe(seconds)
+
+    def attempt_started(self, job_id: str) -> None:
+        with self._lock:
+            self._in_flight[job_id] = self._in_flight.get(job_id, 0) + 1
+
+    def attempt_finished(self, job_id: str) -> None:
+        with self._lock:
+            remaining = self._in_flight.get(job_id, 0) - 1
+            if remaining > 0:
+                self._in_flight[job_id] = remaining
+            else:
+                self._in_flight.pop(job_id, None)
+
+    def window_changed(self, job_id: str, window: int) -> None:
+        with self._lock:
+            self._windows[job_id] = window
+
+    def websocket_connected(self) -> None:
+        with self._lock:
+            self._websocket_clients += 1
+
+    def websocket_disconnected(self) -> None:
+        with self._lock:
+            self._websocket_clients = max(0, self._websocket_clients - 1)
+
+    def import_validated(self, ok: bool, seconds: float) -> None:
+        with self._lock:
+            self._increment(
+                self._import_validations, (("result", "ok" if ok else "failed"),)
+            )
+            self._import_latency.observe(seconds)
+
+    def render(self, event_counts: Iterable[tuple[str, int]] = ()) -> str:
+        """Text exposition (format 0.0.4) of every metric."""
+        out: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+
+        def samples(name: str, values: dict[Labels, int]) -> None:
+            for labels, value in sorted(values.items()):
+                out.append(f"{name}{_format_labels(labels)} {value}")
+
+        with self._lock:
+            family("nw_edit_jobs_total", "counter", "Finished runs by final status.")
+            samples("nw_edit_jobs_total", self._jobs)
+            family(
+                "nw_edit_device_results_total",
+                "counter",
+                "Final device results by status and error_code.",
+            )
+            samples("nw_edit_device_results_total", self._device_results)
+            family(
+                "nw_edit_device_sessions_total",
+                "counter",
+                "Final device results by SSH session source (warm, pooled, new).",
+            )
+            samples("nw_edit_device_sessions_total", self._device_sessions)
+            family(
+                "nw_edit_device_stage_seconds",
+                "histogram",
+                "Device execution stage latency (connect, verify, apply).",
+            )
+            for labels, histogram in sorted(self._stage_latency.items()):
+                out.extend(histogram.lines("nw_edit_device_stage_seconds", labels))
+            family(
+                "nw_edit_device_attempt_seconds",
+                "histogram",
+                "Whole device attempt latency.",
+            )
+            out.extend(
+                self._attempt_latency.lines("nw_edit_device_attempt_seconds", ())
+            )
+            family(
+                "nw_edit_devices_in_flight",
+                "gauge",
+                "Device attempts currently executing, per job (sum for the total).",
+            )
+            for job_id, count in sorted(self._in_flight.items()):
+                out.append(
+                    f"nw_edit_devices_in_flight{_format_labels((('job_id', job_id),))} "
+                    f"{count}"
+                )
+            family(
+                "nw_edit_concurrency_window",
+                "gauge",
+                "Current in-flight limit of each running job.",
+            )
+            for job_id, window in sorted(self._windows.items()):
+                out.append(
+                    f"nw_edit_concurrency_window{_format_labels((('job_id', job_id),))} "
+                    f"{window}"
+                )
+            family(
+                "nw_edit_websocket_clients",
+                "gauge",
+                "Connected job event websocket clients.",
+            )
+            out.append(f"nw_edit_websocket_clients {self._websocket_clients}")
+            family(
+                "nw_edit_import_validations_total",
+                "counter",
+                "Import connection validations by result.",
+            )
+            samples("nw_edit_import_validations_total", self._import_validations)
+            family(
+                "nw_edit_import_validation_seconds",
+                "histogram",
+                "Import connection validation latency.",
+            )
+            out.extend(
+                self._import_latency.lines("nw_edit_import_validation_seconds", ())
+            )
+
+        family(
+            "nw_edit_event_store_events",
+            "gauge",
+            "Buffered execution events per job.",
+        )
+        for job_id, count in event_counts:
+            out.append(
+                f"nw_edit_event_store_events{_format_labels((('job_id', job_id),))} "
+                f"{count}"
+            )
+        return "\n".join(out) + "\n"
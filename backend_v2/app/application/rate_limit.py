@@ -0,0 +1,108 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Token-bucket rate limiting for opening device sessions."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate_per_second`` refill, ``burst`` capacity.
+
+    ``try_acquire`` never blocks; it either takes a token or returns how long
+    until one is available, so schedulers can keep collecting completions
+    instead of sleeping.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate_per_second = rate_per_second
+        self.burst = max(1.0, burst)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
+        self._updated = now
+
+    def _wait_locked(self) -> float:
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate_per_second
+
+    def wait_time(self) -> float:
+        """Seconds until a token is available (0 when one is available now)."""
+        with self._lock:
+            self._refill()
+            return self._wait_locked()
+
+    def try_acquire(self) -> float:
+        """Take one token and return 0, or return the seconds to wait."""
+        with self._lock:
+            self._refill()
+            wait = self._wait_locked()
+            if wait == 0.0:
+                self._tokens -= 1.0
+            return wait
+
+    def acquire(self, cancel_event: threading.Event | None = None) -> bool:
+        """Block until a token is taken; return False if cancelled first."""
+        while True:
+            wait = self.try_acquire()
+            if wait == 0.0:
+                return True
+            if cancel_event is None:
+                time.sleep(wait)
+            elif cancel_event.wait(wait):
+                return False
+
+
+def try_acquire_all(buckets: list[TokenBucket]) -> float:
+    """Take one token from every bucket, or return the longest wait needed.
+
+    Every bucket is locked (in a fixed order, so concurrent callers cannot
+    deadlock) and checked before any token is taken, so a bucket that runs
+    dry under contention never costs the others a token. A bucket listed
+    twice gives one token.
+    """
+    ordered = sorted({id(bucket): bucket for bucket in buckets}.values(), key=id)
+    with ExitStack() as stack:
+        for bucket in ordered:
+            stack.enter_context(bucket._lock)
+        for bucket in ordered:
+            bucket._refill()
+        longest = max((bucket._wait_locked() for bucket in ordered), default=0.0)
+        if longest > 0:
+            return longest
+        for bucket in ordered:
+            bucket._tokens -= 1.0
+    return 0.0
@@ -0,0 +1,58 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Retry eligibility and jittered exponential backoff."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+
+from backend_v2.app.domain.models import DeviceExecutionResult
+
+# Retrying these cannot succeed without operator action: repeated bad
+# credentials may lock the account on the AAA server, and a command the
+# device rejected is rejected again after the lines before it were applied.
+NON_RETRYABLE_ERROR_CODES = frozenset(
+    {"authentication_failed", "cancelled", "command_error"}
+)
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def is_retryable(result: DeviceExecutionResult) -> bool:
+    """Return whether a failed attempt may be queued for another try."""
+    if result.status in {"success", "cancelled"}:
+        return False
+    return result.error_code not in NON_RETRYABLE_ERROR_CODES
+
+
+def backoff_delay(
+    retry_number: int,
+    base_seconds: float,
+    cap_seconds: float = MAX_BACKOFF_SECONDS,
+    rand: Callable[[], float] = random.random,
+) -> float:
+    """Delay before retry ``retry_number`` (1-based), with equal jitter.
+
+    The exponential ceiling ``base * 2**(n-1)`` is capped at ``cap_seconds``
+    and the result drawn from its upper half, so devices that failed together
+    do not retry in lockstep.
+    """
+    if base_seconds <= 0:
+        return 0.0
+    ceiling = min(cap_seconds, base_seconds * 2.0 ** max(0, retry_number - 1))
+    return ceiling / 2 + rand() * ceiling / 2
@@ -0,0 +1,390 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Wave planning and fan-out scheduling state shared by execution engines."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from backend_v2.app.application.adaptive_concurrency import (
+    AimdConcurrencyController,
+    WindowChange,
+)
+from backend_v2.app.application.rate_limit import TokenBucket, try_acquire_all
+from backend_v2.app.application.session_budget import (
+    SESSION_RETRY_SECONDS,
+    SessionLease,
+)
+from backend_v2.app.domain.models import DeviceExecutionResult, DeviceTarget
+
+
+@dataclass(frozen=True)
+class PlannedWave:
+    """Devices released together after the previous wave passed its gate."""
+
+    index: int
+    label: str
+    devices: list[DeviceTarget]
+
+
+def normalize_wave_percentages(percentages: list[float]) -> list[float]:
+    """Validate cumulative wave percentages and make sure the plan ends at 100."""
+    normalized: list[float] = []
+    previous = 0.0
+    for value in percentages:
+        percent = float(value)
+        if percent <= 0 or percent > 100:
+            raise ValueError("waves must be percentages in (0, 100]")
+        if percent <= previous:
+            raise ValueError("waves must be strictly increasing")
+        normalized.append(percent)
+        previous = percent
+    if not normalized or normalized[-1] < 100:
+        normalized.append(100.0)
+    return normalized
+
+
+def _format_percent(percent: float) -> str:
+    return f"{percent:g}%"
+
+
+def plan_waves(
+    devices: list[DeviceTarget], percentages: list[float]
+) -> list[PlannedWave]:
+    """Split non-canary devices into cumulative percentage waves.
+
+    Wave boundaries are rounded up so every non-empty wave holds at least one
+    device; waves that would be empty after rounding are dropped.
+    """
+    if not devices:
+        return []
+    total = len(devices)
+    waves: list[PlannedWave] = []
+    start = 0
+    for percent in normalize_wave_percentages(percentages):
+        end = min(total, max(start + 1, math.ceil(total * percent / 100.0)))
+        if end <= start:
+            continue
+        waves.append(
+            PlannedWave(
+                index=len(waves) + 1,
+                label=_format_percent(percent),
+                devices=devices[start:end],
+            )
+        )
+        start = end
+        if start >= total:
+            break
+    return waves
+
+
+GroupKey = tuple[tuple[str, str], ...]
+
+
+class GroupLimiter:
+    """Per-attribute in-flight caps, e.g. at most 4 devices per ``site``.
+
+    ``limits`` maps an attribute name (any ``host_vars`` key or
+    ``device_type``) to the maximum number of devices sharing one value of
+    that attribute that may run at the same time. Devices without the
+    attribute are not constrained by it.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, int],
+        attributes_by_device: dict[str, dict[str, str]],
+    ):
+        self.limits = {name: max(1, limit) for name, limit in limits.items()}
+        self.attributes_by_device = attributes_by_device
+        self._in_flight: dict[tuple[str, str], int] = {}
+
+    def group_of(self, device: DeviceTarget) -> GroupKey:
+        attributes = self.attributes_by_device.get(device.key, {})
+        return tuple(
+            (name, attributes[name])
+            for name in sorted(self.limits)
+            if attributes.get(name)
+        )
+
+    def can_start(self, group: GroupKey) -> bool:
+        return all(
+            self._in_flight.get(member, 0) < self.limits[member[0]] for member in group
+        )
+
+    def acquire(self, group: GroupKey) -> None:
+        for member in group:
+            self._in_flight[member] = self._in_flight.get(member, 0) + 1
+
+    def release(self, group: GroupKey) -> None:
+        for member in group:
+            remaining = self._in_flight.get(member, 0) - 1
+            if remaining > 0:
+                self._in_flight[member] = remaining
+            else:
+                self._in_flight.pop(member, None)
+
+    def snapshot(self) -> dict[str, int]:
+        """In-flight counts keyed as ``attribute=value``."""
+        return {
+            f"{name}={value}": count for (name, value), count in self._in_flight.items()
+        }
+
+
+@dataclass(frozen=True)
+class FailureBudget:
+    """Failures tolerated before scheduling stops, per run or per wave.
+
+    ``max_failures`` is an absolute count and ``max_failure_percent`` a share
+    of the devices in scope; when both are set the stricter one applies.
+    """
+
+    max_failures: int | None = None
+    max_failure_percent: float | None = None
+    per_wave: bool = False
+
+    def allowance(self, population: int) -> int | None:
+        """Failures allowed among ``population`` devices (None = unlimited)."""
+        limits: list[int] = []
+        if self.max_failures is not None:
+            limits.append(max(0, self.max_failures))
+        if self.max_failure_percent is not None:
+            limits.append(math.floor(population * self.max_failure_percent / 100.0))
+        return min(limits) if limits else None
+
+
+@dataclass
+class RunScheduling:
+    """Scheduling state that spans every wave of one run."""
+
+    controller: AimdConcurrencyController | None = None
+    group_limiter: GroupLimiter | None = None
+    # Session-open rate limits (shared connection limiter, per-run stagger).
+    rate_limiters: list[TokenBucket] = field(default_factory=list)
+    # This run's share of the global session budget across concurrent jobs.
+    session_lease: SessionLease | None = None
+
+
+class FanoutScheduler:
+    """Pure scheduling state for one wave; engines own the actual I/O."""
+
+    def __init__(
+        self,
+        devices: list[DeviceTarget],
+        concurrency_limit: int,
+        stop_on_error: bool,
+        controller: AimdConcurrencyController | None = None,
+        group_limiter: GroupLimiter | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rate_limiters: list[TokenBucket] | None = None,
+        failure_allowance: int | None = None,
+        failures_before: int = 0,
+        session_lease: SessionLease | None = None,
+    ):
+        # Pending devices are bucketed by limiter group so a saturated group
+        # is skipped in O(groups) instead of blocking the head of the queue.
+        self._buckets: dict[GroupKey, list[tuple[int, DeviceTarget]]] = {}
+        self._group_by_key: dict[str, GroupKey] = {}
+        self._position_by_key: dict[str, int] = {}
+        # Devices backing off before another attempt; they hold no slot.
+        self._retries: list[tuple[float, int, DeviceTarget]] = []
+        self._retry_results: dict[str, DeviceExecutionResult] = {}
+        self._abandoned: list[tuple[DeviceTarget, DeviceExecutionResult]] = []
+        self._clock = clock
+        self._throttled_until = 0.0
+        self.rate_limiters = list(rate_limiters or [])
+        self.session_lease = session_lease
+        self.attempts: dict[str, int] = {}
+        self.in_flight: dict[str, DeviceTarget] = {}
+        self.concurrency = max(1, concurrency_limit)
+        self.stop_on_error = stop_on_error
+        # stop_on_error without an explicit budget tolerates zero failures.
+        self.failure_allowance = (
+            failure_allowance
+            if failure_allowance is not None
+            else (0 if stop_on_error else None)
+        )
+        self.failures_before = failures_before
+        self.controller = controller
+        self.group_limiter = group_limiter
+        self.failed = 0
+        self.halted = False
+        for position, device in enumerate(devices):
+            self._push(position, device)
+
+    def _push(self, position: int, device: DeviceTarget) -> None:
+        group: GroupKey = ()
+        if self.group_limiter is not None:
+            group = self.group_limiter.group_of(device)
+        self._group_by_key[device.key] = group
+        self._position_by_key[device.key] = position
+        heapq.heappush(self._buckets.setdefault(group, []), (position, device))
+
+    @property
+    def pending_count(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values()) + len(
+            self._retries
+        )
+
+    @property
+    def window(self) -> int:
+        """Current in-flight limit (adaptive when a controller is attached)."""
+        if self.controller is not None:
+            return self.controller.window
+        return self.concurrency
+
+    @property
+    def budget_exceeded(self) -> bool:
+        """True once failures in scope exceed the allowance."""
+        return (
+            self.failure_allowance is not None
+            and self.failures_before + self.failed > self.failure_allowance
+        )
+
+    def has_work(self) -> bool:
+        return bool(self._buckets or self._retries or self.in_flight)
+
+    def halt(self) -> None:
+        """Stop releasing pending devices; in-flight devices still finish."""
+        self.halted = True
+        self._buckets.clear()
+        self._abandoned = self.drain_retries()
+
+    def drain_retries(self) -> list[tuple[DeviceTarget, DeviceExecutionResult]]:
+        """Drop queued retries and return each device with its last failed result."""
+        drained = self._abandoned + [
+            (device, self._retry_results.pop(device.key))
+            for _, _, device in sorted(self._retries)
+        ]
+        self._retries = []
+        self._abandoned = []
+        return drained
+
+    def next_retry_in(self) -> float | None:
+        """Seconds until the earliest queued retry is due, or None if none."""
+        if not self._retries:
+            return None
+        return max(0.0, self._retries[0][0] - self._clock())
+
+    def next_wakeup(self) -> float | None:
+        """Seconds until a queued retry is due or the rate limit lifts."""
+        waits = [self.next_retry_in()]
+        throttled_for = self._throttled_until - self._clock()
+        if self._buckets and throttled_for > 0:
+            waits.append(throttled_for)
+        known = [wait for wait in waits if wait is not None]
+        return min(known) if known else None
+
+    def _release_due_retries(self) -> None:
+        now = self._clock()
+        while self._retries and self._retries[0][0] <= now:
+            _, position, device = heapq.heappop(self._retries)
+            self._retry_results.pop(device.key, None)
+            self._push(position, device)
+
+    def next_device(self) -> DeviceTarget | None:
+        """Return the earliest eligible pending device, or None if none may start."""
+        if self.halted:
+            return None
+        self._release_due_retries()
+        if not self._buckets:
+            return None
+        if len(self.in_flight) >= self.window:
+            return None
+        chosen: GroupKey | None = None
+        for group, bucket in self._buckets.items():
+            if self.group_limiter is not None and not self.group_limiter.can_start(
+                group
+            ):
+                continue
+            if chosen is None or bucket[0][0] < self._buckets[chosen][0][0]:
+                chosen = group
+        if chosen is None:
+            return None
+        if not self._acquire_session():
+            return None
+        bucket = self._buckets[chosen]
+        _, device = heapq.heappop(bucket)
+        if not bucket:
+            del self._buckets[chosen]
+        if self.group_limiter is not None:
+            self.group_limiter.acquire(chosen)
+        self.in_flight[device.key] = device
+        self.attempts[device.key] = self.attempts.get(device.key, 0) + 1
+        return device
+
+    def _acquire_session(self) -> bool:
+        """Take a global session slot and a rate-limit token, or throttle."""
+        wait = max((bucket.wait_time() for bucket in self.rate_limiters), default=0.0)
+        if wait <= 0:
+            if self.session_lease is not None and not self.session_lease.try_acquire():
+                wait = SESSION_RETRY_SECONDS
+            else:
+                wait = try_acquire_all(self.rate_limiters)
+                if wait > 0 and self.session_lease is not None:
+                    # Lost a token race; hand the slot back quietly so this
+                    # run's own listener does not wake it in a loop.
+                    self.session_lease.release(notify=False)
+        if wait > 0:
+            self._throttled_until = self._clock() + wait
+            return False
+        return True
+
+    def _release(self, device: DeviceTarget) -> None:
+        if self.in_flight.pop(device.key, None) is None:
+            return
+        if self.group_limiter:
+            self.group_limiter.release(self._group_by_key.get(device.key, ()))
+        if self.session_lease is not None:
+            self.session_lease.release()
+
+    def _observe(self, result: DeviceExecutionResult) -> WindowChange | None:
+        if self.controller is None or result.status == "cancelled":
+            return None
+        return self.controller.record(result.duration_seconds, result.error_code)
+
+    def retry(
+        self, device: DeviceTarget, result: DeviceExecutionResult, delay: float
+    ) -> WindowChange | None:
+        """Free the device's slot and queue it for another attempt after ``delay``."""
+        self._release(device)
+        self._retry_results[device.key] = result
+        heapq.heappush(
+            self._retries,
+            (
+                self._clock() + max(0.0, delay),
+                self._position_by_key.get(device.key, 0),
+                device,
+            ),
+        )
+        return self._observe(result)
+
+    def complete(
+        self, device: DeviceTarget, result: DeviceExecutionResult
+    ) -> WindowChange | None:
+        """Record a finished device; return the adaptive window change, if any."""
+        self._release(device)
+        if result.status != "success":
+            self.failed += 1
+            if self.budget_exceeded and not self.halted:
+                self.halt()
+        return self._observe(result)
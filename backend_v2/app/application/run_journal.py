@@ -0,0 +1,94 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Durable per-device run journal used to resume interrupted rollouts."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from backend_v2.app.domain.models import DeviceExecutionResult, JobRecord
+
+# Outcomes that mean the device was actually configured (or tried and
+# failed); anything else, e.g. cancelled before its session, runs again.
+FINISHED_DEVICE_STATUSES = frozenset({"success", "failed"})
+
+
+@dataclass
+class JournaledRun:
+    """Replayed journal of one job: its run request and device outcomes."""
+
+    job_id: str
+    job_name: str
+    creator: str
+    global_vars: dict[str, str] = field(default_factory=dict)
+    # Original job creation time; empty for journals written before it existed.
+    created_at: str = ""
+    request: dict[str, Any] = field(default_factory=dict)
+    device_status: dict[str, str] = field(default_factory=dict)
+    # Last recorded run status; None while a run is started but not finished.
+    status: str | None = None
+
+    @property
+    def interrupted(self) -> bool:
+        return self.status is None
+
+    @property
+    def finished_devices(self) -> list[str]:
+        return [
+            key
+            for key, status in self.device_status.items()
+            if status in FINISHED_DEVICE_STATUSES
+        ]
+
+    def remaining_devices(self) -> list[str]:
+        """Requested devices that have not finished, in request order."""
+        finished = set(self.finished_devices)
+        return [
+            key
+            for key in self.request.get("imported_device_keys") or []
+            if key not in finished
+        ]
+
+
+class RunJournal(Protocol):
+    """Append-only record of run starts, device outcomes and run ends.
+
+    ``record_device`` is called on the scheduler thread, so implementations
+    must not block on I/O or raise write errors into the run.
+    """
+
+    def start_run(self, job: JobRecord, request: dict[str, Any]) -> None:
+        """Record that a run of ``job`` started with ``request``."""
+
+    def record_device(
+        self, job_id: str, device_key: str, result: DeviceExecutionResult
+    ) -> None:
+        """Record one device's final outcome."""
+
+    def finish_run(self, job_id: str, status: str) -> None:
+        """Record that the run reached a terminal status."""
+
+    def load(self, job_id: str) -> JournaledRun | None:
+        """Replay the journal of one job."""
+
+    def interrupted(self) -> list[JournaledRun]:
+        """Runs that started but never finished (e.g. the process died)."""
+
+    def clear(self) -> int:
+        """Delete every job's journal; return how many were removed."""
@@ -0,0 +1,141 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Global device-session budget shared fairly across concurrent jobs."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+
+# Fallback re-check interval for a refused lease; releases also wake waiters
+# through listeners, so this only bounds the worst case.
+SESSION_RETRY_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class JobSessionState:
+    """Per-job view of the session budget."""
+
+    in_use: int
+    fair_share: int
+    waiting: bool
+
+
+class FairShareSessionBudget:
+    """Caps concurrent device sessions across jobs with max-min fair sharing.
+
+    Every registered job is entitled to ``total // jobs`` sessions. A job may
+    go beyond its share while capacity is free, but not while another job
+    below its share is waiting, so a large job cannot starve a small one.
+    """
+
+    def __init__(self, total: int):
+        self.total = max(1, total)
+        self._lock = Lock()
+        self._in_use: dict[str, int] = {}
+        self._waiting: set[str] = set()
+        self._listeners: list[Callable[[], None]] = []
+
+    def _fair_share_locked(self) -> int:
+        return max(1, self.total // max(1, len(self._in_use)))
+
+    def register(self, job_id: str) -> SessionLease:
+        with self._lock:
+            self._in_use.setdefault(job_id, 0)
+        return SessionLease(self, job_id)
+
+    def unregister(self, job_id: str) -> None:
+        with self._lock:
+            self._in_use.pop(job_id, None)
+            self._waiting.discard(job_id)
+        self._notify()
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call ``listener`` whenever capacity may have freed up."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def remove() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return remove
+
+    def _notify(self) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+
+    def try_acquire(self, job_id: str) -> bool:
+        with self._lock:
+            held = self._in_use.get(job_id, 0)
+            share = self._fair_share_locked()
+            if sum(self._in_use.values()) >= self.total:
+                granted = False
+            elif held < share:
+                granted = True
+            else:
+                granted = not any(
+                    other != job_id and self._in_use.get(other, 0) < share
+                    for other in self._waiting
+                )
+            if granted:
+                self._in_use[job_id] = held + 1
+                self._waiting.discard(job_id)
+            else:
+                self._waiting.add(job_id)
+            return granted
+
+    def release(self, job_id: str, notify: bool = True) -> None:
+        with self._lock:
+            if self._in_use.get(job_id, 0) > 0:
+                self._in_use[job_id] -= 1
+        if notify:
+            self._notify()
+
+    def snapshot(self) -> tuple[int, dict[str, JobSessionState]]:
+        """Return total in-use sessions and per-job state."""
+        with self._lock:
+            share = self._fair_share_locked()
+            jobs = {
+                job_id: JobSessionState(
+                    in_use=count, fair_share=share, waiting=job_id in self._waiting
+                )
+                for job_id, count in self._in_use.items()
+            }
+            return sum(self._in_use.values()), jobs
+
+
+class SessionLease:
+    """One job's handle on the shared session budget."""
+
+    def __init__(self, budget: FairShareSessionBudget, job_id: str):
+        self.budget = budget
+        self.job_id = job_id
+
+    def try_acquire(self) -> bool:
+        return self.budget.try_acquire(self.job_id)
+
+    def release(self, notify: bool = True) -> None:
+        self.budget.release(self.job_id, notify=notify)
+
+    def close(self) -> None:
+        self.budget.unregister(self.job_id)
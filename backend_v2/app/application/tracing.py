@@ -0,0 +1,217 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Span tracing of job and device execution with local exporters.
+
+The active span lives in a context variable, so nested ``span()`` calls
+become children without threading a parent through every signature. Work
+handed to another thread keeps its parent when submitted through
+``in_current_context``. ``span()`` outside a sampled trace is a no-op.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import logging
+import secrets
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import ParamSpec, Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@dataclass
+class Span:
+    """One timed operation; ``trace_id`` is the job id."""
+
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    name: str
+    start_time: float
+    duration_seconds: float = 0.0
+    attributes: dict[str, str] = field(default_factory=dict)
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: object) -> None:
+        self.attributes[key] = str(value)
+
+
+class SpanExporter(Protocol):
+    """Receives every finished span of a sampled trace."""
+
+    def export(self, span: Span) -> None:
+        """Store or write one finished span."""
+
+
+@dataclass(frozen=True)
+class _ActiveSpan:
+    tracer: Tracer
+    span: Span
+
+
+_current: contextvars.ContextVar[_ActiveSpan | None] = contextvars.ContextVar(
+    "nw_edit_current_span", default=None
+)
+
+
+class Tracer:
+    """Starts job traces and sends finished spans to the exporters.
+
+    Sampling is decided once per job from a hash of its id, so a run and its
+    resumes are either fully traced or not traced at all.
+    """
+
+    def __init__(self, exporters: list[SpanExporter], sample_rate: float = 1.0):
+        self.exporters = list(exporters)
+        self.sample_rate = min(1.0, max(0.0, sample_rate))
+
+    def sampled(self, job_id: str) -> bool:
+        if self.sample_rate >= 1.0:
+            return True
+        return zlib.crc32(job_id.encode()) / 0xFFFFFFFF < self.sample_rate
+
+    @contextmanager
+    def trace(self, job_id: str, name: str, **attributes: object) -> Iterator[None]:
+        """Root span for ``job_id``; nested ``span()`` calls attach to it."""
+        if not self.exporters or not self.sampled(job_id):
+            token = _current.set(None)
+            try:
+                yield
+            finally:
+                _current.reset(token)
+            return
+        with _open(self, job_id, None, name, attributes):
+            yield
+
+    def _export(self, span: Span) -> None:
+        # Tracing must never change execution results: a failing exporter
+        # (e.g. a full disk under the trace file) is logged, not raised.
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception:
+                logger.exception("Span exporter %s failed", type(exporter).__name__)
+
+
+@contextmanager
+def _open(
+    tracer: Tracer,
+    trace_id: str,
+    parent_id: str | None,
+    name: str,
+    attributes: dict[str, object],
+) -> Iterator[Span]:
+    record = Span(
+        trace_id=trace_id,
+        span_id=secrets.token_hex(8),
+        parent_id=parent_id,
+        name=name,
+        start_time=time.time(),
+        attributes={key: str(value) for key, value in attributes.items()},
+    )
+    started = time.perf_counter()
+    token = _current.set(_ActiveSpan(tracer, record))
+    try:
+        yield record
+    except BaseException as exc:
+        record.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        _current.reset(token)
+        record.duration_seconds = time.perf_counter() - started
+        tracer._export(record)
+
+
+@contextmanager
+def span(name: str, **attributes: object) -> Iterator[Span | None]:
+    """Child of the active span; yields None when no trace is being recorded."""
+    active = _current.get()
+    if active is None:
+        yield None
+        return
+    with _open(
+        active.tracer, active.span.trace_id, active.span.span_id, name, attributes
+    ) as child:
+        yield child
+
+
+def traced(name: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Decorator running a (synchronous) function inside ``span(name)``."""
+
+    def decorate(fn: Callable[P, T]) -> Callable[P, T]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def in_current_context(fn: Callable[..., T]) -> Callable[..., T]:
+    """Bind ``fn`` to a copy of the caller's context for another thread."""
+    return functools.partial(contextvars.copy_context().run, fn)
+
+
+@dataclass(frozen=True)
+class WaterfallRow:
+    """One span placed on a job timeline."""
+
+    span: Span
+    depth: int
+    offset_seconds: float
+
+
+def waterfall(spans: list[Span]) -> list[WaterfallRow]:
+    """Order spans depth-first by start time with offsets from the first span.
+
+    Spans whose parent was not recorded (evicted or unsampled) start a new root.
+    """
+    if not spans:
+        return []
+    by_id = {span.span_id: span for span in spans}
+    children: dict[str | None, list[Span]] = {}
+    for span_ in spans:
+        parent = span_.parent_id if span_.parent_id in by_id else None
+        children.setdefault(parent, []).append(span_)
+    origin = min(span_.start_time for span_ in spans)
+    rows: list[WaterfallRow] = []
+    stack = [
+        (root, 0) for root in sorted(children.get(None, []), key=_start, reverse=True)
+    ]
+    while stack:
+        current, depth = stack.pop()
+        rows.append(WaterfallRow(current, depth, current.start_time - origin))
+        for child in sorted(
+            children.get(current.span_id, []), key=_start, reverse=True
+        ):
+            stack.append((child, depth + 1))
+    return rows
+
+
+def _start(span_: Span) -> float:
+    return span_.start_time
@@ -0,0 +1,284 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Long-lived worker pool shared by runs, imports and status commands."""
+
+from __future__ import annotations
+
+import itertools
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+POOL_OPERATIONS = ("run", "import", "status")
+
+
+@dataclass
+class _PoolTask:
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    future: Future[Any]
+    operation: str
+    owner: str
+    limit: int | None
+    enqueued_at: float
+    sequence: int
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time utilization of the shared pool."""
+
+    capacity: int
+    active: int
+    queued: int
+    completed: int
+    mean_wait_seconds: float
+    max_wait_seconds: float
+    operation_quotas: dict[str, int] = field(default_factory=dict)
+    active_by_operation: dict[str, int] = field(default_factory=dict)
+    queued_by_operation: dict[str, int] = field(default_factory=dict)
+    active_by_owner: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def utilization(self) -> float:
+        return self.active / self.capacity if self.capacity else 0.0
+
+
+class SessionWorkerPool:
+    """Caps device sessions process-wide with per-operation and per-owner quotas.
+
+    Work is queued FIFO and started by the first free thread whose quotas
+    allow it, so a burst of imports queues behind its own quota instead of
+    taking slots a running job needs. Threads are created once and reused
+    across runs.
+
+    Queued work is kept in one deque per operation, owner and limit; all
+    tasks of a deque pass or fail the quota check together, so a dispatch
+    only looks at the deque heads instead of rescanning every queued task.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int,
+        operation_quotas: dict[str, int] | None = None,
+        owner_quota: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = max(1, max_sessions)
+        self.operation_quotas = {
+            operation: max(1, quota)
+            for operation, quota in (operation_quotas or {}).items()
+        }
+        self.owner_quota = max(1, owner_quota) if owner_quota else None
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.capacity, thread_name_prefix="nw-edit-session"
+        )
+        self._lock = Lock()
+        self._queues: dict[tuple[str, str, int | None], deque[_PoolTask]] = {}
+        self._queued = 0
+        self._sequence = itertools.count()
+        self._active = 0
+        self._active_by_operation: dict[str, int] = {}
+        self._active_by_owner: dict[str, int] = {}
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def executor(
+        self, operation: str, owner: str, limit: int | None = None
+    ) -> PoolExecutor:
+        """Executor facade submitting as ``owner``; ``limit`` caps its own slots."""
+        return PoolExecutor(self, operation, owner, limit)
+
+    def submit(
+        self,
+        operation: str,
+        owner: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        limit: int | None = None,
+        **kwargs: Any,
+    ) -> Future[Any]:
+        future: Future[Any] = Future()
+        with self._lock:
+            task = _PoolTask(
+                fn,
+                args,
+                kwargs,
+                future,
+                operation,
+                owner,
+                limit,
+                self._clock(),
+                next(self._sequence),
+            )
+            self._queues.setdefault((operation, owner, limit), deque()).append(task)
+            self._queued += 1
+            self._dispatch_locked()
+        return future
+
+    def _allowed_locked(self, task: _PoolTask) -> bool:
+        if self._active >= self.capacity:
+            return False
+        quota = self.operation_quotas.get(task.operation)
+        if (
+            quota is not None
+            and self._active_by_operation.get(task.operation, 0) >= quota
+        ):
+            return False
+        owner_limits = [
+            limit for limit in (self.owner_quota, task.limit) if limit is not None
+        ]
+        held = self._active_by_owner.get(task.owner, 0)
+        return not owner_limits or held < min(owner_limits)
+
+    def _dispatch_locked(self) -> None:
+        while self._active < self.capacity and self._queued:
+            # The oldest head whose quotas allow it keeps the queue FIFO.
+            ready = [
+                key
+                for key, queue in self._queues.items()
+                if self._allowed_locked(queue[0])
+            ]
+            if not ready:
+                return
+            key = min(ready, key=lambda ready_key: self._queues[ready_key][0].sequence)
+            queue = self._queues[key]
+            task = queue.popleft()
+            if not queue:
+                del self._queues[key]
+            self._queued -= 1
+            self._active += 1
+            self._active_by_operation[task.operation] = (
+                self._active_by_operation.get(task.operation, 0) + 1
+            )
+            self._active_by_owner[task.owner] = (
+                self._active_by_owner.get(task.owner, 0) + 1
+            )
+            waited = self._clock() - task.enqueued_at
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            self._executor.submit(self._run, task)
+
+    def _run(self, task: _PoolTask) -> None:
+        outcome: Any = None
+        error: BaseException | None = None
+        if task.future.set_running_or_notify_cancel():
+            try:
+                outcome = task.fn(*task.args, **task.kwargs)
+            except BaseException as exc:  # noqa: BLE001 - handed to the caller
+                error = exc
+        with self._lock:
+            self._active -= 1
+            self._decrement(self._active_by_operation, task.operation)
+            self._decrement(self._active_by_owner, task.owner)
+            self._completed += 1
+            self._dispatch_locked()
+        # Resolve after freeing the slot so a waiter can resubmit immediately.
+        if task.future.cancelled():
+            return
+        if error is not None:
+            task.future.set_exception(error)
+        else:
+            task.future.set_result(outcome)
+
+    @staticmethod
+    def _decrement(counts: dict[str, int], key: str) -> None:
+        remaining = counts.get(key, 0) - 1
+        if remaining > 0:
+            counts[key] = remaining
+        else:
+            counts.pop(key, None)
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            queued_by_operation: dict[str, int] = {}
+            for (operation, _, _), queue in self._queues.items():
+                queued_by_operation[operation] = queued_by_operation.get(
+                    operation, 0
+                ) + len(queue)
+            started = self._completed + self._active
+            return PoolStats(
+                capacity=self.capacity,
+                active=self._active,
+                queued=self._queued,
+                completed=self._completed,
+                mean_wait_seconds=self._total_wait / started if started else 0.0,
+                max_wait_seconds=self._max_wait,
+                operation_quotas=dict(self.operation_quotas),
+                active_by_operation=dict(self._active_by_operation),
+                queued_by_operation=queued_by_operation,
+                active_by_owner=dict(self._active_by_owner),
+            )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+class PoolExecutor(Executor):
+    """``concurrent.futures.Executor`` view of the pool for one owner.
+
+    ``shutdown(wait=True)`` (and leaving a ``with`` block) waits only for
+    work submitted through this view; the shared threads stay alive.
+    """
+
+    def __init__(
+        self,
+        pool: SessionWorkerPool,
+        operation: str,
+        owner: str,
+        limit: int | None = None,
+    ):
+        self.pool = pool
+        self.operation = operation
+        self.owner = owner
+        self.limit = limit
+        # Unfinished futures only; each removes itself when done.
+        self._futures: set[Future[Any]] = set()
+        self._futures_lock = Lock()
+
+    def _forget(self, future: Future[Any]) -> None:
+        with self._futures_lock:
+            self._futures.discard(future)
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        future = self.pool.submit(
+            self.operation, self.owner, fn, *args, limit=self.limit, **kwargs
+        )
+        with self._futures_lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._futures_lock:
+            pending = list(self._futures)
+        if cancel_futures:
+            for future in pending:
+                future.cancel()
+        if wait and pending:
+            wait_for_futures(pending)
@@ -17,8 +17,9 @@
 # Review required for correctness, security, and licensing.
 """Domain models for the v2 execution engine."""
 
-from dataclasses import dataclass, field
-from typing import Optional
+import math
+from dataclasses import dataclass, field, replace
+from typing import Any, Optional
 from enum import Enum
 
 
@@ -102,6 +103,7 @@ class DeviceExecutionResult:
     error: Optional[str] = None
     error_code: Optional[str] = None
     attempts: int = 1
+    duration_seconds: float = 0.0
     pre_output: Optional[str] = None
     apply_output: Optional[str] = None
     post_output: Optional[str] = None
@@ -109,6 +111,76 @@ class DeviceExecutionResult:
     diff_truncated: bool = False
     diff_original_size: int = 0
     log_trimmed: bool = False
+    # Monotonic seconds per execution stage (connect, pre_verify, apply, ...).
+    stage_timings: dict[str, float] = field(default_factory=dict)
+    # Where the SSH session came from (warm, pooled, new); None when unpooled.
+    session_source: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StagePercentiles:
+    """Nearest-rank latency percentiles of one stage."""
+
+    count: int
+    p50: float
+    p95: float
+    p99: float
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, math.ceil(percent / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def stage_percentiles(
+    results: list[DeviceExecutionResult],
+) -> dict[str, StagePercentiles]:
+    """p50/p95/p99 per stage, plus ``total`` (whole attempt) for every result."""
+    samples: dict[str, list[float]] = {}
+    for result in results:
+        if result.status == "cancelled":
+            continue
+        samples.setdefault("total", []).append(result.duration_seconds)
+        for stage, seconds in result.stage_timings.items():
+            samples.setdefault(stage, []).append(seconds)
+    stats: dict[str, StagePercentiles] = {}
+    for stage, values in samples.items():
+        values.sort()
+        stats[stage] = StagePercentiles(
+            count=len(values),
+            p50=percentile(values, 50),
+            p95=percentile(values, 95),
+            p99=percentile(values, 99),
+        )
+    return stats
+
+
+@dataclass
+class WaveSummary:
+    """Progress of one rollout wave (wave 0 is the canary)."""
+
+    index: int
+    label: str
+    device_keys: list[str] = field(default_factory=list)
+    status: str = "pending"
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RunProgress:
+    """Device counts of a run; ``in_progress`` includes devices backing off to retry."""
+
+    total: int
+    started: int
+    finished: int
+    in_progress: int
+    pending: int
+
+    @property
+    def percent_complete(self) -> float:
+        return 100.0 * self.finished / self.total if self.total else 100.0
 
 
 @dataclass
@@ -121,6 +193,94 @@ class JobRunSummary:
     commands: list[str] = field(default_factory=list)
     verify_commands: list[str] = field(default_factory=list)
     target_device_keys: list[str] = field(default_factory=list)
+    waves: list[WaveSummary] = field(default_factory=list)
+    # Device keys in the order they were started, with the expected duration
+    # each device was scheduled with (actual time is on the device result).
+    schedule_order: list[str] = field(default_factory=list)
+    estimated_durations: dict[str, float] = field(default_factory=dict)
+    # Maintained by record_result so callers never rescan device_results.
+    status_counts: dict[str, int] = field(default_factory=dict)
+    device_types: dict[str, str] = field(default_factory=dict)
+
+    def record_result(self, device_key: str, result: DeviceExecutionResult) -> None:
+        """Store a device result and update status counters in O(1)."""
+        previous = self.device_results.get(device_key)
+        if previous is not None:
+            remaining = self.status_counts.get(previous.status, 0) - 1
+            if remaining > 0:
+                self.status_counts[previous.status] = remaining
+            else:
+                self.status_counts.pop(previous.status, None)
+        self.device_results[device_key] = result
+        self.status_counts[result.status] = self.status_counts.get(result.status, 0) + 1
+
+    @property
+    def failure_count(self) -> int:
+        """Number of recorded devices that did not succeed."""
+        return len(self.device_results) - self.status_counts.get("success", 0)
+
+    def stage_percentiles(self) -> dict[str, StagePercentiles]:
+        return stage_percentiles(list(self.device_results.values()))
+
+    def stage_percentiles_by_device_type(
+        self,
+    ) -> dict[str, dict[str, StagePercentiles]]:
+        by_type: dict[str, list[DeviceExecutionResult]] = {}
+        for key, result in self.device_results.items():
+            device_type = self.device_types.get(key, "unknown")
+            by_type.setdefault(device_type, []).append(result)
+        return {
+            device_type: stage_percentiles(results)
+            for device_type, results in sorted(by_type.items())
+        }
+
+    def session_sources(self) -> dict[str, int]:
+        """Device results counted by the SSH session source they ran on."""
+        counts: dict[str, int] = {}
+        for result in self.device_results.values():
+            if result.session_source is not None:
+                counts[result.session_source] = counts.get(result.session_source, 0) + 1
+        return counts
+
+    def warm_session_hit_rate(self) -> Optional[float]:
+        """Share of pooled-session devices that ran on a warm import session."""
+        counts = self.session_sources()
+        total = sum(counts.values())
+        return counts.get("warm", 0) / total if total else None
+
+    def progress(self) -> RunProgress:
+        total = len(self.target_device_keys)
+        finished = len(self.device_results)
+        started = max(finished, len(self.schedule_order))
+        return RunProgress(
+            total=total,
+            started=started,
+            finished=finished,
+            in_progress=started - finished,
+            pending=max(0, total - started),
+        )
+
+    def snapshot(self) -> "JobRunSummary":
+        """Copy that is safe to read while the engine keeps recording results.
+
+        Container copies are single C-level operations under the GIL, so no
+        lock is needed against the engine thread appending to them.
+        """
+        return replace(
+            self,
+            device_results=dict(self.device_results),
+            commands=list(self.commands),
+            verify_commands=list(self.verify_commands),
+            target_device_keys=list(self.target_device_keys),
+            waves=[
+                replace(wave, device_keys=list(wave.device_keys))
+                for wave in list(self.waves)
+            ],
+            schedule_order=list(self.schedule_order),
+            estimated_durations=dict(self.estimated_durations),
+            status_counts=dict(self.status_counts),
+            device_types=dict(self.device_types),
+        )
 
 
 @dataclass(frozen=True)
@@ -134,6 +294,7 @@ class ExecutionPreset:
     verify_commands: list[str]
     created_at: str
     updated_at: str
+    diff_ignore_patterns: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -151,7 +312,29 @@ class DeviceProfile:
     prod: bool = False
     connection_ok: bool = False
     error_message: Optional[str] = None
+    jump_host: Optional[str] = None
+    jump_port: int = 22
+    jump_username: Optional[str] = None
+    jump_password: Optional[str] = None
 
     @property
     def key(self) -> str:
         return f"{self.host}:{self.port}"
+
+    def connection_params(self) -> dict[str, Any]:
+        """Netmiko connection parameters, including the jump host when set."""
+        params: dict[str, Any] = {
+            "host": self.host,
+            "port": self.port,
+            "device_type": self.device_type,
+            "username": self.username,
+            "password": self.password,
+        }
+        if self.jump_host:
+            params.update(
+                jump_host=self.jump_host,
+                jump_port=self.jump_port,
+                jump_username=self.jump_username,
+                jump_password=self.jump_password,
+            )
+        return params
@@ -0,0 +1,276 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Shared bastion transports carrying device sessions as direct-tcpip channels."""
+
+from __future__ import annotations
+
+import socket
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from threading import Condition
+from typing import Any
+
+DEFAULT_TRANSPORTS_PER_BASTION = 2
+DEFAULT_CHANNELS_PER_TRANSPORT = 10
+DEFAULT_BASTION_IDLE_TTL_SECONDS = 300.0
+BASTION_CONNECT_TIMEOUT = 10
+
+
+@dataclass(frozen=True)
+class JumpHost:
+    """Bastion a device is reached through."""
+
+    host: str
+    port: int
+    username: str
+    password: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.username}@{self.host}:{self.port}"
+
+
+def jump_host_for(device_params: dict[str, Any]) -> JumpHost | None:
+    """Jump host of ``device_params``; credentials default to the device's."""
+    host = str(device_params.get("jump_host") or "").strip()
+    if not host:
+        return None
+    return JumpHost(
+        host=host,
+        port=int(device_params.get("jump_port") or 22),
+        username=str(device_params.get("jump_username") or device_params["username"]),
+        password=str(device_params.get("jump_password") or device_params["password"]),
+    )
+
+
+def open_bastion_transport(
+    jump: JumpHost, timeout: float = BASTION_CONNECT_TIMEOUT, keepalive: int = 0
+) -> Any:
+    """Connect and password-authenticate one paramiko transport to ``jump``."""
+    import paramiko  # type: ignore[import-untyped]
+
+    transport = paramiko.Transport(
+        socket.create_connection((jump.host, jump.port), timeout=timeout)
+    )
+    try:
+        transport.start_client(timeout=timeout)
+        transport.auth_password(jump.username, jump.password)
+        if keepalive > 0:
+            transport.set_keepalive(keepalive)
+    except BaseException:
+        transport.close()
+        raise
+    return transport
+
+
+def _close(transport: Any) -> None:
+    try:
+        transport.close()
+    except Exception:
+        pass
+
+
+def _is_active(transport: Any) -> bool:
+    try:
+        return bool(transport.is_active())
+    except Exception:
+        return False
+
+
+@dataclass
+class _Transport:
+    transport: Any
+    last_used: float
+    channels: list[Any] = field(default_factory=list)
+    opening: int = 0
+
+    def load(self) -> int:
+        self.channels = [channel for channel in self.channels if not channel.closed]
+        return len(self.channels) + self.opening
+
+
+@dataclass(frozen=True)
+class BastionPoolStats:
+    """Counters of one bastion transport pool."""
+
+    bastions: int
+    transports: int
+    channels: int
+    opened_transports: int
+    opened_channels: int
+
+
+class BastionTransportPool:
+    """A few authenticated SSH transports per bastion, shared by device sessions.
+
+    Each device session is a ``direct-tcpip`` channel on the least loaded
+    transport, so a run logs in to the bastion at most
+    ``transports_per_bastion`` times however many devices it reaches. A new
+    transport is opened, one login at a time, only while every existing one
+    carries ``channels_per_transport`` channels; past that limit channels
+    are spread over the existing transports. Dead transports are dropped, and
+    transports without channels are closed after ``idle_ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        transports_per_bastion: int = DEFAULT_TRANSPORTS_PER_BASTION,
+        channels_per_transport: int = DEFAULT_CHANNELS_PER_TRANSPORT,
+        idle_ttl_seconds: float = DEFAULT_BASTION_IDLE_TTL_SECONDS,
+        keepalive_seconds: int = 0,
+        connect_timeout: float = BASTION_CONNECT_TIMEOUT,
+        opener: Callable[[JumpHost], Any] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.transports_per_bastion = max(1, transports_per_bastion)
+        self.channels_per_transport = max(1, channels_per_transport)
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.connect_timeout = connect_timeout
+        self._opener = opener or (
+            lambda jump: open_bastion_transport(
+                jump, timeout=connect_timeout, keepalive=keepalive_seconds
+            )
+        )
+        self._clock = clock
+        self._cond = Condition()
+        # Keyed by credentials too: a re-imported password must not ride on
+        # a transport authenticated with the old one.
+        self._transports: dict[JumpHost, list[_Transport]] = {}
+        self._connecting: dict[JumpHost, int] = {}
+        self._opened_transports = 0
+        self._opened_channels = 0
+
+    def _prune_locked(self, now: float) -> list[Any]:
+        stale: list[Any] = []
+        for jump in list(self._transports):
+            kept: list[_Transport] = []
+            for entry in self._transports[jump]:
+                idle = entry.load() == 0
+                if not _is_active(entry.transport) or (
+                    idle and now - entry.last_used > self.idle_ttl_seconds
+                ):
+                    stale.append(entry.transport)
+                else:
+                    kept.append(entry)
+            if kept:
+                self._transports[jump] = kept
+            else:
+                del self._transports[jump]
+        return stale
+
+    def _reserve_locked(self, jump: JumpHost) -> _Transport | None:
+        """Pick a transport for one more channel; None means open a new one."""
+        while True:
+            entries = self._transports.get(jump, [])
+            free = [e for e in entries if e.load() < self.channels_per_transport]
+            connecting = self._connecting.get(jump, 0)
+            at_limit = len(entries) + connecting >= self.transports_per_bastion
+            candidates = free or (entries if at_limit else [])
+            if candidates:
+                chosen = min(candidates, key=lambda entry: entry.load())
+                chosen.opening += 1
+                return chosen
+            if connecting == 0 and not at_limit:
+                self._connecting[jump] = 1
+                return None
+            # One login per bastion at a time: a burst of first sessions
+            # waits for the transport being opened instead of opening more.
+            self._cond.wait()
+
+    def _connect(self, jump: JumpHost) -> _Transport:
+        try:
+            transport = self._opener(jump)
+        except BaseException:
+            with self._cond:
+                self._connecting[jump] -= 1
+                self._cond.notify_all()
+            raise
+        entry = _Transport(transport, self._clock(), opening=1)
+        with self._cond:
+            self._connecting[jump] -= 1
+            self._transports.setdefault(jump, []).append(entry)
+            self._opened_transports += 1
+            self._cond.notify_all()
+        return entry
+
+    def open_channel(self, jump: JumpHost, host: str, port: int) -> Any:
+        """Open a ``direct-tcpip`` channel to ``host:port`` through ``jump``.
+
+        The channel is a socket-like object for an SSH client's ``sock``;
+        closing it frees its slot on the transport.
+        """
+        with self._cond:
+            stale = self._prune_locked(self._clock())
+            entry = self._reserve_locked(jump)
+        for transport in stale:
+            _close(transport)
+        if entry is None:
+            entry = self._connect(jump)
+        try:
+            channel = entry.transport.open_channel(
+                "direct-tcpip",
+                (host, port),
+                ("127.0.0.1", 0),
+                timeout=self.connect_timeout,
+            )
+        except BaseException:
+            with self._cond:
+                entry.opening -= 1
+            raise
+        with self._cond:
+            entry.opening -= 1
+            entry.channels.append(channel)
+            entry.last_used = self._clock()
+            self._opened_channels += 1
+        return channel
+
+    def prune(self) -> int:
+        """Close dead and idle-expired transports; return how many closed.
+
+        Called periodically by ``PoolReaper`` so quiet pools still expire.
+        """
+        with self._cond:
+            stale = self._prune_locked(self._clock())
+        for transport in stale:
+            _close(transport)
+        return len(stale)
+
+    def close_all(self) -> int:
+        """Close every transport, and with them every channel they carry."""
+        with self._cond:
+            transports = [
+                entry.transport
+                for entries in self._transports.values()
+                for entry in entries
+            ]
+            self._transports.clear()
+        for transport in transports:
+            _close(transport)
+        return len(transports)
+
+    def stats(self) -> BastionPoolStats:
+        with self._cond:
+            entries = [entry for group in self._transports.values() for entry in group]
+            return BastionPoolStats(
+                bastions=len({jump.key for jump in self._transports}),
+                transports=len(entries),
+                channels=sum(entry.load() for entry in entries),
+                opened_transports=self._opened_transports,
+                opened_channels=self._opened_channels,
+            )
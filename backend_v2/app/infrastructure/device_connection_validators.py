@@ -21,6 +21,8 @@ from __future__ import annotations
 
 from backend_v2.app.application.device_import_service import DeviceConnectionValidator
 from backend_v2.app.domain.models import DeviceProfile
+from backend_v2.app.infrastructure.bastion_pool import BastionTransportPool
+from backend_v2.app.infrastructure.netmiko_session_pool import NetmikoSessionPool
 
 
 class SimulatedConnectionValidator(DeviceConnectionValidator):
@@ -34,17 +36,27 @@ class SimulatedConnectionValidator(DeviceConnectionValidator):
 class NetmikoConnectionValidator(DeviceConnectionValidator):
     """Uses v2-local Netmiko validator."""
 
+    def __init__(
+        self,
+        warm_sessions: NetmikoSessionPool | None = None,
+        warm_ttl_seconds: float | None = None,
+        bastions: BastionTransportPool | None = None,
+    ):
+        # Opt-in: validated sessions stay in the pool for the next run.
+        self.warm_sessions = warm_sessions
+        self.warm_ttl_seconds = warm_ttl_seconds
+        self.bastions = bastions
+
     def validate(self, device: DeviceProfile) -> tuple[bool, str | None]:
+        # The connection token is taken by DeviceImportService before this is
+        # submitted to the shared pool, so no slot is held while rate limited.
         from backend_v2.app.infrastructure.netmiko_executor import (
             validate_device_connection,
         )
 
         return validate_device_connection(
-            {
-                "host": device.host,
-                "port": device.port,
-                "device_type": device.device_type,
-                "username": device.username,
-                "password": device.password,
-            }
+            device.connection_params(),
+            session_pool=self.warm_sessions,
+            warm_ttl_seconds=self.warm_ttl_seconds,
+            bastions=self.bastions,
         )
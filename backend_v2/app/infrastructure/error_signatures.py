@@ -0,0 +1,130 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Per-platform command error signatures compiled into one matcher."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Signatures shared by the IOS-style CLIs (IOS, IOS-XE, NX-OS, EOS).
+_CISCO_STYLE = (
+    "% Invalid input",
+    "Invalid input detected",
+    "% Ambiguous command",
+    "% Incomplete command",
+)
+
+# Used for device types without a table of their own; matches the
+# original flat pattern list.
+DEFAULT_ERROR_SIGNATURES: tuple[str, ...] = (
+    "% Invalid input",
+    "Invalid input detected",
+    "Error:",
+    "Ambiguous command",
+    "Incomplete command",
+    "Unknown action",
+)
+
+ERROR_SIGNATURES: dict[str, tuple[str, ...]] = {
+    "cisco_ios": (*_CISCO_STYLE, "% Unknown command", "Error:"),
+    "cisco_xe": (*_CISCO_STYLE, "% Unknown command", "Error:"),
+    "cisco_xr": (*_CISCO_STYLE, "% Failed to commit", "Error:"),
+    "cisco_nxos": (*_CISCO_STYLE, "% Invalid command", "ERROR:"),
+    "arista_eos": (*_CISCO_STYLE, "% Unrecognized command", "% Error"),
+    "juniper_junos": (
+        "syntax error",
+        "unknown command",
+        "missing argument",
+        "invalid value",
+        "is ambiguous",
+        "error: ",
+    ),
+    "fortinet": ("Unknown action", "Command fail", "command parse error"),
+    "linux": ("command not found", "syntax error near unexpected token"),
+}
+
+# Netmiko transport suffixes that share the SSH platform's signatures.
+_TRANSPORT_SUFFIXES = ("_ssh", "_telnet", "_serial")
+
+
+@dataclass(frozen=True)
+class ErrorMatch:
+    """First error signature found in an output."""
+
+    signature: str
+    line: str
+    line_number: int
+    offset: int
+
+    @property
+    def message(self) -> str:
+        return f"Command error detected: {self.signature}"
+
+    def describe(self) -> str:
+        """Message plus where the signature was found, for logs."""
+        return f"{self.message} (output line {self.line_number}: {self.line.strip()})"
+
+
+class ErrorSignatureMatcher:
+    """Find the earliest of several literal signatures in one scan."""
+
+    def __init__(self, signatures: tuple[str, ...]):
+        self.signatures = signatures
+        self._pattern = re.compile(
+            "|".join(
+                f"(?P<s{index}>{re.escape(signature)})"
+                for index, signature in enumerate(signatures)
+            )
+        )
+
+    def search(self, output: str) -> ErrorMatch | None:
+        found = self._pattern.search(output) if self.signatures else None
+        if found is None or found.lastgroup is None:
+            return None
+        start = found.start()
+        line_start = output.rfind("\n", 0, start) + 1
+        line_end = output.find("\n", start)
+        return ErrorMatch(
+            signature=self.signatures[int(found.lastgroup[1:])],
+            line=output[line_start : line_end if line_end >= 0 else len(output)],
+            line_number=output.count("\n", 0, start) + 1,
+            offset=start,
+        )
+
+
+def base_platform(device_type: str | None) -> str:
+    """Lower-case ``device_type`` without its Netmiko transport suffix."""
+    platform = (device_type or "").strip().lower()
+    for suffix in _TRANSPORT_SUFFIXES:
+        if platform.endswith(suffix):
+            return platform[: -len(suffix)]
+    return platform
+
+
+@lru_cache(maxsize=None)
+def _matcher_for_platform(platform: str) -> ErrorSignatureMatcher:
+    return ErrorSignatureMatcher(
+        ERROR_SIGNATURES.get(platform, DEFAULT_ERROR_SIGNATURES)
+    )
+
+
+def error_matcher_for(device_type: str | None) -> ErrorSignatureMatcher:
+    """Return the cached matcher for a Netmiko ``device_type``."""
+    return _matcher_for_platform(base_platform(device_type))
@@ -51,6 +51,14 @@ class FilePresetStore:
             return presets
         return [preset for preset in presets if preset.os_model == os_model]
 
+    def get(self, preset_id: str) -> Optional[ExecutionPreset]:
+        with self._lock:
+            items = self._read_items()
+        for item in items:
+            if str(item.get("preset_id")) == preset_id:
+                return self._from_item(item)
+        return None
+
     def list_os_models(self) -> List[str]:
         with self._lock:
             items = self._read_items()
@@ -65,6 +73,7 @@ class FilePresetStore:
         os_model: str,
         commands: List[str],
         verify_commands: List[str],
+        diff_ignore_patterns: Optional[List[str]] = None,
     ) -> ExecutionPreset:
         with self._lock:
             items = self._read_items()
@@ -76,6 +85,7 @@ class FilePresetStore:
                 "os_model": os_model,
                 "commands": list(commands),
                 "verify_commands": list(verify_commands),
+                "diff_ignore_patterns": list(diff_ignore_patterns or []),
                 "created_at": now,
                 "updated_at": now,
             }
@@ -90,6 +100,7 @@ class FilePresetStore:
         os_model: str,
         commands: List[str],
         verify_commands: List[str],
+        diff_ignore_patterns: Optional[List[str]] = None,
     ) -> Optional[ExecutionPreset]:
         with self._lock:
             items = self._read_items()
@@ -108,6 +119,11 @@ class FilePresetStore:
                     "os_model": os_model,
                     "commands": list(commands),
                     "verify_commands": list(verify_commands),
+                    "diff_ignore_patterns": list(
+                        item.get("diff_ignore_patterns") or []
+                        if diff_ignore_patterns is None
+                        else diff_ignore_patterns
+                    ),
                     "updated_at": utc_now(),
                 }
                 items[index] = updated
@@ -161,4 +177,7 @@ class FilePresetStore:
             ],
             created_at=str(item.get("created_at", "")),
             updated_at=str(item.get("updated_at", "")),
+            diff_ignore_patterns=[
+                str(value) for value in item.get("diff_ignore_patterns", []) or []
+            ],
         )
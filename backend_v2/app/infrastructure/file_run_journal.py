@@ -0,0 +1,200 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""JSONL run journal, one append-only file per job."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from queue import Empty, SimpleQueue
+from threading import Event, Lock, Thread
+from typing import Any
+
+from backend_v2.app.application.events import utc_now
+from backend_v2.app.application.run_journal import JournaledRun
+from backend_v2.app.domain.models import DeviceExecutionResult, JobRecord
+
+logger = logging.getLogger(__name__)
+
+
+class FileRunJournal:
+    """Appends one JSON line per event from a background writer thread.
+
+    Only outcomes are journaled (no credentials, outputs or logs), so a line
+    per device stays small even for thousands of devices. Device results are
+    queued and written in batches with one fsync per file per batch, so the
+    scheduler never waits on the disk; run starts and ends wait until they
+    are on disk. Write errors are logged and never reach the run.
+    """
+
+    MAX_BATCH = 512
+
+    def __init__(self, directory: str) -> None:
+        self._lock = Lock()
+        self.directory = Path(directory)
+        self._queue: SimpleQueue[tuple[str, str] | Event] = SimpleQueue()
+        self._writer: Thread | None = None
+
+    def _path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.jsonl"
+
+    def _ensure_writer(self) -> None:
+        with self._lock:
+            if self._writer is None:
+                self._writer = Thread(
+                    target=self._write_loop, name="run-journal-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            lines_by_job: dict[str, list[str]] = {}
+            flushed: list[Event] = []
+            for item in batch:
+                if isinstance(item, Event):
+                    flushed.append(item)
+                else:
+                    lines_by_job.setdefault(item[0], []).append(item[1])
+            try:
+                self._write(lines_by_job)
+            except Exception:  # the writer must outlive any single batch
+                logger.exception("Run journal writer failed")
+            finally:
+                for event in flushed:
+                    event.set()
+
+    def _write(self, lines_by_job: dict[str, list[str]]) -> None:
+        with self._lock:
+            for job_id, lines in lines_by_job.items():
+                try:
+                    self.directory.mkdir(parents=True, exist_ok=True)
+                    with self._path(job_id).open("a", encoding="utf-8") as handle:
+                        handle.write("".join(lines))
+                        handle.flush()
+                        os.fsync(handle.fileno())
+                except OSError as exc:
+                    logger.error(
+                        "Run journal write failed for job %s (%d lines lost): %s",
+                        job_id,
+                        len(lines),
+                        exc,
+                    )
+
+    def _append(self, job_id: str, entry: dict[str, Any], wait: bool = False) -> None:
+        entry["timestamp"] = utc_now()
+        self._ensure_writer()
+        self._queue.put((job_id, json.dumps(entry, ensure_ascii=True) + "\n"))
+        if wait:
+            self.flush()
+
+    def flush(self) -> None:
+        """Block until every queued line has been written (or failed)."""
+        if self._writer is None:
+            return
+        done = Event()
+        self._queue.put(done)
+        done.wait()
+
+    def start_run(self, job: JobRecord, request: dict[str, Any]) -> None:
+        self._append(
+            job.job_id,
+            {
+                "type": "run_started",
+                "job_id": job.job_id,
+                "job_name": job.job_name,
+                "creator": job.creator,
+                "created_at": job.created_at,
+                "global_vars": dict(job.global_vars),
+                "request": request,
+            },
+            wait=True,
+        )
+
+    def record_device(
+        self, job_id: str, device_key: str, result: DeviceExecutionResult
+    ) -> None:
+        self._append(
+            job_id,
+            {
+                "type": "device_result",
+                "device": device_key,
+                "status": result.status,
+                "error_code": result.error_code,
+                "attempts": result.attempts,
+                "duration_seconds": result.duration_seconds,
+            },
+        )
+
+    def finish_run(self, job_id: str, status: str) -> None:
+        self._append(job_id, {"type": "run_finished", "status": status}, wait=True)
+
+    def load(self, job_id: str) -> JournaledRun | None:
+        self.flush()
+        with self._lock:
+            path = self._path(job_id)
+            if not path.exists():
+                return None
+            lines = path.read_text(encoding="utf-8").splitlines()
+        run: JournaledRun | None = None
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write leaves at most one torn trailing line.
+                continue
+            kind = entry.get("type")
+            if kind == "run_started":
+                previous = run.device_status if run is not None else {}
+                run = JournaledRun(
+                    job_id=str(entry.get("job_id", job_id)),
+                    job_name=str(entry.get("job_name", "")),
+                    creator=str(entry.get("creator", "")),
+                    global_vars=dict(entry.get("global_vars") or {}),
+                    created_at=str(entry.get("created_at") or ""),
+                    request=dict(entry.get("request") or {}),
+                    device_status=previous,
+                )
+            elif run is not None and kind == "device_result":
+                run.device_status[str(entry.get("device"))] = str(entry.get("status"))
+            elif run is not None and kind == "run_finished":
+                run.status = str(entry.get("status"))
+        return run
+
+    def interrupted(self) -> list[JournaledRun]:
+        if not self.directory.is_dir():
+            return []
+        runs = [self.load(path.stem) for path in sorted(self.directory.glob("*.jsonl"))]
+        return [run for run in runs if run is not None and run.interrupted]
+
+    def clear(self) -> int:
+        self.flush()
+        with self._lock:
+            if not self.directory.is_dir():
+                return 0
+            paths = list(self.directory.glob("*.jsonl"))
+            for path in paths:
+                path.unlink()
+            return len(paths)
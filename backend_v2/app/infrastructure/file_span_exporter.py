@@ -0,0 +1,80 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Rotating JSONL span exporter."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from threading import Lock
+from typing import TextIO
+
+from backend_v2.app.application.tracing import Span
+
+
+class RotatingFileSpanExporter:
+    """Appends one JSON line per span and rotates at ``max_bytes``.
+
+    Rotated files are renamed ``<name>.1`` .. ``<name>.<backup_count>``, the
+    oldest being dropped. Lines are flushed but not fsynced; traces are
+    diagnostics, not state.
+    """
+
+    def __init__(self, path: str, max_bytes: int, backup_count: int = 3) -> None:
+        self._lock = Lock()
+        self.path = Path(path)
+        self.max_bytes = max(1, max_bytes)
+        self.backup_count = max(0, backup_count)
+        self._handle: TextIO | None = None
+
+    def _open(self) -> TextIO:
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("a", encoding="utf-8")
+        return self._handle
+
+    def _rotate(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self.backup_count == 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.path.exists():
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(asdict(span), ensure_ascii=True) + "\n"
+        with self._lock:
+            handle = self._open()
+            if handle.tell() > 0 and handle.tell() + len(line) > self.max_bytes:
+                self._rotate()
+                handle = self._open()
+            handle.write(line)
+            handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
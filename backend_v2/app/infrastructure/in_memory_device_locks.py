@@ -0,0 +1,91 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""In-memory per-device locks shared by runs and status commands."""
+
+from __future__ import annotations
+
+from threading import Lock
+
+
+class DeviceLockConflict(Exception):
+    """Raised when devices are already locked by another owner."""
+
+    def __init__(self, conflicts: dict[str, str]):
+        self.conflicts = conflicts
+        held = ", ".join(f"{key} ({owner})" for key, owner in sorted(conflicts.items()))
+        super().__init__(f"Devices are locked by another job: {held}")
+
+
+class DeviceReservation:
+    """Devices newly locked for one owner; release returns exactly those."""
+
+    def __init__(self, registry: InMemoryDeviceLocks, owner: str, keys: list[str]):
+        self.registry = registry
+        self.owner = owner
+        self.keys = keys
+
+    def release(self) -> None:
+        self.registry.release(self.owner, self.keys)
+        self.keys = []
+
+
+class InMemoryDeviceLocks:
+    """All-or-nothing device reservations keyed by ``host:port``."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._owner_by_key: dict[str, str] = {}
+
+    def acquire(self, owner: str, keys: list[str]) -> DeviceReservation:
+        """Lock every key for ``owner`` or raise ``DeviceLockConflict``.
+
+        Keys the owner already holds are left as they are and are not part of
+        the returned reservation, so a rejected duplicate request cannot
+        release locks of the run that is still going.
+        """
+        with self._lock:
+            conflicts = {
+                key: self._owner_by_key[key]
+                for key in keys
+                if self._owner_by_key.get(key, owner) != owner
+            }
+            if conflicts:
+                raise DeviceLockConflict(conflicts)
+            acquired = [
+                key for key in dict.fromkeys(keys) if key not in self._owner_by_key
+            ]
+            for key in acquired:
+                self._owner_by_key[key] = owner
+        return DeviceReservation(self, owner, acquired)
+
+    def release(self, owner: str, keys: list[str]) -> None:
+        with self._lock:
+            for key in keys:
+                if self._owner_by_key.get(key) == owner:
+                    del self._owner_by_key[key]
+
+    def snapshot(self) -> dict[str, str]:
+        """Current lock owner by device key."""
+        with self._lock:
+            return dict(self._owner_by_key)
+
+    def clear(self) -> int:
+        with self._lock:
+            cleared = len(self._owner_by_key)
+            self._owner_by_key = {}
+            return cleared
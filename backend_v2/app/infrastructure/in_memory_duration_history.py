@@ -0,0 +1,53 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""In-memory per-device duration history."""
+
+from __future__ import annotations
+
+from threading import Lock
+
+from backend_v2.app.application.duration_history import DurationHistory
+
+
+class InMemoryDurationHistory(DurationHistory):
+    """Exponentially weighted moving average of execution time per device."""
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        self._lock = Lock()
+        self._alpha = min(1.0, max(0.01, alpha))
+        self._seconds_by_device: dict[str, float] = {}
+
+    def estimate(self, device_key: str) -> float | None:
+        with self._lock:
+            return self._seconds_by_device.get(device_key)
+
+    def record(self, device_key: str, duration_seconds: float) -> None:
+        with self._lock:
+            previous = self._seconds_by_device.get(device_key)
+            if previous is None:
+                self._seconds_by_device[device_key] = duration_seconds
+            else:
+                self._seconds_by_device[device_key] = previous + self._alpha * (
+                    duration_seconds - previous
+                )
+
+    def clear(self) -> int:
+        with self._lock:
+            cleared = len(self._seconds_by_device)
+            self._seconds_by_device = {}
+            return cleared
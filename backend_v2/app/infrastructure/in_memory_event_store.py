@@ -42,6 +42,13 @@ class InMemoryEventStore(EventPublisher):
         with self._lock:
             return len(self._events_by_job.get(job_id, []))
 
+    def event_counts(self) -> list[tuple[str, int]]:
+        """Buffered event count of every job, sorted by job id."""
+        with self._lock:
+            return sorted(
+                (job_id, len(events)) for job_id, events in self._events_by_job.items()
+            )
+
     def clear(self) -> int:
         with self._lock:
             cleared = sum(len(events) for events in self._events_by_job.values())
@@ -0,0 +1,47 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Bounded in-memory ring buffer of finished spans."""
+
+from __future__ import annotations
+
+from collections import deque
+from threading import Lock
+
+from backend_v2.app.application.tracing import Span
+
+
+class InMemorySpanStore:
+    """Keeps the most recent ``capacity`` spans across all jobs."""
+
+    def __init__(self, capacity: int) -> None:
+        self._lock = Lock()
+        self._spans: deque[Span] = deque(maxlen=max(1, capacity))
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def spans_for(self, job_id: str) -> list[Span]:
+        with self._lock:
+            return [span for span in self._spans if span.trace_id == job_id]
+
+    def clear(self) -> int:
+        with self._lock:
+            cleared = len(self._spans)
+            self._spans.clear()
+            return cleared
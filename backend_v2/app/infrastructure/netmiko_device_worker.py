@@ -22,19 +22,43 @@ from __future__ import annotations
 from typing import Callable
 
 from backend_v2.app.application.execution_engine import DeviceWorker
+from backend_v2.app.application.tracing import traced
 from backend_v2.app.domain.models import (
     DeviceExecutionResult,
     DeviceProfile,
     DeviceTarget,
 )
+from backend_v2.app.infrastructure.bastion_pool import BastionTransportPool
+from backend_v2.app.infrastructure.netmiko_session_pool import NetmikoSessionPool
+from backend_v2.app.infrastructure.volatile_lines import current_volatile_line_rules
 
 
 class NetmikoDeviceWorker(DeviceWorker):
     """Executes commands using v2-local Netmiko executor."""
 
-    def __init__(self, profile_resolver: Callable[[str], DeviceProfile | None]):
+    def __init__(
+        self,
+        profile_resolver: Callable[[str], DeviceProfile | None],
+        session_pool: NetmikoSessionPool | None = None,
+        bastions: BastionTransportPool | None = None,
+        pipelined_verify: bool = False,
+        fast_apply_chunk_lines: int = 0,
+        mask_volatile_lines: bool = True,
+    ):
         self.profile_resolver = profile_resolver
+        # Sessions left healthy by a successful run are reused by the next
+        # operation on the same device instead of a fresh SSH handshake.
+        self.session_pool = session_pool
+        # Jump-host devices share a few bastion logins as channels.
+        self.bastions = bastions
+        # One write per verification stage instead of a round trip per command.
+        self.pipelined_verify = pipelined_verify
+        # Config lines per streamed chunk; 0 keeps per-line echo verification.
+        self.fast_apply_chunk_lines = fast_apply_chunk_lines
+        # Built-in per-platform masking of clocks and counters before diffing.
+        self.mask_volatile_lines = mask_volatile_lines
 
+    @traced("NetmikoDeviceWorker.run")
     def run(
         self,
         device: DeviceTarget,
@@ -59,17 +83,19 @@ class NetmikoDeviceWorker(DeviceWorker):
 
         output = execute_device_commands(
             device_params={
-                "host": profile.host,
-                "port": profile.port,
-                "device_type": profile.device_type,
-                "username": profile.username,
-                "password": profile.password,
+                **profile.connection_params(),
                 "verify_cmds": effective_verify_commands,
             },
             commands=commands,
             verify_cmds=effective_verify_commands,
             is_canary=True,
             retry_on_connection_error=False,
+            session_pool=self.session_pool,
+            bastions=self.bastions,
+            pipelined_verify=self.pipelined_verify,
+            fast_apply_chunk_lines=self.fast_apply_chunk_lines,
+            volatile_rules=current_volatile_line_rules(),
+            mask_volatile_lines=self.mask_volatile_lines,
         )
         return DeviceExecutionResult(
             status=output.get("status", "failed"),
@@ -83,4 +109,6 @@ class NetmikoDeviceWorker(DeviceWorker):
             diff_truncated=bool(output.get("diff_truncated", False)),
             diff_original_size=int(output.get("diff_original_size", 0)),
             log_trimmed=bool(output.get("log_trimmed", False)),
+            stage_timings=dict(output.get("stage_timings") or {}),
+            session_source=output.get("session_source"),
         )
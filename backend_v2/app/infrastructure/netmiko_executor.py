@@ -19,33 +19,53 @@
 
 from __future__ import annotations
 
-import difflib
 import re
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from typing import Any
 
+import paramiko  # type: ignore[import-untyped]
 from netmiko import ConnectHandler
 from netmiko.exceptions import (
     NetmikoAuthenticationException,
     NetmikoTimeoutException,
+    ReadTimeout,
 )
 
-ERROR_PATTERNS = [
-    "% Invalid input",
-    "Invalid input detected",
-    "Error:",
-    "Ambiguous command",
-    "Incomplete command",
-    "Unknown action",
-]
+from backend_v2.app.application.config_diff import unified_config_diff
+from backend_v2.app.application.events import report_progress
+from backend_v2.app.application.retry_policy import backoff_delay
+from backend_v2.app.application.tracing import span
+from backend_v2.app.infrastructure.bastion_pool import (
+    BastionTransportPool,
+    JumpHost,
+    jump_host_for,
+)
+from backend_v2.app.infrastructure.error_signatures import (
+    ErrorMatch,
+    ErrorSignatureMatcher,
+    error_matcher_for,
+)
+from backend_v2.app.infrastructure.netmiko_session_pool import (
+    NetmikoSessionPool,
+    SessionLease,
+)
+from backend_v2.app.infrastructure.volatile_lines import (
+    VolatileLineNormalizer,
+    normalizer_for,
+)
 
 MAX_LOG_SIZE = 1024 * 1024
 MAX_DIFF_SIZE = 256 * 1024
 CONNECTION_TIMEOUT = 10
 COMMAND_TIMEOUT = 20
 DEVICE_TIMEOUT = 180
+RECONNECT_BACKOFF_SECONDS = 5.0
+PIPELINE_READ_INTERVAL = 0.025
+DEFAULT_FAST_APPLY_CHUNK_LINES = 100
+_PROMPT_END = re.compile(r"[#>]\s*$")
 DANGEROUS_STATUS_COMMAND_PATTERNS = [
     r"^\s*conf(?:ig(?:ure)?)?(?:\s+(?:t|term(?:inal)?|replace))?\b",
     r"^\s*reload\b",
@@ -58,21 +78,105 @@ DANGEROUS_STATUS_COMMAND_PATTERNS = [
 ]
 
 
-def validate_device_connection(
+# Used for jump-host devices when the caller passes no bastion pool.
+_shared_bastions = BastionTransportPool()
+
+
+def _open_tunnel(
+    jump: JumpHost, device_params: dict[str, Any], bastions: BastionTransportPool
+) -> Any:
+    """Channel to the device through ``jump``, with bastion errors classified."""
+    try:
+        return bastions.open_channel(
+            jump, device_params["host"], int(device_params.get("port", 22))
+        )
+    except paramiko.AuthenticationException as exc:
+        raise NetmikoAuthenticationException(
+            f"Bastion {jump.key} authentication failed: {str(exc)}"
+        ) from exc
+    except TimeoutError as exc:
+        raise NetmikoTimeoutException(
+            f"Bastion {jump.key} timed out: {str(exc)}"
+        ) from exc
+    except (OSError, paramiko.SSHException) as exc:
+        raise ConnectionError(f"Bastion {jump.key}: {str(exc)}") from exc
+
+
+def _open_connection(
     device_params: dict[str, Any],
-) -> tuple[bool, str | None]:
-    """Validate device connection with a lightweight prompt check."""
+    keepalive: int = 0,
+    bastions: BastionTransportPool | None = None,
+) -> Any:
+    options: dict[str, Any] = {}
+    if keepalive > 0:
+        options["keepalive"] = keepalive
+    jump = jump_host_for(device_params)
+    tunnel: Any | None = None
+    if jump is not None:
+        tunnel = _open_tunnel(jump, device_params, bastions or _shared_bastions)
+        options["sock"] = tunnel
     try:
-        connection = ConnectHandler(
+        return ConnectHandler(
             device_type=device_params["device_type"],
             host=device_params["host"],
             port=device_params.get("port", 22),
             username=device_params["username"],
             password=device_params["password"],
             timeout=CONNECTION_TIMEOUT,
+            **options,
         )
+    except BaseException:
+        if tunnel is not None:
+            tunnel.close()
+        raise
+
+
+def _checkout(
+    device_params: dict[str, Any],
+    session_pool: NetmikoSessionPool | None,
+    bastions: BastionTransportPool | None = None,
+) -> tuple[Any, SessionLease | None]:
+    """Open a connection, or check one out of ``session_pool``."""
+    if session_pool is None:
+        return _open_connection(device_params, bastions=bastions), None
+    lease = session_pool.acquire(
+        device_params,
+        lambda: _open_connection(
+            device_params, session_pool.keepalive_seconds, bastions
+        ),
+    )
+    return lease.connection, lease
+
+
+def _check_in(
+    connection: Any | None, lease: SessionLease | None, reusable: bool
+) -> None:
+    """Return a checked-out session to its pool, or disconnect."""
+    if lease is not None:
+        lease.release(reusable=reusable)
+    elif connection is not None:
+        _disconnect(connection)
+
+
+def validate_device_connection(
+    device_params: dict[str, Any],
+    session_pool: NetmikoSessionPool | None = None,
+    warm_ttl_seconds: float | None = None,
+    bastions: BastionTransportPool | None = None,
+) -> tuple[bool, str | None]:
+    """Validate device connection with a lightweight prompt check.
+
+    With ``session_pool`` a validated session is kept warm in the pool (for
+    ``warm_ttl_seconds`` when given) so the next run can skip the handshake.
+    Devices with a jump host are reached through a channel of ``bastions``.
+    """
+    connection: Any | None = None
+    lease: SessionLease | None = None
+    try:
+        connection, lease = _checkout(device_params, session_pool, bastions)
         connection.find_prompt()
-        connection.disconnect()
+        if lease is not None:
+            lease.release(reusable=True, ttl=warm_ttl_seconds, warm=True)
         return True, None
     except NetmikoAuthenticationException as exc:
         return False, f"Authentication failed: {str(exc)}"
@@ -80,13 +184,14 @@ def validate_device_connection(
         return False, f"Connection timeout: {str(exc)}"
     except Exception as exc:  # pragma: no cover - defensive fallback
         return False, f"Connection error: {str(exc)}"
+    finally:
+        _check_in(connection, lease, reusable=False)
 
 
-def _check_for_errors(output: str) -> str | None:
-    for pattern in ERROR_PATTERNS:
-        if pattern in output:
-            return f"Command error detected: {pattern}"
-    return None
+def _check_for_errors(
+    output: str, matcher: ErrorSignatureMatcher | None = None
+) -> ErrorMatch | None:
+    return (matcher or error_matcher_for(None)).search(output)
 
 
 def _trim_log(log: str, max_size: int = MAX_LOG_SIZE) -> tuple[str, bool]:
@@ -108,16 +213,7 @@ def _create_unified_diff(
     from_label: str = "pre",
     to_label: str = "post",
 ) -> str:
-    pre_lines = pre.splitlines(keepends=True)
-    post_lines = post.splitlines(keepends=True)
-    diff = difflib.unified_diff(
-        pre_lines,
-        post_lines,
-        fromfile=from_label,
-        tofile=to_label,
-        lineterm="\n",
-    )
-    return "".join(diff)
+    return unified_config_diff(pre, post, from_label=from_label, to_label=to_label)
 
 
 def _initial_execution_result() -> dict[str, Any]:
@@ -133,9 +229,23 @@ def _initial_execution_result() -> dict[str, Any]:
         "diff_original_size": 0,
         "logs": [],
         "log_trimmed": False,
+        "stage_timings": {},
+        "session_source": None,
     }
 
 
+@contextmanager
+def _timed_stage(result: dict[str, Any], stage: str) -> Iterator[None]:
+    """Add the monotonic time spent in ``stage`` to ``result["stage_timings"]``."""
+    started = time.monotonic()
+    try:
+        with span(f"netmiko.{stage}"):
+            yield
+    finally:
+        timings = result["stage_timings"]
+        timings[stage] = timings.get(stage, 0.0) + (time.monotonic() - started)
+
+
 def _finalize_logs(result: dict[str, Any], logs: list[str]) -> None:
     all_logs = "\n".join(logs)
     trimmed_logs, was_trimmed = _trim_log(all_logs)
@@ -175,6 +285,46 @@ def _disconnect(connection: Any | None) -> None:
             pass
 
 
+def _send_pipelined(connection: Any, commands: list[str]) -> list[str] | None:
+    """Send ``commands`` in one write and split the echoed stream per command.
+
+    Only a prompt at the start of a line ends a command, and reading stops
+    once the stream ends with the prompt and the channel has gone quiet, so
+    nothing is left unread. Each segment is cleaned exactly as
+    ``send_command`` cleans its output. Returns None when the stream cannot
+    be split unambiguously (an echo out of place, or output that itself
+    starts a line with the prompt), so the caller can fall back to one round
+    trip per command on the drained channel.
+    """
+    prompt = str(connection.find_prompt())
+    marker = "\n" + prompt
+    connection.write_channel("".join(connection.normalize_cmd(cmd) for cmd in commands))
+    deadline = time.monotonic() + COMMAND_TIMEOUT * len(commands)
+    raw = ""
+    while True:
+        chunk = connection.read_channel()
+        if chunk:
+            raw += chunk
+            continue
+        if raw.count(marker) >= len(commands) and raw.rstrip().endswith(prompt):
+            break
+        if time.monotonic() > deadline:
+            raise ReadTimeout(
+                f"Pipelined output incomplete: {raw.count(marker)} of "
+                f"{len(commands)} prompts ({prompt!r}) seen"
+            )
+        time.sleep(PIPELINE_READ_INTERVAL)
+    segments = raw.split(marker)
+    if len(segments) != len(commands) + 1 or any(
+        not segment.startswith(cmd.strip()) for cmd, segment in zip(commands, segments)
+    ):
+        return None
+    return [
+        str(connection.strip_prompt(connection.strip_command(cmd, segment + marker)))
+        for cmd, segment in zip(commands, segments)
+    ]
+
+
 def _run_verification_commands(
     connection: Any,
     verify_cmds: list[str],
@@ -183,32 +333,64 @@ def _run_verification_commands(
     has_timed_out: Callable[[str], bool],
     stage: str,
     result: dict[str, Any],
+    pipelined: bool = False,
+    matcher: ErrorSignatureMatcher | None = None,
 ) -> tuple[str, str | None]:
     outputs: list[str] = []
-    for cmd in verify_cmds:
+    pipelined_outputs: list[str] | None = None
+    if pipelined and len(verify_cmds) > 1:
         if should_cancel():
             connection.disconnect()
-            return "\n".join(outputs), "cancelled"
+            return "", "cancelled"
         if has_timed_out(stage):
             connection.disconnect()
-            return "\n".join(outputs), "timed_out"
+            return "", "timed_out"
+        pipelined_outputs = _send_pipelined(connection, verify_cmds)
+        if pipelined_outputs is None:
+            logs.append("Pipelined output could not be split; sending one by one")
+    for index, cmd in enumerate(verify_cmds):
+        if pipelined_outputs is None:
+            if should_cancel():
+                connection.disconnect()
+                return "\n".join(outputs), "cancelled"
+            if has_timed_out(stage):
+                connection.disconnect()
+                return "\n".join(outputs), "timed_out"
         logs.append(f"  > {cmd}")
-        output = str(connection.send_command(cmd, read_timeout=COMMAND_TIMEOUT))
+        if pipelined_outputs is not None:
+            output = pipelined_outputs[index]
+        else:
+            output = str(connection.send_command(cmd, read_timeout=COMMAND_TIMEOUT))
         outputs.append(output)
-        error_message = _check_for_errors(output)
-        if error_message:
+        match = _check_for_errors(output, matcher)
+        if match:
             connection.disconnect()
             _mark_failed(
                 result=result,
                 logs=logs,
                 error_code="command_error",
-                error_message=error_message,
-                log_message=f"ERROR: {error_message}",
+                error_message=match.message,
+                log_message=f"ERROR: {match.describe()}",
             )
             return "\n".join(outputs), "failed"
     return "\n".join(outputs), None
 
 
+def _wait_before_reconnect(
+    retry_number: int,
+    exc: Exception,
+    logs: list[str],
+    cancel_event: threading.Event | None,
+) -> bool:
+    """Back off before reconnecting; return False when cancelled meanwhile."""
+    delay = backoff_delay(retry_number, RECONNECT_BACKOFF_SECONDS)
+    logs.append(f"Connection failed: {str(exc)}. Retrying in {delay:.1f}s...")
+    if cancel_event is None:
+        time.sleep(delay)
+        return True
+    return not cancel_event.wait(delay)
+
+
 def _connect_with_retry(
     device_params: dict[str, Any],
     max_retries: int,
@@ -217,32 +399,33 @@ def _connect_with_retry(
     should_cancel: Callable[[], bool],
     has_timed_out: Callable[[str], bool],
     result: dict[str, Any],
+    cancel_event: threading.Event | None = None,
+    opener: Callable[[], Any] | None = None,
 ) -> tuple[Any | None, str | None]:
     retry_count = 0
     while retry_count <= max_retries:
         try:
             if has_timed_out("connection"):
                 return None, "timed_out"
+            jump = jump_host_for(device_params)
+            via = f" via {jump.host}:{jump.port}" if jump is not None else ""
             logs.append(
-                f"Connecting to {device_params['host']}:{device_params.get('port', 22)}..."
+                f"Connecting to {device_params['host']}:{device_params.get('port', 22)}"
+                f"{via}..."
             )
             if should_cancel():
                 return None, "cancelled"
-            connection = ConnectHandler(
-                device_type=device_params["device_type"],
-                host=device_params["host"],
-                port=device_params.get("port", 22),
-                username=device_params["username"],
-                password=device_params["password"],
-                timeout=CONNECTION_TIMEOUT,
-            )
+            if opener is not None:
+                connection = opener()
+            else:
+                connection = _open_connection(device_params)
             logs.append("Connected successfully")
             return connection, None
         except NetmikoTimeoutException as exc:
             if retry_count < max_retries and retry_on_connection_error:
-                logs.append(f"Connection failed: {str(exc)}. Retrying in 5s...")
-                time.sleep(5)
                 retry_count += 1
+                if not _wait_before_reconnect(retry_count, exc, logs, cancel_event):
+                    return None, "cancelled"
             else:
                 _mark_failed(
                     result=result,
@@ -263,9 +446,9 @@ def _connect_with_retry(
             return None, "failed"
         except Exception as exc:
             if retry_count < max_retries and retry_on_connection_error:
-                logs.append(f"Connection failed: {str(exc)}. Retrying in 5s...")
-                time.sleep(5)
                 retry_count += 1
+                if not _wait_before_reconnect(retry_count, exc, logs, cancel_event):
+                    return None, "cancelled"
             else:
                 _mark_failed(
                     result=result,
@@ -278,6 +461,88 @@ def _connect_with_retry(
     return None, "failed"
 
 
+def _write_chunk(connection: Any, chunk: list[str]) -> list[str]:
+    """Write config lines in one go and return the output attributed to each line.
+
+    A line's output runs from its echo to the next line's echo; the chunk is
+    complete once the last echo is followed by a prompt. The read times out
+    only after ``COMMAND_TIMEOUT`` seconds without new data.
+    """
+    connection.write_channel("".join(connection.normalize_cmd(cmd) for cmd in chunk))
+    echoes = [cmd.strip() for cmd in chunk]
+    buffer = ""
+    found: list[int] = []
+    idle_deadline = time.monotonic() + COMMAND_TIMEOUT
+    while True:
+        data = connection.read_channel()
+        if data:
+            buffer += data
+            idle_deadline = time.monotonic() + COMMAND_TIMEOUT
+        while len(found) < len(echoes):
+            start = found[-1] + len(echoes[len(found) - 1]) if found else 0
+            index = buffer.find(echoes[len(found)], start)
+            if index < 0:
+                break
+            found.append(index)
+        if len(found) == len(echoes) and _PROMPT_END.search(
+            buffer[found[-1] + len(echoes[-1]) :]
+        ):
+            break
+        if time.monotonic() > idle_deadline:
+            raise ReadTimeout(
+                f"Fast apply stalled after {len(found)} of {len(chunk)} "
+                "line echoes in chunk"
+            )
+        if not data:
+            time.sleep(PIPELINE_READ_INTERVAL)
+    bounds = [0, *found[1:], len(buffer)]
+    return [buffer[bounds[i] : bounds[i + 1]] for i in range(len(chunk))]
+
+
+def _fast_apply(
+    connection: Any,
+    commands: list[str],
+    chunk_lines: int,
+    logs: list[str],
+    should_cancel: Callable[[], bool],
+    has_timed_out: Callable[[str], bool],
+    result: dict[str, Any],
+    matcher: ErrorSignatureMatcher | None = None,
+) -> tuple[str | None, str | None]:
+    """Stream config lines in chunks; stop at the first chunk with an error.
+
+    Returns ``(status, error_message)`` with the accumulated output stored in
+    ``result["apply_output"]``.
+    """
+    output = str(connection.config_mode())
+    total = len(commands)
+    for start in range(0, total, chunk_lines):
+        if should_cancel():
+            connection.disconnect()
+            return "cancelled", None
+        if has_timed_out("configuration apply"):
+            connection.disconnect()
+            return "timed_out", None
+        chunk = commands[start : start + chunk_lines]
+        line_outputs = _write_chunk(connection, chunk)
+        output += "".join(line_outputs)
+        result["apply_output"] = output
+        for offset, line_output in enumerate(line_outputs):
+            match = _check_for_errors(line_output, matcher)
+            if match:
+                line_number = start + offset + 1
+                return (
+                    "failed",
+                    f"{match.message} (line {line_number}: {chunk[offset].strip()})",
+                )
+        end = start + len(chunk)
+        logs.append(f"Applied lines {start + 1}-{end} of {total}")
+        report_progress("apply", f"Applied {end}/{total} config lines")
+    output += str(connection.exit_config_mode())
+    result["apply_output"] = output
+    return None, None
+
+
 def _apply_configuration_commands(
     connection: Any,
     commands: list[str],
@@ -285,6 +550,8 @@ def _apply_configuration_commands(
     should_cancel: Callable[[], bool],
     has_timed_out: Callable[[str], bool],
     result: dict[str, Any],
+    fast_apply_chunk_lines: int = 0,
+    matcher: ErrorSignatureMatcher | None = None,
 ) -> str | None:
     logs.append("Applying configuration commands...")
     for cmd in commands:
@@ -296,6 +563,30 @@ def _apply_configuration_commands(
             return "timed_out"
         logs.append(f"  > {cmd}")
 
+    if fast_apply_chunk_lines > 0 and commands:
+        status, error_message = _fast_apply(
+            connection,
+            commands,
+            fast_apply_chunk_lines,
+            logs,
+            should_cancel,
+            has_timed_out,
+            result,
+            matcher,
+        )
+        if status == "failed" and error_message:
+            connection.disconnect()
+            _mark_failed(
+                result=result,
+                logs=logs,
+                error_code="command_error",
+                error_message=error_message,
+                log_message=f"ERROR: {error_message}",
+            )
+        if status is None:
+            logs.append("Configuration applied")
+        return status
+
     if has_timed_out("configuration apply"):
         connection.disconnect()
         return "timed_out"
@@ -305,23 +596,43 @@ def _apply_configuration_commands(
     result["apply_output"] = apply_output
     logs.append("Configuration applied")
 
-    error_message = _check_for_errors(apply_output)
-    if error_message:
+    match = _check_for_errors(apply_output, matcher)
+    if match:
         connection.disconnect()
         _mark_failed(
             result=result,
             logs=logs,
             error_code="command_error",
-            error_message=error_message,
-            log_message=f"ERROR: {error_message}",
+            error_message=match.message,
+            log_message=f"ERROR: {match.describe()}",
         )
         return "failed"
     return None
 
 
-def _store_verification_diff(result: dict[str, Any], logs: list[str]) -> None:
+def _store_verification_diff(
+    result: dict[str, Any],
+    logs: list[str],
+    normalizer: Callable[[], VolatileLineNormalizer] | None = None,
+) -> None:
     if isinstance(result["pre_output"], str) and isinstance(result["post_output"], str):
-        diff = _create_unified_diff(result["pre_output"], result["post_output"])
+        raw_pre, raw_post = result["pre_output"], result["post_output"]
+        pre, post = raw_pre, raw_post
+        if normalizer is not None:
+            # The config is already applied; a bad rule must not fail the device.
+            try:
+                masker = normalizer()
+                pre, pre_masked = masker.normalize(raw_pre)
+                post, post_masked = masker.normalize(raw_post)
+            except Exception as exc:
+                pre, post = raw_pre, raw_post
+                logs.append(f"Volatile line masking failed, diffing raw output: {exc}")
+            else:
+                if pre_masked or post_masked:
+                    logs.append(
+                        f"Masked {pre_masked + post_masked} volatile values before diff"
+                    )
+        diff = _create_unified_diff(pre, post)
         trimmed_diff, was_trimmed, original_size = _trim_diff(diff)
         result["diff"] = trimmed_diff
         result["diff_truncated"] = was_trimmed
@@ -350,26 +661,28 @@ def parse_status_commands(commands: str) -> list[str]:
     return command_list
 
 
-def run_status_commands(device_params: dict[str, Any], commands: str) -> str:
+def run_status_commands(
+    device_params: dict[str, Any],
+    commands: str,
+    session_pool: NetmikoSessionPool | None = None,
+    bastions: BastionTransportPool | None = None,
+) -> str:
     """Execute read-only status commands in exec mode."""
     command_list = parse_status_commands(commands)
+    matcher = error_matcher_for(device_params.get("device_type"))
     connection: Any | None = None
+    lease: SessionLease | None = None
+    reusable = False
     try:
-        connection = ConnectHandler(
-            device_type=device_params["device_type"],
-            host=device_params["host"],
-            port=device_params.get("port", 22),
-            username=device_params["username"],
-            password=device_params["password"],
-            timeout=CONNECTION_TIMEOUT,
-        )
+        connection, lease = _checkout(device_params, session_pool, bastions)
         outputs = []
         for cmd in command_list:
             output = str(connection.send_command(cmd, read_timeout=COMMAND_TIMEOUT))
-            error_message = _check_for_errors(output)
-            if error_message:
-                raise RuntimeError(error_message)
+            match = _check_for_errors(output, matcher)
+            if match:
+                raise RuntimeError(match.describe())
             outputs.append(f"$ {cmd}\n{output}")
+        reusable = True
         return "\n\n".join(outputs)
     except NetmikoAuthenticationException as exc:
         raise RuntimeError(f"Authentication failed: {str(exc)}") from exc
@@ -380,11 +693,7 @@ def run_status_commands(device_params: dict[str, Any], commands: str) -> str:
     except Exception as exc:
         raise RuntimeError(f"SSH execution error: {str(exc)}") from exc
     finally:
-        if connection:
-            try:
-                connection.disconnect()
-            except Exception:
-                pass
+        _check_in(connection, lease, reusable)
 
 
 def execute_device_commands(
@@ -394,11 +703,41 @@ def execute_device_commands(
     is_canary: bool = False,
     retry_on_connection_error: bool = True,
     cancel_event: threading.Event | None = None,
+    session_pool: NetmikoSessionPool | None = None,
+    bastions: BastionTransportPool | None = None,
+    pipelined_verify: bool = False,
+    fast_apply_chunk_lines: int = 0,
+    volatile_rules: Sequence[str] = (),
+    mask_volatile_lines: bool = True,
 ) -> dict[str, Any]:
-    """Execute config commands with pre/post verification and normalized outputs."""
+    """Execute config commands with pre/post verification and normalized outputs.
+
+    With ``session_pool`` the device session is checked out of the pool and,
+    only when every stage succeeded, returned to it instead of disconnected.
+    Devices with a jump host are reached through a channel of ``bastions``.
+    ``pipelined_verify`` sends each stage's verify commands in one write
+    instead of one prompt round trip per command, and a positive
+    ``fast_apply_chunk_lines`` streams config lines in chunks of that size
+    without waiting for each line's echo. Command errors are detected with
+    the error signatures of the device's ``device_type``. Before the
+    pre/post diff, volatile values are masked with the platform's built-in
+    rules (unless ``mask_volatile_lines`` is false) plus ``volatile_rules``;
+    the stored outputs stay raw.
+    """
     result = _initial_execution_result()
+    matcher = error_matcher_for(device_params.get("device_type"))
     logs: list[str] = []
     start_time = time.monotonic()
+    leases: list[SessionLease] = []
+
+    def open_connection() -> Any:
+        connection, lease = _checkout(device_params, session_pool, bastions)
+        if lease is not None:
+            leases.append(lease)
+            result["session_source"] = lease.source
+            if lease.reused:
+                logs.append(f"Reusing {lease.source} session")
+        return connection
 
     def add_log(message: str) -> None:
         logs.append(message)
@@ -440,15 +779,18 @@ def execute_device_commands(
         return result
 
     max_retries = 0 if is_canary else 1
-    connection, connection_status = _connect_with_retry(
-        device_params=device_params,
-        max_retries=max_retries,
-        retry_on_connection_error=retry_on_connection_error,
-        logs=logs,
-        should_cancel=should_cancel,
-        has_timed_out=has_timed_out,
-        result=result,
-    )
+    with _timed_stage(result, "connect"):
+        connection, connection_status = _connect_with_retry(
+            device_params=device_params,
+            max_retries=max_retries,
+            retry_on_connection_error=retry_on_connection_error,
+            logs=logs,
+            should_cancel=should_cancel,
+            has_timed_out=has_timed_out,
+            result=result,
+            cancel_event=cancel_event,
+            opener=open_connection,
+        )
     if connection_status == "cancelled":
         return handle_cancel()
     if connection_status in {"timed_out", "failed"}:
@@ -460,15 +802,18 @@ def execute_device_commands(
 
         if verify_cmds:
             add_log("Running pre-verification commands...")
-            pre_output, pre_status = _run_verification_commands(
-                connection=connection,
-                verify_cmds=verify_cmds,
-                logs=logs,
-                should_cancel=should_cancel,
-                has_timed_out=has_timed_out,
-                stage="pre-verification",
-                result=result,
-            )
+            with _timed_stage(result, "pre_verify"):
+                pre_output, pre_status = _run_verification_commands(
+                    connection=connection,
+                    verify_cmds=verify_cmds,
+                    logs=logs,
+                    should_cancel=should_cancel,
+                    has_timed_out=has_timed_out,
+                    stage="pre-verification",
+                    result=result,
+                    pipelined=pipelined_verify,
+                    matcher=matcher,
+                )
             if pre_status == "cancelled":
                 return handle_cancel()
             if pre_status in {"timed_out", "failed"}:
@@ -476,14 +821,17 @@ def execute_device_commands(
             result["pre_output"] = pre_output
             add_log("Pre-verification complete")
 
-        apply_status = _apply_configuration_commands(
-            connection=connection,
-            commands=commands,
-            logs=logs,
-            should_cancel=should_cancel,
-            has_timed_out=has_timed_out,
-            result=result,
-        )
+        with _timed_stage(result, "apply"):
+            apply_status = _apply_configuration_commands(
+                connection=connection,
+                commands=commands,
+                logs=logs,
+                should_cancel=should_cancel,
+                has_timed_out=has_timed_out,
+                result=result,
+                fast_apply_chunk_lines=fast_apply_chunk_lines,
+                matcher=matcher,
+            )
         if apply_status == "cancelled":
             return handle_cancel()
         if apply_status in {"timed_out", "failed"}:
@@ -491,15 +839,18 @@ def execute_device_commands(
 
         if verify_cmds:
             add_log("Running post-verification commands...")
-            post_output, post_status = _run_verification_commands(
-                connection=connection,
-                verify_cmds=verify_cmds,
-                logs=logs,
-                should_cancel=should_cancel,
-                has_timed_out=has_timed_out,
-                stage="post-verification",
-                result=result,
-            )
+            with _timed_stage(result, "post_verify"):
+                post_output, post_status = _run_verification_commands(
+                    connection=connection,
+                    verify_cmds=verify_cmds,
+                    logs=logs,
+                    should_cancel=should_cancel,
+                    has_timed_out=has_timed_out,
+                    stage="post-verification",
+                    result=result,
+                    pipelined=pipelined_verify,
+                    matcher=matcher,
+                )
             if post_status == "cancelled":
                 return handle_cancel()
             if post_status in {"timed_out", "failed"}:
@@ -507,10 +858,23 @@ def execute_device_commands(
             result["post_output"] = post_output
             add_log("Post-verification complete")
 
-            _store_verification_diff(result, logs)
+            with _timed_stage(result, "diff"):
+                _store_verification_diff(
+                    result,
+                    logs,
+                    lambda: normalizer_for(
+                        device_params.get("device_type"),
+                        volatile_rules,
+                        builtin=mask_volatile_lines,
+                    ),
+                )
 
-        connection.disconnect()
-        add_log("Disconnected")
+        with _timed_stage(result, "disconnect"):
+            if leases:
+                leases[-1].release(reusable=True)
+            else:
+                connection.disconnect()
+        add_log("Session returned to pool" if leases else "Disconnected")
 
     except NetmikoTimeoutException as exc:
         _disconnect(connection)
@@ -526,6 +890,11 @@ def execute_device_commands(
             error_message=f"Execution error: {str(exc)}",
             log_message=f"ERROR: {str(exc)}",
         )
+    finally:
+        # Any path that did not return the session (failure, cancel, timeout)
+        # leaves it in an unknown state, so it is closed rather than pooled.
+        for lease in leases:
+            lease.release(reusable=False)
 
     _finalize_logs(result, logs)
     return result
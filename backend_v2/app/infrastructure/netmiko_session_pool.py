@@ -0,0 +1,305 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Keyed pool of idle SSH sessions reused across device operations."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+DEFAULT_MAX_IDLE_SESSIONS = 256
+DEFAULT_IDLE_TTL_SECONDS = 120.0
+DEFAULT_MAX_AGE_SECONDS = 900.0
+DEFAULT_KEEPALIVE_SECONDS = 30
+DEFAULT_WARM_TTL_SECONDS = 600.0
+
+# Where a checked-out session came from: kept warm by import validation,
+# left idle by an earlier operation, or opened for this checkout.
+SESSION_SOURCES = ("warm", "pooled", "new")
+
+
+def session_key(device_params: dict[str, Any]) -> str:
+    """Pool key: one session per user, device and platform."""
+    return (
+        f"{device_params['username']}@{device_params['host']}:"
+        f"{device_params.get('port', 22)}/{device_params['device_type']}"
+    )
+
+
+def _close(connection: Any) -> None:
+    try:
+        connection.disconnect()
+    except Exception:
+        pass
+
+
+def _is_alive(connection: Any) -> bool:
+    try:
+        return bool(connection.is_alive())
+    except Exception:
+        return False
+
+
+@dataclass
+class _IdleSession:
+    connection: Any
+    password: str
+    created_at: float
+    idle_since: float
+    ttl: float
+    warm: bool
+
+
+@dataclass(frozen=True)
+class SessionPoolStats:
+    """Counters of one session pool."""
+
+    idle: int
+    warm_idle: int
+    checked_out: int
+    opened: int
+    reused: int
+    warm_reused: int
+    discarded: int
+
+
+class SessionLease:
+    """Exclusive use of one device session until ``release``."""
+
+    def __init__(
+        self,
+        pool: NetmikoSessionPool,
+        key: str,
+        connection: Any,
+        password: str,
+        created_at: float,
+        source: str,
+    ):
+        self._pool = pool
+        self._key = key
+        self._password = password
+        self._created_at = created_at
+        self._released = False
+        self.connection = connection
+        self.source = source
+
+    @property
+    def reused(self) -> bool:
+        return self.source != "new"
+
+    def release(
+        self, reusable: bool, ttl: float | None = None, warm: bool = False
+    ) -> None:
+        """Return the session to the pool, or close it; later calls are no-ops.
+
+        ``ttl`` overrides the pool's idle TTL for this session and ``warm``
+        marks it as kept ahead of a run rather than left by one.
+        """
+        if self._released:
+            return
+        self._released = True
+        self._pool._return(
+            self._key,
+            self.connection,
+            self._password,
+            self._created_at,
+            reusable,
+            self._pool.idle_ttl_seconds if ttl is None else ttl,
+            warm,
+        )
+
+
+class NetmikoSessionPool:
+    """Idle SSH sessions keyed by device, each checked out by one caller at a time.
+
+    A checkout waits while another caller holds the same device. Idle sessions
+    are dropped after ``idle_ttl_seconds`` (or the TTL given on release), any
+    session after
+    ``max_age_seconds``, and a reused session must pass ``is_alive()`` first.
+    Beyond ``max_idle`` the least recently used idle session is closed, which
+    bounds the sessions held open on devices between operations. Transport
+    keepalives (``keepalive_seconds``) stop NAT and firewalls from dropping
+    idle sessions.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = DEFAULT_MAX_IDLE_SESSIONS,
+        idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        keepalive_seconds: int = DEFAULT_KEEPALIVE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_idle = max(0, max_idle)
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self._clock = clock
+        self._lock = Lock()
+        self._idle: OrderedDict[str, _IdleSession] = OrderedDict()
+        # Per-device checkout locks, dropped once no caller holds or waits
+        # on them so the dict only covers devices in use.
+        self._device_locks: dict[str, Lock] = {}
+        self._device_lock_users: dict[str, int] = {}
+        self._checked_out = 0
+        self._opened = 0
+        self._reused = 0
+        self._warm_reused = 0
+        self._discarded = 0
+
+    def _expired(self, session: _IdleSession, now: float) -> bool:
+        return (
+            now - session.idle_since > session.ttl
+            or now - session.created_at > self.max_age_seconds
+        )
+
+    def _prune_locked(self, now: float) -> list[Any]:
+        expired = [
+            key for key, session in self._idle.items() if self._expired(session, now)
+        ]
+        stale = [self._idle.pop(key).connection for key in expired]
+        while len(self._idle) > self.max_idle:
+            stale.append(self._idle.popitem(last=False)[1].connection)
+        self._discarded += len(stale)
+        return stale
+
+    def _leave_device_locked(self, key: str) -> Lock:
+        device_lock = self._device_locks[key]
+        users = self._device_lock_users[key] - 1
+        if users:
+            self._device_lock_users[key] = users
+        else:
+            del self._device_lock_users[key]
+            del self._device_locks[key]
+        return device_lock
+
+    def prune(self) -> int:
+        """Close expired and surplus idle sessions; return how many closed.
+
+        Called periodically by ``PoolReaper`` so quiet pools still expire.
+        """
+        with self._lock:
+            stale = self._prune_locked(self._clock())
+        for connection in stale:
+            _close(connection)
+        return len(stale)
+
+    def acquire(
+        self, device_params: dict[str, Any], opener: Callable[[], Any]
+    ) -> SessionLease:
+        """Check out the device's idle session if healthy, else open one.
+
+        Exceptions from ``opener`` propagate with the device released.
+        """
+        key = session_key(device_params)
+        password = str(device_params["password"])
+        with self._lock:
+            device_lock = self._device_locks.setdefault(key, Lock())
+            self._device_lock_users[key] = self._device_lock_users.get(key, 0) + 1
+        device_lock.acquire()
+        try:
+            with self._lock:
+                now = self._clock()
+                stale = self._prune_locked(now)
+                idle = self._idle.pop(key, None)
+                self._checked_out += 1
+            for connection in stale:
+                _close(connection)
+            if idle is not None:
+                if idle.password == password and _is_alive(idle.connection):
+                    with self._lock:
+                        self._reused += 1
+                        self._warm_reused += int(idle.warm)
+                    return SessionLease(
+                        self,
+                        key,
+                        idle.connection,
+                        password,
+                        idle.created_at,
+                        "warm" if idle.warm else "pooled",
+                    )
+                _close(idle.connection)
+                with self._lock:
+                    self._discarded += 1
+            connection = opener()
+        except BaseException:
+            with self._lock:
+                self._checked_out -= 1
+                self._leave_device_locked(key)
+            device_lock.release()
+            raise
+        with self._lock:
+            self._opened += 1
+        return SessionLease(self, key, connection, password, self._clock(), "new")
+
+    def _return(
+        self,
+        key: str,
+        connection: Any,
+        password: str,
+        created_at: float,
+        reusable: bool,
+        ttl: float,
+        warm: bool,
+    ) -> None:
+        stale: list[Any] = []
+        with self._lock:
+            self._checked_out -= 1
+            now = self._clock()
+            if (
+                reusable
+                and self.max_idle > 0
+                and now - created_at < self.max_age_seconds
+            ):
+                self._idle[key] = _IdleSession(
+                    connection, password, created_at, now, ttl, warm
+                )
+                stale = self._prune_locked(now)
+            else:
+                stale = [connection]
+                self._discarded += 1
+            device_lock = self._leave_device_locked(key)
+        device_lock.release()
+        for item in stale:
+            _close(item)
+
+    def close_all(self) -> int:
+        """Close every idle session."""
+        with self._lock:
+            idle = [session.connection for session in self._idle.values()]
+            self._idle.clear()
+            self._discarded += len(idle)
+        for connection in idle:
+            _close(connection)
+        return len(idle)
+
+    def stats(self) -> SessionPoolStats:
+        with self._lock:
+            return SessionPoolStats(
+                idle=len(self._idle),
+                warm_idle=sum(1 for session in self._idle.values() if session.warm),
+                checked_out=self._checked_out,
+                opened=self._opened,
+                reused=self._reused,
+                warm_reused=self._warm_reused,
+                discarded=self._discarded,
+            )
@@ -0,0 +1,78 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Background thread that closes idle pooled connections on a timer."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+
+DEFAULT_REAP_INTERVAL_SECONDS = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+class PoolReaper:
+    """Calls each registered ``prune()`` every ``interval_seconds``.
+
+    Pools only expire idle connections when they are used, so without this a
+    quiet pool keeps its sessions (and the devices' VTY lines) open until the
+    next operation. A failing prune is logged and retried on the next tick.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = DEFAULT_REAP_INTERVAL_SECONDS,
+        prunes: list[Callable[[], int]] | None = None,
+    ):
+        self.interval_seconds = interval_seconds
+        self._prunes = list(prunes or [])
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def reap_once(self) -> int:
+        """Run every prune once; return how many connections were closed."""
+        closed = 0
+        for prune in self._prunes:
+            try:
+                closed += prune()
+            except Exception:
+                logger.exception("Idle connection reaping failed")
+        return closed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.reap_once()
+
+    def start(self) -> bool:
+        """Start the reaper thread; False when disabled (interval <= 0)."""
+        if self.interval_seconds <= 0 or self._thread is not None:
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pool-reaper", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
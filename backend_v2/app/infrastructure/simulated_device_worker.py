@@ -19,6 +19,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 
@@ -29,6 +30,19 @@ from backend_v2.app.domain.models import DeviceExecutionResult, DeviceTarget
 class SimulatedDeviceWorker(DeviceWorker):
     """Returns successful execution for every device."""
 
+    @staticmethod
+    def _delay_seconds() -> float:
+        delay_ms = int(os.getenv("NW_EDIT_V2_SIMULATED_DELAY_MS", "0").strip() or "0")
+        return delay_ms / 1000.0 if delay_ms > 0 else 0.0
+
+    @staticmethod
+    def _result(device: DeviceTarget, commands: list[str]) -> DeviceExecutionResult:
+        command_count = len(commands)
+        return DeviceExecutionResult(
+            status="success",
+            logs=[f"simulated apply on {device.key}: {command_count} commands"],
+        )
+
     def run(
         self,
         device: DeviceTarget,
@@ -36,11 +50,20 @@ class SimulatedDeviceWorker(DeviceWorker):
         verify_commands: list[str] | None = None,
     ) -> DeviceExecutionResult:
         del verify_commands
-        delay_ms = int(os.getenv("NW_EDIT_V2_SIMULATED_DELAY_MS", "0").strip() or "0")
-        if delay_ms > 0:
-            time.sleep(delay_ms / 1000.0)
-        command_count = len(commands)
-        return DeviceExecutionResult(
-            status="success",
-            logs=[f"simulated apply on {device.key}: {command_count} commands"],
-        )
+        delay = self._delay_seconds()
+        if delay > 0:
+            time.sleep(delay)
+        return self._result(device, commands)
+
+    async def run_async(
+        self,
+        device: DeviceTarget,
+        commands: list[str],
+        verify_commands: list[str] | None = None,
+    ) -> DeviceExecutionResult:
+        """Event-loop friendly variant used by the asyncio engine."""
+        del verify_commands
+        delay = self._delay_seconds()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._result(device, commands)
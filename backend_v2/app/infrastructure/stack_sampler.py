@@ -0,0 +1,115 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Standard-library sampling profiler producing collapsed stacks."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import CodeType, FrameType
+
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 0.01
+MAX_STACK_DEPTH = 128
+
+
+@dataclass(frozen=True)
+class ProfileCapture:
+    """Aggregated stacks of one capture."""
+
+    samples: int
+    duration_seconds: float
+    stacks: Counter[str]
+
+    def collapsed(self) -> str:
+        """Brendan Gregg collapsed format: ``thread;outer;...;inner count``."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in sorted(self.stacks.items())
+        )
+
+
+class StackSampler:
+    """Samples every thread's Python stack via ``sys._current_frames``.
+
+    Each stack is rooted at its thread name, so engine pool, run coordinator
+    and server threads stay apart in a flame graph. Frames are labelled
+    ``module:qualname`` without line numbers so samples of one function merge.
+    Only one capture runs at a time.
+    """
+
+    def __init__(self, interval_seconds: float = DEFAULT_SAMPLE_INTERVAL_SECONDS):
+        self.interval_seconds = max(0.001, interval_seconds)
+        self._capture_lock = threading.Lock()
+        self._labels: dict[CodeType, str] = {}
+
+    @property
+    def busy(self) -> bool:
+        return self._capture_lock.locked()
+
+    def _label(self, frame: FrameType) -> str:
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            module = frame.f_globals.get("__name__", "?")
+            label = f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+            self._labels[code] = label
+        return label
+
+    def _stack(self, frame: FrameType | None) -> list[str]:
+        labels: list[str] = []
+        while frame is not None and len(labels) < MAX_STACK_DEPTH:
+            labels.append(self._label(frame))
+            frame = frame.f_back
+        labels.reverse()
+        return labels
+
+    def sample_once(self, stacks: Counter[str]) -> None:
+        """Add one sample of every other thread to ``stacks``."""
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            name = names.get(ident, f"thread-{ident}").replace(";", ":")
+            stacks[";".join([name, *self._stack(frame)])] += 1
+
+    def capture(self, seconds: float) -> ProfileCapture:
+        """Sample for ``seconds``; raise RuntimeError if a capture is running."""
+        if not self._capture_lock.acquire(blocking=False):
+            raise RuntimeError("A profile capture is already running")
+        try:
+            stacks: Counter[str] = Counter()
+            samples = 0
+            started = time.monotonic()
+            deadline = started + seconds
+            while True:
+                self.sample_once(stacks)
+                samples += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(self.interval_seconds, remaining))
+            return ProfileCapture(
+                samples=samples,
+                duration_seconds=time.monotonic() - started,
+                stacks=stacks,
+            )
+        finally:
+            self._capture_lock.release()
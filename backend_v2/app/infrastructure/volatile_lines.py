@@ -0,0 +1,164 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Mask volatile values (clocks, uptimes, counters) before diffing outputs."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+
+from backend_v2.app.infrastructure.error_signatures import base_platform
+
+VOLATILE_MASK = "<volatile>"
+
+# Rules are regular expressions matched per line (``re.MULTILINE``); every
+# match is replaced with ``VOLATILE_MASK`` on both sides of the diff.
+_COMMON_RULES = (
+    r"(?<![:\w])\d{1,2}:\d{2}:\d{2}(?:\.\d+)?(?![:\w])",
+    r"(?<=uptime is ).*$",
+)
+
+_IOS_RULES = (
+    *_COMMON_RULES,
+    r"^! (?:Last configuration change|NVRAM config last updated) at .*$",
+    r"^Current configuration : \d+ bytes$",
+    r"^\s*\d+ (?:minute|second) (?:input|output) rate .*$",
+    r"^\s*\d+ packets (?:input|output), .*$",
+    r"^\s*Last input .*, output .*$",
+    r"^\s*Last clearing of .*$",
+)
+
+VOLATILE_LINE_RULES: dict[str, tuple[str, ...]] = {
+    "cisco_ios": _IOS_RULES,
+    "cisco_xe": _IOS_RULES,
+    "cisco_xr": (*_IOS_RULES, r"^Building configuration\.\.\.$"),
+    "cisco_nxos": (
+        *_COMMON_RULES,
+        r"^!Time: .*$",
+        r"^!Running configuration last done at: .*$",
+        r"^\s*\d+ seconds (?:input|output) rate .*$",
+        r"^\s*Last link flapped .*$",
+        r"^\s*Last clearing of .*$",
+        r"^\s*\d+ (?:input|output) packets .*$",
+    ),
+    "arista_eos": (
+        *_COMMON_RULES,
+        r"^! (?:Startup-config last modified|Command: .*) at .*$",
+        r"^Uptime: .*$",
+        r"^\s*\d+ (?:seconds|minutes) (?:input|output) rate .*$",
+        r"^\s*\d+ packets (?:input|output), .*$",
+        r"^\s*Up \d+ .*$",
+    ),
+    "juniper_junos": (
+        *_COMMON_RULES,
+        r"^## Last (?:commit|changed): .*$",
+        r"^\s*Last flapped\s*: .*$",
+        r"^\s*(?:Input|Output) (?:rate|packets)\s*: .*$",
+        r"(?<=[Uu]ptime: ).*$",
+    ),
+    "fortinet": (
+        *_COMMON_RULES,
+        r"^#conf_file_ver=\d+$",
+        r"^System time: .*$",
+        r"^Uptime: .*$",
+    ),
+    "linux": (
+        *_COMMON_RULES,
+        r"(?<= up ).*(?=load average)",
+        r"load average: .*$",
+    ),
+}
+
+_run_rules: ContextVar[tuple[str, ...]] = ContextVar(
+    "volatile_line_run_rules", default=()
+)
+
+
+def _combined(rules: Sequence[str]) -> re.Pattern[str]:
+    return re.compile("|".join(f"(?:{rule})" for rule in rules), re.MULTILINE)
+
+
+class VolatileLineNormalizer:
+    """All rules compiled into one pattern applied in a single pass."""
+
+    def __init__(self, rules: Sequence[str]):
+        self.rules = tuple(rules)
+        self._pattern = _combined(self.rules) if self.rules else None
+
+    def normalize(self, output: str) -> tuple[str, int]:
+        """Return ``output`` with volatile values masked and the mask count."""
+        if self._pattern is None:
+            return output, 0
+        return self._pattern.subn(VOLATILE_MASK, output)
+
+
+def validate_volatile_rules(rules: Iterable[str]) -> list[str]:
+    """Return the rules, raising ``ValueError`` naming the first invalid one.
+
+    Each rule is compiled the way the normalizer joins it, so global inline
+    flags such as ``(?i)`` are rejected here (use the scoped ``(?i:...)``).
+    """
+    checked = [rule for rule in rules if rule]
+    for rule in checked:
+        try:
+            pattern = _combined([rule])
+        except re.error as exc:
+            raise ValueError(f"Invalid volatile line rule {rule!r}: {exc}") from exc
+        if pattern.groups or pattern.search(""):
+            raise ValueError(
+                f"Invalid volatile line rule {rule!r}: "
+                "capturing groups and empty matches are not allowed"
+            )
+    try:
+        _combined(checked)
+    except re.error as exc:
+        raise ValueError(f"Invalid volatile line rules: {exc}") from exc
+    return checked
+
+
+@lru_cache(maxsize=256)
+def _normalizer(rules: tuple[str, ...]) -> VolatileLineNormalizer:
+    return VolatileLineNormalizer(rules)
+
+
+def normalizer_for(
+    device_type: str | None,
+    extra_rules: Sequence[str] = (),
+    builtin: bool = True,
+) -> VolatileLineNormalizer:
+    """Return the cached normalizer for a platform plus run/preset rules."""
+    rules = VOLATILE_LINE_RULES.get(base_platform(device_type), _COMMON_RULES)
+    return _normalizer((*(rules if builtin else ()), *extra_rules))
+
+
+@contextmanager
+def volatile_line_rules(rules: Sequence[str]) -> Iterator[None]:
+    """Add run-level rules for every diff computed in this context."""
+    token = _run_rules.set(tuple(rules))
+    try:
+        yield
+    finally:
+        _run_rules.reset(token)
+
+
+def current_volatile_line_rules() -> tuple[str, ...]:
+    """Run-level rules of the current context (empty outside a run)."""
+    return _run_rules.get()
@@ -29,6 +29,13 @@ from fastapi.testclient import TestClient
 from backend_v2.app.infrastructure.netmiko_executor import validate_device_connection
 
 
+@pytest.fixture(autouse=True)
+def isolated_state_files(monkeypatch, tmp_path):
+    """Keep run journals and presets written by these runs out of the tree."""
+    monkeypatch.setenv("NW_EDIT_V2_RUN_JOURNAL_DIR", str(tmp_path / "run_journal"))
+    monkeypatch.setenv("NW_EDIT_V2_PRESET_FILE", str(tmp_path / "run_presets.json"))
+
+
 def _ensure_mock_server():
     device_params = {
         "host": "localhost",
@@ -123,7 +130,11 @@ def test_v2_netmiko_import_and_run(monkeypatch):
 
         run_response = client.post(
             f"/api/v2/jobs/{job_id}/run",
-            json={"commands": ["snmp-server location IntegrationLab"]},
+            json={
+                "commands": ["snmp-server location IntegrationLab"],
+                "imported_device_keys": ["localhost:2222"],
+                "canary": {"host": "localhost", "port": 2222},
+            },
         )
         assert run_response.status_code == 200
         payload = run_response.json()
@@ -195,6 +206,8 @@ def test_v2_netmiko_async_pause_resume_cancel(monkeypatch):
             f"/api/v2/jobs/{job_id}/run/async",
             json={
                 "commands": ["snmp-server contact Integration Team"],
+                "imported_device_keys": ["localhost:2222", "127.0.0.1:2222"],
+                "canary": {"host": "localhost", "port": 2222},
                 "concurrency_limit": 1,
                 "stagger_delay": 0.0,
             },
@@ -228,3 +241,128 @@ def test_v2_netmiko_async_pause_resume_cancel(monkeypatch):
         if process:
             process.terminate()
             process.wait(timeout=5)
+
+
+def _start_mock_server(port: int, *args: str):
+    """Start a mock server instance on ``port``; None when it never answers."""
+    server_script = (
+        Path(__file__).resolve().parents[3] / "tests" / "mock_ssh_server" / "server.py"
+    )
+    process = subprocess.Popen(
+        [sys.executable, str(server_script), "--port", str(port), *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    device_params = {
+        "host": "127.0.0.1",
+        "port": port,
+        "device_type": "cisco_ios",
+        "username": "admin",
+        "password": "admin123",
+    }
+    for _ in range(20):
+        success, _ = validate_device_connection(device_params)
+        if success:
+            return process
+        time.sleep(0.5)
+    process.terminate()
+    process.wait(timeout=5)
+    return None
+
+
+@pytest.mark.integration
+def test_v2_netmiko_jump_host_multiplexes_device_sessions(monkeypatch):
+    """Reach two devices through one bastion login using two mock servers."""
+    device = _start_mock_server(2232)
+    bastion = _start_mock_server(2233, "--allow-forwarding")
+    try:
+        if device is None or bastion is None:
+            pytest.skip("Mock SSH servers not available")
+
+        monkeypatch.setenv("NW_EDIT_V2_WORKER_MODE", "netmiko")
+        monkeypatch.setenv("NW_EDIT_V2_VALIDATOR_MODE", "netmiko")
+        import backend_v2.app.api.main as api_main
+
+        importlib.reload(api_main)
+        client = TestClient(api_main.app)
+
+        import_response = client.post(
+            "/api/v2/devices/import",
+            content=(
+                "host,port,device_type,username,password,name,jump_host,jump_port\n"
+                "localhost,2232,cisco_ios,admin,admin123,mock-a,127.0.0.1,2233\n"
+                "127.0.0.1,2232,cisco_ios,admin,admin123,mock-b,127.0.0.1,2233\n"
+            ),
+            headers={"Content-Type": "text/plain"},
+        )
+        assert import_response.status_code == 200
+        assert len(import_response.json()["devices"]) == 2
+
+        job_id = client.post(
+            "/api/v2/jobs",
+            json={"job_name": "netmiko-v2-jump", "creator": "integration"},
+        ).json()["job_id"]
+        run_response = client.post(
+            f"/api/v2/jobs/{job_id}/run",
+            json={
+                "commands": ["snmp-server location JumpLab"],
+                "imported_device_keys": ["localhost:2232", "127.0.0.1:2232"],
+                "canary": {"host": "localhost", "port": 2232},
+            },
+        )
+        assert run_response.status_code == 200
+        results = run_response.json()["device_results"]
+        assert results["localhost:2232"]["status"] == "success"
+        assert results["127.0.0.1:2232"]["status"] == "success"
+        assert any(
+            " via 127.0.0.1:2233" in line for line in results["localhost:2232"]["logs"]
+        )
+
+        bastions = client.get("/api/v2/scheduler/state").json()["bastions"]
+        assert bastions["opened_transports"] == 1
+        assert bastions["opened_channels"] >= 2
+    finally:
+        for process in (device, bastion):
+            if process:
+                process.terminate()
+                process.wait(timeout=5)
+
+
+@pytest.mark.integration
+def test_v2_netmiko_pipelined_verification_matches_sequential():
+    """Pipelined and per-command verification return the same outputs."""
+    from backend_v2.app.infrastructure.netmiko_executor import execute_device_commands
+
+    process = _start_mock_server(2234)
+    try:
+        if process is None:
+            pytest.skip("Mock SSH server not available")
+        device_params = {
+            "host": "127.0.0.1",
+            "port": 2234,
+            "device_type": "cisco_ios",
+            "username": "admin",
+            "password": "admin123",
+        }
+        verify_cmds = [
+            "show running-config",
+            "show ip interface brief",
+            "show running-config",
+        ]
+        results = [
+            execute_device_commands(
+                device_params,
+                ["snmp-server location PipelineLab"],
+                verify_cmds,
+                pipelined_verify=pipelined,
+            )
+            for pipelined in (False, True)
+        ]
+        assert [result["status"] for result in results] == ["success", "success"]
+        assert results[0]["pre_output"] == results[1]["pre_output"]
+        assert results[0]["post_output"] == results[1]["post_output"]
+        assert results[0]["logs"] == results[1]["logs"]
+    finally:
+        if process:
+            process.terminate()
+            process.wait(timeout=5)
@@ -0,0 +1,80 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the AIMD concurrency controller."""
+
+from backend_v2.app.application.adaptive_concurrency import AimdConcurrencyController
+
+
+def test_window_grows_additively_after_a_full_window_of_healthy_results():
+    controller = AimdConcurrencyController(initial=2, minimum=1, maximum=4)
+
+    changes = [controller.record(1.0, None) for _ in range(5)]
+
+    grown = [c for c in changes if c is not None]
+    assert [(c.previous, c.current) for c in grown] == [(2, 3), (3, 4)]
+    assert controller.window == 4
+
+
+def test_window_is_capped_at_maximum():
+    controller = AimdConcurrencyController(initial=3, minimum=1, maximum=3)
+
+    assert all(controller.record(1.0, None) is None for _ in range(10))
+    assert controller.window == 3
+
+
+def test_congestion_error_halves_window_once_per_window():
+    controller = AimdConcurrencyController(initial=8, minimum=2, maximum=16)
+
+    first = controller.record(1.0, "connection_timeout")
+    second = controller.record(1.0, "connection_timeout")
+
+    assert first is not None
+    assert (first.previous, first.current) == (8, 4)
+    assert "connection_timeout" in first.reason
+    assert second is None
+    assert controller.window == 4
+
+
+def test_latency_inflation_triggers_decrease_and_respects_minimum():
+    controller = AimdConcurrencyController(initial=2, minimum=2, maximum=10)
+    controller.record(1.0, None)
+
+    assert controller.record(5.0, None) is None
+    assert controller.window == 2
+
+    controller = AimdConcurrencyController(initial=6, minimum=1, maximum=10)
+    controller.record(1.0, None)
+    change = controller.record(5.0, None)
+    assert change is not None
+    assert change.current == 3
+    assert "baseline" in change.reason
+
+
+def test_device_specific_errors_do_not_shrink_window():
+    controller = AimdConcurrencyController(initial=4, minimum=1, maximum=8)
+
+    assert controller.record(1.0, "command_error") is None
+    assert controller.window == 4
+
+
+def test_sub_floor_latency_jitter_is_not_congestion():
+    controller = AimdConcurrencyController(initial=4, minimum=1, maximum=8)
+    controller.record(0.001, None)
+
+    assert controller.record(0.01, None) is None
+    assert controller.window == 4
@@ -28,7 +28,13 @@ import pytest
 import backend_v2.app.api.main as api_main
 
 from backend_v2.app.api.main import app
-from backend_v2.app.domain.models import DeviceExecutionResult, JobRunSummary, JobStatus
+from backend_v2.app.domain.models import (
+    DeviceExecutionResult,
+    JobRecord,
+    JobRunSummary,
+    JobStatus,
+)
+from backend_v2.app.infrastructure.volatile_lines import current_volatile_line_rules
 
 
 class FailHostValidator:
@@ -54,7 +60,7 @@ def import_devices_for_run(client: TestClient, rows: list[str]) -> None:
 
 
 @pytest.fixture(autouse=True)
-def reset_in_memory_runtime_state():
+def reset_in_memory_runtime_state(tmp_path):
     """Ensure each test starts with a clean in-memory runtime state."""
     original_worker_mode = os.environ.get("NW_EDIT_V2_WORKER_MODE")
     original_validator_mode = os.environ.get("NW_EDIT_V2_VALIDATOR_MODE")
@@ -83,7 +89,11 @@ def reset_in_memory_runtime_state():
     api_main.event_store.clear()
     api_main.run_store.clear()
     api_main.control_store.clear()
+    api_main.device_locks.clear()
+    api_main.span_store.clear()
+    api_main.run_journal.directory = tmp_path / "run_journal"
     api_main.engine.worker = api_main.SimulatedDeviceWorker()
+    api_main.async_engine.worker = api_main.SimulatedDeviceWorker()
     api_main.device_import_service.validator = api_main.SimulatedConnectionValidator()
     yield
     if original_worker_mode is None:
@@ -104,6 +114,109 @@ def test_health_endpoint():
     assert response.json() == {"status": "ok"}
 
 
+def test_idle_ssh_sessions_and_bastion_transports_are_reaped():
+    assert api_main.pool_reaper._prunes == [
+        api_main.ssh_sessions.prune,
+        api_main.bastions.prune,
+    ]
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        [
+            "10.1.9.1,22,cisco_ios,admin,pass,edge-a,show run,",
+            "10.1.9.2,22,cisco_ios,admin,pass,edge-b,show run,",
+        ],
+    )
+    job_id = client.post(
+        "/api/v2/jobs", json={"job_name": "metrics", "creator": "tester"}
+    ).json()["job_id"]
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.1.9.1:22", "10.1.9.2:22"],
+            "canary": {"host": "10.1.9.1", "port": 22},
+            "commands": ["show version"],
+            "stagger_delay": 0.0,
+        },
+    )
+    assert run_response.status_code == 200
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert "# TYPE nw_edit_jobs_total counter" in text
+    assert 'nw_edit_import_validations_total{result="ok"}' in text
+    assert 'nw_edit_device_results_total{status="success",error_code=""}' in text
+    assert f'nw_edit_event_store_events{{job_id="{job_id}"}}' in text
+    assert "nw_edit_websocket_clients 0" in text
+
+
+def test_job_trace_returns_waterfall_of_run_spans():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        [
+            "10.1.8.1,22,cisco_ios,admin,pass,edge-a,show run,",
+            "10.1.8.2,22,cisco_ios,admin,pass,edge-b,show run,",
+        ],
+    )
+    job_id = client.post(
+        "/api/v2/jobs", json={"job_name": "trace", "creator": "tester"}
+    ).json()["job_id"]
+    assert client.get(f"/api/v2/jobs/{job_id}/trace").status_code == 404
+
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.1.8.1:22", "10.1.8.2:22"],
+            "canary": {"host": "10.1.8.1", "port": 22},
+            "commands": ["show version"],
+            "stagger_delay": 0.0,
+        },
+    )
+    assert run_response.status_code == 200
+
+    response = client.get(f"/api/v2/jobs/{job_id}/trace")
+    assert response.status_code == 200
+    payload = response.json()
+    rows = [(span["name"], span["depth"]) for span in payload["spans"]]
+    assert rows[:5] == [
+        ("run", 0),
+        ("prepare_run", 1),
+        ("reset_run_control", 1),
+        ("execute_prepared_run", 1),
+        ("run_job", 2),
+    ]
+    attempts = [span for span in payload["spans"] if span["name"] == "device_attempt"]
+    assert {span["attributes"]["device"] for span in attempts} == {
+        "10.1.8.1:22",
+        "10.1.8.2:22",
+    }
+    assert all(span["depth"] == 3 for span in attempts)
+    assert payload["total_seconds"] >= payload["spans"][0]["duration_seconds"]
+
+
+def test_debug_profile_returns_collapsed_stacks(monkeypatch):
+    client = TestClient(app)
+    response = client.post("/api/v2/debug/profile?seconds=0.1")
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].startswith(
+        'attachment; filename="nw-edit-profile-'
+    )
+    assert int(response.headers["x-profile-samples"]) >= 1
+    first = response.text.splitlines()[0]
+    assert ";" in first and first.rsplit(" ", 1)[1].isdigit()
+
+    monkeypatch.setenv("NW_EDIT_V2_PROFILE_MAX_SECONDS", "1")
+    assert client.post("/api/v2/debug/profile?seconds=2").status_code == 400
+    assert client.post("/api/v2/debug/profile?seconds=0").status_code == 400
+
+
 def test_runtime_modes_endpoint_defaults_worker_to_netmiko(monkeypatch):
     monkeypatch.delenv("NW_EDIT_V2_WORKER_MODE", raising=False)
     monkeypatch.delenv("NW_EDIT_V2_VALIDATOR_MODE", raising=False)
@@ -232,6 +345,263 @@ def test_job_run_with_simulated_worker():
     result_response = client.get(f"/api/v2/jobs/{job_id}/result")
     assert result_response.status_code == 200
     assert result_response.json()["status"] == "completed"
+    assert result_response.json()["stage_percentiles"]["total"]["count"] == 2
+    by_type = result_response.json()["stage_percentiles_by_device_type"]
+    assert by_type["cisco_ios"]["total"]["count"] == 2
+
+
+def test_run_with_async_engine_mode():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        [
+            "10.1.5.1,22,cisco_ios,admin,pass,edge-a,show run,",
+            "10.1.5.2,22,cisco_ios,admin,pass,edge-b,show run,",
+            "10.1.5.3,22,cisco_ios,admin,pass,edge-c,show run,",
+        ],
+    )
+    create = client.post("/api/v2/jobs", json={"job_name": "async", "creator": "ops"})
+    job_id = create.json()["job_id"]
+
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.1.5.1:22", "10.1.5.2:22", "10.1.5.3:22"],
+            "canary": {"host": "10.1.5.1", "port": 22},
+            "commands": ["show version"],
+            "engine_mode": "async",
+            "concurrency_limit": 2000,
+        },
+    )
+
+    assert run_response.status_code == 200
+    payload = run_response.json()
+    assert payload["status"] == "completed"
+    assert set(payload["device_results"]) == {
+        "10.1.5.1:22",
+        "10.1.5.2:22",
+        "10.1.5.3:22",
+    }
+
+
+def test_run_with_waves_reports_wave_progress():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        [f"10.1.7.{i},22,cisco_ios,admin,pass,edge-{i},show run," for i in range(1, 6)],
+    )
+    create = client.post("/api/v2/jobs", json={"job_name": "waves", "creator": "ops"})
+    job_id = create.json()["job_id"]
+
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": [f"10.1.7.{i}:22" for i in range(1, 6)],
+            "canary": {"host": "10.1.7.1", "port": 22},
+            "commands": ["show version"],
+            "waves": [25, 50],
+        },
+    )
+
+    assert run_response.status_code == 200
+    waves = run_response.json()["waves"]
+    assert [w["label"] for w in waves] == ["canary", "25%", "50%", "100%"]
+    assert [w["status"] for w in waves] == ["completed"] * 4
+
+
+def test_run_rejects_invalid_waves():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        ["10.1.8.1,22,cisco_ios,admin,pass,edge-a,show run,"],
+    )
+    create = client.post("/api/v2/jobs", json={"job_name": "bad", "creator": "ops"})
+    job_id = create.json()["job_id"]
+
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.1.8.1:22"],
+            "canary": {"host": "10.1.8.1", "port": 22},
+            "commands": ["show version"],
+            "waves": [50, 10],
+        },
+    )
+
+    assert run_response.status_code == 400
+    assert "strictly increasing" in run_response.json()["detail"]
+
+
+def test_run_passes_group_limits_and_device_attributes(monkeypatch):
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        [
+            '10.1.9.1,22,cisco_ios,admin,pass,edge-a,show run,"{""site"":""nrt""}"',
+            '10.1.9.2,22,cisco_ios,admin,pass,edge-b,show run,"{""site"":""kix""}"',
+        ],
+    )
+    create = client.post("/api/v2/jobs", json={"job_name": "sites", "creator": "ops"})
+    job_id = create.json()["job_id"]
+    captured: dict[str, object] = {}
+
+    def fake_run_job(**kwargs):
+        captured.update(kwargs)
+        return JobRunSummary(job_id=job_id, status=JobStatus.COMPLETED)
+
+    monkeypatch.setattr(api_main.engine, "run_job", fake_run_job)
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.1.9.1:22", "10.1.9.2:22"],
+            "canary": {"host": "10.1.9.1", "port": 22},
+            "commands": ["show version"],
+            "group_limits": {"site": 1},
+        },
+    )
+
+    assert run_response.status_code == 200
+    assert captured["config"].group_limits == {"site": 1}
+    attributes = captured["device_attributes"]
+    assert attributes["10.1.9.1:22"]["site"] == "nrt"
+    assert attributes["10.1.9.2:22"]["device_type"] == "cisco_ios"
+
+
+def test_run_rejects_non_positive_group_limits():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        ["10.1.9.9,22,cisco_ios,admin,pass,edge-a,show run,"],
+    )
+    create = client.post("/api/v2/jobs", json={"job_name": "bad", "creator": "ops"})
+    job_id = create.json()["job_id"]
+
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.1.9.9:22"],
+            "canary": {"host": "10.1.9.9", "port": 22},
+            "commands": ["show version"],
+            "group_limits": {"site": 0},
+        },
+    )
+
+    assert run_response.status_code == 400
+    assert "group_limits" in run_response.json()["detail"]
+
+
+def test_run_reports_schedule_order_and_durations():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        [
+            "10.1.8.1,22,cisco_ios,admin,pass,edge-a,show run,",
+            "10.1.8.2,22,cisco_ios,admin,pass,edge-b,show run,",
+        ],
+    )
+    create = client.post("/api/v2/jobs", json={"job_name": "lpt", "creator": "ops"})
+    job_id = create.json()["job_id"]
+
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.1.8.1:22", "10.1.8.2:22"],
+            "canary": {"host": "10.1.8.1", "port": 22},
+            "commands": ["show version"],
+        },
+    )
+
+    assert run_response.status_code == 200
+    body = run_response.json()
+    assert body["schedule_order"] == ["10.1.8.1:22", "10.1.8.2:22"]
+    assert body["status_counts"] == {"success": 2}
+    assert body["device_results"]["10.1.8.2:22"]["duration_seconds"] >= 0
+    assert api_main.duration_history.estimate("10.1.8.2:22") is not None
+
+
+def test_run_rejects_unknown_schedule_order():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        ["10.1.8.9,22,cisco_ios,admin,pass,edge-a,show run,"],
+    )
+    create = client.post("/api/v2/jobs", json={"job_name": "bad", "creator": "ops"})
+    job_id = create.json()["job_id"]
+
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.1.8.9:22"],
+            "canary": {"host": "10.1.8.9", "port": 22},
+            "commands": ["show version"],
+            "schedule_order": "random",
+        },
+    )
+
+    assert run_response.status_code == 400
+    assert "schedule_order" in run_response.json()["detail"]
+
+
+def test_run_passes_failure_budget_and_rejects_unknown_scope(monkeypatch):
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        ["10.1.7.1,22,cisco_ios,admin,pass,edge-a,show run,"],
+    )
+    create = client.post("/api/v2/jobs", json={"job_name": "fb", "creator": "ops"})
+    job_id = create.json()["job_id"]
+    payload = {
+        "imported_device_keys": ["10.1.7.1:22"],
+        "canary": {"host": "10.1.7.1", "port": 22},
+        "commands": ["show version"],
+        "max_failure_percent": 5,
+        "failure_budget_scope": "nope",
+    }
+
+    rejected = client.post(f"/api/v2/jobs/{job_id}/run", json=payload)
+    assert rejected.status_code == 400
+    assert "failure_budget_scope" in rejected.json()["detail"]
+
+    captured: dict[str, object] = {}
+
+    def fake_run_job(**kwargs):
+        captured.update(kwargs)
+        return JobRunSummary(job_id=job_id, status=JobStatus.COMPLETED)
+
+    monkeypatch.setattr(api_main.engine, "run_job", fake_run_job)
+    accepted = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={**payload, "failure_budget_scope": "wave"},
+    )
+
+    assert accepted.status_code == 200
+    budget = captured["config"].failure_budget
+    assert budget.max_failure_percent == 5
+    assert budget.max_failures is None
+    assert budget.per_wave is True
+
+
+def test_run_rejects_high_concurrency_for_thread_engine():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        ["10.1.6.1,22,cisco_ios,admin,pass,edge-a,show run,"],
+    )
+    create = client.post("/api/v2/jobs", json={"job_name": "big", "creator": "ops"})
+    job_id = create.json()["job_id"]
+
+    run_response = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.1.6.1:22"],
+            "canary": {"host": "10.1.6.1", "port": 22},
+            "commands": ["show version"],
+            "concurrency_limit": 500,
+        },
+    )
+
+    assert run_response.status_code == 400
+    assert "engine_mode=async" in run_response.json()["detail"]
 
 
 def test_device_import_and_run_with_imported_devices():
@@ -425,14 +795,105 @@ def test_list_jobs_endpoint():
     assert all("job_id" in item and "status" in item for item in jobs)
 
 
-def test_create_job_returns_409_when_active_job_exists():
+def test_create_job_allows_concurrent_active_jobs():
     client = TestClient(app)
     first = client.post("/api/v2/jobs", json={"job_name": "first", "creator": "ops"})
     assert first.status_code == 200
 
     second = client.post("/api/v2/jobs", json={"job_name": "second", "creator": "ops"})
-    assert second.status_code == 409
-    assert "already queued" in second.json()["detail"]
+    assert second.status_code == 200
+    assert second.json()["status"] == "queued"
+
+
+def test_concurrent_jobs_lock_devices_and_expose_scheduler_state(monkeypatch):
+    client = TestClient(app)
+    monkeypatch.setenv("NW_EDIT_V2_SIMULATED_DELAY_MS", "700")
+    import_devices_for_run(
+        client,
+        [
+            "10.9.5.1,22,cisco_ios,admin,pass,edge-a,show run,",
+            "10.9.5.2,22,cisco_ios,admin,pass,edge-b,show run,",
+            "10.9.5.3,22,cisco_ios,admin,pass,edge-c,show run,",
+        ],
+    )
+    job_ids = [
+        client.post("/api/v2/jobs", json={"job_name": name, "creator": "ops"}).json()[
+            "job_id"
+        ]
+        for name in ("long", "disjoint", "overlap")
+    ]
+
+    started = client.post(
+        f"/api/v2/jobs/{job_ids[0]}/run/async",
+        json={
+            "imported_device_keys": ["10.9.5.1:22", "10.9.5.2:22"],
+            "canary": {"host": "10.9.5.1", "port": 22},
+            "commands": ["show version"],
+        },
+    )
+    assert started.status_code == 200
+
+    state = client.get("/api/v2/scheduler/state").json()
+    assert {"device": "10.9.5.2:22", "owner": job_ids[0]} in state["device_locks"]
+    assert state["session_budget"]["total"] == api_main.session_budget.total
+    assert state["worker_pool"]["capacity"] == api_main.session_pool.capacity
+    assert state["worker_pool"]["active_by_owner"].get(job_ids[0], 0) <= 1
+    assert set(state["ssh_sessions"]) == {
+        "idle",
+        "warm_idle",
+        "checked_out",
+        "opened",
+        "reused",
+        "warm_reused",
+        "discarded",
+    }
+    assert set(state["bastions"]) == {
+        "bastions",
+        "transports",
+        "channels",
+        "opened_transports",
+        "opened_channels",
+    }
+
+    monkeypatch.setenv("NW_EDIT_V2_SIMULATED_DELAY_MS", "0")
+    disjoint = client.post(
+        f"/api/v2/jobs/{job_ids[1]}/run",
+        json={
+            "imported_device_keys": ["10.9.5.3:22"],
+            "canary": {"host": "10.9.5.3", "port": 22},
+            "commands": ["show version"],
+        },
+    )
+    assert disjoint.status_code == 200
+    assert disjoint.json()["status"] == "completed"
+
+    overlap = client.post(
+        f"/api/v2/jobs/{job_ids[2]}/run",
+        json={
+            "imported_device_keys": ["10.9.5.2:22", "10.9.5.3:22"],
+            "canary": {"host": "10.9.5.3", "port": 22},
+            "commands": ["show version"],
+        },
+    )
+    assert overlap.status_code == 409
+    assert f"10.9.5.2:22 ({job_ids[0]})" in overlap.json()["detail"]
+    assert client.get(f"/api/v2/jobs/{job_ids[2]}").json()["status"] == "queued"
+
+    status = client.post(
+        "/api/v2/commands/exec",
+        json={"host": "10.9.5.1", "port": 22, "commands": "show version"},
+    )
+    assert status.status_code == 409
+
+    deadline = time.monotonic() + 5.0
+    while api_main.device_locks.snapshot() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert api_main.device_locks.snapshot() == {}
+    assert client.get("/api/v2/scheduler/state").json()["session_budget"] == {
+        "total": api_main.session_budget.total,
+        "in_use": 0,
+        "jobs": [],
+    }
 
 
 def test_create_job_allowed_after_active_job_is_terminal():
@@ -779,6 +1240,89 @@ def test_presets_crud_and_duplicate_conflict():
     assert "cisco_ios" in models.json()
 
 
+def test_run_applies_preset_and_request_diff_ignore_patterns(monkeypatch):
+    client = TestClient(app)
+    preset = client.post(
+        "/api/v2/presets",
+        json={
+            "name": f"ios-masked-{time.time_ns()}",
+            "os_model": "cisco_ios",
+            "commands": ["show version"],
+            "diff_ignore_patterns": [r"^ntp clock-period \d+$"],
+        },
+    )
+    assert preset.status_code == 200
+    assert preset.json()["diff_ignore_patterns"] == [r"^ntp clock-period \d+$"]
+    preset_id = preset.json()["preset_id"]
+    form_save = client.put(
+        f"/api/v2/presets/{preset_id}",
+        json={
+            "name": preset.json()["name"],
+            "os_model": "cisco_ios",
+            "commands": ["show version", "show clock"],
+        },
+    )
+    assert form_save.status_code == 200
+    assert form_save.json()["commands"] == ["show version", "show clock"]
+    assert form_save.json()["diff_ignore_patterns"] == [r"^ntp clock-period \d+$"]
+    invalid = client.post(
+        "/api/v2/presets",
+        json={
+            "name": f"ios-bad-{time.time_ns()}",
+            "os_model": "cisco_ios",
+            "commands": ["show version"],
+            "diff_ignore_patterns": ["(unclosed"],
+        },
+    )
+    assert invalid.status_code == 400
+    assert "Invalid volatile line rule '(unclosed'" in invalid.json()["detail"]
+
+    import_devices_for_run(client, ["10.25.0.1,22,cisco_ios,admin,pass,edge,,"])
+    job_id = client.post(
+        "/api/v2/jobs", json={"job_name": "masked-diff", "creator": "tester"}
+    ).json()["job_id"]
+    captured: dict[str, object] = {}
+
+    def fake_run_job(**kwargs):
+        captured["rules"] = current_volatile_line_rules()
+        return JobRunSummary(
+            job_id=job_id,
+            status=JobStatus.COMPLETED,
+            commands=["show version"],
+            verify_commands=[],
+            target_device_keys=["10.25.0.1:22"],
+            device_results={"10.25.0.1:22": DeviceExecutionResult(status="success")},
+        )
+
+    monkeypatch.setattr(api_main.engine, "run_job", fake_run_job)
+    run_payload = {
+        "commands": ["show version"],
+        "imported_device_keys": ["10.25.0.1:22"],
+        "canary": {"host": "10.25.0.1", "port": 22},
+        "diff_ignore_patterns": ["^Building configuration"],
+    }
+    inline_flag = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={**run_payload, "diff_ignore_patterns": ["(?i)serial .*$"]},
+    )
+    assert inline_flag.status_code == 400
+    assert "global flags" in inline_flag.json()["detail"]
+    unknown = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={**run_payload, "preset_id": "missing"},
+    )
+    assert unknown.status_code == 400
+    assert unknown.json()["detail"] == "Unknown preset_id: missing"
+
+    run = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={**run_payload, "preset_id": preset.json()["preset_id"]},
+    )
+    assert run.status_code == 200
+    assert captured["rules"] == (r"^ntp clock-period \d+$", "^Building configuration")
+    assert current_volatile_line_rules() == ()
+
+
 def test_app_reset_clears_volatile_state_but_keeps_presets():
     client = TestClient(app)
     preset_name = f"reset-keep-{time.time_ns()}"
@@ -822,6 +1366,8 @@ def test_app_reset_clears_volatile_state_but_keeps_presets():
     assert reset.json()["cleared"]["events"] > 0
     assert reset.json()["cleared"]["run_results"] == 1
     assert reset.json()["cleared"]["controls"] == 1
+    assert reset.json()["cleared"]["run_journals"] == 1
+    assert api_main.run_journal.interrupted() == []
 
     listed_devices = client.get("/api/v2/devices")
     assert listed_devices.status_code == 200
@@ -1344,3 +1890,149 @@ def test_run_verify_mode_canary_targets_only_canary(monkeypatch):
     verify_by_device = captured["verify_commands_by_device"]
     assert verify_by_device["10.13.0.1:22"] == []
     assert verify_by_device["10.13.0.2:22"] == ["show run"]
+
+
+def test_interrupted_run_is_restored_and_resumes_only_unfinished_devices():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        [
+            "10.9.6.1,22,cisco_ios,admin,pass,edge-a,show run,",
+            "10.9.6.2,22,cisco_ios,admin,pass,edge-b,show run,",
+            "10.9.6.3,22,cisco_ios,admin,pass,edge-c,show run,",
+        ],
+    )
+    job = JobRecord(
+        job_id="job-interrupted",
+        job_name="big rollout",
+        creator="ops",
+        status=JobStatus.RUNNING,
+        created_at="2026-01-01T00:00:00+00:00",
+    )
+    api_main.run_journal.start_run(
+        job,
+        {
+            "imported_device_keys": ["10.9.6.1:22", "10.9.6.2:22", "10.9.6.3:22"],
+            "canary": {"host": "10.9.6.1", "port": 22},
+            "commands": ["show version"],
+        },
+    )
+    api_main.run_journal.record_device(
+        job.job_id, "10.9.6.1:22", DeviceExecutionResult(status="success")
+    )
+    api_main.run_journal.record_device(
+        job.job_id, "10.9.6.2:22", DeviceExecutionResult(status="cancelled")
+    )
+
+    assert api_main.restore_interrupted_jobs() == 1
+    restored = client.get(f"/api/v2/jobs/{job.job_id}")
+    assert restored.json()["status"] == "queued"
+    assert restored.json()["created_at"] == "2026-01-01T00:00:00+00:00"
+    interrupted = client.get("/api/v2/jobs/interrupted").json()
+    assert interrupted == [
+        {
+            "job_id": job.job_id,
+            "job_name": "big rollout",
+            "finished_devices": 1,
+            "remaining_devices": ["10.9.6.2:22", "10.9.6.3:22"],
+        }
+    ]
+
+    resumed = client.post(f"/api/v2/jobs/{job.job_id}/run/resume")
+    assert resumed.status_code == 200
+    deadline = time.monotonic() + 5.0
+    while (
+        client.get(f"/api/v2/jobs/{job.job_id}").json()["status"] == "running"
+        and time.monotonic() < deadline
+    ):
+        time.sleep(0.05)
+
+    result = client.get(f"/api/v2/jobs/{job.job_id}/result").json()
+    assert result["status"] == "completed"
+    assert sorted(result["device_results"]) == ["10.9.6.2:22", "10.9.6.3:22"]
+    assert client.get("/api/v2/jobs/interrupted").json() == []
+    journaled = api_main.run_journal.load(job.job_id)
+    assert journaled is not None
+    assert journaled.request["imported_device_keys"] == [
+        "10.9.6.1:22",
+        "10.9.6.2:22",
+        "10.9.6.3:22",
+    ]
+    again = client.post(f"/api/v2/jobs/{job.job_id}/run/resume")
+    assert again.status_code == 409
+
+
+def test_completed_run_is_journaled_and_not_resumable():
+    client = TestClient(app)
+    import_devices_for_run(
+        client,
+        ["10.9.7.1,22,cisco_ios,admin,pass,edge-a,show run,"],
+    )
+    job_id = client.post(
+        "/api/v2/jobs", json={"job_name": "journaled", "creator": "ops"}
+    ).json()["job_id"]
+
+    run = client.post(
+        f"/api/v2/jobs/{job_id}/run",
+        json={
+            "imported_device_keys": ["10.9.7.1:22"],
+            "canary": {"host": "10.9.7.1", "port": 22},
+            "commands": ["show version"],
+        },
+    )
+
+    assert run.status_code == 200
+    journaled = api_main.run_journal.load(job_id)
+    assert journaled is not None
+    assert journaled.status == "completed"
+    assert journaled.device_status == {"10.9.7.1:22": "success"}
+    assert client.post(f"/api/v2/jobs/{job_id}/run/resume").status_code == 409
+
+
+def test_progress_endpoint_reports_partial_results_during_async_run(monkeypatch):
+    client = TestClient(app)
+    monkeypatch.setenv("NW_EDIT_V2_SIMULATED_DELAY_MS", "300")
+    import_devices_for_run(
+        client,
+        [
+            "10.9.8.1,22,cisco_ios,admin,pass,edge-a,show run,",
+            "10.9.8.2,22,cisco_ios,admin,pass,edge-b,show run,",
+        ],
+    )
+    job_id = client.post(
+        "/api/v2/jobs", json={"job_name": "progress", "creator": "ops"}
+    ).json()["job_id"]
+    assert client.get(f"/api/v2/jobs/{job_id}/progress").status_code == 404
+
+    started = client.post(
+        f"/api/v2/jobs/{job_id}/run/async",
+        json={
+            "imported_device_keys": ["10.9.8.1:22", "10.9.8.2:22"],
+            "canary": {"host": "10.9.8.1", "port": 22},
+            "commands": ["show version"],
+        },
+    )
+    assert started.status_code == 200
+
+    deadline = time.monotonic() + 2.0
+    progress = client.get(f"/api/v2/jobs/{job_id}/progress")
+    while progress.status_code == 404 and time.monotonic() < deadline:
+        time.sleep(0.01)
+        progress = client.get(f"/api/v2/jobs/{job_id}/progress")
+    assert progress.status_code == 200
+    running = progress.json()
+    assert running["status"] == "running"
+    assert running["total"] == 2
+    assert running["finished"] < 2
+    assert client.get(f"/api/v2/jobs/{job_id}/result").status_code == 200
+
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        done = client.get(f"/api/v2/jobs/{job_id}/progress").json()
+        if done["status"] != "running":
+            break
+        time.sleep(0.05)
+    assert done["status"] == "completed"
+    assert done["finished"] == 2
+    assert done["percent_complete"] == 100.0
+    assert sorted(done["summary"]["device_results"]) == ["10.9.8.1:22", "10.9.8.2:22"]
@@ -0,0 +1,259 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the asyncio execution engine."""
+
+import asyncio
+import threading
+import time
+
+from backend_v2.app.application.async_execution_engine import AsyncExecutionEngine
+from backend_v2.app.application.events import report_progress
+from backend_v2.app.application.execution_control import ExecutionControl
+from backend_v2.app.application.execution_engine import ExecutionConfig
+from backend_v2.app.application.worker_pool import SessionWorkerPool
+from backend_v2.app.domain.models import DeviceExecutionResult, DeviceTarget, JobStatus
+from backend_v2.app.infrastructure.in_memory_event_store import InMemoryEventStore
+
+
+class BlockingStubWorker:
+    """Blocking worker with predefined outcomes by device key."""
+
+    def __init__(self, plan: dict[str, list[str]]):
+        self.plan = {k: list(v) for k, v in plan.items()}
+        self.calls: list[str] = []
+        self.threads: set[str] = set()
+
+    def run(
+        self,
+        device: DeviceTarget,
+        commands: list[str],
+        verify_commands: list[str] | None = None,
+    ) -> DeviceExecutionResult:
+        del commands, verify_commands
+        key = device.key
+        self.calls.append(key)
+        self.threads.add(threading.current_thread().name)
+        queue = self.plan.get(key, ["success"])
+        status = queue.pop(0) if queue else "success"
+        self.plan[key] = queue
+        if status == "success":
+            return DeviceExecutionResult(status="success", logs=[f"{key} ok"])
+        return DeviceExecutionResult(status="failed", error=f"{key} failed")
+
+
+class CoroutineWorker:
+    """Async-native worker that tracks peak concurrency."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    def run(self, device, commands, verify_commands=None):
+        raise AssertionError("blocking path must not be used")
+
+    async def run_async(
+        self,
+        device: DeviceTarget,
+        commands: list[str],
+        verify_commands: list[str] | None = None,
+    ) -> DeviceExecutionResult:
+        del commands, verify_commands
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return DeviceExecutionResult(status="success", logs=[f"{device.key} ok"])
+
+
+def _targets(count: int) -> list[DeviceTarget]:
+    return [DeviceTarget(host=f"10.20.{i // 250}.{i % 250 + 1}") for i in range(count)]
+
+
+def _run(engine, devices, config, control=None, job_id="async-job"):
+    return engine.run_job(
+        job_id=job_id,
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={d.key: [] for d in devices},
+        config=config,
+        control=control,
+    )
+
+
+def test_async_engine_runs_thousands_of_devices_without_threads():
+    devices = _targets(1500)
+    worker = CoroutineWorker()
+    engine = AsyncExecutionEngine(worker=worker)
+
+    summary = _run(engine, devices, ExecutionConfig(concurrency_limit=1000))
+
+    assert summary.status == JobStatus.COMPLETED
+    assert len(summary.device_results) == 1500
+    assert worker.peak == 1000
+    assert engine._bridge is None
+
+
+def test_async_engine_canary_failure_aborts_remaining_devices():
+    devices = _targets(3)
+    worker = BlockingStubWorker(plan={devices[0].key: ["failed"]})
+    engine = AsyncExecutionEngine(worker=worker)
+
+    summary = _run(engine, devices, ExecutionConfig())
+
+    assert summary.status == JobStatus.FAILED
+    assert worker.calls == [devices[0].key]
+
+
+def test_async_engine_bridges_blocking_worker_and_retries():
+    devices = _targets(2)
+    worker = BlockingStubWorker(plan={devices[1].key: ["failed", "success"]})
+    engine = AsyncExecutionEngine(worker=worker, bridge_workers=2)
+
+    summary = _run(engine, devices, ExecutionConfig(non_canary_retry_limit=1))
+
+    assert summary.status == JobStatus.COMPLETED
+    assert summary.device_results[devices[1].key].attempts == 2
+    assert all(name.startswith("nw-edit-bridge") for name in worker.threads)
+    engine.shutdown()
+
+
+def test_async_engine_stop_on_error_and_events():
+    devices = _targets(3)
+    worker = BlockingStubWorker(plan={devices[1].key: ["failed"]})
+    events = InMemoryEventStore()
+    engine = AsyncExecutionEngine(worker=worker, publisher=events)
+
+    summary = _run(
+        engine,
+        devices,
+        ExecutionConfig(concurrency_limit=1, non_canary_retry_limit=0),
+        job_id="async-stop",
+    )
+
+    assert summary.status == JobStatus.FAILED
+    assert devices[2].key not in summary.device_results
+    assert events.list_events("async-stop")[-1].type == "job_complete"
+
+
+def test_async_engine_cancel_before_start():
+    devices = _targets(2)
+    control = ExecutionControl()
+    control.cancel_event.set()
+    engine = AsyncExecutionEngine(worker=BlockingStubWorker(plan={}))
+
+    summary = _run(engine, devices, ExecutionConfig(), control=control)
+
+    assert summary.status == JobStatus.CANCELLED
+    assert summary.device_results == {}
+
+
+def test_async_engine_records_devices_still_running_at_cancel():
+    devices = _targets(3)
+    control = ExecutionControl()
+
+    class CancellingWorker:
+        def run(self, device, commands, verify_commands=None):
+            if device.key == devices[1].key:
+                time.sleep(0.2)
+            elif device.key == devices[2].key:
+                control.cancel_event.set()
+            return DeviceExecutionResult(status="success")
+
+    engine = AsyncExecutionEngine(worker=CancellingWorker(), bridge_workers=2)
+
+    summary = _run(
+        engine, devices, ExecutionConfig(concurrency_limit=2), control=control
+    )
+    engine.shutdown()
+
+    assert summary.status == JobStatus.CANCELLED
+    assert summary.device_results[devices[1].key].status == "success"
+    assert summary.device_results[devices[2].key].status == "success"
+
+
+def test_async_engine_caps_its_shared_pool_slots_at_max_concurrency(monkeypatch):
+    pool = SessionWorkerPool(max_sessions=8)
+    limits: list[int | None] = []
+    original_executor = pool.executor
+
+    def recording_executor(operation, owner, limit=None):
+        limits.append(limit)
+        return original_executor(operation, owner, limit)
+
+    monkeypatch.setattr(pool, "executor", recording_executor)
+    engine = AsyncExecutionEngine(worker=BlockingStubWorker(plan={}), pool=pool)
+
+    summary = _run(engine, _targets(4), ExecutionConfig(concurrency_limit=3))
+    pool.shutdown()
+
+    assert summary.status == JobStatus.COMPLETED
+    assert limits and set(limits) == {3}
+
+
+def test_async_engine_resumes_on_control_signal():
+    devices = [DeviceTarget(host=f"10.61.0.{i}", port=22) for i in range(1, 6)]
+    worker = BlockingStubWorker(plan={})
+    control = ExecutionControl()
+    event_store = InMemoryEventStore()
+    engine = AsyncExecutionEngine(worker=worker, publisher=event_store)
+    control.pause_event.set()
+    timer = threading.Timer(0.2, control.pause_event.clear)
+    timer.start()
+
+    summary = engine.run_job(
+        job_id="job-async-pause",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(concurrency_limit=5),
+        control=control,
+    )
+    timer.join()
+    engine.shutdown()
+
+    assert summary.status == JobStatus.COMPLETED
+    assert len(worker.calls) == 5
+    latency_events = [
+        e
+        for e in event_store.list_events("job-async-pause")
+        if e.type == "control_latency"
+    ]
+    assert [e.status for e in latency_events] == ["resume"]
+
+
+def test_async_engine_emits_bridged_worker_progress():
+    class ProgressWorker:
+        def run(self, device, commands, verify_commands=None):
+            report_progress("apply", f"{device.key} chunk")
+            return DeviceExecutionResult(status="success")
+
+    devices = _targets(3)
+    event_store = InMemoryEventStore()
+    engine = AsyncExecutionEngine(worker=ProgressWorker(), publisher=event_store)
+
+    _run(engine, devices, ExecutionConfig(concurrency_limit=2), job_id="async-progress")
+    engine.shutdown()
+
+    progress = [
+        (event.device, event.message)
+        for event in event_store.list_events("async-progress")
+        if event.type == "device_progress"
+    ]
+    assert sorted(progress) == sorted((d.key, f"{d.key} chunk") for d in devices)
@@ -0,0 +1,247 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the bastion transport pool."""
+
+import threading
+import time
+
+import pytest
+
+from backend_v2.app.infrastructure.bastion_pool import (
+    BastionTransportPool,
+    JumpHost,
+    jump_host_for,
+)
+from backend_v2.app.infrastructure.pool_reaper import PoolReaper
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeChannel:
+    def __init__(self, destination):
+        self.destination = destination
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeTransport:
+    def __init__(self, jump):
+        self.jump = jump
+        self.active = True
+        self.channels = []
+
+    def is_active(self):
+        return self.active
+
+    def open_channel(self, kind, destination, source, timeout=None):
+        assert kind == "direct-tcpip"
+        channel = FakeChannel(destination)
+        self.channels.append(channel)
+        return channel
+
+    def close(self):
+        self.active = False
+
+
+class Opener:
+    def __init__(self):
+        self.transports = []
+
+    def __call__(self, jump):
+        transport = FakeTransport(jump)
+        self.transports.append(transport)
+        return transport
+
+
+JUMP = JumpHost(host="bastion", port=22, username="jump", password="secret")
+
+
+def make_pool(**kwargs):
+    opener = Opener()
+    clock = FakeClock()
+    pool = BastionTransportPool(opener=opener, clock=clock, **kwargs)
+    return pool, opener, clock
+
+
+def test_jump_host_for_defaults_to_device_credentials():
+    params = {
+        "host": "10.0.0.1",
+        "username": "admin",
+        "password": "pw",
+        "jump_host": "bastion",
+    }
+    assert jump_host_for(params) == JumpHost("bastion", 22, "admin", "pw")
+    assert jump_host_for({**params, "jump_host": ""}) is None
+    assert jump_host_for(
+        {**params, "jump_port": 2022, "jump_username": "j", "jump_password": "x"}
+    ) == JumpHost("bastion", 2022, "j", "x")
+
+
+def test_device_channels_share_one_transport_until_it_is_full():
+    pool, opener, _ = make_pool(transports_per_bastion=2, channels_per_transport=3)
+
+    channels = [pool.open_channel(JUMP, f"10.0.0.{i}", 22) for i in range(3)]
+
+    assert len(opener.transports) == 1
+    assert [c.destination for c in channels] == [
+        ("10.0.0.0", 22),
+        ("10.0.0.1", 22),
+        ("10.0.0.2", 22),
+    ]
+    pool.open_channel(JUMP, "10.0.0.3", 22)
+    assert len(opener.transports) == 2
+    stats = pool.stats()
+    assert (stats.bastions, stats.transports, stats.channels) == (1, 2, 4)
+    assert (stats.opened_transports, stats.opened_channels) == (2, 4)
+
+
+def test_channels_spread_over_capped_transports():
+    pool, opener, _ = make_pool(transports_per_bastion=2, channels_per_transport=1)
+
+    for i in range(6):
+        pool.open_channel(JUMP, f"10.0.0.{i}", 22)
+
+    assert len(opener.transports) == 2
+    assert sorted(len(t.channels) for t in opener.transports) == [3, 3]
+
+
+def test_closed_channels_free_their_slot():
+    pool, opener, _ = make_pool(transports_per_bastion=2, channels_per_transport=1)
+
+    first = pool.open_channel(JUMP, "10.0.0.1", 22)
+    first.close()
+    pool.open_channel(JUMP, "10.0.0.2", 22)
+
+    assert len(opener.transports) == 1
+    assert pool.stats().channels == 1
+
+
+def test_dead_transport_is_replaced():
+    pool, opener, _ = make_pool()
+
+    pool.open_channel(JUMP, "10.0.0.1", 22)
+    opener.transports[0].active = False
+    pool.open_channel(JUMP, "10.0.0.2", 22)
+
+    assert len(opener.transports) == 2
+    assert pool.stats().transports == 1
+
+
+def test_idle_transport_closes_after_ttl():
+    pool, opener, clock = make_pool(idle_ttl_seconds=60)
+
+    pool.open_channel(JUMP, "10.0.0.1", 22).close()
+    clock.now = 30
+    assert pool.prune() == 0
+    clock.now = 61
+    assert pool.prune() == 1
+    assert opener.transports[0].active is False
+
+
+def test_reaper_closes_idle_transports_without_further_pool_use():
+    pool, opener, clock = make_pool(idle_ttl_seconds=60)
+    reaper = PoolReaper(prunes=[pool.prune])
+
+    pool.open_channel(JUMP, "10.0.0.1", 22).close()
+    clock.now = 61
+
+    assert reaper.reap_once() == 1
+    assert opener.transports[0].active is False
+    assert pool.stats().transports == 0
+
+
+def test_transport_with_open_channels_is_kept_past_ttl():
+    pool, _, clock = make_pool(idle_ttl_seconds=60)
+
+    pool.open_channel(JUMP, "10.0.0.1", 22)
+    clock.now = 600
+
+    assert pool.prune() == 0
+
+
+def test_changed_bastion_password_gets_its_own_transport():
+    pool, opener, _ = make_pool()
+
+    pool.open_channel(JUMP, "10.0.0.1", 22)
+    pool.open_channel(
+        JumpHost(JUMP.host, JUMP.port, JUMP.username, "rotated"), "10.0.0.2", 22
+    )
+
+    assert [t.jump.password for t in opener.transports] == ["secret", "rotated"]
+    assert pool.stats().bastions == 1
+
+
+def test_failed_bastion_login_releases_its_transport_slot():
+    attempts = []
+
+    def opener(jump):
+        attempts.append(jump)
+        if len(attempts) == 1:
+            raise OSError("bastion unreachable")
+        return FakeTransport(jump)
+
+    pool = BastionTransportPool(transports_per_bastion=1, opener=opener)
+
+    with pytest.raises(OSError):
+        pool.open_channel(JUMP, "10.0.0.1", 22)
+    pool.open_channel(JUMP, "10.0.0.1", 22)
+
+    assert len(attempts) == 2
+    assert pool.stats().transports == 1
+
+
+def test_close_all_closes_transports():
+    pool, opener, _ = make_pool()
+
+    pool.open_channel(JUMP, "10.0.0.1", 22)
+
+    assert pool.close_all() == 1
+    assert opener.transports[0].active is False
+    assert pool.stats().transports == 0
+
+
+def test_concurrent_first_sessions_wait_for_one_bastion_login():
+    release = threading.Event()
+    opener = Opener()
+
+    def slow_opener(jump):
+        release.wait(timeout=5)
+        return opener(jump)
+
+    pool = BastionTransportPool(transports_per_bastion=3, opener=slow_opener)
+    threads = [
+        threading.Thread(target=pool.open_channel, args=(JUMP, f"10.0.0.{i}", 22))
+        for i in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(opener.transports) == 1
+    assert pool.stats().channels == 5
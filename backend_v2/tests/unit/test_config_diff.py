@@ -0,0 +1,104 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the section-aware verification diff."""
+
+import difflib
+import random
+
+from backend_v2.app.application.config_diff import unified_config_diff
+
+
+def _difflib(pre: str, post: str) -> str:
+    return "".join(
+        difflib.unified_diff(
+            pre.splitlines(keepends=True),
+            post.splitlines(keepends=True),
+            fromfile="pre",
+            tofile="post",
+            lineterm="\n",
+        )
+    )
+
+
+def _apply(pre: str, diff: str) -> str:
+    """Rebuild the post side from ``pre`` and a unified diff."""
+    source = pre.splitlines(keepends=True)
+    rebuilt: list[str] = []
+    position = 0
+    for line in diff.splitlines(keepends=True)[2:]:
+        if line.startswith("@@"):
+            old = line.split()[1][1:].split(",")
+            start = int(old[0])
+            if len(old) == 1 or int(old[1]):
+                start -= 1
+            rebuilt.extend(source[position:start])
+            position = start
+        elif line[0] == "+":
+            rebuilt.append(line[1:])
+        else:
+            assert source[position] == line[1:]
+            if line[0] == " ":
+                rebuilt.append(line[1:])
+            position += 1
+    return "".join(rebuilt + source[position:])
+
+
+def test_identical_outputs_produce_no_diff():
+    assert unified_config_diff("a\nb\n", "a\nb\n") == ""
+    assert unified_config_diff("", "") == ""
+
+
+def test_single_change_matches_difflib_format():
+    pre = "".join(f"line {index}\n" for index in range(20))
+    post = pre.replace("line 10\n", "line ten\n")
+
+    assert unified_config_diff(pre, post) == _difflib(pre, post)
+    assert unified_config_diff("", "a\n") == _difflib("", "a\n")
+
+
+def test_sections_align_on_unchanged_blocks():
+    block = " switchport mode access\n no shutdown\n!\n"
+    pre = "".join(f"interface Gi0/{i}\n{block}" for i in range(5))
+    post = pre.replace("interface Gi0/2\n", "interface Gi0/2\n description new\n")
+
+    diff = unified_config_diff(pre, post)
+
+    assert [
+        line
+        for line in diff.splitlines()
+        if line[:1] in "+-" and not line.startswith(("+++", "---"))
+    ] == ["+ description new"]
+    assert _apply(pre, diff) == post
+
+
+def test_random_edits_round_trip():
+    rng = random.Random(3)
+    vocab = ["interface a\n", " x\n", " y\n", "!\n", "router\n", "a\n"]
+    for _ in range(500):
+        pre_lines = [rng.choice(vocab) for _ in range(rng.randint(0, 25))]
+        post_lines = list(pre_lines)
+        for _ in range(rng.randint(1, 4)):
+            if post_lines and rng.random() < 0.5:
+                del post_lines[rng.randrange(len(post_lines))]
+            else:
+                post_lines.insert(rng.randint(0, len(post_lines)), rng.choice(vocab))
+        pre, post = "".join(pre_lines), "".join(post_lines)
+        for sections in (True, False):
+            diff = unified_config_diff(pre, post, sections=sections)
+            assert _apply(pre, diff) == post
+            assert (diff == "") == (pre == post)
@@ -20,6 +20,8 @@
 import time
 
 from backend_v2.app.application.device_import_service import DeviceImportService
+from backend_v2.app.application.rate_limit import TokenBucket
+from backend_v2.app.application.worker_pool import SessionWorkerPool
 from backend_v2.app.infrastructure.device_connection_validators import (
     SimulatedConnectionValidator,
 )
@@ -164,6 +166,45 @@ def test_import_csv_collects_failed_rows():
     assert len(result.failed_rows) == 2
 
 
+def test_import_csv_parses_jump_host_columns():
+    service = DeviceImportService(
+        store=InMemoryDeviceStore(),
+        validator=SimulatedConnectionValidator(),
+    )
+    result = service.import_csv(
+        "host,device_type,username,password,jump_host,jump_port,"
+        "jump_username,jump_password\n"
+        "10.0.0.1,cisco_ios,admin,pass,bastion.example,2022,jump,jump-pass\n"
+        "10.0.0.2,cisco_ios,admin,pass,,,,\n"
+    )
+
+    assert [device.host for device in result.devices] == ["10.0.0.1", "10.0.0.2"]
+    via_jump, direct = result.devices
+    assert via_jump.connection_params() == {
+        "host": "10.0.0.1",
+        "port": 22,
+        "device_type": "cisco_ios",
+        "username": "admin",
+        "password": "pass",
+        "jump_host": "bastion.example",
+        "jump_port": 2022,
+        "jump_username": "jump",
+        "jump_password": "jump-pass",
+    }
+    assert "jump_password" not in via_jump.host_vars
+    assert via_jump.host_vars["jump_host"] == "bastion.example"
+    assert direct.jump_host is None
+    assert "jump_host" not in direct.connection_params()
+
+    invalid = service.import_csv(
+        "host,device_type,username,password,jump_host,jump_port\n"
+        "10.0.0.3,cisco_ios,admin,pass,bastion.example,abc\n"
+    )
+    assert [row.error for row in invalid.failed_rows] == [
+        "Invalid jump_port value: abc"
+    ]
+
+
 def test_import_csv_parallel_validation_preserves_input_order():
     store = InMemoryDeviceStore()
     service = DeviceImportService(
@@ -328,3 +369,51 @@ def test_import_csv_rejects_invalid_host_vars_keys():
     assert len(result.devices) == 0
     assert len(result.failed_rows) == 1
     assert "Invalid host_vars key(s): bad-key" == result.failed_rows[0].error
+
+
+def test_import_csv_validates_through_shared_pool_with_import_quota():
+    pool = SessionWorkerPool(max_sessions=8, operation_quotas={"import": 2})
+    service = DeviceImportService(
+        store=InMemoryDeviceStore(),
+        validator=SlowOrderAwareValidator(delays={}),
+        pool=pool,
+    )
+    rows = "\n".join(f"10.0.9.{i},22,cisco_ios,admin,pass" for i in range(1, 6))
+
+    result = service.import_csv("host,port,device_type,username,password\n" + rows)
+
+    assert [device.host for device in result.devices] == [
+        f"10.0.9.{i}" for i in range(1, 6)
+    ]
+    stats = pool.stats()
+    assert stats.completed == 5
+    assert stats.active == 0
+    pool.shutdown()
+
+
+def test_import_csv_takes_connection_tokens_before_holding_pool_slots():
+    pool = SessionWorkerPool(max_sessions=8, operation_quotas={"import": 4})
+    active_seen: list[int] = []
+
+    class RecordingValidator:
+        def validate(self, device: DeviceProfile) -> tuple[bool, str | None]:
+            active_seen.append(pool.stats().active)
+            return True, None
+
+    service = DeviceImportService(
+        store=InMemoryDeviceStore(),
+        validator=RecordingValidator(),
+        pool=pool,
+        rate_limiter=TokenBucket(rate_per_second=20, burst=1),
+    )
+    rows = "\n".join(f"10.0.8.{i},22,cisco_ios,admin,pass" for i in range(1, 4))
+
+    started = time.monotonic()
+    result = service.import_csv("host,port,device_type,username,password\n" + rows)
+
+    assert len(result.devices) == 3
+    assert time.monotonic() - started >= 0.09
+    # Rate-limited validations are never parked on a shared slot.
+    assert active_seen == [1, 1, 1]
+    assert pool.stats().queued == 0
+    pool.shutdown()
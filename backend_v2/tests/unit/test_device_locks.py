@@ -0,0 +1,56 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for in-memory device locks."""
+
+import pytest
+
+from backend_v2.app.infrastructure.in_memory_device_locks import (
+    DeviceLockConflict,
+    InMemoryDeviceLocks,
+)
+
+
+def test_acquire_is_all_or_nothing():
+    locks = InMemoryDeviceLocks()
+    locks.acquire("job-a", ["r1:22"])
+
+    with pytest.raises(DeviceLockConflict) as exc_info:
+        locks.acquire("job-b", ["r2:22", "r1:22"])
+
+    assert exc_info.value.conflicts == {"r1:22": "job-a"}
+    assert locks.snapshot() == {"r1:22": "job-a"}
+
+
+def test_reacquire_by_same_owner_does_not_take_over_release():
+    locks = InMemoryDeviceLocks()
+    first = locks.acquire("job-a", ["r1:22", "r2:22"])
+    duplicate = locks.acquire("job-a", ["r1:22"])
+
+    duplicate.release()
+    assert locks.snapshot() == {"r1:22": "job-a", "r2:22": "job-a"}
+
+    first.release()
+    assert locks.snapshot() == {}
+
+
+def test_clear_returns_number_of_locks():
+    locks = InMemoryDeviceLocks()
+    locks.acquire("job-a", ["r1:22", "r2:22"])
+
+    assert locks.clear() == 2
+    assert locks.snapshot() == {}
@@ -0,0 +1,64 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for duration history and longest-first ordering."""
+
+from backend_v2.app.application.duration_history import (
+    estimate_durations,
+    order_longest_first,
+)
+from backend_v2.app.domain.models import DeviceTarget
+from backend_v2.app.infrastructure.in_memory_duration_history import (
+    InMemoryDurationHistory,
+)
+
+
+def test_history_tracks_moving_average_and_clears():
+    history = InMemoryDurationHistory(alpha=0.5)
+
+    assert history.estimate("10.0.0.1:22") is None
+    history.record("10.0.0.1:22", 10.0)
+    history.record("10.0.0.1:22", 20.0)
+
+    assert history.estimate("10.0.0.1:22") == 15.0
+    assert history.clear() == 1
+    assert history.estimate("10.0.0.1:22") is None
+
+
+def test_unseen_devices_are_estimated_at_known_mean():
+    devices = [DeviceTarget(host=f"10.0.1.{i}") for i in range(1, 4)]
+    history = InMemoryDurationHistory()
+    history.record(devices[0].key, 2.0)
+    history.record(devices[1].key, 6.0)
+
+    estimates = estimate_durations(devices, history)
+
+    assert estimates == {devices[0].key: 2.0, devices[1].key: 6.0, devices[2].key: 4.0}
+
+
+def test_order_longest_first_keeps_input_order_on_ties():
+    devices = [DeviceTarget(host=f"10.0.2.{i}") for i in range(1, 5)]
+    estimates = {
+        devices[0].key: 1.0,
+        devices[1].key: 9.0,
+        devices[2].key: 1.0,
+        devices[3].key: 5.0,
+    }
+
+    ordered = order_longest_first(devices, estimates)
+
+    assert ordered == [devices[1], devices[3], devices[0], devices[2]]
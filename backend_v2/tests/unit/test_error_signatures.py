@@ -0,0 +1,62 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for per-platform error signature matching."""
+
+from backend_v2.app.infrastructure.error_signatures import (
+    DEFAULT_ERROR_SIGNATURES,
+    ErrorSignatureMatcher,
+    error_matcher_for,
+)
+
+
+def test_matcher_reports_earliest_signature_with_line_and_offset():
+    matcher = ErrorSignatureMatcher(("Error:", "% Invalid input"))
+    output = "r1#show ver\n  ^\n% Invalid input detected\nError: later\n"
+
+    match = matcher.search(output)
+
+    assert match is not None
+    assert match.signature == "% Invalid input"
+    assert match.line == "% Invalid input detected"
+    assert match.line_number == 3
+    assert match.offset == output.index("% Invalid")
+    assert match.message == "Command error detected: % Invalid input"
+
+
+def test_matcher_treats_signatures_as_literals():
+    matcher = ErrorSignatureMatcher(("a.b (x)",))
+
+    assert matcher.search("aXb (x)") is None
+    assert matcher.search("last line a.b (x)") is not None
+    assert ErrorSignatureMatcher(()).search("anything") is None
+
+
+def test_error_matcher_for_selects_and_caches_platform_tables():
+    junos = error_matcher_for("juniper_junos")
+
+    assert error_matcher_for("juniper_junos") is junos
+    assert error_matcher_for("cisco_ios_telnet") is error_matcher_for("cisco_ios")
+    assert junos.search("error: configuration check-out failed") is not None
+    assert junos.search("% Invalid input detected") is None
+    assert error_matcher_for("linux").search("Error: nothing to do") is None
+    assert error_matcher_for("linux").search("bash: foo: command not found")
+
+
+def test_unknown_device_types_use_default_signatures():
+    assert error_matcher_for("vendor_x").signatures == DEFAULT_ERROR_SIGNATURES
+    assert error_matcher_for(None).signatures == DEFAULT_ERROR_SIGNATURES
@@ -39,3 +39,11 @@ def test_event_store_appends_and_reads_with_cursor():
         "job_complete",
     ]
     assert [e.type for e in store.list_events("j1", 1)] == ["job_complete"]
+
+
+def test_event_store_reports_counts_per_job():
+    store = InMemoryEventStore()
+    for job_id in ["j2", "j1", "j2"]:
+        store.publish(ExecutionEvent(type="log", job_id=job_id, timestamp="t"))
+
+    assert store.event_counts() == [("j1", 1), ("j2", 2)]
@@ -0,0 +1,85 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for condition-based execution control."""
+
+import threading
+import time
+
+from backend_v2.app.application.execution_control import ExecutionControl
+
+
+def test_wait_for_signal_wakes_immediately_on_resume():
+    control = ExecutionControl()
+    control.pause_event.set()
+    generation = control.generation
+    timer = threading.Timer(0.05, control.pause_event.clear)
+    timer.start()
+
+    started = time.monotonic()
+    assert control.wait_for_signal(generation, timeout=5.0) is True
+    assert time.monotonic() - started < 1.0
+    timer.join()
+
+
+def test_wait_for_signal_returns_at_once_for_missed_signal():
+    control = ExecutionControl()
+    generation = control.generation
+    control.notify()
+
+    assert control.wait_for_signal(generation, timeout=None) is True
+    assert control.wait_for_signal(control.generation, timeout=0.01) is False
+
+
+def test_acknowledge_reports_each_request_once():
+    control = ExecutionControl()
+    control.pause_event.set()
+    control.pause_event.clear()
+
+    latency = control.acknowledge("resume")
+    assert latency is not None and latency >= 0
+    assert control.acknowledge("resume") is None
+
+    control.cancel_event.set()
+    control.pause_event.clear()
+    assert control.acknowledge("cancel") is not None
+    assert control.acknowledge("resume") is None
+
+
+def test_reset_clears_flags_without_recording_requests():
+    control = ExecutionControl()
+    control.pause_event.set()
+    control.cancel_event.set()
+
+    control.reset()
+
+    assert not control.pause_event.is_set()
+    assert not control.cancel_event.is_set()
+    assert control.acknowledge("resume") is None
+    assert control.acknowledge("cancel") is None
+
+
+def test_listeners_are_called_until_removed():
+    control = ExecutionControl()
+    calls: list[int] = []
+    remove = control.add_listener(lambda: calls.append(1))
+
+    control.pause_event.set()
+    remove()
+    control.pause_event.clear()
+
+    assert calls == [1]
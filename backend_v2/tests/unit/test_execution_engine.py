@@ -17,9 +17,19 @@
 # Review required for correctness, security, and licensing.
 """Unit tests for canary-first execution engine."""
 
+import threading
+import time
+
+from backend_v2.app.application.events import report_progress
 from backend_v2.app.application.execution_engine import ExecutionConfig, ExecutionEngine
 from backend_v2.app.application.execution_control import ExecutionControl
+from backend_v2.app.application.rate_limit import TokenBucket
+from backend_v2.app.application.rollout import FailureBudget
+from backend_v2.app.application.worker_pool import SessionWorkerPool
 from backend_v2.app.domain.models import DeviceExecutionResult, DeviceTarget, JobStatus
+from backend_v2.app.infrastructure.in_memory_duration_history import (
+    InMemoryDurationHistory,
+)
 from backend_v2.app.infrastructure.in_memory_event_store import InMemoryEventStore
 
 
@@ -45,6 +55,24 @@ class StubWorker:
         self.plan[key] = queue
         if status == "success":
             return DeviceExecutionResult(status="success", logs=[f"{key} ok"])
+        if status == "timeout":
+            return DeviceExecutionResult(
+                status="failed",
+                error=f"{key} timed out",
+                error_code="connection_timeout",
+            )
+        if status == "auth":
+            return DeviceExecutionResult(
+                status="failed",
+                error=f"{key} authentication failed",
+                error_code="authentication_failed",
+            )
+        if status == "rejected":
+            return DeviceExecutionResult(
+                status="failed",
+                error=f"{key} rejected a command",
+                error_code="command_error",
+            )
         return DeviceExecutionResult(status="failed", error=f"{key} failed")
 
 
@@ -163,6 +191,44 @@ def test_engine_emits_completion_event():
     assert events[-1].status == "completed"
 
 
+class ProgressWorker:
+    """Worker that reports progress through the attempt's context."""
+
+    def run(
+        self,
+        device: DeviceTarget,
+        commands: list[str],
+        verify_commands: list[str] | None = None,
+    ) -> DeviceExecutionResult:
+        del verify_commands
+        report_progress("apply", f"Applied {len(commands)}/{len(commands)} lines")
+        return DeviceExecutionResult(status="success")
+
+
+def test_engine_emits_worker_progress_as_device_events():
+    devices = [DeviceTarget(host=f"198.51.100.{i}", port=22) for i in (7, 8)]
+    event_store = InMemoryEventStore()
+    engine = ExecutionEngine(worker=ProgressWorker(), publisher=event_store)
+
+    engine.run_job(
+        job_id="job-progress",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["a", "b"] for d in devices},
+        verify_commands_by_device={d.key: [] for d in devices},
+        config=ExecutionConfig(),
+    )
+
+    progress = [
+        (event.device, event.status, event.message)
+        for event in event_store.list_events("job-progress")
+        if event.type == "device_progress"
+    ]
+    assert sorted(progress) == [
+        (device.key, "apply", "Applied 2/2 lines") for device in devices
+    ]
+
+
 def test_engine_cancel_before_start():
     canary = DeviceTarget(host="203.0.113.50", port=22)
     worker = StubWorker(plan={})
@@ -202,3 +268,597 @@ def test_engine_emits_queued_and_log_events_for_streaming():
     events = event_store.list_events("job-7")
     assert any(e.type == "device_status" and e.status == "queued" for e in events)
     assert any(e.type == "log" and e.device == canary.key for e in events)
+
+
+def test_waves_release_devices_in_order_and_record_summary():
+    canary = DeviceTarget(host="10.40.0.1", port=22)
+    others = [DeviceTarget(host=f"10.40.0.{i}", port=22) for i in range(2, 12)]
+    devices = [canary, *others]
+    worker = StubWorker(plan={})
+    event_store = InMemoryEventStore()
+    engine = ExecutionEngine(worker=worker, publisher=event_store)
+
+    summary = engine.run_job(
+        job_id="job-waves",
+        devices=devices,
+        canary=canary,
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={d.key: [] for d in devices},
+        config=ExecutionConfig(concurrency_limit=4, waves=(10, 50, 100)),
+    )
+
+    assert summary.status == JobStatus.COMPLETED
+    assert [w.label for w in summary.waves] == ["canary", "10%", "50%", "100%"]
+    assert [len(w.device_keys) for w in summary.waves] == [1, 1, 4, 5]
+    assert all(w.status == "completed" for w in summary.waves)
+    wave_events = [
+        e for e in event_store.list_events("job-waves") if e.type == "wave_status"
+    ]
+    assert [e.status for e in wave_events] == ["running", "completed"] * 4
+    assert worker.calls[:2] == [canary.key, others[0].key]
+
+
+def test_failed_wave_gate_skips_later_waves():
+    canary = DeviceTarget(host="10.41.0.1", port=22)
+    others = [DeviceTarget(host=f"10.41.0.{i}", port=22) for i in range(2, 6)]
+    worker = StubWorker(plan={others[0].key: ["failed"]})
+    engine = ExecutionEngine(worker=worker)
+
+    summary = engine.run_job(
+        job_id="job-wave-gate",
+        devices=[canary, *others],
+        canary=canary,
+        commands_by_device={d.key: ["conf t"] for d in [canary, *others]},
+        verify_commands_by_device={},
+        config=ExecutionConfig(non_canary_retry_limit=0, waves=(25, 100)),
+    )
+
+    assert summary.status == JobStatus.FAILED
+    assert [w.status for w in summary.waves] == ["completed", "failed", "skipped"]
+    assert worker.calls == [canary.key, others[0].key]
+
+
+def test_adaptive_concurrency_publishes_window_changes():
+    canary = DeviceTarget(host="10.42.0.1", port=22)
+    others = [DeviceTarget(host=f"10.42.0.{i}", port=22) for i in range(2, 12)]
+    plan = {others[0].key: ["timeout"]}
+    worker = StubWorker(plan=plan)
+    event_store = InMemoryEventStore()
+    engine = ExecutionEngine(worker=worker, publisher=event_store)
+
+    summary = engine.run_job(
+        job_id="job-aimd",
+        devices=[canary, *others],
+        canary=canary,
+        commands_by_device={d.key: ["conf t"] for d in [canary, *others]},
+        verify_commands_by_device={},
+        config=ExecutionConfig(
+            concurrency_limit=1,
+            stop_on_error=False,
+            non_canary_retry_limit=0,
+            adaptive_concurrency=True,
+            concurrency_min=1,
+            concurrency_max=4,
+        ),
+    )
+
+    assert summary.status == JobStatus.FAILED
+    assert len(summary.device_results) == 11
+    window_events = [
+        e for e in event_store.list_events("job-aimd") if e.type == "concurrency_window"
+    ]
+    assert window_events
+    assert all(e.status == "increase" for e in window_events)
+    assert window_events[0].message.startswith("Concurrency window 1 -> 2")
+
+
+class ConcurrencyTrackingWorker:
+    """Worker that records peak in-flight devices per site."""
+
+    def __init__(self, sites: dict[str, str]):
+        self.sites = sites
+        self.lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    def run(self, device, commands, verify_commands=None):
+        del commands, verify_commands
+        site = self.sites[device.key]
+        with self.lock:
+            self.active[site] = self.active.get(site, 0) + 1
+            self.peak[site] = max(self.peak.get(site, 0), self.active[site])
+        time.sleep(0.02)
+        with self.lock:
+            self.active[site] -= 1
+        return DeviceExecutionResult(status="success")
+
+
+def test_group_limits_cap_concurrency_per_site():
+    devices = [DeviceTarget(host=f"10.43.0.{i}", port=22) for i in range(1, 13)]
+    sites = {d.key: ("tokyo" if i % 3 else "osaka") for i, d in enumerate(devices)}
+    worker = ConcurrencyTrackingWorker(sites)
+    engine = ExecutionEngine(worker=worker)
+
+    summary = engine.run_job(
+        job_id="job-groups",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(concurrency_limit=8, group_limits={"site": 2}),
+        device_attributes={key: {"site": site} for key, site in sites.items()},
+    )
+
+    assert summary.status == JobStatus.COMPLETED
+    assert worker.peak == {"osaka": 2, "tokyo": 2}
+
+
+def test_history_orders_devices_longest_first_and_reports_estimates():
+    devices = [DeviceTarget(host=f"10.44.0.{i}", port=22) for i in range(1, 5)]
+    history = InMemoryDurationHistory()
+    history.record(devices[1].key, 1.0)
+    history.record(devices[2].key, 3.0)
+    history.record(devices[3].key, 8.0)
+    worker = StubWorker({})
+    engine = ExecutionEngine(worker=worker, history=history)
+
+    summary = engine.run_job(
+        job_id="job-lpt",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(concurrency_limit=1),
+    )
+
+    expected = [devices[0].key, devices[3].key, devices[2].key, devices[1].key]
+    assert summary.status == JobStatus.COMPLETED
+    assert worker.calls == expected
+    assert summary.schedule_order == expected
+    assert summary.estimated_durations[devices[3].key] == 8.0
+    assert devices[0].key not in summary.estimated_durations
+    assert history.estimate(devices[0].key) is not None
+
+
+def test_fifo_schedule_order_ignores_history():
+    devices = [DeviceTarget(host=f"10.44.1.{i}", port=22) for i in range(1, 4)]
+    history = InMemoryDurationHistory()
+    history.record(devices[2].key, 9.0)
+    worker = StubWorker({})
+    engine = ExecutionEngine(worker=worker, history=history)
+
+    summary = engine.run_job(
+        job_id="job-fifo",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(concurrency_limit=1, schedule_order="fifo"),
+    )
+
+    assert summary.schedule_order == [d.key for d in devices]
+
+
+def test_backing_off_device_releases_its_slot_to_other_devices():
+    devices = [DeviceTarget(host=f"10.45.0.{i}", port=22) for i in range(1, 4)]
+    worker = StubWorker(plan={devices[1].key: ["timeout", "success"]})
+    engine = ExecutionEngine(worker=worker)
+
+    summary = engine.run_job(
+        job_id="job-retry-queue",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(
+            concurrency_limit=1,
+            non_canary_retry_limit=1,
+            retry_backoff_seconds=0.2,
+            schedule_order="fifo",
+        ),
+    )
+
+    assert summary.status == JobStatus.COMPLETED
+    assert worker.calls == [
+        devices[0].key,
+        devices[1].key,
+        devices[2].key,
+        devices[1].key,
+    ]
+    assert summary.device_results[devices[1].key].attempts == 2
+
+
+def test_authentication_failure_is_not_retried():
+    devices = [DeviceTarget(host=f"10.45.1.{i}", port=22) for i in range(1, 3)]
+    worker = StubWorker(plan={devices[1].key: ["auth", "success"]})
+    engine = ExecutionEngine(worker=worker)
+
+    summary = engine.run_job(
+        job_id="job-auth",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(non_canary_retry_limit=3),
+    )
+
+    assert summary.status == JobStatus.FAILED
+    assert worker.calls.count(devices[1].key) == 1
+    assert summary.device_results[devices[1].key].error_code == (
+        "authentication_failed"
+    )
+
+
+def test_rejected_command_is_not_reapplied():
+    devices = [DeviceTarget(host=f"10.45.2.{i}", port=22) for i in range(1, 3)]
+    worker = StubWorker(plan={devices[1].key: ["rejected", "success"]})
+    engine = ExecutionEngine(worker=worker)
+
+    summary = engine.run_job(
+        job_id="job-rejected",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(non_canary_retry_limit=3),
+    )
+
+    assert summary.status == JobStatus.FAILED
+    assert worker.calls.count(devices[1].key) == 1
+    assert summary.device_results[devices[1].key].error_code == "command_error"
+
+
+def test_stop_on_error_records_devices_waiting_to_retry():
+    devices = [DeviceTarget(host=f"10.45.2.{i}", port=22) for i in range(1, 4)]
+    worker = StubWorker(
+        plan={devices[1].key: ["timeout", "success"], devices[2].key: ["auth"]}
+    )
+    engine = ExecutionEngine(worker=worker)
+
+    summary = engine.run_job(
+        job_id="job-halt-retry",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(
+            concurrency_limit=1,
+            non_canary_retry_limit=1,
+            retry_backoff_seconds=30.0,
+            schedule_order="fifo",
+        ),
+    )
+
+    assert summary.status == JobStatus.FAILED
+    assert summary.device_results[devices[1].key].error_code == "connection_timeout"
+    assert worker.calls.count(devices[1].key) == 1
+
+
+class StartTimeWorker:
+    """Worker that records when each device session started."""
+
+    def __init__(self):
+        self.started: dict[str, float] = {}
+
+    def run(self, device, commands, verify_commands=None):
+        del commands, verify_commands
+        self.started[device.key] = time.monotonic()
+        time.sleep(0.05)
+        return DeviceExecutionResult(status="success")
+
+
+def test_connection_limiter_spaces_session_opens_without_blocking_completion():
+    devices = [DeviceTarget(host=f"10.46.0.{i}", port=22) for i in range(1, 6)]
+    worker = StartTimeWorker()
+    engine = ExecutionEngine(
+        worker=worker,
+        connection_limiter=TokenBucket(rate_per_second=20.0, burst=2),
+    )
+
+    summary = engine.run_job(
+        job_id="job-rate",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(concurrency_limit=10, schedule_order="fifo"),
+    )
+
+    assert summary.status == JobStatus.COMPLETED
+    starts = sorted(worker.started.values())
+    # Burst of two (canary + first device), then one open per 50ms.
+    assert starts[-1] - starts[0] >= 0.14
+
+
+def test_stagger_delay_does_not_delay_cancellation():
+    devices = [DeviceTarget(host=f"10.46.1.{i}", port=22) for i in range(1, 6)]
+    worker = StartTimeWorker()
+    control = ExecutionControl()
+    engine = ExecutionEngine(worker=worker)
+    timer = threading.Timer(0.3, control.cancel_event.set)
+    timer.start()
+
+    started = time.monotonic()
+    summary = engine.run_job(
+        job_id="job-stagger-cancel",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(concurrency_limit=5, stagger_delay=30.0),
+        control=control,
+    )
+    timer.cancel()
+
+    assert summary.status == JobStatus.CANCELLED
+    assert time.monotonic() - started < 2.0
+    assert len(worker.started) == 2
+
+
+def _control_latency_events(event_store: InMemoryEventStore, job_id: str):
+    return [e for e in event_store.list_events(job_id) if e.type == "control_latency"]
+
+
+def test_pause_holds_new_devices_and_resume_wakes_scheduler_immediately():
+    devices = [DeviceTarget(host=f"10.47.0.{i}", port=22) for i in range(1, 5)]
+    worker = StartTimeWorker()
+    control = ExecutionControl()
+    event_store = InMemoryEventStore()
+    engine = ExecutionEngine(worker=worker, publisher=event_store)
+    results: dict[str, object] = {}
+
+    control.pause_event.set()
+    runner = threading.Thread(
+        target=lambda: results.update(
+            summary=engine.run_job(
+                job_id="job-pause",
+                devices=devices,
+                canary=devices[0],
+                commands_by_device={d.key: ["conf t"] for d in devices},
+                verify_commands_by_device={},
+                config=ExecutionConfig(concurrency_limit=4),
+                control=control,
+            )
+        )
+    )
+    runner.start()
+    time.sleep(0.3)
+    assert set(worker.started) == {devices[0].key}
+
+    resumed_at = time.monotonic()
+    control.pause_event.clear()
+    runner.join(timeout=5)
+
+    assert results["summary"].status == JobStatus.COMPLETED
+    assert min(worker.started[d.key] for d in devices[1:]) - resumed_at < 0.1
+    events = _control_latency_events(event_store, "job-pause")
+    assert [e.status for e in events] == ["resume"]
+    assert events[0].message.startswith("resume observed after")
+
+
+def test_cancel_while_paused_reports_latency():
+    devices = [DeviceTarget(host=f"10.47.1.{i}", port=22) for i in range(1, 4)]
+    control = ExecutionControl()
+    event_store = InMemoryEventStore()
+    engine = ExecutionEngine(worker=StartTimeWorker(), publisher=event_store)
+    control.pause_event.set()
+    timer = threading.Timer(0.2, control.cancel_event.set)
+    timer.start()
+
+    started = time.monotonic()
+    summary = engine.run_job(
+        job_id="job-pause-cancel",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(concurrency_limit=2),
+        control=control,
+    )
+    timer.join()
+
+    assert summary.status == JobStatus.CANCELLED
+    assert time.monotonic() - started < 1.0
+    events = _control_latency_events(event_store, "job-pause-cancel")
+    assert [e.status for e in events] == ["cancel"]
+
+
+def _budget_run(plan, budget, devices, waves=()):
+    worker = StubWorker(plan=plan)
+    event_store = InMemoryEventStore()
+    engine = ExecutionEngine(worker=worker, publisher=event_store)
+    summary = engine.run_job(
+        job_id="job-budget",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(
+            concurrency_limit=1,
+            non_canary_retry_limit=0,
+            failure_budget=budget,
+            waves=waves,
+            schedule_order="fifo",
+        ),
+    )
+    return summary, worker, event_store
+
+
+def test_failure_budget_tolerates_failures_up_to_count():
+    devices = [DeviceTarget(host=f"10.48.0.{i}", port=22) for i in range(1, 7)]
+    plan = {devices[1].key: ["failed"], devices[3].key: ["failed"]}
+
+    summary, worker, _ = _budget_run(plan, FailureBudget(max_failures=2), devices)
+
+    assert len(worker.calls) == 6
+    assert summary.status == JobStatus.FAILED
+    assert summary.status_counts == {"success": 4, "failed": 2}
+    assert summary.failure_count == 2
+
+
+def test_failure_budget_stops_scheduling_once_exceeded():
+    devices = [DeviceTarget(host=f"10.48.1.{i}", port=22) for i in range(1, 7)]
+    plan = {devices[1].key: ["failed"], devices[2].key: ["failed"]}
+
+    summary, worker, event_store = _budget_run(
+        plan, FailureBudget(max_failure_percent=20), devices
+    )
+
+    assert worker.calls == [d.key for d in devices[:3]]
+    assert summary.status == JobStatus.FAILED
+    budget_events = [
+        e for e in event_store.list_events("job-budget") if e.type == "failure_budget"
+    ]
+    assert len(budget_events) == 1
+    assert "run budget of 1" in budget_events[0].message
+
+
+def test_per_wave_failure_budget_resets_each_wave():
+    devices = [DeviceTarget(host=f"10.48.2.{i}", port=22) for i in range(1, 10)]
+    plan = {devices[1].key: ["failed"], devices[5].key: ["failed"]}
+
+    summary, worker, _ = _budget_run(
+        plan,
+        FailureBudget(max_failures=1, per_wave=True),
+        devices,
+        waves=(50, 100),
+    )
+
+    assert len(worker.calls) == 9
+    assert [w.status for w in summary.waves] == ["completed", "failed", "failed"]
+    assert summary.status_counts == {"success": 7, "failed": 2}
+
+
+def test_shared_pool_reuses_threads_across_runs():
+    pool = SessionWorkerPool(max_sessions=2)
+    thread_names: set[str] = set()
+
+    class ThreadRecordingWorker:
+        def run(self, device, commands, verify_commands=None):
+            del device, commands, verify_commands
+            thread_names.add(threading.current_thread().name)
+            return DeviceExecutionResult(status="success")
+
+    engine = ExecutionEngine(worker=ThreadRecordingWorker(), pool=pool)
+    devices = [DeviceTarget(host=f"10.48.0.{i}", port=22) for i in range(1, 6)]
+    for run in range(2):
+        summary = engine.run_job(
+            job_id=f"job-pool-{run}",
+            devices=devices,
+            canary=devices[0],
+            commands_by_device={d.key: ["conf t"] for d in devices},
+            verify_commands_by_device={},
+            config=ExecutionConfig(concurrency_limit=4),
+        )
+        assert summary.status == JobStatus.COMPLETED
+
+    assert thread_names and all(n.startswith("nw-edit-session") for n in thread_names)
+    assert len(thread_names) <= 2
+    assert pool.stats().completed == 10
+    pool.shutdown()
+
+
+def test_summary_store_exposes_partial_results_while_running():
+    release = threading.Event()
+    saved = []
+
+    class Store:
+        def save(self, summary):
+            saved.append(summary)
+
+    class HoldLastWorker:
+        def run(self, device, commands, verify_commands=None):
+            del commands, verify_commands
+            if device.host.endswith(".3"):
+                release.wait(timeout=2.0)
+            return DeviceExecutionResult(status="success")
+
+    engine = ExecutionEngine(worker=HoldLastWorker(), summary_store=Store())
+    devices = [DeviceTarget(host=f"10.49.0.{i}", port=22) for i in range(1, 4)]
+    runner = threading.Thread(
+        target=engine.run_job,
+        kwargs=dict(
+            job_id="job-partial",
+            devices=devices,
+            canary=devices[0],
+            commands_by_device={d.key: ["conf t"] for d in devices},
+            verify_commands_by_device={},
+            config=ExecutionConfig(concurrency_limit=2),
+        ),
+    )
+    runner.start()
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline and (
+        not saved or len(saved[0].device_results) < 2
+    ):
+        time.sleep(0.01)
+
+    partial = saved[0].snapshot()
+    progress = partial.progress()
+    assert partial.status == JobStatus.RUNNING
+    assert (progress.total, progress.finished, progress.in_progress) == (3, 2, 1)
+    assert progress.pending == 0
+
+    release.set()
+    runner.join(timeout=2.0)
+    assert saved[0].status == JobStatus.COMPLETED
+    assert saved[0].progress().percent_complete == 100.0
+    assert partial.status == JobStatus.RUNNING
+
+
+def test_summary_reports_stage_percentiles_per_device_type():
+    class TimedWorker:
+        def run(self, device, commands, verify_commands=None):
+            del commands, verify_commands
+            index = int(device.host.rsplit(".", 1)[1])
+            return DeviceExecutionResult(
+                status="success",
+                stage_timings={"connect": float(index), "apply": 0.5},
+            )
+
+    devices = [DeviceTarget(host=f"10.50.0.{i}", port=22) for i in range(1, 5)]
+    attributes = {
+        d.key: {"device_type": "cisco_ios" if i < 3 else "arista_eos"}
+        for i, d in enumerate(devices)
+    }
+    summary = ExecutionEngine(worker=TimedWorker()).run_job(
+        job_id="job-stages",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(concurrency_limit=4),
+        device_attributes=attributes,
+    )
+
+    overall = summary.stage_percentiles()
+    assert overall["connect"].count == 4
+    assert (overall["connect"].p50, overall["connect"].p99) == (2.0, 4.0)
+    assert overall["total"].count == 4
+    by_type = summary.stage_percentiles_by_device_type()
+    assert by_type["cisco_ios"]["connect"].p95 == 3.0
+    assert by_type["arista_eos"]["connect"].p50 == 4.0
+
+
+def test_summary_reports_warm_session_hit_rate():
+    sources = {"10.51.0.1": "warm", "10.51.0.2": "warm", "10.51.0.3": "new"}
+
+    class PooledWorker:
+        def run(self, device, commands, verify_commands=None):
+            del commands, verify_commands
+            return DeviceExecutionResult(
+                status="success", session_source=sources.get(device.host)
+            )
+
+    devices = [DeviceTarget(host=f"10.51.0.{i}", port=22) for i in range(1, 5)]
+    summary = ExecutionEngine(worker=PooledWorker()).run_job(
+        job_id="job-warm",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={d.key: ["conf t"] for d in devices},
+        verify_commands_by_device={},
+        config=ExecutionConfig(concurrency_limit=4),
+    )
+
+    assert summary.session_sources() == {"warm": 2, "new": 1}
+    assert summary.warm_session_hit_rate() == 2 / 3
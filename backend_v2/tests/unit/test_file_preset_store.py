@@ -79,3 +79,28 @@ def test_store_rejects_duplicate_name_per_os_model(tmp_path: Path):
             commands=["show clock"],
             verify_commands=[],
         )
+
+
+def test_store_keeps_diff_ignore_patterns_and_reads_legacy_items(tmp_path: Path):
+    path = tmp_path / "presets.json"
+    path.write_text(
+        '[{"preset_id": "old", "name": "legacy", "os_model": "cisco_ios",'
+        ' "commands": ["show version"], "verify_commands": []}]\n',
+        encoding="utf-8",
+    )
+    store = FilePresetStore(str(path))
+    created = store.create(
+        name="masked",
+        os_model="cisco_ios",
+        commands=["show version"],
+        verify_commands=[],
+        diff_ignore_patterns=["^ntp clock-period .*$"],
+    )
+
+    reloaded = FilePresetStore(str(path))
+    legacy = reloaded.get("old")
+    masked = reloaded.get(created.preset_id)
+    assert legacy is not None and legacy.diff_ignore_patterns == []
+    assert masked is not None
+    assert masked.diff_ignore_patterns == ["^ntp clock-period .*$"]
+    assert reloaded.get("missing") is None
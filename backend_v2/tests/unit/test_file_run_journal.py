@@ -0,0 +1,132 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the JSONL run journal."""
+
+from backend_v2.app.api.run_execution import resume_request
+from backend_v2.app.domain.models import DeviceExecutionResult, JobRecord, JobStatus
+from backend_v2.app.infrastructure.file_run_journal import FileRunJournal
+
+
+def make_job(job_id: str = "job-1") -> JobRecord:
+    return JobRecord(
+        job_id=job_id,
+        job_name="rollout",
+        creator="ops",
+        status=JobStatus.RUNNING,
+        created_at="2026-01-01T00:00:00+00:00",
+        global_vars={"ntp": "10.0.0.1"},
+    )
+
+
+REQUEST = {
+    "imported_device_keys": ["r1:22", "r2:22", "r3:22"],
+    "canary": {"host": "r1", "port": 22},
+    "commands": ["ntp server {{ ntp }}"],
+}
+
+
+def test_unfinished_run_is_interrupted_and_tracks_device_outcomes(tmp_path):
+    journal = FileRunJournal(str(tmp_path))
+    journal.start_run(make_job(), REQUEST)
+    journal.record_device("job-1", "r1:22", DeviceExecutionResult(status="success"))
+    journal.record_device("job-1", "r2:22", DeviceExecutionResult(status="cancelled"))
+
+    [run] = journal.interrupted()
+
+    assert run.job_name == "rollout"
+    assert run.created_at == "2026-01-01T00:00:00+00:00"
+    assert run.global_vars == {"ntp": "10.0.0.1"}
+    assert run.finished_devices == ["r1:22"]
+    assert run.remaining_devices() == ["r2:22", "r3:22"]
+
+
+def test_finished_run_is_not_interrupted_and_torn_line_is_ignored(tmp_path):
+    journal = FileRunJournal(str(tmp_path))
+    journal.start_run(make_job(), REQUEST)
+    journal.finish_run("job-1", "completed")
+    with (tmp_path / "job-1.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"type": "device_res')
+
+    run = journal.load("job-1")
+
+    assert run is not None and run.status == "completed"
+    assert journal.interrupted() == []
+    assert journal.load("missing") is None
+
+
+def test_outcomes_accumulate_across_resumed_segments(tmp_path):
+    journal = FileRunJournal(str(tmp_path))
+    journal.start_run(make_job(), REQUEST)
+    journal.record_device("job-1", "r1:22", DeviceExecutionResult(status="success"))
+    journal.start_run(make_job(), REQUEST)
+    journal.record_device("job-1", "r2:22", DeviceExecutionResult(status="failed"))
+
+    run = journal.load("job-1")
+
+    assert run is not None
+    assert run.remaining_devices() == ["r3:22"]
+    assert journal.clear() == 1
+
+
+def test_resume_request_moves_canary_off_finished_device(tmp_path):
+    journal = FileRunJournal(str(tmp_path))
+    journal.start_run(make_job(), REQUEST)
+    journal.record_device("job-1", "r1:22", DeviceExecutionResult(status="success"))
+    run = journal.load("job-1")
+    assert run is not None
+
+    request = resume_request(run)
+
+    assert request is not None
+    assert request["imported_device_keys"] == ["r2:22", "r3:22"]
+    assert request["canary"] == {"host": "r2", "port": 22}
+    assert request["commands"] == REQUEST["commands"]
+    for key in ("r2:22", "r3:22"):
+        journal.record_device("job-1", key, DeviceExecutionResult(status="success"))
+    finished = journal.load("job-1")
+    assert finished is not None and resume_request(finished) is None
+
+
+def test_write_errors_are_logged_and_never_raised(tmp_path, caplog):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    journal = FileRunJournal(str(blocker))
+
+    journal.start_run(make_job(), REQUEST)
+    journal.record_device("job-1", "r1:22", DeviceExecutionResult(status="success"))
+    journal.finish_run("job-1", "completed")
+
+    assert "Run journal write failed for job job-1" in caplog.text
+    journal.directory = tmp_path / "journal"
+    journal.start_run(make_job(), REQUEST)
+    run = journal.load("job-1")
+    assert run is not None and run.job_name == "rollout"
+
+
+def test_device_results_are_batched_off_the_caller_thread(tmp_path):
+    journal = FileRunJournal(str(tmp_path))
+    journal.start_run(make_job(), REQUEST)
+    for index in range(200):
+        journal.record_device(
+            "job-1", f"d{index}:22", DeviceExecutionResult(status="success")
+        )
+
+    run = journal.load("job-1")
+
+    assert run is not None
+    assert len(run.device_status) == 200
@@ -0,0 +1,58 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the rotating JSONL span exporter."""
+
+import json
+
+from backend_v2.app.application.tracing import Span
+from backend_v2.app.infrastructure.file_span_exporter import RotatingFileSpanExporter
+
+
+def test_exporter_writes_json_lines(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    exporter = RotatingFileSpanExporter(path=str(path), max_bytes=10_000)
+
+    exporter.export(Span("job-1", "s1", None, "run", 1.0, 0.5, {"mode": "sync"}))
+    exporter.close()
+
+    [line] = path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(line) == {
+        "trace_id": "job-1",
+        "span_id": "s1",
+        "parent_id": None,
+        "name": "run",
+        "start_time": 1.0,
+        "duration_seconds": 0.5,
+        "attributes": {"mode": "sync"},
+        "error": None,
+    }
+
+
+def test_exporter_rotates_and_drops_oldest_backup(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    exporter = RotatingFileSpanExporter(path=str(path), max_bytes=200, backup_count=2)
+
+    for index in range(8):
+        exporter.export(Span("job-1", f"s{index}", None, "op", float(index)))
+    exporter.close()
+
+    names = sorted(item.name for item in tmp_path.iterdir())
+    assert names == ["spans.jsonl", "spans.jsonl.1", "spans.jsonl.2"]
+    current = [json.loads(line)["span_id"] for line in path.read_text().splitlines()]
+    assert current[-1] == "s7"
+    assert all(item.stat().st_size <= 200 for item in tmp_path.iterdir())
@@ -0,0 +1,152 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the Prometheus metrics registry."""
+
+from backend_v2.app.application.execution_engine import ExecutionConfig, ExecutionEngine
+from backend_v2.app.application.metrics import BackendMetrics
+from backend_v2.app.domain.models import DeviceExecutionResult, DeviceTarget
+
+
+def sample_lines(text: str, name: str) -> dict[str, str]:
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith(name) and not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            samples[key] = value
+    return samples
+
+
+def test_device_results_count_by_status_and_error_code_and_fill_histograms():
+    metrics = BackendMetrics()
+    metrics.device_result(
+        DeviceExecutionResult(
+            status="success",
+            duration_seconds=1.5,
+            stage_timings={"connect": 0.2, "apply": 0.7, "diff": 0.01},
+        )
+    )
+    metrics.device_result(
+        DeviceExecutionResult(
+            status="failed", error_code="connection_timeout", duration_seconds=30.0
+        )
+    )
+    metrics.device_result(DeviceExecutionResult(status="cancelled"))
+    metrics.device_result(
+        DeviceExecutionResult(status="success", session_source="warm")
+    )
+
+    text = metrics.render()
+    results = sample_lines(text, "nw_edit_device_results_total")
+    assert (
+        results['nw_edit_device_results_total{status="success",error_code=""}'] == "2"
+    )
+    assert 'nw_edit_device_sessions_total{source="warm"} 1' in text
+    assert (
+        results[
+            'nw_edit_device_results_total{status="failed",error_code="connection_timeout"}'
+        ]
+        == "1"
+    )
+    assert (
+        results['nw_edit_device_results_total{status="cancelled",error_code=""}'] == "1"
+    )
+    stages = sample_lines(text, "nw_edit_device_stage_seconds")
+    assert (
+        stages['nw_edit_device_stage_seconds_bucket{stage="connect",le="0.25"}'] == "1"
+    )
+    assert stages['nw_edit_device_stage_seconds_bucket{stage="apply",le="0.5"}'] == "0"
+    assert stages['nw_edit_device_stage_seconds_bucket{stage="apply",le="+Inf"}'] == "1"
+    assert stages['nw_edit_device_stage_seconds_sum{stage="apply"}'] == "0.7"
+    assert not any('stage="diff"' in key for key in stages)
+    attempts = sample_lines(text, "nw_edit_device_attempt_seconds")
+    assert attempts["nw_edit_device_attempt_seconds_count"] == "3"
+    assert "# TYPE nw_edit_device_stage_seconds histogram" in text
+
+
+def test_gauges_track_in_flight_window_and_clear_when_job_finishes():
+    metrics = BackendMetrics()
+    metrics.attempt_started("job-1")
+    metrics.attempt_started("job-1")
+    metrics.attempt_started("job-2")
+    metrics.attempt_finished("job-2")
+    metrics.window_changed("job-1", 8)
+    metrics.websocket_connected()
+
+    text = metrics.render([("job-1", 12)])
+    in_flight = [
+        line
+        for line in text.splitlines()
+        if line.startswith("nw_edit_devices_in_flight")
+    ]
+    assert in_flight == ['nw_edit_devices_in_flight{job_id="job-1"} 2']
+    assert 'job_id="job-2"' not in text
+    assert 'nw_edit_concurrency_window{job_id="job-1"} 8' in text
+    assert "nw_edit_websocket_clients 1" in text
+    assert 'nw_edit_event_store_events{job_id="job-1"} 12' in text
+
+    metrics.job_finished("job-1", "completed")
+    metrics.websocket_disconnected()
+    metrics.websocket_disconnected()
+    text = metrics.render()
+    assert "nw_edit_devices_in_flight{" not in text
+    assert "nw_edit_concurrency_window{" not in text
+    assert "nw_edit_websocket_clients 0" in text
+    assert 'nw_edit_jobs_total{status="completed"} 1' in text
+
+
+def test_import_validations_and_label_escaping():
+    metrics = BackendMetrics()
+    metrics.import_validated(True, 0.3)
+    metrics.import_validated(False, 2.0)
+    metrics.window_changed('job"\\\n', 1)
+
+    text = metrics.render()
+    assert 'nw_edit_import_validations_total{result="ok"} 1' in text
+    assert 'nw_edit_import_validations_total{result="failed"} 1' in text
+    assert "nw_edit_import_validation_seconds_count 2" in text
+    assert 'nw_edit_concurrency_window{job_id="job\\"\\\\\\n"} 1' in text
+
+
+class SimpleWorker:
+    def run(self, device, commands, verify_commands=None):
+        return DeviceExecutionResult(
+            status="success", stage_timings={"connect": 0.01, "apply": 0.02}
+        )
+
+
+def test_engine_feeds_metrics_for_a_run():
+    metrics = BackendMetrics()
+    engine = ExecutionEngine(worker=SimpleWorker(), metrics=metrics)
+    devices = [DeviceTarget(host=f"10.0.0.{i}", port=22) for i in range(1, 4)]
+
+    summary = engine.run_job(
+        job_id="job-m",
+        devices=devices,
+        canary=devices[0],
+        commands_by_device={device.key: ["conf t"] for device in devices},
+        verify_commands_by_device=None,
+        config=ExecutionConfig(concurrency_limit=2),
+    )
+
+    assert summary.status.value == "completed"
+    text = metrics.render()
+    assert 'nw_edit_jobs_total{status="completed"} 1' in text
+    assert 'nw_edit_device_results_total{status="success",error_code=""} 3' in text
+    assert 'nw_edit_device_stage_seconds_count{stage="connect"} 3' in text
+    assert "nw_edit_devices_in_flight{" not in text
+    assert "nw_edit_concurrency_window{" not in text
@@ -26,7 +26,10 @@ from backend_v2.app.infrastructure.device_connection_validators import (
     NetmikoConnectionValidator,
     SimulatedConnectionValidator,
 )
+from backend_v2.app.infrastructure.bastion_pool import BastionTransportPool
 from backend_v2.app.infrastructure.netmiko_device_worker import NetmikoDeviceWorker
+from backend_v2.app.infrastructure.netmiko_session_pool import NetmikoSessionPool
+from backend_v2.app.infrastructure.volatile_lines import volatile_line_rules
 
 
 def _profile() -> DeviceProfile:
@@ -50,8 +53,13 @@ def test_simulated_connection_validator_always_succeeds():
 def test_netmiko_connection_validator_delegates_with_expected_params(monkeypatch):
     captured: dict[str, object] = {}
 
-    def fake_validate_device_connection(device_params):
+    def fake_validate_device_connection(device_params, **kwargs):
         captured.update(device_params)
+        assert kwargs == {
+            "session_pool": None,
+            "warm_ttl_seconds": None,
+            "bastions": None,
+        }
         return True, None
 
     monkeypatch.setattr(
@@ -72,6 +80,28 @@ def test_netmiko_connection_validator_delegates_with_expected_params(monkeypatch
     }
 
 
+def test_netmiko_connection_validator_keeps_sessions_warm_when_enabled(monkeypatch):
+    captured: dict[str, object] = {}
+
+    def fake_validate_device_connection(device_params, **kwargs):
+        captured.update(kwargs)
+        return True, None
+
+    monkeypatch.setattr(
+        netmiko_executor, "validate_device_connection", fake_validate_device_connection
+    )
+    pool = NetmikoSessionPool()
+    validator = NetmikoConnectionValidator(warm_sessions=pool, warm_ttl_seconds=300)
+
+    validator.validate(_profile())
+
+    assert captured == {
+        "session_pool": pool,
+        "warm_ttl_seconds": 300,
+        "bastions": None,
+    }
+
+
 def test_netmiko_worker_returns_failed_when_profile_not_found():
     worker = NetmikoDeviceWorker(profile_resolver=lambda key: None)
     result = worker.run(DeviceTarget(host="10.9.9.9", port=22), ["show version"])
@@ -96,6 +126,8 @@ def test_netmiko_worker_maps_executor_payload(monkeypatch):
             "diff_truncated": True,
             "diff_original_size": 12345,
             "log_trimmed": True,
+            "stage_timings": {"connect": 1.5, "apply": 0.25},
+            "session_source": "warm",
         }
 
     monkeypatch.setattr(
@@ -117,6 +149,8 @@ def test_netmiko_worker_maps_executor_payload(monkeypatch):
     assert result.diff_truncated is True
     assert result.diff_original_size == 12345
     assert result.log_trimmed is True
+    assert result.stage_timings == {"connect": 1.5, "apply": 0.25}
+    assert result.session_source == "warm"
     assert captured["device_params"] == {
         "host": "10.0.0.1",
         "port": 2222,
@@ -129,3 +163,40 @@ def test_netmiko_worker_maps_executor_payload(monkeypatch):
     assert captured["verify_cmds"] == ["show running-config | section snmp"]
     assert captured["is_canary"] is True
     assert captured["retry_on_connection_error"] is False
+    assert captured["pipelined_verify"] is False
+    assert captured["fast_apply_chunk_lines"] == 0
+    assert captured["volatile_rules"] == ()
+    assert captured["mask_volatile_lines"] is True
+
+    with volatile_line_rules(["^Building configuration"]):
+        worker.run(DeviceTarget(host=profile.host, port=profile.port), ["end"])
+    assert captured["volatile_rules"] == ("^Building configuration",)
+
+
+def test_netmiko_worker_passes_jump_host_and_bastion_pool(monkeypatch):
+    captured: dict[str, object] = {}
+
+    def fake_execute_device_commands(**kwargs):
+        captured.update(kwargs)
+        return {"status": "success"}
+
+    monkeypatch.setattr(
+        netmiko_executor, "execute_device_commands", fake_execute_device_commands
+    )
+    profile = _profile()
+    profile.jump_host = "bastion"
+    profile.jump_username = "jump"
+    bastions = BastionTransportPool()
+    worker = NetmikoDeviceWorker(
+        profile_resolver=lambda key: profile, bastions=bastions
+    )
+
+    worker.run(DeviceTarget(host=profile.host, port=profile.port), ["show version"])
+
+    device_params = captured["device_params"]
+    assert isinstance(device_params, dict)
+    assert device_params["jump_host"] == "bastion"
+    assert device_params["jump_port"] == 22
+    assert device_params["jump_username"] == "jump"
+    assert device_params["jump_password"] is None
+    assert captured["bastions"] is bastions
@@ -21,7 +21,12 @@ from __future__ import annotations
 
 import threading
 
+from netmiko.base_connection import BaseConnection
+
 import backend_v2.app.infrastructure.netmiko_executor as executor
+from backend_v2.app.application.events import device_progress
+from backend_v2.app.application.tracing import Tracer
+from backend_v2.app.infrastructure.netmiko_session_pool import NetmikoSessionPool
 
 
 class _FakeConnection:
@@ -48,6 +53,9 @@ class _FakeConnection:
     def disconnect(self) -> None:
         self.disconnected = True
 
+    def is_alive(self) -> bool:
+        return not self.disconnected
+
 
 def _device_params() -> dict[str, object]:
     return {
@@ -110,6 +118,189 @@ def test_execute_device_commands_success_with_diff(monkeypatch):
     assert result["diff_truncated"] is False
     assert result["diff_original_size"] >= 0
     assert fake.disconnected is True
+    assert list(result["stage_timings"]) == [
+        "connect",
+        "pre_verify",
+        "apply",
+        "post_verify",
+        "diff",
+        "disconnect",
+    ]
+    assert all(seconds >= 0 for seconds in result["stage_timings"].values())
+
+
+class _ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+def test_execute_device_commands_records_stage_spans_in_active_trace(monkeypatch):
+    fake = _FakeConnection(pre_output="a", post_output="b")
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: fake)
+    exporter = _ListExporter()
+
+    with Tracer([exporter]).trace("job-1", "run"):
+        executor.execute_device_commands(
+            device_params=_device_params(),
+            commands=["snmp-server contact Ops Team"],
+            verify_cmds=["show running-config | section snmp"],
+            is_canary=True,
+        )
+
+    root = exporter.spans[-1]
+    stages = [span for span in exporter.spans if span.parent_id == root.span_id]
+    assert [span.name for span in stages] == [
+        "netmiko.connect",
+        "netmiko.pre_verify",
+        "netmiko.apply",
+        "netmiko.post_verify",
+        "netmiko.diff",
+        "netmiko.disconnect",
+    ]
+    assert all(span.trace_id == "job-1" for span in stages)
+
+
+def test_pooled_session_is_reused_by_status_and_execution(monkeypatch):
+    opened = []
+
+    def connect(**kwargs):
+        opened.append(kwargs)
+        return _FakeConnection()
+
+    monkeypatch.setattr(executor, "ConnectHandler", connect)
+    pool = NetmikoSessionPool(keepalive_seconds=15)
+
+    assert executor.validate_device_connection(_device_params(), pool) == (True, None)
+    executor.run_status_commands(_device_params(), "show version", pool)
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=["snmp-server contact Ops Team"],
+        verify_cmds=["show running-config | section snmp"],
+        is_canary=True,
+        session_pool=pool,
+    )
+
+    assert result["status"] == "success"
+    assert result["session_source"] == "pooled"
+    assert "Reusing pooled session" in result["logs"]
+    assert result["logs"][-1] == "Session returned to pool"
+    assert len(opened) == 1
+    assert opened[0]["keepalive"] == 15
+    assert pool.stats().reused == 2
+    assert pool.stats().idle == 1
+
+
+def test_validated_session_is_kept_warm_for_the_next_run(monkeypatch):
+    opened = []
+
+    def connect(**kwargs):
+        opened.append(kwargs)
+        return _FakeConnection()
+
+    monkeypatch.setattr(executor, "ConnectHandler", connect)
+    pool = NetmikoSessionPool(idle_ttl_seconds=0.0)
+
+    ok, _ = executor.validate_device_connection(
+        _device_params(), pool, warm_ttl_seconds=600
+    )
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=["snmp-server contact Ops Team"],
+        verify_cmds=[],
+        is_canary=True,
+        session_pool=pool,
+    )
+
+    assert ok is True
+    assert result["session_source"] == "warm"
+    assert len(opened) == 1
+    assert pool.stats().warm_reused == 1
+    assert pool.stats().warm_idle == 0
+
+
+def test_failed_execution_does_not_return_session_to_pool(monkeypatch):
+    fake = _FakeConnection()
+
+    def send_config_set_error(commands: list[str], read_timeout: int) -> str:
+        del commands, read_timeout
+        return "% Invalid input detected at '^' marker."
+
+    fake.send_config_set = send_config_set_error  # type: ignore[method-assign]
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: fake)
+    pool = NetmikoSessionPool()
+
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=["bad"],
+        verify_cmds=[],
+        is_canary=True,
+        session_pool=pool,
+    )
+
+    assert result["status"] == "failed"
+    assert fake.disconnected is True
+    assert pool.stats().idle == 0
+    assert pool.stats().checked_out == 0
+
+
+def test_execute_device_commands_masks_volatile_lines_before_diff(monkeypatch):
+    pre = (
+        "! Last configuration change at 10:01:02 UTC Mon Mar 2 2026\n"
+        "ntp clock-period 17179860\n"
+        "snmp-server location HQ\n"
+    )
+    post = (
+        "! Last configuration change at 10:05:44 UTC Mon Mar 2 2026\n"
+        "ntp clock-period 17179871\n"
+        "snmp-server location DC\n"
+    )
+
+    def run(**kwargs: object) -> dict[str, object]:
+        fake = _FakeConnection(pre_output=pre, post_output=post)
+        monkeypatch.setattr(executor, "ConnectHandler", lambda **_: fake)
+        return executor.execute_device_commands(
+            device_params=_device_params(),
+            commands=["snmp-server location DC"],
+            verify_cmds=["show running-config"],
+            **kwargs,
+        )
+
+    masked = run(volatile_rules=[r"(?<=^ntp clock-period )\d+$"])
+    changed = [
+        line
+        for line in str(masked["diff"]).splitlines()
+        if line[:1] in "+-" and not line.startswith(("+++", "---"))
+    ]
+    assert changed == ["-snmp-server location HQ", "+snmp-server location DC"]
+    assert masked["pre_output"] == pre
+    assert masked["post_output"] == post
+    assert "Masked 4 volatile values before diff" in masked["logs"]
+
+    unmasked = run(mask_volatile_lines=False)
+    assert "Last configuration change at 10:05:44" in str(unmasked["diff"])
+    assert "+ntp clock-period 17179871" in str(unmasked["diff"])
+
+
+def test_execute_device_commands_diffs_raw_output_when_masking_fails(monkeypatch):
+    fake = _FakeConnection(pre_output="serial A1\n", post_output="serial B2\n")
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: fake)
+
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=["snmp-server location DC"],
+        verify_cmds=["show inventory"],
+        volatile_rules=["(?i)serial .*$"],
+    )
+
+    assert result["status"] == "success"
+    assert "+serial B2" in str(result["diff"])
+    assert any(
+        line.startswith("Volatile line masking failed, diffing raw output:")
+        for line in result["logs"]
+    )
 
 
 def test_execute_device_commands_detects_command_error(monkeypatch):
@@ -132,6 +323,7 @@ def test_execute_device_commands_detects_command_error(monkeypatch):
     assert result["status"] == "failed"
     assert result["error_code"] == "command_error"
     assert "Command error detected" in str(result["error"])
+    assert set(result["stage_timings"]) == {"connect", "apply"}
 
 
 def test_execute_device_commands_detects_fortios_unknown_action(monkeypatch):
@@ -147,7 +339,7 @@ def test_execute_device_commands_detects_fortios_unknown_action(monkeypatch):
     monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: fake)
 
     result = executor.execute_device_commands(
-        device_params=_device_params(),
+        device_params={**_device_params(), "device_type": "fortinet"},
         commands=["bad fortios command"],
         verify_cmds=[],
         is_canary=True,
@@ -165,15 +357,42 @@ def test_run_status_commands_detects_fortios_unknown_action(monkeypatch):
     monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: fake)
 
     try:
-        executor.run_status_commands(_device_params(), "bad fortios command")
+        executor.run_status_commands(
+            {**_device_params(), "device_type": "fortinet"}, "bad fortios command"
+        )
     except RuntimeError as exc:
         assert "Unknown action" in str(exc)
+        assert "output line 2: Unknown action 0" in str(exc)
     else:
         raise AssertionError("FortiOS Unknown action output should fail")
 
     assert fake.disconnected is True
 
 
+def test_execute_device_commands_uses_device_type_signatures(monkeypatch):
+    junos_output = "set system host-name r1\nsyntax error, expecting <command>.\n"
+    linux_output = "Error: nothing to do\n"
+
+    def run(device_type: str, output: str) -> dict[str, object]:
+        fake = _FakeConnection()
+        fake.send_config_set = (  # type: ignore[method-assign]
+            lambda commands, read_timeout: output
+        )
+        monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: fake)
+        return executor.execute_device_commands(
+            device_params={**_device_params(), "device_type": device_type},
+            commands=["cmd"],
+            verify_cmds=[],
+        )
+
+    junos = run("juniper_junos", junos_output)
+    assert junos["status"] == "failed"
+    assert junos["error"] == "Command error detected: syntax error"
+    assert "(output line 2: syntax error, expecting <command>.)" in str(junos["logs"])
+    assert run("linux", linux_output)["status"] == "success"
+    assert run("cisco_ios", linux_output)["status"] == "failed"
+
+
 def test_execute_device_commands_cancelled_before_connect(monkeypatch):
     cancel_event = threading.Event()
     cancel_event.set()
@@ -311,3 +530,380 @@ def test_execute_device_commands_device_timeout_before_connect(monkeypatch):
     )
     assert result["status"] == "failed"
     assert result["error_code"] == "device_timeout"
+
+
+def test_reconnect_backoff_is_interrupted_by_cancel(monkeypatch):
+    attempts = {"count": 0}
+    cancel_event = threading.Event()
+
+    def raise_timeout(**kwargs):
+        del kwargs
+        attempts["count"] += 1
+        cancel_event.set()
+        raise executor.NetmikoTimeoutException("timeout")
+
+    monkeypatch.setattr(executor, "ConnectHandler", raise_timeout)
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=["show version"],
+        verify_cmds=[],
+        is_canary=False,
+        retry_on_connection_error=True,
+        cancel_event=cancel_event,
+    )
+
+    assert attempts["count"] == 1
+    assert result["status"] == "cancelled"
+
+
+class _FakeBastions:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.opened: list[tuple[object, str, int]] = []
+        self.channels: list[_FakeTunnel] = []
+
+    def open_channel(self, jump, host, port):
+        if self.error is not None:
+            raise self.error
+        self.opened.append((jump, host, port))
+        channel = _FakeTunnel()
+        self.channels.append(channel)
+        return channel
+
+
+class _FakeTunnel:
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _jump_params() -> dict[str, object]:
+    return {**_device_params(), "jump_host": "bastion", "jump_port": 2022}
+
+
+def test_jump_host_device_connects_over_bastion_channel(monkeypatch):
+    captured: list[dict[str, object]] = []
+
+    def connect(**kwargs):
+        captured.append(kwargs)
+        return _FakeConnection()
+
+    monkeypatch.setattr(executor, "ConnectHandler", connect)
+    bastions = _FakeBastions()
+
+    result = executor.execute_device_commands(
+        device_params=_jump_params(),
+        commands=["snmp-server location Lab"],
+        verify_cmds=[],
+        bastions=bastions,  # type: ignore[arg-type]
+    )
+
+    assert result["status"] == "success"
+    assert result["logs"][0] == "Connecting to 10.0.0.1:22 via bastion:2022..."
+    jump, host, port = bastions.opened[0]
+    assert (jump.key, host, port) == ("admin@bastion:2022", "10.0.0.1", 22)
+    assert captured[0]["sock"] is bastions.channels[0]
+    assert "sock" not in _device_params()
+
+
+def test_failed_device_login_closes_bastion_channel(monkeypatch):
+    def raise_auth(**kwargs):
+        raise executor.NetmikoAuthenticationException("bad credentials")
+
+    monkeypatch.setattr(executor, "ConnectHandler", raise_auth)
+    bastions = _FakeBastions()
+
+    ok, error = executor.validate_device_connection(
+        _jump_params(), bastions=bastions  # type: ignore[arg-type]
+    )
+
+    assert ok is False
+    assert error == "Authentication failed: bad credentials"
+    assert bastions.channels[0].closed is True
+
+
+def test_bastion_errors_are_classified(monkeypatch):
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: _FakeConnection())
+
+    auth = _FakeBastions(executor.paramiko.AuthenticationException("denied"))
+    ok, error = executor.validate_device_connection(
+        _jump_params(), bastions=auth  # type: ignore[arg-type]
+    )
+    assert ok is False
+    assert error == (
+        "Authentication failed: Bastion admin@bastion:2022 authentication failed: denied"
+    )
+
+    refused = _FakeBastions(executor.paramiko.ChannelException(2, "Connect failed"))
+    result = executor.execute_device_commands(
+        device_params=_jump_params(),
+        commands=["snmp-server location Lab"],
+        verify_cmds=[],
+        is_canary=True,
+        bastions=refused,  # type: ignore[arg-type]
+    )
+    assert result["status"] == "failed"
+    assert result["error_code"] == "connection_error"
+    assert "Bastion admin@bastion:2022" in result["error"]
+
+
+class _FakeShell(_FakeConnection):
+    """Device whose channel echoes each command, prints its output and a prompt."""
+
+    RETURN = "\n"
+    RESPONSE_RETURN = "\n"
+    base_prompt = "router"
+    normalize_cmd = BaseConnection.normalize_cmd
+    strip_command = BaseConnection.strip_command
+    strip_prompt = BaseConnection.strip_prompt
+
+    def __init__(self, outputs: dict[str, str], early_echo: bool = False):
+        super().__init__()
+        self.outputs = outputs
+        self.early_echo = early_echo
+        self.writes: list[str] = []
+        self.sent: list[str] = []
+        self._pending = ""
+
+    def send_command(self, command: str, read_timeout: int) -> str:
+        del read_timeout
+        assert self._pending == "", "send_command on a channel with unread output"
+        self.sent.append(command)
+        return self.outputs.get(command, "")
+
+    def write_channel(self, data: str) -> None:
+        self.writes.append(data)
+        commands = data.splitlines()
+        if self.early_echo:
+            self._pending += "".join(f"{cmd}\n" for cmd in commands)
+        for cmd in commands:
+            echo = "" if self.early_echo else f"{cmd}\n"
+            self._pending += f"{echo}{self.outputs.get(cmd, '')}\nrouter#"
+
+    def read_channel(self) -> str:
+        chunk, self._pending = self._pending[:7], self._pending[7:]
+        return chunk
+
+
+_SHOW_OUTPUTS = {
+    "show version": "IOS 15.2\nuptime 3 days",
+    "show ip int br": "Gi0/1 192.0.2.1 up up",
+    "show run | section snmp": "snmp-server location Lab",
+}
+
+
+def test_pipelined_verification_matches_sequential_outputs(monkeypatch):
+    verify = list(_SHOW_OUTPUTS)
+    results = {}
+    shells = {}
+    for pipelined in (False, True):
+        shell = _FakeShell(_SHOW_OUTPUTS)
+        shells[pipelined] = shell
+        monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: shell)
+        results[pipelined] = executor.execute_device_commands(
+            device_params=_device_params(),
+            commands=["snmp-server location Lab"],
+            verify_cmds=verify,
+            pipelined_verify=pipelined,
+        )
+
+    sequential, pipelined_result = results[False], results[True]
+    assert pipelined_result["status"] == "success"
+    assert pipelined_result["pre_output"] == sequential["pre_output"]
+    assert pipelined_result["post_output"] == sequential["post_output"]
+    assert pipelined_result["logs"] == sequential["logs"]
+    assert shells[True].sent == []
+    assert len(shells[True].writes) == 2
+    assert shells[False].sent == verify * 2
+
+
+def test_pipelined_verification_detects_command_errors(monkeypatch):
+    outputs = {**_SHOW_OUTPUTS, "show ip int br": "% Invalid input detected"}
+    verify = list(outputs)
+    results = {}
+    for pipelined in (False, True):
+        shell = _FakeShell(outputs)
+        monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: shell)
+        results[pipelined] = executor.execute_device_commands(
+            device_params=_device_params(),
+            commands=["snmp-server location Lab"],
+            verify_cmds=verify,
+            pipelined_verify=pipelined,
+        )
+
+    assert results[True]["status"] == "failed"
+    assert results[True]["error_code"] == "command_error"
+    for key in ("error", "logs", "pre_output"):
+        assert results[True][key] == results[False][key]
+
+
+def test_pipelined_verification_falls_back_when_echo_is_interleaved(monkeypatch):
+    shell = _FakeShell(_SHOW_OUTPUTS, early_echo=True)
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: shell)
+
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=["snmp-server location Lab"],
+        verify_cmds=list(_SHOW_OUTPUTS),
+        pipelined_verify=True,
+    )
+
+    assert result["status"] == "success"
+    assert result["pre_output"] == "\n".join(_SHOW_OUTPUTS.values())
+    assert shell.sent == list(_SHOW_OUTPUTS) * 2
+    assert "Pipelined output could not be split; sending one by one" in result["logs"]
+
+
+def test_pipelined_verification_ignores_prompt_inside_output(monkeypatch):
+    outputs = {
+        "show history": "router#show clock\nrouter#show version",
+        "show version": "IOS 15.2",
+    }
+    shell = _FakeShell(outputs)
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: shell)
+
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=["snmp-server location Lab"],
+        verify_cmds=list(outputs),
+        pipelined_verify=True,
+    )
+
+    assert result["status"] == "success"
+    assert result["pre_output"] == "\n".join(outputs.values())
+    assert result["post_output"] == result["pre_output"]
+    assert shell.sent == list(outputs) * 2
+    assert "Pipelined output could not be split; sending one by one" in result["logs"]
+
+
+def test_pipelined_verification_keeps_prompt_text_mid_line(monkeypatch):
+    outputs = {
+        "show run | include router#": "banner motd ^login at router# only^",
+        "show version": "IOS 15.2",
+    }
+    shell = _FakeShell(outputs)
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: shell)
+
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=["snmp-server location Lab"],
+        verify_cmds=list(outputs),
+        pipelined_verify=True,
+    )
+
+    assert result["status"] == "success"
+    assert result["pre_output"] == "\n".join(outputs.values())
+    assert shell.sent == []
+
+
+def test_pipelined_verification_times_out_like_send_command(monkeypatch):
+    shell = _FakeShell(_SHOW_OUTPUTS)
+    shell.read_channel = lambda: ""  # type: ignore[method-assign]
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: shell)
+    monkeypatch.setattr(executor, "COMMAND_TIMEOUT", 0.01)
+
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=["snmp-server location Lab"],
+        verify_cmds=list(_SHOW_OUTPUTS),
+        pipelined_verify=True,
+    )
+
+    assert result["status"] == "failed"
+    assert result["error_code"] == "execution_error"
+    assert "0 of 3 prompts" in result["error"]
+
+
+class _FakeConfigShell(_FakeShell):
+    """Config-mode device that reports invalid lines and prompts after each."""
+
+    def __init__(self) -> None:
+        super().__init__({})
+        self.applied: list[str] = []
+
+    def config_mode(self) -> str:
+        return "configure terminal\nrouter(config)#"
+
+    def exit_config_mode(self) -> str:
+        return "end\nrouter#"
+
+    def write_channel(self, data: str) -> None:
+        self.writes.append(data)
+        for cmd in data.splitlines():
+            self.applied.append(cmd)
+            error = "% Invalid input detected\n" if "invalid" in cmd else ""
+            self._pending += f"{cmd}\n{error}router(config)#"
+
+
+def _config_lines(count: int) -> list[str]:
+    return [
+        f"ip prefix-list P seq {index} permit 10.0.{index}.0/24"
+        for index in range(1, count + 1)
+    ]
+
+
+def test_fast_apply_streams_chunks_and_reports_progress(monkeypatch):
+    shell = _FakeConfigShell()
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: shell)
+    progress: list[tuple[str, str]] = []
+
+    with device_progress(lambda status, message: progress.append((status, message))):
+        result = executor.execute_device_commands(
+            device_params=_device_params(),
+            commands=_config_lines(5),
+            verify_cmds=[],
+            fast_apply_chunk_lines=2,
+        )
+
+    assert result["status"] == "success"
+    assert len(shell.writes) == 3
+    assert shell.applied == _config_lines(5)
+    assert result["apply_output"].startswith("configure terminal\nrouter(config)#ip ")
+    assert result["apply_output"].endswith("router(config)#end\nrouter#")
+    assert "Applied lines 5-5 of 5" in result["logs"]
+    assert progress == [
+        ("apply", "Applied 2/5 config lines"),
+        ("apply", "Applied 4/5 config lines"),
+        ("apply", "Applied 5/5 config lines"),
+    ]
+
+
+def test_fast_apply_attributes_errors_to_lines_and_stops(monkeypatch):
+    shell = _FakeConfigShell()
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: shell)
+    commands = _config_lines(6)
+    commands[2] = "invalid line"
+
+    result = executor.execute_device_commands(
+        device_params=_device_params(),
+        commands=commands,
+        verify_cmds=[],
+        fast_apply_chunk_lines=2,
+    )
+
+    assert result["status"] == "failed"
+    assert result["error_code"] == "command_error"
+    assert result["error"] == (
+        "Command error detected: % Invalid input (line 3: invalid line)"
+    )
+    assert len(shell.writes) == 2
+    assert shell.disconnected is True
+
+
+def test_fast_apply_checks_cancel_between_chunks(monkeypatch):
+    shell = _FakeConfigShell()
+    monkeypatch.setattr(executor, "ConnectHandler", lambda **kwargs: shell)
+    cancel_event = threading.Event()
+
+    with device_progress(lambda status, message: cancel_event.set()):
+        result = executor.execute_device_commands(
+            device_params=_device_params(),
+            commands=_config_lines(6),
+            verify_cmds=[],
+            cancel_event=cancel_event,
+            fast_apply_chunk_lines=2,
+        )
+
+    assert result["status"] == "cancelled"
+    assert len(shell.writes) == 1
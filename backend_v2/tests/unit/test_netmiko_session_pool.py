@@ -0,0 +1,195 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the keyed SSH session pool."""
+
+import threading
+
+import pytest
+
+from backend_v2.app.infrastructure.netmiko_session_pool import (
+    NetmikoSessionPool,
+    session_key,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeConnection:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.disconnected = False
+
+    def is_alive(self):
+        return self.alive and not self.disconnected
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def params(host="10.0.0.1", password="secret"):
+    return {
+        "host": host,
+        "port": 22,
+        "device_type": "cisco_ios",
+        "username": "admin",
+        "password": password,
+    }
+
+
+def test_session_key_ignores_password():
+    assert session_key(params()) == "admin@10.0.0.1:22/cisco_ios"
+    assert session_key(params(password="other")) == session_key(params())
+
+
+def test_reusable_session_is_checked_out_again():
+    pool = NetmikoSessionPool()
+    first = pool.acquire(params(), FakeConnection)
+    connection = first.connection
+    first.release(reusable=True)
+
+    second = pool.acquire(params(), FakeConnection)
+
+    assert second.reused is True
+    assert second.connection is connection
+    second.release(reusable=False)
+    assert connection.disconnected is True
+    stats = pool.stats()
+    assert (stats.opened, stats.reused, stats.idle, stats.checked_out) == (1, 1, 0, 0)
+
+
+def test_unhealthy_or_recredentialed_session_is_replaced():
+    pool = NetmikoSessionPool()
+    lease = pool.acquire(params(), FakeConnection)
+    dead = lease.connection
+    lease.release(reusable=True)
+    dead.alive = False
+
+    fresh = pool.acquire(params(), FakeConnection)
+    assert fresh.reused is False and fresh.connection is not dead
+    assert dead.disconnected is True
+    fresh.release(reusable=True)
+
+    changed = pool.acquire(params(password="rotated"), FakeConnection)
+    assert changed.reused is False
+    assert pool.stats().discarded == 2
+
+
+def test_idle_ttl_and_max_age_expire_sessions():
+    clock = FakeClock()
+    pool = NetmikoSessionPool(idle_ttl_seconds=10, max_age_seconds=30, clock=clock)
+    lease = pool.acquire(params(), FakeConnection)
+    lease.release(reusable=True)
+
+    clock.now = 11
+    assert pool.prune() == 1
+    assert lease.connection.disconnected is True
+
+    lease = pool.acquire(params(), FakeConnection)
+    reused = []
+    for _ in range(4):
+        clock.now += 8
+        lease.release(reusable=True)
+        lease = pool.acquire(params(), FakeConnection)
+        reused.append(lease.reused)
+    assert reused == [True, True, True, False]
+
+
+def test_warm_sessions_use_their_own_ttl_and_report_source():
+    clock = FakeClock()
+    pool = NetmikoSessionPool(idle_ttl_seconds=10, clock=clock)
+    pool.acquire(params(), FakeConnection).release(reusable=True, ttl=100, warm=True)
+    assert pool.stats().warm_idle == 1
+
+    clock.now = 50
+    lease = pool.acquire(params(), FakeConnection)
+    assert lease.source == "warm"
+    lease.release(reusable=True)
+
+    lease = pool.acquire(params(), FakeConnection)
+    assert lease.source == "pooled"
+    lease.release(reusable=True)
+    clock.now = 61
+    assert pool.acquire(params(), FakeConnection).source == "new"
+    assert pool.stats().warm_reused == 1
+
+
+def test_max_idle_closes_least_recently_used():
+    pool = NetmikoSessionPool(max_idle=2)
+    leases = [pool.acquire(params(f"10.0.0.{i}"), FakeConnection) for i in range(3)]
+    for lease in leases:
+        lease.release(reusable=True)
+
+    assert pool.stats().idle == 2
+    assert leases[0].connection.disconnected is True
+    assert pool.close_all() == 2
+
+
+def test_device_is_checked_out_by_one_caller_at_a_time():
+    pool = NetmikoSessionPool()
+    lease = pool.acquire(params(), FakeConnection)
+    acquired = threading.Event()
+
+    def second_caller():
+        pool.acquire(params(), FakeConnection).release(reusable=True)
+        acquired.set()
+
+    thread = threading.Thread(target=second_caller)
+    thread.start()
+    assert not acquired.wait(0.1)
+    lease.release(reusable=True)
+    thread.join(1)
+    assert acquired.is_set()
+    assert pool.stats().reused == 1
+    assert pool._device_locks == {}
+
+
+def test_failed_open_releases_the_device():
+    pool = NetmikoSessionPool()
+
+    def refuse():
+        raise TimeoutError("unreachable")
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(params(), refuse)
+
+    lease = pool.acquire(params(), FakeConnection)
+    assert pool.stats().checked_out == 1
+    lease.release(reusable=False)
+    lease.release(reusable=True)
+    assert pool.stats().checked_out == 0
+
+
+def test_device_locks_are_dropped_once_no_caller_uses_the_device():
+    pool = NetmikoSessionPool(max_idle=0)
+    for i in range(50):
+        pool.acquire(params(f"10.0.1.{i}"), FakeConnection).release(reusable=True)
+
+    def refuse():
+        raise TimeoutError("unreachable")
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(params("10.0.2.1"), refuse)
+
+    assert pool._device_locks == {}
+    assert pool._device_lock_users == {}
@@ -0,0 +1,85 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the idle connection reaper."""
+
+import time
+
+from backend_v2.app.infrastructure.netmiko_session_pool import NetmikoSessionPool
+from backend_v2.app.infrastructure.pool_reaper import PoolReaper
+
+
+class FakeConnection:
+    def __init__(self):
+        self.disconnected = False
+
+    def is_alive(self):
+        return not self.disconnected
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def test_reaper_closes_idle_sessions_without_further_pool_use():
+    pool = NetmikoSessionPool(idle_ttl_seconds=0.01)
+    lease = pool.acquire(
+        {
+            "host": "10.0.0.1",
+            "device_type": "cisco_ios",
+            "username": "admin",
+            "password": "secret",
+        },
+        FakeConnection,
+    )
+    lease.release(reusable=True)
+    reaper = PoolReaper(interval_seconds=0.02, prunes=[pool.prune])
+
+    assert reaper.start() is True
+    try:
+        for _ in range(100):
+            if lease.connection.disconnected:
+                break
+            time.sleep(0.01)
+    finally:
+        reaper.stop()
+
+    assert lease.connection.disconnected is True
+    assert pool.stats().idle == 0
+
+
+def test_failing_prune_does_not_stop_the_others():
+    calls: list[str] = []
+
+    def broken() -> int:
+        calls.append("broken")
+        raise RuntimeError("boom")
+
+    def working() -> int:
+        calls.append("working")
+        return 2
+
+    reaper = PoolReaper(prunes=[broken, working])
+
+    assert reaper.reap_once() == 2
+    assert calls == ["broken", "working"]
+
+
+def test_reaper_is_disabled_by_a_non_positive_interval():
+    reaper = PoolReaper(interval_seconds=0, prunes=[lambda: 0])
+
+    assert reaper.start() is False
+    reaper.stop()
@@ -0,0 +1,108 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the connection-rate token bucket."""
+
+import threading
+
+import pytest
+
+from backend_v2.app.application.rate_limit import TokenBucket, try_acquire_all
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_allows_burst_then_reports_wait_without_blocking():
+    clock = _FakeClock()
+    bucket = TokenBucket(rate_per_second=2.0, burst=3, clock=clock)
+
+    assert [bucket.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert bucket.try_acquire() == 0.0
+    clock.now += 10.0
+    assert bucket.wait_time() == 0.0
+    assert [bucket.try_acquire() for _ in range(4)][-1] == pytest.approx(0.5)
+
+
+def test_try_acquire_all_takes_nothing_while_any_bucket_is_empty():
+    clock = _FakeClock()
+    shared = TokenBucket(rate_per_second=1.0, burst=2, clock=clock)
+    stagger = TokenBucket(rate_per_second=4.0, burst=1, clock=clock)
+
+    assert try_acquire_all([shared, stagger]) == 0.0
+    assert try_acquire_all([shared, stagger]) == pytest.approx(0.25)
+    assert shared.wait_time() == 0.0
+
+    clock.now += 0.25
+    assert try_acquire_all([shared, stagger]) == 0.0
+    assert shared.wait_time() == pytest.approx(0.75)
+
+
+def test_try_acquire_all_never_loses_a_token_to_a_concurrent_taker():
+    stagger_clock = _FakeClock()
+    stagger_reads: list[float] = []
+
+    def counting_clock() -> float:
+        stagger_reads.append(stagger_clock.now)
+        return stagger_clock.now
+
+    stagger = TokenBucket(rate_per_second=0.001, burst=1, clock=counting_clock)
+    rivals: list[threading.Thread] = []
+
+    def shared_clock() -> float:
+        # Once the stagger bucket has been checked, another run grabs its
+        # token before try_acquire_all takes it.
+        if len(stagger_reads) > 1 and not rivals:
+            rival = threading.Thread(target=stagger.try_acquire)
+            rivals.append(rival)
+            rival.start()
+            rival.join(0.2)
+        return 0.0
+
+    shared = TokenBucket(rate_per_second=0.001, burst=1, clock=shared_clock)
+
+    wait = try_acquire_all([shared, stagger])
+    for rival in rivals:
+        rival.join(1.0)
+
+    # Either both tokens were taken, or the shared one is still there.
+    if wait == 0.0:
+        assert shared.wait_time() > 0
+    else:
+        assert shared.wait_time() == 0.0
+
+
+def test_blocking_acquire_returns_false_when_cancelled():
+    bucket = TokenBucket(rate_per_second=0.001, burst=1)
+    bucket.try_acquire()
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    assert bucket.acquire(cancel_event) is False
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(rate_per_second=0)
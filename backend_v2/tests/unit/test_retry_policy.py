@@ -0,0 +1,44 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for retry eligibility and backoff."""
+
+from backend_v2.app.application.retry_policy import backoff_delay, is_retryable
+from backend_v2.app.domain.models import DeviceExecutionResult
+
+
+def test_authentication_failures_and_cancellations_are_never_retried():
+    assert not is_retryable(
+        DeviceExecutionResult(status="failed", error_code="authentication_failed")
+    )
+    assert not is_retryable(
+        DeviceExecutionResult(status="failed", error_code="command_error")
+    )
+    assert not is_retryable(DeviceExecutionResult(status="cancelled"))
+    assert not is_retryable(DeviceExecutionResult(status="success"))
+    assert is_retryable(
+        DeviceExecutionResult(status="failed", error_code="connection_timeout")
+    )
+    assert is_retryable(DeviceExecutionResult(status="failed"))
+
+
+def test_backoff_grows_exponentially_with_equal_jitter_and_cap():
+    assert backoff_delay(1, 2.0, rand=lambda: 0.0) == 1.0
+    assert backoff_delay(1, 2.0, rand=lambda: 1.0) == 2.0
+    assert backoff_delay(3, 2.0, rand=lambda: 1.0) == 8.0
+    assert backoff_delay(10, 2.0, cap_seconds=30.0, rand=lambda: 1.0) == 30.0
+    assert backoff_delay(2, 0.0) == 0.0
@@ -0,0 +1,200 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for rollout wave planning and fan-out scheduling."""
+
+import pytest
+
+from backend_v2.app.application.rollout import (
+    FailureBudget,
+    FanoutScheduler,
+    GroupLimiter,
+    normalize_wave_percentages,
+    plan_waves,
+)
+from backend_v2.app.domain.models import DeviceExecutionResult, DeviceTarget
+
+
+def _targets(count: int) -> list[DeviceTarget]:
+    return [DeviceTarget(host=f"10.30.0.{i + 1}") for i in range(count)]
+
+
+def test_normalize_wave_percentages_appends_final_wave():
+    assert normalize_wave_percentages([1, 10, 50]) == [1.0, 10.0, 50.0, 100.0]
+    assert normalize_wave_percentages([]) == [100.0]
+
+
+@pytest.mark.parametrize("waves", [[0, 50], [50, 10], [10, 10], [120]])
+def test_normalize_wave_percentages_rejects_invalid_plans(waves):
+    with pytest.raises(ValueError):
+        normalize_wave_percentages(waves)
+
+
+def test_plan_waves_uses_cumulative_percentages():
+    devices = _targets(200)
+
+    waves = plan_waves(devices, [1, 10, 50, 100])
+
+    assert [len(w.devices) for w in waves] == [2, 18, 80, 100]
+    assert [w.label for w in waves] == ["1%", "10%", "50%", "100%"]
+    assert [w.index for w in waves] == [1, 2, 3, 4]
+    flattened = [d for w in waves for d in w.devices]
+    assert flattened == devices
+
+
+def test_plan_waves_keeps_at_least_one_device_per_wave_and_drops_empty():
+    waves = plan_waves(_targets(3), [1, 10, 50, 100])
+
+    assert [len(w.devices) for w in waves] == [1, 1, 1]
+
+
+def test_fanout_scheduler_respects_concurrency_and_stop_on_error():
+    devices = _targets(4)
+    scheduler = FanoutScheduler(devices, concurrency_limit=2, stop_on_error=True)
+
+    first = scheduler.next_device()
+    second = scheduler.next_device()
+    assert scheduler.next_device() is None
+    assert first is not None and second is not None
+
+    scheduler.complete(first, DeviceExecutionResult(status="failed"))
+
+    assert scheduler.next_device() is None
+    assert scheduler.failed == 1
+    assert scheduler.has_work() is True
+    scheduler.complete(second, DeviceExecutionResult(status="success"))
+    assert scheduler.has_work() is False
+
+
+def test_group_limiter_skips_saturated_group_instead_of_blocking_head():
+    devices = _targets(4)
+    sites = {
+        devices[0].key: {"site": "tokyo"},
+        devices[1].key: {"site": "tokyo"},
+        devices[2].key: {"site": "tokyo"},
+        devices[3].key: {"site": "osaka"},
+    }
+    limiter = GroupLimiter({"site": 1}, sites)
+    scheduler = FanoutScheduler(
+        devices, concurrency_limit=10, stop_on_error=False, group_limiter=limiter
+    )
+
+    first = scheduler.next_device()
+    second = scheduler.next_device()
+
+    assert first == devices[0]
+    assert second == devices[3]
+    assert scheduler.next_device() is None
+    assert limiter.snapshot() == {"site=tokyo": 1, "site=osaka": 1}
+
+    scheduler.complete(devices[0], DeviceExecutionResult(status="success"))
+    assert scheduler.next_device() == devices[1]
+
+
+def test_group_limiter_ignores_devices_without_attribute():
+    devices = _targets(3)
+    limiter = GroupLimiter({"site": 1}, {})
+    scheduler = FanoutScheduler(
+        devices, concurrency_limit=3, stop_on_error=False, group_limiter=limiter
+    )
+
+    started = [scheduler.next_device() for _ in range(3)]
+
+    assert started == devices
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_retry_frees_slot_until_backoff_elapses():
+    devices = _targets(2)
+    clock = _FakeClock()
+    scheduler = FanoutScheduler(
+        devices, concurrency_limit=1, stop_on_error=False, clock=clock
+    )
+
+    first = scheduler.next_device()
+    scheduler.retry(first, DeviceExecutionResult(status="failed"), delay=5.0)
+
+    assert scheduler.next_device() == devices[1]
+    assert scheduler.next_retry_in() == 5.0
+    scheduler.complete(devices[1], DeviceExecutionResult(status="success"))
+    assert scheduler.next_device() is None
+
+    clock.now += 5.0
+    assert scheduler.next_device() == devices[0]
+    assert scheduler.attempts[devices[0].key] == 2
+    assert scheduler.next_retry_in() is None
+
+
+def test_halt_returns_queued_retries_with_last_result():
+    devices = _targets(2)
+    scheduler = FanoutScheduler(devices, concurrency_limit=2, stop_on_error=True)
+    first = scheduler.next_device()
+    second = scheduler.next_device()
+    last = DeviceExecutionResult(status="failed", error="timeout")
+
+    scheduler.retry(first, last, delay=30.0)
+    scheduler.complete(second, DeviceExecutionResult(status="failed"))
+
+    assert not scheduler.has_work()
+    assert scheduler.drain_retries() == [(first, last)]
+
+
+def test_failure_budget_allowance_uses_stricter_limit():
+    assert FailureBudget().allowance(100) is None
+    assert FailureBudget(max_failures=5).allowance(100) == 5
+    assert FailureBudget(max_failure_percent=2.5).allowance(200) == 5
+    assert FailureBudget(max_failures=3, max_failure_percent=10).allowance(100) == 3
+    assert FailureBudget(max_failure_percent=10).allowance(5) == 0
+
+
+def test_scheduler_halts_once_failures_exceed_allowance():
+    devices = _targets(5)
+    scheduler = FanoutScheduler(
+        devices,
+        concurrency_limit=1,
+        stop_on_error=True,
+        failure_allowance=2,
+        failures_before=1,
+    )
+    failed = DeviceExecutionResult(status="failed")
+
+    scheduler.complete(scheduler.next_device(), failed)
+    assert not scheduler.budget_exceeded
+    scheduler.complete(scheduler.next_device(), failed)
+
+    assert scheduler.budget_exceeded
+    assert scheduler.next_device() is None
+    assert not scheduler.has_work()
+
+
+def test_scheduler_without_stop_on_error_or_budget_never_halts():
+    devices = _targets(3)
+    scheduler = FanoutScheduler(devices, concurrency_limit=1, stop_on_error=False)
+
+    for _ in range(3):
+        scheduler.complete(scheduler.next_device(), DeviceExecutionResult("failed"))
+
+    assert scheduler.failure_allowance is None
+    assert not scheduler.budget_exceeded
+    assert scheduler.failed == 3
@@ -0,0 +1,86 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the fair-share session budget."""
+
+from backend_v2.app.application.rollout import FanoutScheduler
+from backend_v2.app.application.session_budget import FairShareSessionBudget
+from backend_v2.app.domain.models import DeviceExecutionResult, DeviceTarget
+
+
+def test_single_job_may_use_whole_budget():
+    budget = FairShareSessionBudget(total=3)
+    lease = budget.register("job-a")
+
+    assert [lease.try_acquire() for _ in range(4)] == [True, True, True, False]
+    in_use, jobs = budget.snapshot()
+    assert in_use == 3
+    assert jobs["job-a"].waiting is True
+
+
+def test_job_over_its_share_yields_to_waiting_job_below_share():
+    budget = FairShareSessionBudget(total=4)
+    big = budget.register("big")
+    small = budget.register("small")
+    assert all(big.try_acquire() for _ in range(3))
+
+    assert small.try_acquire() is True
+    assert small.try_acquire() is False  # budget full
+    big.release()
+
+    # big is above its share of 2 while small waits below it.
+    assert big.try_acquire() is False
+    assert small.try_acquire() is True
+    _, jobs = budget.snapshot()
+    assert jobs["big"].in_use == 2
+    assert jobs["small"].in_use == 2
+    assert jobs["small"].fair_share == 2
+
+
+def test_release_notifies_listeners_and_unregister_frees_share():
+    budget = FairShareSessionBudget(total=2)
+    wakeups: list[str] = []
+    remove = budget.add_listener(lambda: wakeups.append("wake"))
+    lease = budget.register("job-a")
+    lease.try_acquire()
+
+    lease.release()
+    lease.release(notify=False)
+    remove()
+    lease.close()
+
+    assert wakeups == ["wake"]
+    assert budget.snapshot() == (0, {})
+
+
+def test_scheduler_holds_one_session_per_in_flight_device():
+    budget = FairShareSessionBudget(total=2)
+    lease = budget.register("job-a")
+    devices = [DeviceTarget(host=f"10.0.0.{i}") for i in range(3)]
+    scheduler = FanoutScheduler(
+        devices, concurrency_limit=5, stop_on_error=False, session_lease=lease
+    )
+
+    first = scheduler.next_device()
+    second = scheduler.next_device()
+    assert scheduler.next_device() is None
+    assert scheduler.next_wakeup() is not None
+    assert first is not None and second is not None
+
+    scheduler.complete(first, DeviceExecutionResult(status="success"))
+    assert scheduler.next_device() == devices[2]
+    assert budget.snapshot()[0] == 2
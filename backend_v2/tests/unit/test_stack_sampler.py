@@ -0,0 +1,72 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the stack sampling profiler."""
+
+import threading
+
+import pytest
+
+from backend_v2.app.infrastructure.stack_sampler import StackSampler
+
+
+def busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_capture_collapses_named_thread_stacks():
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,), name="nw-edit-run;1")
+    worker.start()
+    try:
+        capture = StackSampler(interval_seconds=0.005).capture(0.2)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert capture.samples >= 2
+    lines = capture.collapsed().splitlines()
+    busy = [line for line in lines if line.startswith("nw-edit-run:1;")]
+    assert busy
+    stack, count = busy[0].rsplit(" ", 1)
+    assert int(count) >= 1
+    assert stack.split(";")[1] == "threading:Thread._bootstrap"
+    assert any("test_stack_sampler:busy_loop" in line for line in busy)
+    assert not any("StackSampler.capture" in line for line in lines)
+
+
+def test_only_one_capture_runs_at_a_time():
+    sampler = StackSampler(interval_seconds=0.005)
+    started = threading.Event()
+    original = sampler.sample_once
+
+    def sample_once(stacks):
+        started.set()
+        original(stacks)
+
+    sampler.sample_once = sample_once
+    thread = threading.Thread(target=sampler.capture, args=(0.3,))
+    thread.start()
+    started.wait(1)
+    try:
+        with pytest.raises(RuntimeError):
+            sampler.capture(0.01)
+        assert sampler.busy
+    finally:
+        thread.join()
+    assert not sampler.busy
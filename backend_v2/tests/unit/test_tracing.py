@@ -0,0 +1,195 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for span tracing and the in-memory span store."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend_v2.app.application.async_execution_engine import AsyncExecutionEngine
+from backend_v2.app.application.execution_engine import ExecutionConfig, ExecutionEngine
+from backend_v2.app.application.tracing import (
+    Span,
+    Tracer,
+    in_current_context,
+    span,
+    traced,
+    waterfall,
+)
+from backend_v2.app.domain.models import DeviceExecutionResult, DeviceTarget
+from backend_v2.app.infrastructure.in_memory_span_store import InMemorySpanStore
+
+
+def test_nested_spans_link_to_parent_and_share_job_trace():
+    store = InMemorySpanStore(capacity=10)
+
+    with Tracer([store]).trace("job-1", "run", mode="sync"):
+        with span("prepare_run"):
+            with span("device_attempt", device="10.0.0.1:22") as current:
+                assert current is not None
+                current.set_attribute("status", "success")
+
+    spans = {item.name: item for item in store.spans_for("job-1")}
+    assert spans["run"].parent_id is None
+    assert spans["run"].attributes == {"mode": "sync"}
+    assert spans["prepare_run"].parent_id == spans["run"].span_id
+    assert spans["device_attempt"].parent_id == spans["prepare_run"].span_id
+    assert spans["device_attempt"].attributes == {
+        "device": "10.0.0.1:22",
+        "status": "success",
+    }
+
+
+def test_span_outside_a_trace_is_a_noop():
+    with span("orphan") as current:
+        assert current is None
+
+
+def test_unsampled_job_records_nothing():
+    store = InMemorySpanStore(capacity=10)
+    tracer = Tracer([store], sample_rate=0.0)
+
+    with tracer.trace("job-1", "run"):
+        with span("child") as current:
+            assert current is None
+
+    assert store.spans_for("job-1") == []
+
+
+def test_sampling_is_deterministic_per_job():
+    tracer = Tracer([InMemorySpanStore(capacity=1)], sample_rate=0.5)
+    decisions = {f"job-{i}": tracer.sampled(f"job-{i}") for i in range(200)}
+
+    assert decisions == {job: tracer.sampled(job) for job in decisions}
+    assert 40 < sum(decisions.values()) < 160
+
+
+def test_failed_span_records_error_and_reraises():
+    store = InMemorySpanStore(capacity=10)
+
+    @traced("reset_run_control")
+    def fail() -> None:
+        raise ValueError("bad transition")
+
+    with pytest.raises(ValueError):
+        with Tracer([store]).trace("job-1", "run"):
+            fail()
+
+    failed = [item for item in store.spans_for("job-1") if item.name != "run"]
+    assert failed[0].error == "ValueError: bad transition"
+
+
+def test_failing_exporter_never_reaches_instrumented_code(caplog):
+    class BrokenExporter:
+        def export(self, span: Span) -> None:
+            raise OSError("No space left on device")
+
+    store = InMemorySpanStore(capacity=10)
+
+    @traced("connect")
+    def connect() -> str:
+        return "connected"
+
+    with Tracer([BrokenExporter(), store]).trace("job-1", "run"):
+        assert connect() == "connected"
+
+    assert [item.name for item in store.spans_for("job-1")] == ["connect", "run"]
+    assert "Span exporter BrokenExporter failed" in caplog.text
+
+
+def test_in_current_context_keeps_parent_across_threads():
+    store = InMemorySpanStore(capacity=10)
+
+    def child() -> None:
+        with span("worker"):
+            pass
+
+    with Tracer([store]).trace("job-1", "run"):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(in_current_context(child)).result()
+            executor.submit(child).result()
+
+    spans = store.spans_for("job-1")
+    assert [item.name for item in spans] == ["worker", "run"]
+    assert spans[0].parent_id == spans[1].span_id
+
+
+def test_ring_buffer_keeps_most_recent_spans():
+    store = InMemorySpanStore(capacity=2)
+    for index in range(3):
+        store.export(Span("job-1", f"s{index}", None, "op", float(index)))
+
+    assert [item.span_id for item in store.spans_for("job-1")] == ["s1", "s2"]
+    assert store.clear() == 2
+
+
+def test_waterfall_orders_depth_first_with_offsets():
+    spans = [
+        Span("job", "c2", "root", "second", 13.0, 1.0),
+        Span("job", "root", None, "run", 10.0, 5.0),
+        Span("job", "c1", "root", "first", 11.0, 1.0),
+        Span("job", "g1", "c1", "grandchild", 11.5, 0.2),
+        Span("job", "lost", "evicted", "orphan", 12.0, 0.1),
+    ]
+
+    rows = waterfall(spans)
+
+    assert [(row.span.name, row.depth) for row in rows] == [
+        ("run", 0),
+        ("first", 1),
+        ("grandchild", 2),
+        ("second", 1),
+        ("orphan", 0),
+    ]
+    assert rows[2].offset_seconds == pytest.approx(1.5)
+
+
+class SimpleWorker:
+    def run(self, device, commands, verify_commands=None):
+        with span("worker.run"):
+            return DeviceExecutionResult(status="success")
+
+
+@pytest.mark.parametrize("engine_class", [ExecutionEngine, AsyncExecutionEngine])
+def test_engine_spans_devices_under_run_job(engine_class):
+    store = InMemorySpanStore(capacity=100)
+    engine = engine_class(worker=SimpleWorker())
+    devices = [DeviceTarget(host=f"10.0.0.{i}", port=22) for i in range(1, 4)]
+
+    with Tracer([store]).trace("job-1", "run"):
+        engine.run_job(
+            job_id="job-1",
+            devices=devices,
+            canary=devices[0],
+            commands_by_device={device.key: ["conf t"] for device in devices},
+            verify_commands_by_device=None,
+            config=ExecutionConfig(concurrency_limit=2),
+        )
+
+    spans = store.spans_for("job-1")
+    by_id = {item.span_id: item for item in spans}
+    run_job = next(item for item in spans if item.name == "run_job")
+    attempts = [item for item in spans if item.name == "device_attempt"]
+    assert sorted(item.attributes["device"] for item in attempts) == [
+        device.key for device in devices
+    ]
+    assert all(item.parent_id == run_job.span_id for item in attempts)
+    assert all(item.attributes["status"] == "success" for item in attempts)
+    workers = [item for item in spans if item.name == "worker.run"]
+    assert len(workers) == 3
+    assert all(by_id[item.parent_id].name == "device_attempt" for item in workers)
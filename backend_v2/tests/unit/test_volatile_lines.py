@@ -0,0 +1,81 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for volatile-value masking before verification diffs."""
+
+import pytest
+
+from backend_v2.app.infrastructure.volatile_lines import (
+    VOLATILE_MASK,
+    current_volatile_line_rules,
+    normalizer_for,
+    validate_volatile_rules,
+    volatile_line_rules,
+)
+
+
+def test_ios_rules_mask_clocks_uptime_and_counters():
+    output = (
+        "router uptime is 3 weeks, 2 days, 4 hours\n"
+        "*10:15:23.123 UTC Mon Mar 2 2026\n"
+        "  5 minute input rate 2000 bits/sec, 3 packets/sec\n"
+        "     1234 packets input, 567890 bytes, 0 no buffer\n"
+        " mac-address 00:11:22:33:44:55\n"
+        "interface GigabitEthernet0/1\n"
+    )
+
+    normalized, masked = normalizer_for("cisco_ios").normalize(output)
+
+    assert masked == 4
+    assert normalized.splitlines() == [
+        f"router uptime is {VOLATILE_MASK}",
+        f"*{VOLATILE_MASK} UTC Mon Mar 2 2026",
+        VOLATILE_MASK,
+        VOLATILE_MASK,
+        " mac-address 00:11:22:33:44:55",
+        "interface GigabitEthernet0/1",
+    ]
+
+
+def test_platform_rules_differ_and_are_cached():
+    junos_header = "## Last commit: 2026-03-02 10:15:23 UTC by admin\n"
+
+    assert normalizer_for("juniper_junos").normalize(junos_header)[0] == (
+        VOLATILE_MASK + "\n"
+    )
+    assert normalizer_for("cisco_ios").normalize("## Last commit: x\n")[1] == 0
+    assert normalizer_for("cisco_ios_telnet") is normalizer_for("cisco_ios")
+    assert normalizer_for("cisco_ios", ["^x$"]) is normalizer_for("cisco_ios", ("^x$",))
+    assert normalizer_for("cisco_ios", builtin=False).normalize("10:15:23") == (
+        "10:15:23",
+        0,
+    )
+
+
+def test_validate_volatile_rules_rejects_unsafe_patterns():
+    assert validate_volatile_rules(["^a$", ""]) == ["^a$"]
+    assert validate_volatile_rules(["(?i:serial .*$)"]) == ["(?i:serial .*$)"]
+    for rule in ["(unclosed", "(a)b", "x*", "(?i)serial .*$"]:
+        with pytest.raises(ValueError, match="Invalid volatile line rule"):
+            validate_volatile_rules([rule])
+
+
+def test_run_rules_are_scoped_to_the_context():
+    assert current_volatile_line_rules() == ()
+    with volatile_line_rules(["^a$"]):
+        assert current_volatile_line_rules() == ("^a$",)
+    assert current_volatile_line_rules() == ()
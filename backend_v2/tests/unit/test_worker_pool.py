@@ -0,0 +1,165 @@
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Unit tests for the shared session worker pool."""
+
+import threading
+import time
+
+import pytest
+
+from backend_v2.app.application.worker_pool import SessionWorkerPool
+
+
+class Gate:
+    """Blocks submitted work until released and tracks peak concurrency."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def work(self, value=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self.release.wait(timeout=2.0)
+        with self.lock:
+            self.active -= 1
+        return value
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert predicate()
+
+
+def test_global_cap_queues_excess_work_and_reports_stats():
+    pool = SessionWorkerPool(max_sessions=2)
+    gate = Gate()
+    futures = [pool.submit("run", "job-a", gate.work, i) for i in range(5)]
+
+    wait_until(lambda: pool.stats().active == 2)
+    stats = pool.stats()
+    assert stats.queued == 3
+    assert stats.utilization == 1.0
+    assert stats.queued_by_operation == {"run": 3}
+
+    gate.release.set()
+    assert [future.result(timeout=2.0) for future in futures] == [0, 1, 2, 3, 4]
+    assert gate.peak == 2
+    final = pool.stats()
+    assert final.completed == 5
+    assert final.active == 0
+    assert final.max_wait_seconds > 0
+    pool.shutdown()
+
+
+def test_operation_quota_lets_other_operations_pass_queued_imports():
+    pool = SessionWorkerPool(max_sessions=3, operation_quotas={"import": 1})
+    gate = Gate()
+    imports = [pool.submit("import", f"import-{i}", gate.work) for i in range(3)]
+    run = pool.submit("run", "job-a", gate.work)
+
+    wait_until(lambda: pool.stats().active == 2)
+    stats = pool.stats()
+    assert stats.active_by_operation == {"import": 1, "run": 1}
+    assert stats.queued_by_operation == {"import": 2}
+
+    gate.release.set()
+    for future in [*imports, run]:
+        future.result(timeout=2.0)
+    pool.shutdown()
+
+
+def test_owner_limits_cap_one_job():
+    pool = SessionWorkerPool(max_sessions=4, owner_quota=3)
+    gate = Gate()
+    executor = pool.executor("run", "job-a", limit=2)
+    for _ in range(4):
+        executor.submit(gate.work)
+    other = pool.submit("run", "job-b", gate.work)
+
+    wait_until(lambda: pool.stats().active == 3)
+    assert pool.stats().active_by_owner == {"job-a": 2, "job-b": 1}
+
+    gate.release.set()
+    executor.shutdown(wait=True)
+    other.result(timeout=2.0)
+    assert gate.peak == 3
+    pool.shutdown()
+
+
+def test_executor_view_waits_for_its_own_work_and_propagates_errors():
+    pool = SessionWorkerPool(max_sessions=2)
+
+    def boom():
+        raise RuntimeError("device unreachable")
+
+    with pool.executor("status", "status:1") as executor:
+        failing = executor.submit(boom)
+        ok = executor.submit(lambda: "done")
+
+    assert ok.done() and ok.result() == "done"
+    with pytest.raises(RuntimeError, match="device unreachable"):
+        failing.result()
+    pool.shutdown()
+
+
+def test_queued_work_starts_in_submission_order_across_owners():
+    pool = SessionWorkerPool(max_sessions=1)
+    gate = Gate()
+    started: list[str] = []
+    blocker = pool.submit("run", "job-a", gate.work)
+    futures = [
+        pool.submit("run", owner, started.append, f"{owner}-{index}")
+        for index, owner in enumerate(["job-b", "job-a", "job-c", "job-b"])
+    ]
+
+    wait_until(lambda: pool.stats().queued == 4)
+    gate.release.set()
+    blocker.result(timeout=2.0)
+    for future in futures:
+        future.result(timeout=2.0)
+
+    assert started == ["job-b-0", "job-a-1", "job-c-2", "job-b-3"]
+    assert pool._queues == {}
+    pool.shutdown()
+
+
+def test_executor_view_forgets_finished_futures_and_cancels_queued_ones():
+    pool = SessionWorkerPool(max_sessions=1)
+    gate = Gate()
+    executor = pool.executor("run", "job-a")
+    for index in range(200):
+        executor.submit(lambda value=index: value).result(timeout=2.0)
+    assert executor._futures == set()
+
+    running = executor.submit(gate.work)
+    queued = executor.submit(gate.work)
+    wait_until(lambda: gate.active == 1)
+    executor.shutdown(wait=False, cancel_futures=True)
+    gate.release.set()
+
+    assert queued.cancelled()
+    assert running.result(timeout=2.0) is None
+    wait_until(lambda: pool.stats().active == 0)
+    assert executor._futures == set()
+    pool.shutdown()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Benchmark the verification diff engine against ``difflib.unified_diff``.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python scripts/bench_config_diff.py --sections 20000 --changes 50
+
+Builds a synthetic running-config of ``--sections`` interface blocks, applies
+``--changes`` edits (changed, added and removed lines and sections) and times
+both engines on the same pre/post pair, plus the identical-output case.
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import random
+import time
+from collections.abc import Callable
+
+from backend_v2.app.application.config_diff import unified_config_diff
+
+
+def _config(sections: int) -> list[str]:
+    lines = ["hostname bench-r1\n", "!\n"]
+    for index in range(sections):
+        lines.extend(
+            [
+                f"interface GigabitEthernet{index // 48}/0/{index % 48}\n",
+                f" description port-{index}\n",
+                " switchport mode access\n",
+                f" switchport access vlan {100 + index % 50}\n",
+                " spanning-tree portfast\n",
+                " no shutdown\n",
+                "!\n",
+            ]
+        )
+    lines.append("end\n")
+    return lines
+
+
+def _mutate(lines: list[str], changes: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    post = list(lines)
+    for _ in range(changes):
+        index = rng.randrange(2, len(post) - 1)
+        choice = rng.random()
+        if choice < 0.4:
+            post[index] = f" description changed-{rng.randrange(10**6)}\n"
+        elif choice < 0.7:
+            post.insert(index, f" ip access-group ACL-{rng.randrange(100)} in\n")
+        elif choice < 0.85:
+            del post[index]
+        else:
+            post[index:index] = ["interface Loopback99\n", " no shutdown\n", "!\n"]
+    return post
+
+
+def _difflib(pre: str, post: str) -> str:
+    return "".join(
+        difflib.unified_diff(
+            pre.splitlines(keepends=True),
+            post.splitlines(keepends=True),
+            fromfile="pre",
+            tofile="post",
+            lineterm="\n",
+        )
+    )
+
+
+def _timed(label: str, func: Callable[[str, str], str], pre: str, post: str) -> str:
+    started = time.perf_counter()
+    diff = func(pre, post)
+    elapsed = time.perf_counter() - started
+    changed = sum(
+        1
+        for line in diff.splitlines()
+        if line[:1] in "+-" and not line.startswith(("+++", "---"))
+    )
+    print(f"{label:<28} {elapsed:8.3f}s  {changed:6d} changed lines")
+    return diff
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=20000)
+    parser.add_argument("--changes", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    lines = _config(args.sections)
+    pre = "".join(lines)
+    post = "".join(_mutate(lines, args.changes, args.seed))
+    print(f"{len(lines)} lines, {args.changes} edits")
+    _timed("difflib.unified_diff", _difflib, pre, post)
+    _timed(
+        "patience (line level)",
+        lambda a, b: unified_config_diff(a, b, sections=False),
+        pre,
+        post,
+    )
+    _timed("patience (sections)", unified_config_diff, pre, post)
+    _timed("difflib identical", _difflib, pre, pre)
+    _timed("patience identical", unified_config_diff, pre, pre)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# Copyright 2026 icecake0141
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file was created or modified with the assistance of an AI (Large Language Model).
+# Review required for correctness, security, and licensing.
+"""Benchmark standard vs fast-apply config pushes against the mock SSH server.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python scripts/bench_fast_apply.py --lines 4000 --chunk 100
+
+Starts ``tests/mock_ssh_server/server.py`` on ``--port`` unless one is
+already listening there, pushes ``--lines`` prefix-list lines once per mode
+and prints apply-stage throughput.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from backend_v2.app.infrastructure.netmiko_executor import (
+    DEFAULT_FAST_APPLY_CHUNK_LINES,
+    execute_device_commands,
+    validate_device_connection,
+)
+
+SERVER_SCRIPT = (
+    Path(__file__).resolve().parents[1] / "tests" / "mock_ssh_server" / "server.py"
+)
+
+
+def _device_params(port: int) -> dict[str, object]:
+    return {
+        "host": "127.0.0.1",
+        "port": port,
+        "device_type": "cisco_ios",
+        "username": "admin",
+        "password": "admin123",
+    }
+
+
+def _ensure_server(port: int) -> subprocess.Popen[bytes] | None:
+    if validate_device_connection(_device_params(port))[0]:
+        return None
+    process = subprocess.Popen(
+        [sys.executable, str(SERVER_SCRIPT), "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    for _ in range(20):
+        time.sleep(0.5)
+        if validate_device_connection(_device_params(port))[0]:
+            return process
+    process.terminate()
+    raise SystemExit(f"mock SSH server did not start on port {port}")
+
+
+def _config_lines(count: int) -> list[str]:
+    return [
+        f"ip prefix-list BENCH seq {index * 5} permit "
+        f"10.{index // 256 % 256}.{index % 256}.0/24"
+        for index in range(1, count + 1)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=2000)
+    parser.add_argument("--chunk", type=int, default=DEFAULT_FAST_APPLY_CHUNK_LINES)
+    parser.add_argument("--port", type=int, default=2240)
+    args = parser.parse_args()
+
+    process = _ensure_server(args.port)
+    try:
+        commands = _config_lines(args.lines)
+        print(f"{'mode':<12}{'status':<10}{'apply s':>10}{'lines/s':>12}")
+        for label, chunk in (("standard", 0), (f"fast/{args.chunk}", args.chunk)):
+            result = execute_device_commands(
+                _device_params(args.port),
+                commands,
+                [],
+                fast_apply_chunk_lines=chunk,
+            )
+            seconds = float(result["stage_timings"].get("apply", 0.0))
+            rate = args.lines / seconds if seconds else 0.0
+            print(f"{label:<12}{result['status']:<10}{seconds:>10.2f}{rate:>12.0f}")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=5)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,7 @@
 # Review required for correctness, security, and licensing.
 """Mock SSH server for integration testing."""
 
+import argparse
 import asyncio
 import asyncssh
 
@@ -25,6 +26,9 @@ import asyncssh
 class MockSSHServer(asyncssh.SSHServer):
     """Mock SSH server that simulates a network device."""
 
+    # Set with --allow-forwarding so the instance can act as a bastion.
+    allow_forwarding = False
+
     def connection_made(self, conn):
         """Called when a connection is made."""
         print(f"Connection from {conn.get_extra_info('peername')}")
@@ -42,6 +46,14 @@ class MockSSHServer(asyncssh.SSHServer):
         """Password authentication is supported."""
         return True
 
+    def session_requested(self):
+        """Open a simulated device shell."""
+        return MockSSHServerSession()
+
+    def connection_requested(self, dest_host, dest_port, orig_host, orig_port):
+        """Forward direct-tcpip channels when acting as a bastion."""
+        return self.allow_forwarding
+
     def validate_password(self, username, password):
         """Validate password."""
         # Accept any admin/admin123 combination
@@ -91,10 +103,13 @@ class MockSSHServerSession(asyncssh.SSHServerSession):
                 idx = min(idx_n, idx_r)
 
             line = self._buffer[:idx].strip()
+            # Treat CRLF as one line ending.
+            if self._buffer[idx : idx + 2] == "\r\n":
+                idx += 1
             self._buffer = self._buffer[idx + 1 :]
 
-            if line:
-                self._process_command(line)
+            # An empty line re-sends the prompt, as clients use it to find one.
+            self._process_command(line)
 
     def _process_command(self, command):
         """Process a command."""
@@ -184,7 +199,6 @@ async def start_server(host="0.0.0.0", port=2222):
         MockSSHServer,
         host,
         port,
-        session_factory=MockSSHServerSession,
         server_host_keys=["/tmp/ssh_host_key"],
         keepalive_interval=15,
     )
@@ -197,6 +211,17 @@ async def start_server(host="0.0.0.0", port=2222):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=2222)
+    parser.add_argument(
+        "--allow-forwarding",
+        action="store_true",
+        help="accept direct-tcpip channels, acting as a jump host",
+    )
+    args = parser.parse_args()
+    MockSSHServer.allow_forwarding = args.allow_forwarding
+
     # Generate host key if it doesn't exist
     try:
         with open("/tmp/ssh_host_key", "r"):
@@ -208,6 +233,6 @@ if __name__ == "__main__":
         subprocess.run(["ssh-keygen", "-t", "rsa", "-f", "/tmp/ssh_host_key", "-N", ""])
 
     try:
-        asyncio.run(start_server())
+        asyncio.run(start_server(host=args.host, port=args.port))
     except KeyboardInterrupt:
         print("\nShutting down...")